@@ -0,0 +1,211 @@
+"""In-process response cache for PostgREST reads: LRU + TTL + singleflight,
+invalidated by the warehouse's own freshness report.
+
+The ``api.*`` views this server reads only change when the daily load and
+mart refresh run, so an agent session asking about the same team twice
+should not cost Supabase two queries. Entries are keyed on everything that
+shapes the response -- request kind, base URL, view/RPC name, profile and
+the full (already row-capped) params -- and live until the first of:
+
+- their TTL (``CFB_MCP_CACHE_TTL`` seconds, default 3600; 0 disables the
+  cache entirely),
+- LRU eviction past ``CFB_MCP_CACHE_MAX_ENTRIES`` (default 512),
+- a newer load. ``public.get_data_freshness()`` reads the
+  ``marts.data_freshness`` materialized view, whose rows (row counts,
+  days since activity) are frozen between mart refreshes; a change in their
+  fingerprint therefore means a refresh has landed, and the whole cache is
+  dropped. The baseline fingerprint is taken before the first fetch that
+  fills the cache, re-checked at most every ``FRESHNESS_CHECK_SECONDS``
+  before serving a hit, and also updated whenever the get_data_freshness
+  tool runs. Entries stored before any baseline exists (the probe failed)
+  are dropped by the first fingerprint that does arrive.
+
+Identical concurrent misses coalesce: the first caller fetches and everyone
+else awaits the same result (or the same error -- errors are never cached).
+
+Cached rows are shared between callers; tools treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 512
+FRESHNESS_CHECK_SECONDS = 300.0
+
+Rows = list[dict[str, Any]]
+
+
+def freshness_fingerprint(rows: Rows) -> str:
+    """Order-independent digest of a get_data_freshness result."""
+    canonical = sorted(json.dumps(row, sort_keys=True, default=str) for row in rows)
+    return hashlib.sha256("\n".join(canonical).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """See the module docstring. One instance is shared process-wide
+    (``shared_response_cache``); tests construct their own."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        freshness_interval: float = FRESHNESS_CHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.freshness_interval = freshness_interval
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Rows]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[Rows]] = {}
+        self._probe: asyncio.Future[None] | None = None
+        self._fingerprint: str | None = None
+        self._checked_at: float | None = None
+        # Bumped on every invalidation, so a fetch that started before one
+        # cannot store a pre-load result after it.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> ResponseCache:
+        return cls(
+            ttl=float(os.environ.get("CFB_MCP_CACHE_TTL", DEFAULT_TTL)),
+            max_entries=int(os.environ.get("CFB_MCP_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(kind: str, base_url: str, name: str, profile: str, params: Any) -> tuple:
+        return (kind, base_url, name, profile, json.dumps(params, sort_keys=True, default=str))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+        self._checked_at = None
+
+    def observe_freshness(self, rows: Rows) -> bool:
+        """Record a get_data_freshness result. Drops every entry and returns
+        True if it differs from the last one seen -- or, for the first one
+        seen, if entries were already cached: nothing vouches for when those
+        were fetched."""
+        fingerprint = freshness_fingerprint(rows)
+        if self._fingerprint is None:
+            changed = bool(self._entries)
+        else:
+            changed = fingerprint != self._fingerprint
+        if changed:
+            self.clear()
+        self._fingerprint = fingerprint
+        self._checked_at = self._clock()
+        return changed
+
+    async def _ensure_fresh(self, probe: Callable[[], Awaitable[Rows]]) -> None:
+        """Re-check freshness before serving a hit if the last check is older
+        than freshness_interval. One probe at a time; a failed probe keeps
+        the cache (the TTL still bounds staleness)."""
+        if self._checked_at is not None and (
+            self._clock() - self._checked_at < self.freshness_interval
+        ):
+            return
+        if self._probe is not None:
+            await asyncio.shield(self._probe)
+            return
+        self._probe = asyncio.get_running_loop().create_future()
+        try:
+            self.observe_freshness(await probe())
+        except Exception:
+            self._checked_at = self._clock()
+        finally:
+            self._probe.set_result(None)
+            self._probe = None
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Rows]],
+        *,
+        probe: Callable[[], Awaitable[Rows]] | None = None,
+    ) -> Rows:
+        """Cached rows for `key`, else `fetch()` them -- once, however many
+        callers ask concurrently. `probe` fetches get_data_freshness for the
+        pre-hit freshness check, and for the baseline fingerprint before the
+        first fetch -- taken first, so the baseline is never newer than the
+        rows it vouches for."""
+        if not self.enabled:
+            return await fetch()
+
+        if probe is not None and (key in self._entries or self._fingerprint is None):
+            await self._ensure_fresh(probe)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, rows = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return rows
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future: asyncio.Future[Rows] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            rows = await fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved: no "never retrieved" warning without waiters
+            raise
+        else:
+            future.set_result(rows)
+            if generation == self._generation:
+                self._store(key, rows)
+            return rows
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: Hashable, rows: Rows) -> None:
+        now = self._clock()
+        self._entries[key] = (now + self.ttl, rows)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_shared_cache: ResponseCache | None = None
+
+
+def shared_response_cache() -> ResponseCache:
+    """The process-wide cache, configured from the environment on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ResponseCache.from_env()
+    return _shared_cache
+
+
+def reset_shared_response_cache() -> None:
+    """Forget the process-wide cache (it is rebuilt, re-reading the
+    environment, on next use)."""
+    global _shared_cache
+    _shared_cache = None
@@ -12,6 +12,13 @@ Design constraints (see mcp/README.md and docs/SCHEMA_CONTRACT.md):
   ``public`` schema RPC.
 - Every read is capped at ``DEFAULT_ROW_CAP`` rows. Callers may request a
   smaller limit; they can never request more than the cap.
+- One pooled ``httpx.AsyncClient`` (HTTP/2, keep-alive) serves every call
+  for the life of the process, so only the first request pays for DNS, TCP
+  and TLS; every later one -- and every concurrent sub-request a tool issues
+  with ``asyncio.gather`` -- rides the same warm connection.
+- Responses are cached in-process (cfb_mcp.cache): LRU + TTL, identical
+  concurrent calls coalesced, and everything dropped when
+  ``get_data_freshness`` reports a newer load.
 
 This module has no knowledge of MCP tool semantics -- it only knows how to
 build PostgREST requests and turn PostgREST/network errors into short,
@@ -20,6 +27,7 @@ actionable messages that a tool can hand straight back to the calling LLM.
 
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -27,9 +35,21 @@ from typing import Any
 
 import httpx
 
+from cfb_mcp.cache import ResponseCache, shared_response_cache
+
 DEFAULT_ROW_CAP = 100
 REQUEST_TIMEOUT = 30.0
 
+# The RPC the cache watches for new loads (see cfb_mcp.cache). Never served
+# from the cache itself.
+FRESHNESS_RPC = "get_data_freshness"
+
+# Every request goes to the one Supabase host, and HTTP/2 multiplexes a
+# tool's concurrent sub-requests over a single connection, so the pool stays
+# small. Idle connections are kept warm across an LLM's think time between
+# tool calls.
+POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=120.0)
+
 
 class PostgrestError(Exception):
     """Raised for any PostgREST/network failure.
@@ -93,11 +113,58 @@ def in_(values: Iterable[Any]) -> str:
     return "in.(" + ",".join(str(v) for v in values) + ")"
 
 
+# --- Shared HTTP client ------------------------------------------------
+#
+# An AsyncClient's connections belong to the event loop that opened them, so
+# the shared client is tied to the loop it was created on and rebuilt if it
+# is used from a different one (each asyncio.run(), or each test). The stdio
+# server runs one loop for its whole life, so in practice this is created
+# once.
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """The process-wide pooled client for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT, http2=True, limits=POOL_LIMITS)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def aclose_shared_http_client() -> None:
+    """Close the pooled client (server shutdown). The next call reopens one."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and _http_client_loop is asyncio.get_running_loop():
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
 class PostgrestClient:
-    """Async client for reading api.* views and calling public RPCs."""
+    """Async client for reading api.* views and calling public RPCs.
+
+    Cheap to construct (it only reads config); requests go through the
+    shared pooled HTTP client and the shared response cache unless others
+    are passed in.
+    """
 
-    def __init__(self, config: PostgrestConfig | None = None):
+    def __init__(
+        self,
+        config: PostgrestConfig | None = None,
+        http: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
+    ):
         self._config = config or PostgrestConfig.from_env()
+        self._http = http
+        self._cache = cache if cache is not None else shared_response_cache()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        return self._http or shared_http_client()
 
     def _headers(self, profile: str, *, write: bool) -> dict[str, str]:
         profile_header = "Content-Profile" if write else "Accept-Profile"
@@ -130,16 +197,21 @@ class PostgrestClient:
         query: dict[str, Any] = dict(params or {})
         query["limit"] = str(capped_limit)
 
+        key = ResponseCache.make_key("select", self._config.base_url, view, profile, query)
+        return await self._cache.get_or_fetch(
+            key, lambda: self._select(view, query, profile), probe=self._freshness_rows
+        )
+
+    async def _select(self, view: str, query: dict[str, Any], profile: str) -> list[dict[str, Any]]:
         url = f"{self._config.base_url}/rest/v1/{view}"
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            try:
-                response = await client.get(
-                    url, params=query, headers=self._headers(profile, write=False)
-                )
-            except httpx.TimeoutException as e:
-                raise PostgrestError(f"Error: request to '{view}' timed out.") from e
-            except httpx.RequestError as e:
-                raise PostgrestError(f"Error: network failure calling '{view}': {e}") from e
+        try:
+            response = await self.http.get(
+                url, params=query, headers=self._headers(profile, write=False)
+            )
+        except httpx.TimeoutException as e:
+            raise PostgrestError(f"Error: request to '{view}' timed out.") from e
+        except httpx.RequestError as e:
+            raise PostgrestError(f"Error: network failure calling '{view}': {e}") from e
 
         result = _parse_response(response, view)
         return result if isinstance(result, list) else [result]
@@ -151,17 +223,35 @@ class PostgrestClient:
         *,
         profile: str = "public",
     ) -> list[dict[str, Any]]:
-        """POST to a PostgREST RPC endpoint (Content-Profile: <profile>)."""
+        """POST to a PostgREST RPC endpoint (Content-Profile: <profile>).
+
+        get_data_freshness always goes upstream, and its result is handed to
+        the cache so a newer load invalidates it.
+        """
+        if function == FRESHNESS_RPC:
+            rows = await self._rpc(function, args, profile)
+            self._cache.observe_freshness(rows)
+            return rows
+        key = ResponseCache.make_key("rpc", self._config.base_url, function, profile, args or {})
+        return await self._cache.get_or_fetch(
+            key, lambda: self._rpc(function, args, profile), probe=self._freshness_rows
+        )
+
+    async def _freshness_rows(self) -> list[dict[str, Any]]:
+        return await self._rpc(FRESHNESS_RPC, {}, "public")
+
+    async def _rpc(
+        self, function: str, args: dict[str, Any] | None, profile: str
+    ) -> list[dict[str, Any]]:
         url = f"{self._config.base_url}/rest/v1/rpc/{function}"
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            try:
-                response = await client.post(
-                    url, json=args or {}, headers=self._headers(profile, write=True)
-                )
-            except httpx.TimeoutException as e:
-                raise PostgrestError(f"Error: request to rpc/{function} timed out.") from e
-            except httpx.RequestError as e:
-                raise PostgrestError(f"Error: network failure calling rpc/{function}: {e}") from e
+        try:
+            response = await self.http.post(
+                url, json=args or {}, headers=self._headers(profile, write=True)
+            )
+        except httpx.TimeoutException as e:
+            raise PostgrestError(f"Error: request to rpc/{function} timed out.") from e
+        except httpx.RequestError as e:
+            raise PostgrestError(f"Error: network failure calling rpc/{function}: {e}") from e
 
         result = _parse_response(response, f"rpc/{function}")
         if result is None:
@@ -14,16 +14,36 @@ model can qualify its answer ("per api.leaderboard_teams...").
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from enum import StrEnum
 from typing import Annotated, Any
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
-from cfb_mcp.postgrest import DEFAULT_ROW_CAP, PostgrestClient, PostgrestError, eq, gte
+from cfb_mcp.postgrest import (
+    DEFAULT_ROW_CAP,
+    PostgrestClient,
+    PostgrestError,
+    aclose_shared_http_client,
+    eq,
+    gte,
+)
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Close the pooled PostgREST connection when the server shuts down."""
+    try:
+        yield
+    finally:
+        await aclose_shared_http_client()
 
-mcp = FastMCP("cfb_mcp")
+
+mcp = FastMCP("cfb_mcp", lifespan=_lifespan)
 
 # All eight tools are read-only, non-destructive, idempotent, and talk to an
 # external service -- same annotation set for every one of them.
@@ -122,7 +142,7 @@ async def query_team(
     When to use: any question about a single team -- "how good is Oklahoma this
     year", "show Oklahoma's history since 2014", ratings/EPA trends over time.
 
-    Combines two sources in one call:
+    Combines two sources in one call (fetched concurrently):
       - api.team_detail: current-season snapshot (record, SP+/Elo/FPI ratings,
         EPA/success rate/explosiveness, recruiting rank). At most one row.
       - api.team_history: one row per season the team has data for (record,
@@ -141,14 +161,14 @@ async def query_team(
     """
     try:
         client = PostgrestClient()
-        detail_rows = await client.select(
-            "team_detail", {"school": eq(team)}, profile="api", limit=1
-        )
-        history_rows = await client.select(
-            "team_history",
-            {"team": eq(team), "order": "season.desc"},
-            profile="api",
-            limit=DEFAULT_ROW_CAP,
+        detail_rows, history_rows = await asyncio.gather(
+            client.select("team_detail", {"school": eq(team)}, profile="api", limit=1),
+            client.select(
+                "team_history",
+                {"team": eq(team), "order": "season.desc"},
+                profile="api",
+                limit=DEFAULT_ROW_CAP,
+            ),
         )
     except PostgrestError as e:
         return e.message
@@ -663,7 +683,9 @@ async def get_data_freshness() -> str:
 
     Takes no arguments. Backed by the public.get_data_freshness() RPC, which
     reports row_count, expected_refresh_frequency, days_since_activity, and
-    is_stale for each of ~23 tracked tables, ordered stale-first.
+    is_stale for each of ~23 tracked tables, ordered stale-first. Always
+    fetched live (never from the server's response cache); a result showing
+    a newer load also clears that cache.
 
     Returns: JSON {"_source": "public.get_data_freshness", "count": int,
     "rows": [...]}.
@@ -7,6 +7,8 @@ anyway, but the tests are hermetic regardless of where they run.)
 
 import pytest
 
+from cfb_mcp.cache import reset_shared_response_cache
+
 TEST_BASE_URL = "https://test-project.supabase.co"
 TEST_ANON_KEY = "test-anon-key"
 
@@ -16,3 +18,12 @@ def supabase_env(monkeypatch):
     """Every test gets a valid, fake Supabase config unless it overrides env itself."""
     monkeypatch.setenv("SUPABASE_URL", TEST_BASE_URL)
     monkeypatch.setenv("SUPABASE_ANON_KEY", TEST_ANON_KEY)
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache():
+    """Every test starts (and leaves) with an empty process-wide response
+    cache, so one test's mocked rows are never served to another."""
+    reset_shared_response_cache()
+    yield
+    reset_shared_response_cache()
@@ -0,0 +1,316 @@
+"""Tests for cfb_mcp.cache: LRU + TTL response cache, singleflight, and
+freshness-driven invalidation, both directly and through PostgrestClient."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from cfb_mcp.cache import ResponseCache, freshness_fingerprint, shared_response_cache
+from cfb_mcp.postgrest import PostgrestClient, PostgrestError, eq
+from cfb_mcp.server import get_data_freshness, query_team
+from tests.conftest import TEST_BASE_URL
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_fetch(rows):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return rows
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_fetch_until_ttl_expires():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=60, clock=clock)
+    fetch, calls = _counting_fetch([{"a": 1}])
+
+    assert await cache.get_or_fetch("k", fetch) == [{"a": 1}]
+    assert await cache.get_or_fetch("k", fetch) == [{"a": 1}]
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    clock.now += 61
+    await cache.get_or_fetch("k", fetch)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        await cache.get_or_fetch(key, _counting_fetch([{key: 1}])[0])
+    await cache.get_or_fetch("a", _counting_fetch([])[0])  # touch a
+    await cache.get_or_fetch("c", _counting_fetch([{"c": 1}])[0])  # evicts b
+
+    fetch_b, calls_b = _counting_fetch([{"b": 2}])
+    fetch_a, calls_a = _counting_fetch([{"a": 2}])
+    assert await cache.get_or_fetch("a", fetch_a) == [{"a": 1}]
+    assert await cache.get_or_fetch("b", fetch_b) == [{"b": 2}]
+    assert (len(calls_a), len(calls_b)) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_fetches():
+    cache = ResponseCache(ttl=0)
+    fetch, calls = _counting_fetch([])
+    await cache.get_or_fetch("k", fetch)
+    await cache.get_or_fetch("k", fetch)
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_misses_coalesce():
+    cache = ResponseCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return [{"x": 1}]
+
+    waiters = [asyncio.create_task(cache.get_or_fetch("k", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert len(calls) == 1
+    assert results == [[{"x": 1}]] * 5
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached():
+    cache = ResponseCache()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise PostgrestError("Error: boom")
+
+    waiters = [asyncio.create_task(cache.get_or_fetch("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(r, PostgrestError) for r in results)
+    assert len(cache) == 0
+    fetch, calls = _counting_fetch([{"ok": True}])
+    assert await cache.get_or_fetch("k", fetch) == [{"ok": True}]
+    assert len(calls) == 1
+
+
+def test_freshness_fingerprint_ignores_row_order():
+    rows = [{"table_name": "games", "row_count": 1}, {"table_name": "plays", "row_count": 2}]
+    assert freshness_fingerprint(rows) == freshness_fingerprint(rows[::-1])
+    assert freshness_fingerprint(rows) != freshness_fingerprint(
+        [{"table_name": "games", "row_count": 5}, rows[1]]
+    )
+
+
+@pytest.mark.asyncio
+async def test_newer_freshness_drops_everything():
+    cache = ResponseCache()
+    cache.observe_freshness([{"table_name": "games", "row_count": 1}])
+    await cache.get_or_fetch("k", _counting_fetch([{"old": 1}])[0])
+
+    assert cache.observe_freshness([{"table_name": "games", "row_count": 1}]) is False
+    assert len(cache) == 1
+    assert cache.observe_freshness([{"table_name": "games", "row_count": 2}]) is True
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_freshness_check_probes_before_a_hit():
+    clock = FakeClock()
+    cache = ResponseCache(freshness_interval=300, clock=clock)
+    freshness = [[{"row_count": 1}]]
+
+    async def probe():
+        return freshness[0]
+
+    await cache.get_or_fetch("k", _counting_fetch([{"v": 1}])[0], probe=probe)
+    cache.observe_freshness(freshness[0])
+
+    # Within the interval: served without probing, even though a load landed.
+    freshness[0] = [{"row_count": 2}]
+    clock.now += 100
+    fetch, calls = _counting_fetch([{"v": 2}])
+    assert await cache.get_or_fetch("k", fetch, probe=probe) == [{"v": 1}]
+
+    # Past it: the probe sees the new load and the hit becomes a refetch.
+    clock.now += 300
+    assert await cache.get_or_fetch("k", fetch, probe=probe) == [{"v": 2}]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_load_inside_the_first_interval_is_detected():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=3600, freshness_interval=300, clock=clock)
+    freshness = [[{"row_count": 1}]]
+    probes = []
+
+    async def probe():
+        probes.append(clock.now)
+        return freshness[0]
+
+    start = clock.now
+    assert await cache.get_or_fetch("k", _counting_fetch(["OLD"])[0], probe=probe) == ["OLD"]
+    assert probes == [start]  # baseline taken before the first fetch
+
+    clock.now = start + 100
+    freshness[0] = [{"row_count": 2}]
+    fetch, calls = _counting_fetch(["NEW"])
+    clock.now = start + 400
+    assert await cache.get_or_fetch("k", fetch, probe=probe) == ["NEW"]
+    clock.now = start + 800
+    assert await cache.get_or_fetch("k", fetch, probe=probe) == ["NEW"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_first_fingerprint_drops_entries_cached_without_a_baseline():
+    clock = FakeClock()
+    cache = ResponseCache(freshness_interval=300, clock=clock)
+
+    async def broken_probe():
+        raise PostgrestError("Error: down")
+
+    await cache.get_or_fetch("k", _counting_fetch(["OLD"])[0], probe=broken_probe)
+    assert len(cache) == 1
+
+    assert cache.observe_freshness([{"row_count": 2}]) is True
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_keeps_serving_cache():
+    clock = FakeClock()
+    cache = ResponseCache(freshness_interval=300, clock=clock)
+    await cache.get_or_fetch("k", _counting_fetch([{"v": 1}])[0])
+
+    async def broken_probe():
+        raise PostgrestError("Error: down")
+
+    clock.now += 301
+    assert await cache.get_or_fetch("k", _counting_fetch([])[0], probe=broken_probe) == [{"v": 1}]
+
+
+# --- Through PostgrestClient / tools ------------------------------------
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_repeated_tool_call_is_served_from_cache():
+    detail = respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        return_value=httpx.Response(200, json=[{"school": "Oklahoma"}])
+    )
+    history = respx.get(f"{TEST_BASE_URL}/rest/v1/team_history").mock(
+        return_value=httpx.Response(200, json=[{"team": "Oklahoma", "season": 2024}])
+    )
+
+    first = await query_team(team="Oklahoma")
+    second = await query_team(team="Oklahoma")
+
+    assert first == second
+    assert (detail.call_count, history.call_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_key_covers_params_and_profile():
+    route = respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    client = PostgrestClient()
+    await client.select("team_detail", {"school": eq("Oklahoma")}, profile="api")
+    await client.select("team_detail", {"school": eq("Texas")}, profile="api")
+    await client.select("team_detail", {"school": eq("Texas")}, profile="api", limit=5)
+    await client.select("team_detail", {"school": eq("Texas")}, profile="other")
+    await client.select("team_detail", {"school": eq("Texas")}, profile="api")
+    assert route.call_count == 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_identical_rpcs_make_one_request():
+    route = respx.post(f"{TEST_BASE_URL}/rest/v1/rpc/get_player_search").mock(
+        return_value=httpx.Response(200, json=[{"player_id": 1}])
+    )
+    client = PostgrestClient()
+    results = await asyncio.gather(
+        *(client.rpc("get_player_search", {"p_query": "Bijan"}) for _ in range(4))
+    )
+    assert route.call_count == 1
+    assert results == [[{"player_id": 1}]] * 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_freshness_tool_is_never_cached_and_invalidates_on_new_load():
+    freshness = respx.post(f"{TEST_BASE_URL}/rest/v1/rpc/get_data_freshness").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"table_name": "games", "row_count": 1}]),
+            httpx.Response(200, json=[{"table_name": "games", "row_count": 2}]),
+        ]
+    )
+    matchup = respx.get(f"{TEST_BASE_URL}/rest/v1/matchup").mock(
+        return_value=httpx.Response(200, json=[{"team1": "Oklahoma", "team2": "Texas"}])
+    )
+    client = PostgrestClient()
+
+    await get_data_freshness()
+    await client.select("matchup", {}, profile="api")
+    await client.select("matchup", {}, profile="api")
+    assert matchup.call_count == 1
+
+    result = json.loads(await get_data_freshness())
+    assert result["rows"] == [{"table_name": "games", "row_count": 2}]
+    assert freshness.call_count == 2
+    assert len(shared_response_cache()) == 0
+
+    await client.select("matchup", {}, profile="api")
+    assert matchup.call_count == 2
+
+
+def test_env_configures_shared_cache(monkeypatch):
+    monkeypatch.setenv("CFB_MCP_CACHE_TTL", "0")
+    monkeypatch.setenv("CFB_MCP_CACHE_MAX_ENTRIES", "7")
+    cache = ResponseCache.from_env()
+    assert cache.ttl == 0
+    assert cache.max_entries == 7
+    assert not cache.enabled
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_keeps_an_empty_cache_passed_in():
+    # An empty ResponseCache is falsy (__len__ == 0); it must not be swapped
+    # for the shared one.
+    route = respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        return_value=httpx.Response(200, json=[{"school": "Oklahoma"}])
+    )
+    cache = ResponseCache()
+    client = PostgrestClient(cache=cache)
+    assert client._cache is cache
+
+    await client.select("team_detail", {"school": eq("Oklahoma")}, profile="api")
+    await client.select("team_detail", {"school": eq("Oklahoma")}, profile="api")
+    assert route.call_count == 1
+    assert len(cache) == 1
+    assert len(shared_response_cache()) == 0
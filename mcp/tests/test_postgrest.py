@@ -1,4 +1,7 @@
-"""Unit tests for cfb_mcp.postgrest: config, operator builders, row cap, error mapping."""
+"""Unit tests for cfb_mcp.postgrest: config, operator builders, row cap, error mapping,
+shared pooled HTTP client."""
+
+import asyncio
 
 import httpx
 import pytest
@@ -9,10 +12,12 @@ from cfb_mcp.postgrest import (
     PostgrestClient,
     PostgrestConfig,
     PostgrestError,
+    aclose_shared_http_client,
     eq,
     gte,
     in_,
     lte,
+    shared_http_client,
 )
 from tests.conftest import TEST_BASE_URL
 
@@ -180,3 +185,61 @@ async def test_select_timeout_is_wrapped():
     client = PostgrestClient()
     with pytest.raises(PostgrestError, match="timed out"):
         await client.select("team_detail", {}, profile="api")
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_and_http2():
+    first = shared_http_client()
+    assert shared_http_client() is first
+    assert PostgrestClient().http is first
+    # http2=True builds an HTTP/2-capable pool (needs the httpx[http2] extra).
+    assert first._transport._pool._http2 is True
+    await aclose_shared_http_client()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_reopens_after_close():
+    first = shared_http_client()
+    await aclose_shared_http_client()
+    second = shared_http_client()
+    assert second is not first
+    assert not second.is_closed
+    await aclose_shared_http_client()
+
+
+def test_shared_http_client_is_per_event_loop():
+    async def grab():
+        return shared_http_client()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_every_request_uses_the_shared_client():
+    respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    respx.post(f"{TEST_BASE_URL}/rest/v1/rpc/get_data_freshness").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    shared = shared_http_client()
+    await PostgrestClient().select("team_detail", {}, profile="api")
+    await PostgrestClient().rpc("get_data_freshness", {})
+    assert shared_http_client() is shared
+    assert not shared.is_closed
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_explicit_http_client_is_used():
+    respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        return_value=httpx.Response(200, json=[{"school": "Oklahoma"}])
+    )
+    async with httpx.AsyncClient() as http:
+        client = PostgrestClient(http=http)
+        assert client.http is http
+        assert await client.select("team_detail", {}, profile="api") == [{"school": "Oklahoma"}]
@@ -1,5 +1,6 @@
 """Tests for the query_team tool: api.team_detail + api.team_history."""
 
+import asyncio
 import json
 
 import httpx
@@ -64,3 +65,32 @@ async def test_query_team_error_path_returns_error_string():
     result = await query_team(team="Oklahoma")
 
     assert result.startswith("Error:")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_query_team_fetches_both_sources_concurrently():
+    # Each route waits until the other has been requested too: sequential
+    # awaits would deadlock here (and fail on the timeout), concurrent ones
+    # complete.
+    both_started = asyncio.Event()
+    started: set[str] = set()
+
+    async def respond(view, payload):
+        started.add(view)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=2)
+        return httpx.Response(200, json=payload)
+
+    respx.get(f"{TEST_BASE_URL}/rest/v1/team_detail").mock(
+        side_effect=lambda request: respond("team_detail", [{"school": "Oklahoma"}])
+    )
+    respx.get(f"{TEST_BASE_URL}/rest/v1/team_history").mock(
+        side_effect=lambda request: respond("team_history", [{"team": "Oklahoma"}])
+    )
+
+    result = json.loads(await query_team(team="Oklahoma"))
+
+    assert result["team_detail"]["count"] == 1
+    assert result["team_history"]["count"] == 1
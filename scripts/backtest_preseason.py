@@ -19,7 +19,7 @@ A genuine preseason backtest re-scores every game of season S from each team's
 that is knowable in August -- using the frozen fit trained through S-1. That is
 what this script does.
 
-The scoring itself reuses ``score_fitted.score_game`` unchanged, so the design
+The scoring itself reuses ``score_fitted.score_games`` unchanged, so the design
 matrix, imputation, standardization and Platt calibration are byte-identical to
 production. The ONLY difference is which ``team_week`` row is joined.
 ``build_feature_vector`` reads just ``neutral_site`` off the game plus the two
@@ -88,11 +88,23 @@ Usage:
     python scripts/backtest_preseason.py --start 2018 --end 2025
     python scripts/backtest_preseason.py --all-divisions
     python scripts/backtest_preseason.py --no-write         # report only
+    python scripts/backtest_preseason.py --sweep-strength-share 0,0.1,0.2 --workers 8
+
+Scored seasons are cached on disk (--cache-dir, default under
+$XDG_CACHE_HOME) keyed by the frozen fit's fit_at, the team_week
+feature_build_version and a fingerprint of the season's core.games rows, so
+a re-run or a second sweep skips straight to simulation while a corrected or
+re-loaded game is re-scored. --no-cache re-scores everything.
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import os
+import pickle
 import sys
+from pathlib import Path
 
 import numpy as np
 
@@ -100,7 +112,7 @@ from scripts.compute_predictions import get_db_url
 from scripts.score_fitted import (
     fetch_available_train_through,
     load_fit,
-    score_game,
+    score_games,
     select_train_through,
 )
 from scripts.simulate_season import (
@@ -139,6 +151,18 @@ PRESEASON_SLATE_GAMES = 12
 # Calibration buckets for p_bowl_eligible / p_ten_plus reliability.
 CALIBRATION_EDGES = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
 
+# Scored-season cache. Scoring every game of a season from week-1 vectors is
+# the expensive half of a run and depends only on the frozen fit and the
+# team_week build it read, not on anything a sweep varies -- so a scored
+# season is kept on disk between invocations, keyed by both (see
+# scored_cache_key). Bump the format when the cached bundle's shape changes.
+SCORED_CACHE_FORMAT = 1
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "cfb-database"
+    / "backtest_preseason"
+)
+
 # A preseason win-total model landing inside this is respectable (plan 4.5).
 # Advisory only -- this script reports what it measures and does not gate.
 RESPECTABLE_WIN_MAE = 1.5
@@ -265,6 +289,44 @@ def brier(probs: list[float], outcomes: list[bool]) -> float | None:
     return float(np.mean((p - o) ** 2))
 
 
+def scored_cache_key(
+    season: int,
+    train_through: int,
+    fit_version: str | None,
+    feature_build_version: str | None,
+    fbs_only: bool,
+    games_fingerprint: str | None,
+) -> str | None:
+    """Cache key for one scored season, or None when it must not be cached.
+
+    Everything the scored bundle depends on: the frozen fit (its ``fit_at``
+    stamp changes on a refit even when train_through does not), the
+    team_week build the week-1 vectors came from, the season's core.games
+    rows themselves (``fetch_games_fingerprint`` -- a re-loaded or corrected
+    score changes it), the scope that decides the ``fbs`` filter, and the
+    rules applied while scoring. An unknown fit, feature build or game
+    fingerprint cannot be told apart from a changed one, so it is never
+    cached -- a stale scored season would re-report an old model's numbers
+    under the current one's name.
+    """
+    if fit_version is None or feature_build_version is None or games_fingerprint is None:
+        return None
+    payload = {
+        "format": SCORED_CACHE_FORMAT,
+        "model_version": MODEL_VERSION,
+        "season": season,
+        "train_through": train_through,
+        "fit_version": fit_version,
+        "feature_build_version": feature_build_version,
+        "games_fingerprint": games_fingerprint,
+        "fbs_only": fbs_only,
+        "season_type": BACKTEST_SEASON_TYPE,
+        "slate_games": PRESEASON_SLATE_GAMES,
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    return f"{MODEL_VERSION}_s{season}_{digest[:20]}"
+
+
 def build_backtest_row(
     agg: dict,
     *,
@@ -495,6 +557,68 @@ def fetch_feature_build_versions(conn, seasons: list[int]) -> str | None:
     return ",".join(versions) if versions else None
 
 
+def fetch_fit_version(conn, train_through: int) -> str | None:
+    """``fit_at`` of the frozen fit, as a string -- what changes on a refit."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT fit_at FROM features.model_metadata "
+            "WHERE model_version = %s AND train_through_season = %s",
+            (MODEL_VERSION, train_through),
+        )
+        row = cur.fetchone()
+    return row[0].isoformat() if row and row[0] is not None else None
+
+
+# Every core.games column a scored bundle reads -- the games, their scores
+# and flags, and the classifications behind the fbs/bowl fixtures -- over
+# every season type (fetch_fbs_teams does not filter on it).
+GAMES_FINGERPRINT_QUERY = """
+    SELECT COUNT(*),
+           md5(string_agg(
+               concat_ws('|', id, season_type, week, start_date, neutral_site,
+                         home_team, away_team, home_points, away_points, completed,
+                         conference_game, home_classification, away_classification),
+               ',' ORDER BY id))
+    FROM core.games
+    WHERE season = %(season)s
+"""
+
+
+def fetch_games_fingerprint(conn, season: int) -> str | None:
+    """``"<rows>:<md5>"`` over the season's core.games rows, so a re-loaded or
+    corrected game invalidates its season's scored-cache entry."""
+    with conn.cursor() as cur:
+        cur.execute(GAMES_FINGERPRINT_QUERY, {"season": season})
+        row = cur.fetchone()
+    if row is None:
+        return None
+    n_rows, digest = row
+    return f"{int(n_rows)}:{digest or ''}"
+
+
+def load_scored_season(cache_dir: Path, key: str) -> dict | None:
+    path = cache_dir / f"{key}.pkl"
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or foreign file is a cache miss, not a failed backtest.
+        logger.warning("ignoring unreadable scored-season cache %s", path)
+        return None
+
+
+def store_scored_season(cache_dir: Path, key: str, bundle: dict) -> None:
+    """Write-then-rename, so a concurrent or interrupted run never leaves a
+    half-written file under a valid key."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_dir / f"{key}.pkl.{os.getpid()}.tmp"
+    with tmp.open("wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_dir / f"{key}.pkl")
+
+
 # Columns written by this script. backtest_id is identity; computed_at and
 # run_date take their DEFAULTs so the UTC day is decided server-side (same
 # reason simulate_season omits projection_date -- the client's clock must not
@@ -636,8 +760,10 @@ def score_season_preseason(conn, season: int, fit: dict) -> tuple[list[dict], in
     carrying ``expected_home_margin`` and the realized ``actual_margin``,
     plus the number of games dropped by the slate cap."""
     games, dropped = drop_outcome_dependent(fetch_preseason_games(conn, season))
-    for g in games:
-        expected_margin, win_prob = score_game(g, fit)
+    margins, win_probs = score_games(games, fit)
+    for g, expected_margin, win_prob in zip(
+        games, margins.tolist(), win_probs.tolist(), strict=True
+    ):
         g["expected_home_margin"] = expected_margin
         g["home_win_prob"] = win_prob
         g["actual_margin"] = float(g["home_points"] - g["away_points"])
@@ -647,6 +773,52 @@ def score_season_preseason(conn, season: int, fit: dict) -> tuple[list[dict], in
     return games, dropped
 
 
+def score_season_bundle(conn, season: int, train_through: int, fbs_only: bool) -> dict:
+    """Everything PASS 1 needs from the database for one season: the scored
+    games plus the fixtures the simulation pass compares against."""
+    fit = load_fit(conn, train_through)
+    games, dropped = score_season_preseason(conn, season, fit)
+    return {
+        "games": games,
+        "dropped": dropped,
+        "scheduled": fetch_scheduled_counts(conn, season),
+        "fbs": fetch_fbs_teams(conn, season) if fbs_only else None,
+        # ALWAYS fetched, independent of scope (PR #56 review, P2).
+        # `fbs` above is the POPULATION filter and is None under
+        # --all-divisions; this is the BOWL-ELIGIBILITY set, which is a
+        # different question. Without it an --all-divisions run scored
+        # P(6+ wins) for every DIII team into bowl_brier and the bowl
+        # calibration buckets -- measuring a probability that
+        # api.season_outlook deliberately publishes as NULL outside FBS.
+        "bowl_teams": fetch_fbs_teams(conn, season),
+    }
+
+
+def cached_season_bundle(
+    conn, season: int, train_through: int, fbs_only: bool, cache_dir: Path | None
+) -> dict:
+    """``score_season_bundle``, served from ``cache_dir`` when the fit, the
+    feature build and the season's games it was scored under are unchanged."""
+    if cache_dir is None:
+        return score_season_bundle(conn, season, train_through, fbs_only)
+    key = scored_cache_key(
+        season,
+        train_through,
+        fetch_fit_version(conn, train_through),
+        fetch_feature_build_versions(conn, [season]),
+        fbs_only,
+        fetch_games_fingerprint(conn, season),
+    )
+    bundle = load_scored_season(cache_dir, key) if key else None
+    if bundle is not None:
+        logger.info("season %d: scored games loaded from cache (%s)", season, key)
+        return bundle
+    bundle = score_season_bundle(conn, season, train_through, fbs_only)
+    if key:
+        store_scored_season(cache_dir, key, bundle)
+    return bundle
+
+
 def actual_wins_over(games: list[dict]) -> dict:
     """Actual wins per team over exactly `games` -- the simulated subset."""
     wins: dict = {}
@@ -680,6 +852,8 @@ def run_backtest(
     fbs_only: bool,
     shares: list[float],
     write: bool = True,
+    cache_dir: Path | None = None,
+    workers: int = 1,
 ) -> int:
     available = fetch_available_train_through(conn)
     logger.info("frozen fits available for train_through: %s", sorted(available))
@@ -719,8 +893,8 @@ def run_backtest(
 
     for season in usable:
         train_through = select_train_through("backfill", season)
-        fit = load_fit(conn, train_through)
-        games, dropped = score_season_preseason(conn, season, fit)
+        bundle = cached_season_bundle(conn, season, train_through, fbs_only, cache_dir)
+        games, dropped = bundle["games"], bundle["dropped"]
         if not games:
             logger.warning("season %d: no scorable games, skipping", season)
             continue
@@ -762,16 +936,9 @@ def run_backtest(
                 "margin_mae": margin_mae,
                 "truth": actual_wins_over(games),
                 "prior": dict(prior_actuals.get(season - 1, {})),
-                "scheduled": fetch_scheduled_counts(conn, season),
-                "fbs": fetch_fbs_teams(conn, season) if fbs_only else None,
-                # ALWAYS fetched, independent of scope (PR #56 review, P2).
-                # `fbs` above is the POPULATION filter and is None under
-                # --all-divisions; this is the BOWL-ELIGIBILITY set, which is a
-                # different question. Without it an --all-divisions run scored
-                # P(6+ wins) for every DIII team into bowl_brier and the bowl
-                # calibration buckets -- measuring a probability that
-                # api.season_outlook deliberately publishes as NULL outside FBS.
-                "bowl_teams": fetch_fbs_teams(conn, season),
+                "scheduled": bundle["scheduled"],
+                "fbs": bundle["fbs"],
+                "bowl_teams": bundle["bowl_teams"],
             }
         )
         prior_residuals.extend(g["actual_margin"] - g["expected_home_margin"] for g in games)
@@ -782,12 +949,9 @@ def run_backtest(
         return 1
 
     # PASS 2 -- simulate, once per candidate strength share.
-    sweep_rows = []
-    for share in shares:
-        agg = _simulate_pass(scored, n_sims=n_sims, seed=seed, strength_share=share)
-        sweep_rows.append(agg)
-        if len(shares) == 1:
-            _report(agg, fbs_only, share)
+    sweep_rows = _simulate_grid(scored, n_sims=n_sims, seed=seed, shares=shares, workers=workers)
+    if len(shares) == 1:
+        _report(sweep_rows[0], fbs_only, shares[0])
 
     if len(shares) > 1:
         # A sweep is a calibration exercise over candidate configurations, not
@@ -931,27 +1095,109 @@ def _simulate_pass(scored, n_sims: int, seed: int, strength_share: float) -> dic
         ten_probs += [r["p_ten"] for r in rows]
         ten_out += [r["actual_wins"] >= TEN_PLUS_WINS for r in rows]
 
+    return _pass_summary(
+        strength_share,
+        {
+            "per_season": per_season,
+            "proj": all_proj,
+            "act": all_act,
+            "p10": all_p10,
+            "p90": all_p90,
+            "base_prior": base_prior,
+            "base_flat": base_flat,
+            "bowl_probs": bowl_probs,
+            "bowl_out": bowl_out,
+            "ten_probs": ten_probs,
+            "ten_out": ten_out,
+        },
+    )
+
+
+def _pass_summary(strength_share: float, lists: dict) -> dict:
+    """The aggregate ``_simulate_pass`` returns, from its per-row lists."""
+    proj, act = lists["proj"], lists["act"]
     return {
         "strength_share": strength_share,
-        "per_season": per_season,
-        "proj": all_proj,
-        "act": all_act,
-        "p10": all_p10,
-        "p90": all_p90,
-        "base_prior": base_prior,
-        "base_flat": base_flat,
-        "bowl_probs": bowl_probs,
-        "bowl_out": bowl_out,
-        "ten_probs": ten_probs,
-        "ten_out": ten_out,
-        "overall": win_error_metrics(all_proj, all_act),
-        "coverage": interval_coverage(all_act, all_p10, all_p90),
-        "quantiles": residual_quantiles(all_proj, all_act),
-        "bowl_brier": brier(bowl_probs, bowl_out),
-        "ten_brier": brier(ten_probs, ten_out),
+        **lists,
+        "overall": win_error_metrics(proj, act),
+        "coverage": interval_coverage(act, lists["p10"], lists["p90"]),
+        "quantiles": residual_quantiles(proj, act),
+        "bowl_brier": brier(lists["bowl_probs"], lists["bowl_out"]),
+        "ten_brier": brier(lists["ten_probs"], lists["ten_out"]),
     }
 
 
+_PASS_LIST_KEYS = (
+    "per_season",
+    "proj",
+    "act",
+    "p10",
+    "p90",
+    "base_prior",
+    "base_flat",
+    "bowl_probs",
+    "bowl_out",
+    "ten_probs",
+    "ten_out",
+)
+
+
+def merge_passes(parts: list[dict]) -> dict:
+    """One aggregate from single-season ``_simulate_pass`` results.
+
+    Concatenating the per-season lists in season order and recomputing the
+    summaries gives exactly what ``_simulate_pass`` over all the seasons
+    returns -- each season's simulation depends only on that season and the
+    seed -- which is what lets the grid run a cell per (season, share).
+    """
+    shares = {p["strength_share"] for p in parts}
+    if len(shares) != 1:
+        raise ValueError(f"merge_passes needs one strength_share, got {sorted(shares)}")
+    lists = {k: [x for p in parts for x in p[k]] for k in _PASS_LIST_KEYS}
+    return _pass_summary(shares.pop(), lists)
+
+
+_GRID_CTX: dict = {}
+
+
+def _init_grid_worker(ctx: dict) -> None:
+    _GRID_CTX.clear()
+    _GRID_CTX.update(ctx)
+
+
+def _simulate_cell(cell: tuple[int, float]) -> dict:
+    index, share = cell
+    ctx = _GRID_CTX
+    return _simulate_pass(
+        [ctx["scored"][index]], n_sims=ctx["n_sims"], seed=ctx["seed"], strength_share=share
+    )
+
+
+def _simulate_grid(scored, n_sims: int, seed: int, shares: list[float], workers: int = 1):
+    """``[_simulate_pass(scored, ..., share) for share in shares]``, with the
+    (season x share) cells spread over ``workers`` processes.
+
+    The scored seasons are shipped to each worker once (initializer), not per
+    cell. Results are identical to the serial loop for any worker count.
+    """
+    if workers <= 1 or len(scored) * len(shares) <= 1:
+        return [
+            _simulate_pass(scored, n_sims=n_sims, seed=seed, strength_share=share)
+            for share in shares
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    cells = [(i, share) for share in shares for i in range(len(scored))]
+    ctx = {"scored": scored, "n_sims": n_sims, "seed": seed}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_grid_worker, initargs=(ctx,)
+    ) as pool:
+        parts = list(pool.map(_simulate_cell, cells))
+    n = len(scored)
+    return [merge_passes(parts[k * n : (k + 1) * n]) for k in range(len(shares))]
+
+
 def _report_sweep(rows: list[dict]) -> None:
     """Coverage vs strength share -- how rho is chosen rather than guessed.
 
@@ -1109,6 +1355,24 @@ def main() -> None:
         action="store_true",
         help="report only; do not write a predictions.model_backtest snapshot",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes for the (season x strength share) simulation grid (default 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"scored-season cache, keyed by fit, feature build and game data "
+        f"(default {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="re-score every season; neither read nor write the scored-season cache",
+    )
     args = parser.parse_args()
 
     if args.start > args.end:
@@ -1141,6 +1405,8 @@ def main() -> None:
             fbs_only=not args.all_divisions,
             shares=shares,
             write=not args.no_write,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            workers=args.workers,
         )
     finally:
         conn.close()
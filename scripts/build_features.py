@@ -43,6 +43,17 @@ than as nested SQL CASE/COALESCE chains:
 Write: idempotent per-season DELETE + INSERT, one commit per season (same
 pattern as scripts/compute_house_elo.py / scripts/compute_adjusted_epa.py).
 
+Incremental (migration 052): a row at week_index WI only reads data from
+weeks below WI, so once a week is settled every row up to it is final, and
+the rows after it need only the season-to-date sums through it.
+features.team_week_carry holds exactly those sums per team (the same
+per-week aggregates FEATURE_ROWS_QUERY's LATERAL joins add up, pre-summed
+below a through_week_index), and features.team_week_watermark fingerprints
+the schedule and stored pregame Elos below that week. --incremental rebuilds
+only the rows from through_week_index on -- the last completed week plus
+everything upcoming -- reading source data for those weeks alone, then
+advances the carry in the same transaction. Any full build reseeds both tables.
+
 Usage:
     python scripts/build_features.py --from 2015
         Backfill every season from YYYY through the latest season with a
@@ -56,10 +67,15 @@ Usage:
         Build a single season.
 
     python scripts/build_features.py --incremental
-        Shorthand for `--season <current season>`. What the daily workflow
-        runs.
-
-Each season prints a machine-readable gate line after writing:
+        Every projection season, each rebuilt from its carry's
+        through_week_index on -- O(one week) in season. Falls back to the
+        full season when there is no carry yet, it was written by another
+        FEATURE_BUILD_VERSION, or a game was added, removed or (un)completed
+        below its week. What the daily workflow runs. Late corrections to an
+        already-settled week are only picked up by a full `--season` build.
+
+Each season prints a machine-readable gate line after writing (over the rows
+it wrote -- just the rebuilt weeks for an incremental season):
     FEATURES_GATE season={s} rows={n} null_elo={a} null_adj_epa={b}
     adj_src_week={c} adj_src_prior={d} null_std={e} week1_rows={f}
 """
@@ -246,6 +262,73 @@ def resolve_team_week_elo(
     return resolve_elo(team, season, elo_current)
 
 
+def season_carry_through(schedule: list[dict]) -> int | None:
+    """The week_index the season-to-date carry is advanced to after a build,
+    i.e. where the next --incremental run starts rebuilding. ``schedule`` is
+    every core.games row of the season as ``{"week_index", "completed"}``.
+
+    Everything before the first week with an unplayed game is settled, but the
+    most recently completed week is kept OUT of the carry and re-read by the
+    next run: its plays, drives and havoc rows can land a day after the game
+    is marked completed, and re-reading one week is what absorbs that. So the
+    carry runs through the last completed week before the open one (a
+    finished season: its last week). A season with nothing completed yet
+    carries nothing -- the next run rebuilds every row, which it has to anyway
+    while they are all upcoming. None for an empty schedule.
+    """
+    if not schedule:
+        return None
+    week_indexes = sorted({g["week_index"] for g in schedule})
+    open_week_indexes = [g["week_index"] for g in schedule if not g["completed"]]
+    open_week_index = min(open_week_indexes) if open_week_indexes else week_indexes[-1] + 1
+    settled = [wi for wi in week_indexes if wi < open_week_index]
+    return settled[-1] if settled else open_week_index
+
+
+def schedule_fingerprint(schedule: list[dict], week_index: int) -> dict:
+    """What the watermark stores about the weeks its carry covers: the games
+    and completed games with ``week_index`` strictly below the given one, and
+    the sum of their stored pregame Elos (``elo``, home + away, None where
+    analytics.house_elo_game has no row). The Elo sum is there because the
+    rows below the carry are never rewritten by --incremental, and a house
+    Elo season rebuild (a corrected score) moves every later pregame Elo."""
+    below = [g for g in schedule if g["week_index"] < week_index]
+    return {
+        "games_below": len(below),
+        "completed_below": sum(1 for g in below if g["completed"]),
+        "elo_below": sum(g["elo"] for g in below if g.get("elo") is not None),
+    }
+
+
+def incremental_rebuild_reason(watermark: dict | None, schedule: list[dict]) -> str | None:
+    """Decide whether --incremental can rebuild only the rows from
+    ``watermark["through_week_index"]`` on, or must rebuild the season.
+    Returns None to go incremental, else a human-readable reason.
+
+    The carry is only valid while the weeks it covers are exactly as they
+    were: same build version, neither a game added, removed nor (un)completed
+    below its through_week_index, the same stored pregame Elos there, and that
+    week itself still settled (the carry can only move forward). Every row
+    from that week on is recomputed, so anything that changes there is
+    picked up regardless.
+    """
+    if watermark is None:
+        return "no persisted season-to-date carry"
+    if watermark["feature_build_version"] != FEATURE_BUILD_VERSION:
+        return f"carry was built by {watermark['feature_build_version']}"
+    through = watermark["through_week_index"]
+    fingerprint = schedule_fingerprint(schedule, through)
+    if fingerprint["games_below"] != watermark["games_below"]:
+        return f"schedule changed before week_index {through}"
+    if fingerprint["completed_below"] != watermark["completed_below"]:
+        return f"a game's completion changed before week_index {through}"
+    if fingerprint["elo_below"] != watermark["elo_below"]:
+        return f"house Elo changed before week_index {through}"
+    if season_carry_through(schedule) < through:
+        return f"week_index {through} is no longer settled"
+    return None
+
+
 # =============================================================================
 # --- I/O layer --- (SQL does the heavy set ops; Python resolves adj-EPA +
 # upcoming-game Elo per row, then writes).
@@ -298,6 +381,159 @@ def _resolve_projection_seasons() -> list[int]:
         conn.close()
 
 
+def _week_window(alias: str, ceiling: bool = False) -> str:
+    """SQL predicate restricting ``alias`` (a core.games row) to the week
+    window an incremental build reads: ``week_index >= %(from_week_index)s``,
+    and ``< %(to_week_index)s`` when advancing the carry."""
+    week_index = (
+        f"(CASE WHEN {alias}.season_type = 'postseason' THEN 100 + {alias}.week "
+        f"ELSE {alias}.week END)"
+    )
+    clause = f"\n      AND {week_index} >= %(from_week_index)s"
+    if ceiling:
+        clause += f"\n      AND {week_index} < %(to_week_index)s"
+    return clause
+
+
+def _carried_bucket(columns: str, carried: bool) -> str:
+    """The carried season-to-date sums, appended to a per-week aggregate as
+    one extra bucket at ``through_week_index - 1``. Every row an incremental
+    build writes has ``week_index >= through_week_index``, so the existing
+    ``week_index < s.week_index`` LATERAL sums pick the bucket up unchanged,
+    and SUM's NULL handling is the same as if the weeks were still there."""
+    if not carried:
+        return ""
+    return f"\n    UNION ALL\n    SELECT team, through_week_index - 1, {columns}\n    FROM carry"
+
+
+def _week_agg_ctes(window: str = "", carried: bool = False) -> str:
+    """plays_wi .. havoc_week_agg: the per-(team, week_index) pre-aggregates
+    behind every season-to-date column, shared by the row query and
+    CARRY_ADVANCE_SQL. ``window`` filters the source games (see
+    _week_window); ``carried`` folds the ``carry`` CTE in as a bucket."""
+    carried_off = _carried_bucket(
+        "off_sum_epa, off_sum_success, off_sum_explosive, off_n_plays", carried
+    )
+    carried_def = _carried_bucket(
+        "def_sum_epa, def_sum_success, def_sum_explosive, def_n_plays", carried
+    )
+    carried_drive = _carried_bucket("drive_sum_points, drive_n_drives", carried)
+    carried_havoc = _carried_bucket(
+        "def_havoc_events, def_plays, off_havoc_events_allowed, off_plays_allowed", carried
+    )
+    return f"""plays_wi AS (
+    SELECT
+        pe.offense,
+        pe.defense,
+        pe.epa,
+        pe.success,
+        pe.explosive,
+        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index
+    FROM marts.play_epa pe
+    JOIN core.games g ON g.id = pe.game_id
+    WHERE pe.season = %(season)s
+      AND NOT pe.is_garbage_time{window}
+),
+off_week_agg AS (
+    SELECT
+        offense AS team,
+        week_index,
+        SUM(epa) AS sum_epa,
+        SUM(success) AS sum_success,
+        SUM(explosive) AS sum_explosive,
+        COUNT(*) AS n_plays
+    FROM plays_wi
+    GROUP BY offense, week_index{carried_off}
+),
+def_week_agg AS (
+    SELECT
+        defense AS team,
+        week_index,
+        SUM(epa) AS sum_epa,
+        SUM(success) AS sum_success,
+        SUM(explosive) AS sum_explosive,
+        COUNT(*) AS n_plays
+    FROM plays_wi
+    GROUP BY defense, week_index{carried_def}
+),
+-- Migration 048 (starter-pack plan U3, KTD6): exact per-drive points from
+-- core.drives' score delta, not the TD=7/FG=3 estimate marts.scoring_opportunities
+-- uses. Same week-bucket-then-LATERAL-sum pattern as off_week_agg/def_week_agg
+-- above -- pre-aggregate to (team, week_index) once, then sum over
+-- week_index < s.week_index per row.
+drives_wi AS (
+    SELECT
+        d.offense AS team,
+        d.start_offense_score,
+        d.end_offense_score,
+        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index
+    FROM core.drives d
+    JOIN core.games g ON g.id = d.game_id
+    WHERE g.season = %(season)s{window}
+),
+off_drive_week_agg AS (
+    SELECT
+        team,
+        week_index,
+        SUM(end_offense_score - start_offense_score) AS sum_points,
+        COUNT(*) AS n_drives
+    FROM drives_wi
+    WHERE start_offense_score IS NOT NULL AND end_offense_score IS NOT NULL
+    GROUP BY team, week_index{carried_drive}
+),
+-- stats.game_havoc, joined by game_id for the week_index window (design doc
+-- section 1e). defense__* = havoc that team's DEFENSE generated;
+-- offense__* = havoc generated AGAINST that team's OFFENSE (havoc allowed).
+-- offense__* mirrors mart 005's defense__* naming exactly -- dlt flattens
+-- the CFBD response's nested "offense" object the same way it flattens
+-- "defense" -- but is UNVERIFIED against a live information_schema check as
+-- of this writing (mart 005 only live-verified defense__*, noting
+-- offense__* "is present but is unused here"). If this query fails with
+-- "column offense__... does not exist", re-run mart 005's presence check
+-- against stats.game_havoc and fix the two offense__* refs below.
+havoc_wi AS (
+    SELECT
+        gh.team,
+        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index,
+        COALESCE(
+            gh.defense__total_havoc_events::double precision,
+            gh.defense__total_havoc_events__v_double
+        ) AS def_havoc_events,
+        gh.defense__total_plays AS def_plays,
+        COALESCE(
+            gh.offense__total_havoc_events::double precision,
+            gh.offense__total_havoc_events__v_double
+        ) AS off_havoc_events_allowed,
+        gh.offense__total_plays AS off_plays_allowed
+    FROM stats.game_havoc gh
+    JOIN core.games g ON g.id = gh.game_id
+    WHERE g.season = %(season)s{window}
+),
+havoc_week_agg AS (
+    SELECT
+        team,
+        week_index,
+        SUM(def_havoc_events) AS def_havoc_events,
+        SUM(def_plays) AS def_plays,
+        SUM(off_havoc_events_allowed) AS off_havoc_events_allowed,
+        SUM(off_plays_allowed) AS off_plays_allowed
+    FROM havoc_wi
+    GROUP BY team, week_index{carried_havoc}
+),"""
+
+
+# The carried season-to-date sums an incremental build starts from
+# (features.team_week_carry, migration 052): one row per team holding the
+# same sums the week aggregates produce, over every week_index below
+# through_week_index.
+_CARRY_CTE = """carry AS (
+    SELECT *
+    FROM features.team_week_carry
+    WHERE season = %(season)s AND through_week_index = %(from_week_index)s
+),
+"""
+
+
 # One big per-season SELECT: spine (both sides of every core.games row for
 # the season) plus every SQL-computable feature family (design doc sections
 # 1a, 1b-completed-games-only, 1d, 1e, 1f). Adjusted-EPA (1c) and the
@@ -309,8 +545,26 @@ def _resolve_projection_seasons() -> list[int]:
 # then summed for week_index < s.week_index via a LATERAL join -- far
 # cheaper than a LATERAL scanning raw per-play rows, while computing exactly
 # the same weighted average (sum/sum, not an average-of-averages).
-FEATURE_ROWS_QUERY = f"""
-WITH coach_counts AS (
+#
+# --incremental runs the same SELECT over just the spine rows at or after the
+# carry's through_week_index (INCREMENTAL_FEATURE_ROWS_QUERY): the per-week
+# aggregates read only source games from that week on, and everything earlier
+# arrives as the one carried bucket per team (see _carried_bucket), so the
+# LATERAL sums -- and the week_index < s.week_index leak rule -- are untouched.
+def _feature_rows_query(incremental: bool) -> str:
+    """FEATURE_ROWS_QUERY, or its incremental form: the same SELECT over only
+    the spine rows with ``week_index >= %(from_week_index)s``, reading source
+    data from that week on and everything earlier from the carry."""
+    carry_cte = _CARRY_CTE if incremental else ""
+    window = _week_window("g") if incremental else ""
+    gp_window = _week_window("gp") if incremental else ""
+    carried_games = (
+        "COALESCE((SELECT cg.games_played FROM carry cg WHERE cg.team = s.team), 0) + "
+        if incremental
+        else ""
+    )
+    return f"""
+WITH {carry_cte}coach_counts AS (
     -- Coaches CFBD lists per school-year. >1 means a mid-season change; those
     -- school-years are excluded in coach_tenure below (leak guard).
     SELECT school, year, COUNT(*) AS n_coaches
@@ -415,105 +669,7 @@ blue_chip_classes AS (
       AND rc.year BETWEEN %(season)s - {CLASS_WINDOW} AND %(season)s - 1
     GROUP BY 1
 ),
-plays_wi AS (
-    SELECT
-        pe.offense,
-        pe.defense,
-        pe.epa,
-        pe.success,
-        pe.explosive,
-        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index
-    FROM marts.play_epa pe
-    JOIN core.games g ON g.id = pe.game_id
-    WHERE pe.season = %(season)s
-      AND NOT pe.is_garbage_time
-),
-off_week_agg AS (
-    SELECT
-        offense AS team,
-        week_index,
-        SUM(epa) AS sum_epa,
-        SUM(success) AS sum_success,
-        SUM(explosive) AS sum_explosive,
-        COUNT(*) AS n_plays
-    FROM plays_wi
-    GROUP BY offense, week_index
-),
-def_week_agg AS (
-    SELECT
-        defense AS team,
-        week_index,
-        SUM(epa) AS sum_epa,
-        SUM(success) AS sum_success,
-        SUM(explosive) AS sum_explosive,
-        COUNT(*) AS n_plays
-    FROM plays_wi
-    GROUP BY defense, week_index
-),
--- Migration 048 (starter-pack plan U3, KTD6): exact per-drive points from
--- core.drives' score delta, not the TD=7/FG=3 estimate marts.scoring_opportunities
--- uses. Same week-bucket-then-LATERAL-sum pattern as off_week_agg/def_week_agg
--- above -- pre-aggregate to (team, week_index) once, then sum over
--- week_index < s.week_index per row.
-drives_wi AS (
-    SELECT
-        d.offense AS team,
-        d.start_offense_score,
-        d.end_offense_score,
-        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index
-    FROM core.drives d
-    JOIN core.games g ON g.id = d.game_id
-    WHERE g.season = %(season)s
-),
-off_drive_week_agg AS (
-    SELECT
-        team,
-        week_index,
-        SUM(end_offense_score - start_offense_score) AS sum_points,
-        COUNT(*) AS n_drives
-    FROM drives_wi
-    WHERE start_offense_score IS NOT NULL AND end_offense_score IS NOT NULL
-    GROUP BY team, week_index
-),
--- stats.game_havoc, joined by game_id for the week_index window (design doc
--- section 1e). defense__* = havoc that team's DEFENSE generated;
--- offense__* = havoc generated AGAINST that team's OFFENSE (havoc allowed).
--- offense__* mirrors mart 005's defense__* naming exactly -- dlt flattens
--- the CFBD response's nested "offense" object the same way it flattens
--- "defense" -- but is UNVERIFIED against a live information_schema check as
--- of this writing (mart 005 only live-verified defense__*, noting
--- offense__* "is present but is unused here"). If this query fails with
--- "column offense__... does not exist", re-run mart 005's presence check
--- against stats.game_havoc and fix the two offense__* refs below.
-havoc_wi AS (
-    SELECT
-        gh.team,
-        CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index,
-        COALESCE(
-            gh.defense__total_havoc_events::double precision,
-            gh.defense__total_havoc_events__v_double
-        ) AS def_havoc_events,
-        gh.defense__total_plays AS def_plays,
-        COALESCE(
-            gh.offense__total_havoc_events::double precision,
-            gh.offense__total_havoc_events__v_double
-        ) AS off_havoc_events_allowed,
-        gh.offense__total_plays AS off_plays_allowed
-    FROM stats.game_havoc gh
-    JOIN core.games g ON g.id = gh.game_id
-    WHERE g.season = %(season)s
-),
-havoc_week_agg AS (
-    SELECT
-        team,
-        week_index,
-        SUM(def_havoc_events) AS def_havoc_events,
-        SUM(def_plays) AS def_plays,
-        SUM(off_havoc_events_allowed) AS off_havoc_events_allowed,
-        SUM(off_plays_allowed) AS off_plays_allowed
-    FROM havoc_wi
-    GROUP BY team, week_index
-),
+{_week_agg_ctes(window, carried=incremental)}
 -- Spine (design doc section 0): both team-sides of every core.games row for
 -- the season, completed or scheduled.
 spine AS (
@@ -522,14 +678,14 @@ spine AS (
         CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END AS week_index,
         g.home_team AS team, g.home_conference AS conference, true AS is_home
     FROM core.games g
-    WHERE g.season = %(season)s
+    WHERE g.season = %(season)s{window}
     UNION ALL
     SELECT
         g.id, g.season, g.season_type, g.week,
         CASE WHEN g.season_type = 'postseason' THEN 100 + g.week ELSE g.week END,
         g.away_team, g.away_conference, false
     FROM core.games g
-    WHERE g.season = %(season)s
+    WHERE g.season = %(season)s{window}
 )
 SELECT
     s.season,
@@ -651,13 +807,13 @@ LEFT JOIN analytics.house_elo_game he ON he.game_id = s.game_id
 -- GROUP BY), so games_played_to_date is 0 -- never NULL -- for a team's
 -- first game of the season (design doc section 1a).
 LEFT JOIN LATERAL (
-    SELECT COUNT(*) AS games_played_to_date
+    SELECT {carried_games}COUNT(*) AS games_played_to_date
     FROM core.games gp
     WHERE COALESCE(gp.completed, false)
       AND gp.season = s.season
       AND (gp.home_team = s.team OR gp.away_team = s.team)
       AND (CASE WHEN gp.season_type = 'postseason' THEN 100 + gp.week ELSE gp.week END)
-          < s.week_index
+          < s.week_index{gp_window}
 ) gpd ON true
 LEFT JOIN LATERAL (
     SELECT
@@ -706,6 +862,106 @@ LEFT JOIN stats.advanced_team_stats ats
 ORDER BY s.team, s.week_index
 """
 
+
+FEATURE_ROWS_QUERY = _feature_rows_query(incremental=False)
+INCREMENTAL_FEATURE_ROWS_QUERY = _feature_rows_query(incremental=True)
+
+_CARRY_COLUMNS = [
+    "games_played",
+    "off_sum_epa",
+    "off_sum_success",
+    "off_sum_explosive",
+    "off_n_plays",
+    "def_sum_epa",
+    "def_sum_success",
+    "def_sum_explosive",
+    "def_n_plays",
+    "drive_sum_points",
+    "drive_n_drives",
+    "def_havoc_events",
+    "def_plays",
+    "off_havoc_events_allowed",
+    "off_plays_allowed",
+]
+
+# Advance the carry from %(from_week_index)s to %(to_week_index)s: the stored
+# carry at from_week_index plus the per-week aggregates of every source game in
+# [from_week_index, to_week_index), summed per team with the same SUMs the
+# LATERAL joins use -- so the new carry holds exactly what those joins would
+# sum over week_index < to_week_index. Reads the old carry rows before the
+# caller deletes them, in the same transaction.
+CARRY_ADVANCE_SQL = f"""
+INSERT INTO features.team_week_carry (
+    season, team, through_week_index, {", ".join(_CARRY_COLUMNS)}
+)
+WITH {_CARRY_CTE}{_week_agg_ctes(_week_window("g", ceiling=True), carried=True)}
+games_wi AS (
+    SELECT team, SUM(n) AS games_played
+    FROM (
+        SELECT g.home_team AS team, 1 AS n
+        FROM core.games g
+        WHERE g.season = %(season)s
+          AND COALESCE(g.completed, false){_week_window("g", ceiling=True)}
+        UNION ALL
+        SELECT g.away_team, 1
+        FROM core.games g
+        WHERE g.season = %(season)s
+          AND COALESCE(g.completed, false){_week_window("g", ceiling=True)}
+        UNION ALL
+        SELECT team, games_played
+        FROM carry
+    ) x
+    GROUP BY team
+),
+teams AS (
+    SELECT team FROM carry
+    UNION SELECT team FROM games_wi
+    UNION SELECT team FROM off_week_agg
+    UNION SELECT team FROM def_week_agg
+    UNION SELECT team FROM off_drive_week_agg
+    UNION SELECT team FROM havoc_week_agg
+)
+SELECT
+    %(season)s,
+    t.team,
+    %(to_week_index)s,
+    COALESCE(gw.games_played, 0),
+    o.sum_epa, o.sum_success, o.sum_explosive, o.n_plays,
+    d.sum_epa, d.sum_success, d.sum_explosive, d.n_plays,
+    dr.sum_points, dr.n_drives,
+    hv.def_havoc_events, hv.def_plays, hv.off_havoc_events_allowed, hv.off_plays_allowed
+FROM teams t
+LEFT JOIN games_wi gw ON gw.team = t.team
+LEFT JOIN (
+    SELECT team, SUM(sum_epa) AS sum_epa, SUM(sum_success) AS sum_success,
+           SUM(sum_explosive) AS sum_explosive, SUM(n_plays) AS n_plays
+    FROM off_week_agg
+    GROUP BY team
+) o ON o.team = t.team
+LEFT JOIN (
+    SELECT team, SUM(sum_epa) AS sum_epa, SUM(sum_success) AS sum_success,
+           SUM(sum_explosive) AS sum_explosive, SUM(n_plays) AS n_plays
+    FROM def_week_agg
+    GROUP BY team
+) d ON d.team = t.team
+LEFT JOIN (
+    SELECT team, SUM(sum_points) AS sum_points, SUM(n_drives) AS n_drives
+    FROM off_drive_week_agg
+    GROUP BY team
+) dr ON dr.team = t.team
+LEFT JOIN (
+    SELECT team, SUM(def_havoc_events) AS def_havoc_events, SUM(def_plays) AS def_plays,
+           SUM(off_havoc_events_allowed) AS off_havoc_events_allowed,
+           SUM(off_plays_allowed) AS off_plays_allowed
+    FROM havoc_week_agg
+    GROUP BY team
+) hv ON hv.team = t.team
+WHERE t.team IS NOT NULL
+ON CONFLICT (season, through_week_index, team) DO UPDATE SET
+    {", ".join(f"{c} = EXCLUDED.{c}" for c in _CARRY_COLUMNS)}
+"""
+
+
 _INSERT_COLUMNS = [
     "season",
     "season_type",
@@ -759,14 +1015,63 @@ _INSERT_COLUMNS = [
 _INSERT_SQL = f"INSERT INTO features.team_week ({', '.join(_INSERT_COLUMNS)}) VALUES %s"
 
 
-def fetch_feature_rows(conn, season: int) -> list[dict]:
+def fetch_feature_rows(conn, season: int, from_week_index: int | None = None) -> list[dict]:
+    """FEATURE_ROWS_QUERY for the whole season, or with `from_week_index` the
+    incremental query for just the rows at or after it."""
     import psycopg2.extras
 
     with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-        cur.execute(FEATURE_ROWS_QUERY, {"season": season})
+        if from_week_index is None:
+            cur.execute(FEATURE_ROWS_QUERY, {"season": season})
+        else:
+            cur.execute(
+                INCREMENTAL_FEATURE_ROWS_QUERY,
+                {"season": season, "from_week_index": from_week_index},
+            )
         return [dict(row) for row in cur.fetchall()]
 
 
+def fetch_season_schedule(conn, season: int) -> list[dict]:
+    """Every core.games row of `season` as {"week_index", "completed", "elo"}
+    -- the input to season_carry_through / incremental_rebuild_reason."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT g.week, g.season_type, COALESCE(g.completed, false),
+                   he.home_pregame_elo + he.away_pregame_elo
+            FROM core.games g
+            LEFT JOIN analytics.house_elo_game he ON he.game_id = g.id
+            WHERE g.season = %s
+            """,
+            (season,),
+        )
+        return [
+            {
+                "week_index": compute_week_index(week, season_type),
+                "completed": bool(completed),
+                "elo": elo,
+            }
+            for week, season_type, completed, elo in cur.fetchall()
+        ]
+
+
+def fetch_watermark(conn, season: int) -> dict | None:
+    import psycopg2.extras
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(
+            """
+            SELECT through_week_index, games_below, completed_below, elo_below,
+                   feature_build_version
+            FROM features.team_week_watermark
+            WHERE season = %s
+            """,
+            (season,),
+        )
+        row = cur.fetchone()
+    return dict(row) if row else None
+
+
 def fetch_adj_epa_week_rows(conn, season: int) -> dict[str, list[dict]]:
     """analytics.adjusted_epa_week_build rows for `season`, grouped by team,
     for resolve_adj_epa's as-of-week lookup."""
@@ -817,11 +1122,17 @@ def fetch_adj_epa_full_rows(conn, season: int) -> dict[str, dict]:
     return result
 
 
-def build_season_rows(conn, season: int, elo_current: dict[str, tuple[float, int]]) -> list[dict]:
-    """Fetch one season's SQL-computed rows and resolve adj-EPA + Elo
-    fallback in Python (see module docstring). Empty list = clean no-op
-    (no core.games rows for this season)."""
-    raw_rows = fetch_feature_rows(conn, season)
+def build_season_rows(
+    conn,
+    season: int,
+    elo_current: dict[str, tuple[float, int]],
+    from_week_index: int | None = None,
+) -> list[dict]:
+    """Fetch one season's SQL-computed rows -- or, with `from_week_index`,
+    just the rows at or after it -- and resolve adj-EPA + Elo fallback in
+    Python (see module docstring). Empty list = clean no-op (no core.games
+    rows for this season)."""
+    raw_rows = fetch_feature_rows(conn, season, from_week_index)
     if not raw_rows:
         return []
 
@@ -884,16 +1195,80 @@ def build_season_rows(conn, season: int, elo_current: dict[str, tuple[float, int
     return built
 
 
-def write_season(conn, season: int, rows: list[dict]) -> None:
-    """Idempotent per-season write: DELETE then bulk INSERT, one commit."""
+def _advance_carry(cur, season: int, schedule: list[dict], from_week_index: int) -> None:
+    """Move the season's carry + watermark to season_carry_through(schedule),
+    folding in the source weeks from `from_week_index` up to it."""
+    through = season_carry_through(schedule)
+    if through is None:
+        return
+    cur.execute(
+        CARRY_ADVANCE_SQL,
+        {"season": season, "from_week_index": from_week_index, "to_week_index": through},
+    )
+    cur.execute(
+        "DELETE FROM features.team_week_carry WHERE season = %s AND through_week_index <> %s",
+        (season, through),
+    )
+    fingerprint = schedule_fingerprint(schedule, through)
+    cur.execute(
+        """
+        INSERT INTO features.team_week_watermark (
+            season, through_week_index, games_below, completed_below, elo_below,
+            feature_build_version
+        )
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (season) DO UPDATE SET
+            through_week_index = EXCLUDED.through_week_index,
+            games_below = EXCLUDED.games_below,
+            completed_below = EXCLUDED.completed_below,
+            elo_below = EXCLUDED.elo_below,
+            feature_build_version = EXCLUDED.feature_build_version,
+            updated_at = now()
+        """,
+        (
+            season,
+            through,
+            fingerprint["games_below"],
+            fingerprint["completed_below"],
+            fingerprint["elo_below"],
+            FEATURE_BUILD_VERSION,
+        ),
+    )
+
+
+def write_season(
+    conn,
+    season: int,
+    rows: list[dict],
+    schedule: list[dict],
+    from_week_index: int | None = None,
+) -> None:
+    """Idempotent per-season write: DELETE then bulk INSERT, one commit --
+    every row of the season, or with `from_week_index` only the rows at or
+    after it. The carry and watermark (migration 052) advance in the same
+    transaction; a full write reseeds them from the season's first week."""
     from psycopg2.extras import execute_values
 
     cur = conn.cursor()
     try:
-        cur.execute("DELETE FROM features.team_week WHERE season = %s", (season,))
+        if from_week_index is None:
+            cur.execute("DELETE FROM features.team_week WHERE season = %s", (season,))
+            cur.execute("DELETE FROM features.team_week_carry WHERE season = %s", (season,))
+        else:
+            cur.execute(
+                "DELETE FROM features.team_week WHERE season = %s AND week_index >= %s",
+                (season, from_week_index),
+            )
         if rows:
             values = [tuple(r[c] for c in _INSERT_COLUMNS) for r in rows]
             execute_values(cur, _INSERT_SQL, values)
+        if schedule:
+            carry_from = (
+                min(g["week_index"] for g in schedule)
+                if from_week_index is None
+                else from_week_index
+            )
+            _advance_carry(cur, season, schedule, carry_from)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -937,9 +1312,12 @@ def print_gate(season: int, rows: list[dict]) -> None:
     )
 
 
-def compute_seasons(seasons: list[int]) -> int:
+def compute_seasons(seasons: list[int], incremental: bool = False) -> int:
     """Build and write each season. Returns count of failed seasons (an
-    empty/no-op season is NOT a failure)."""
+    empty/no-op season is NOT a failure). With `incremental`, each season
+    rebuilds only the rows from its carry's through_week_index on, falling
+    back to a full season build whenever incremental_rebuild_reason says the
+    carry cannot be trusted."""
     import psycopg2
 
     conn = psycopg2.connect(get_db_url())
@@ -955,15 +1333,27 @@ def compute_seasons(seasons: list[int]) -> int:
         elo_current = fetch_elo_current(conn)
         for season in seasons:
             try:
-                rows = build_season_rows(conn, season, elo_current)
-                if not rows:
+                schedule = fetch_season_schedule(conn, season)
+                from_week_index = None
+                if incremental and schedule:
+                    watermark = fetch_watermark(conn, season)
+                    reason = incremental_rebuild_reason(watermark, schedule)
+                    if reason is None:
+                        from_week_index = watermark["through_week_index"]
+                        logger.info(
+                            f"season={season}: incremental from week_index={from_week_index}"
+                        )
+                    else:
+                        logger.info(f"season={season}: rebuilding the full season: {reason}")
+                rows = build_season_rows(conn, season, elo_current, from_week_index)
+                if not rows and from_week_index is None:
                     logger.info(f"season={season}: no core.games rows found, clean no-op")
                     print(
                         f"FEATURES_GATE season={season} rows=0 null_elo=0 null_adj_epa=0 "
                         "adj_src_week=0 adj_src_prior=0 null_std=0 week1_rows=0"
                     )
                     continue
-                write_season(conn, season, rows)
+                write_season(conn, season, rows, schedule, from_week_index)
                 print_gate(season, rows)
                 logger.info(f"season={season}: wrote {len(rows)} features.team_week row(s)")
             except Exception as e:
@@ -1000,8 +1390,8 @@ def main() -> None:
         action="store_true",
         help="Build every projection season -- the most recent season with completed "
         "games plus every later season with a published schedule "
-        "(src.pipelines.config.years.get_projection_seasons()). What the daily "
-        "workflow runs.",
+        "(src.pipelines.config.years.get_projection_seasons()) -- rebuilding only "
+        "the weeks after each season's settled carry. What the daily workflow runs.",
     )
     args = parser.parse_args()
 
@@ -1035,7 +1425,7 @@ def main() -> None:
         seasons = list(range(args.from_season, last_season + 1))
 
     logger.info(f"Building features.team_week for {len(seasons)} season(s): {seasons}")
-    failures = compute_seasons(seasons)
+    failures = compute_seasons(seasons, incremental=args.incremental)
 
     if failures:
         logger.warning(f"{failures} season(s) failed")
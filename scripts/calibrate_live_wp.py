@@ -9,30 +9,40 @@ state to its game's final outcome (core.games) and pregame expected margin
 (analytics.house_elo_game, via scripts.compute_predictions.elo_margin --
 imported, not re-derived), then grid-searches sigma in
 scripts.poll_scoreboard.house_live_home_wp (also imported, not re-derived) to
-minimize Brier score against those outcomes.
+minimize Brier score against those outcomes, then refines the grid winner to
+a continuous optimum by golden-section search inside its neighbouring cells.
+
+The evaluation is vectorized: states become numpy column arrays once
+(`state_arrays`), the sigma-free part of the formula is computed once, and
+each sigma tried -- grid cell or golden-section probe -- is one array pass.
+`house_live_home_wp_array` evaluates erf as a float64 array expression
+(`_erf`, Cody's rational approximation), so it agrees with the scalar live
+formula's math.erf to within an ulp or two. Rows stream off a server-side
+cursor and are folded into states one game at a time, so fitting over every
+season holds the states, not the raw rows.
 
 Architecture mirrors the rest of the Tier 3 compute scripts: the grid search,
 Brier scoring, decile calibration, sigma-grid parsing, and in-game-state
 reconstruction (`build_states`) are pure -- plain dicts/floats, no I/O -- so
 they are fully unit-testable without a database (see
 tests/test_live_wp.py, which recovers a known synthetic sigma). Everything
-below `# --- I/O layer ---` is a thin wrapper: verify metrics.win_probability's
-actual columns, fetch + join, drive the pure functions, print the report, and
-optionally write live.wp_params.
-
-metrics.win_probability's schema is NOT hardcoded here. win_probability_by_game_resource
-is new (this same Tier 3 phase) and this script has no guarantee it has ever
-been run against a live database when this script itself is exercised, so
-`discover_wp_columns` verifies the table's actual columns via
-information_schema at runtime and fails with a clear message (listing what
-IS there) if the expected shape isn't found, rather than assuming column
-names and getting an opaque "column does not exist" from Postgres.
+below `# --- I/O layer ---` is a thin wrapper: fetch + join, drive the pure
+functions, print the report, and optionally write live.wp_params.
+
+States are read from metrics.win_probability_game -- one row per game with
+the per-play fields packed into play_id-ordered arrays
+(src/schemas/migrations/054_win_probability_game.sql, maintained by the
+metrics_wp loader) -- so each game is a single fetched row that
+`explode_wp_game` unpacks into the per-play dicts build_states takes. Its
+columns are fixed by that migration, which is also where the per-play
+table's dlt column names are pinned.
 
 Usage:
     python scripts/calibrate_live_wp.py
         Grid-search sigma over the default grid (10..24 step 1), print the
-        per-sigma Brier table, the decile calibration curve for the winning
-        sigma, and house-vs-CFBD Brier on the same states. Advisory only --
+        per-sigma Brier table, the continuous (golden-section) fit inside the
+        grid winner's neighbouring cells, the decile calibration curve for
+        the fitted sigma, and house-vs-CFBD Brier on the same states. Advisory only --
         does not write live.wp_params.
 
     python scripts/calibrate_live_wp.py --sigma-grid 12:20:0.5
@@ -40,7 +50,13 @@ Usage:
 
     python scripts/calibrate_live_wp.py --write
         Same as above, then UPDATEs live.wp_params id=1 (sigma,
-        fitted_through_season, n_games, brier, updated_at) with the winning
+        fitted_through_season, n_games, brier, updated_at) with the
+        continuous fit.
+
+    python scripts/calibrate_live_wp.py --fit-by era
+        Also fit sigma per season / era (ERA_START_SEASONS) / quarter and
+        print the per-group table. Advisory: live.wp_params holds one sigma
+        and the live formula takes one, so --write still writes the pooled
         fit.
 
 Prints, at the end:
@@ -49,11 +65,15 @@ Prints, at the end:
 
 import argparse
 import logging
+import math
 import sys
 from collections import defaultdict
+from itertools import groupby
+
+import numpy as np
 
 from scripts.compute_predictions import elo_margin
-from scripts.poll_scoreboard import house_live_home_wp, parse_clock
+from scripts.poll_scoreboard import parse_clock
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -61,6 +81,96 @@ logger = logging.getLogger(__name__)
 DEFAULT_SIGMA_GRID_SPEC = "10:24:1"
 DEFAULT_N_DECILES = 10
 
+# The per-state columns the vectorized path works on: the formula's inputs,
+# plus the outcome they are scored against.
+WP_INPUT_KEYS = ("current_margin", "pregame_expected_margin", "seconds_remaining")
+STATE_KEYS = (*WP_INPUT_KEYS, "home_win")
+
+# Games per round trip when streaming metrics.win_probability_game
+# (fetch_wp_rows) -- one packed row each, ~150 plays unpacked client-side.
+FETCH_ITERSIZE = 500
+
+# poll_scoreboard.house_live_home_wp's default eps (one second of a 3600s game).
+WP_EPS = 1.0 / 3600.0
+
+# Golden-section tolerance on sigma, and the precision the fit is reported and
+# written at -- far finer than the live formula can tell apart.
+SIGMA_TOL = 1e-3
+SIGMA_DECIMALS = 3
+
+# --fit-by era boundaries: the first season of each era after the first. 2023
+# is the clock-rule change (the clock no longer stops on a first down outside
+# the last two minutes of a half), which took roughly eight plays out of a
+# game and so changes how much a margin can still move per second remaining.
+ERA_START_SEASONS = (2023,)
+
+FIT_BY_CHOICES = ("season", "era", "quarter")
+
+# numpy has no erf (and the project carries no scipy), so the array path
+# evaluates W. J. Cody's rational approximations (Math. Comp. 23, 1969; the
+# CALERF coefficients) -- within ~2 ulp of the stdlib math.erf poll_scoreboard
+# uses. Three regimes of |x|: erf directly up to ERF_SMALL, erfc by a rational
+# in |x| up to ERFC_SERIES, erfc by a rational in 1/x^2 beyond; erfc underflows
+# to zero from ERFC_UNDERFLOW on.
+_ERF_SMALL = 0.46875
+_ERFC_SERIES = 4.0
+_ERFC_UNDERFLOW = 27.0
+_ERF_A = (
+    3.16112374387056560e00,
+    1.13864154151050156e02,
+    3.77485237685302021e02,
+    3.20937758913846947e03,
+    1.85777706184603153e-1,
+)
+_ERF_B = (
+    2.36012909523441209e01,
+    2.44024637934444173e02,
+    1.28261652607737228e03,
+    2.84423683343917062e03,
+)
+_ERF_C = (
+    5.64188496988670089e-1,
+    8.88314979438837594e00,
+    6.61191906371416295e01,
+    2.98635138197400131e02,
+    8.81952221241769090e02,
+    1.71204761263407058e03,
+    2.05107837782607147e03,
+    1.23033935479799725e03,
+    2.15311535474403846e-8,
+)
+_ERF_D = (
+    1.57449261107098347e01,
+    1.17693950891312499e02,
+    5.37181101862009858e02,
+    1.62138957456669019e03,
+    3.29079923573345963e03,
+    4.36261909014324716e03,
+    3.43936767414372164e03,
+    1.23033935480374942e03,
+)
+_ERF_P = (
+    3.05326634961232344e-1,
+    3.60344899949804439e-1,
+    1.25781726111229246e-1,
+    1.60837851487422766e-2,
+    6.58749161529837803e-4,
+    1.63153871373020978e-2,
+)
+_ERF_Q = (
+    2.56852019228982242e00,
+    1.87295284992346725e00,
+    5.27905102951428412e-1,
+    6.05183413124413191e-2,
+    2.33520497626869185e-3,
+)
+_INV_SQRT_PI = 1.0 / math.sqrt(math.pi)
+
+# Elements per _erf pass: every regime is evaluated over the whole block, so
+# blocks small enough to keep the temporaries cache-resident are ~2x faster
+# than one pass over a multi-million-state array.
+_ERF_BLOCK = 1 << 16
+
 # =============================================================================
 # Pure core -- no I/O, no DB, unit-tested directly (tests/test_live_wp.py).
 # =============================================================================
@@ -83,31 +193,137 @@ def parse_sigma_grid(spec: str) -> list[float]:
     return [round(lo + i * step, 6) for i in range(n_steps)]
 
 
-def brier_score(predictions: list[float], outcomes: list[float]) -> float:
+def brier_score(predictions, outcomes) -> float:
     """Mean squared error between `predictions` (probabilities) and
-    `outcomes` (0/1). NaN for an empty input (no states to score)."""
-    n = len(predictions)
-    if n == 0:
+    `outcomes` (0/1), lists or arrays. NaN for an empty input (no states to
+    score)."""
+    predictions = np.asarray(predictions, dtype=np.float64)
+    if predictions.size == 0:
         return float("nan")
-    return sum((p - o) ** 2 for p, o in zip(predictions, outcomes)) / n
+    outcomes = np.asarray(outcomes, dtype=np.float64)
+    return float(np.mean((predictions - outcomes) ** 2))
+
+
+def _rational(t: np.ndarray, lead: float, num_coef, den_coef) -> tuple[np.ndarray, np.ndarray]:
+    """Cody's Horner form: numerator and denominator before their constant
+    terms."""
+    num = lead * t
+    den = t.copy()
+    for a, b in zip(num_coef, den_coef):
+        num += a
+        num *= t
+        den += b
+        den *= t
+    return num, den
+
+
+def _erf_block(x: np.ndarray) -> np.ndarray:
+    y = np.abs(x)
+    ys = np.minimum(y, _ERF_SMALL)
+    num, den = _rational(ys * ys, _ERF_A[4], _ERF_A[:3], _ERF_B[:3])
+    small = x * (num + _ERF_A[3]) / (den + _ERF_B[3])
+
+    yc = np.clip(y, _ERF_SMALL, _ERFC_SERIES)
+    num, den = _rational(yc, _ERF_C[8], _ERF_C[:7], _ERF_D[:7])
+    erfc = (num + _ERF_C[7]) / (den + _ERF_D[7])
+    far = y > _ERFC_SERIES
+    if far.any():
+        yf = np.clip(y, _ERFC_SERIES, _ERFC_UNDERFLOW)
+        inv = 1.0 / (yf * yf)
+        num, den = _rational(inv, _ERF_P[5], _ERF_P[:4], _ERF_Q[:4])
+        tail = (_INV_SQRT_PI - inv * (num + _ERF_P[4]) / (den + _ERF_Q[4])) / yf
+        np.copyto(erfc, tail, where=far)
+    # exp(-y^2) split as exp(-head^2) * exp(-(y - head)(y + head)) with head
+    # y truncated to 1/16ths, so the large exponent is formed exactly.
+    yt = np.minimum(y, _ERFC_UNDERFLOW)
+    head = np.trunc(yt * 16.0) / 16.0
+    erfc *= np.exp(-head * head) * np.exp(-(yt - head) * (yt + head))
+    erfc[y >= _ERFC_UNDERFLOW] = 0.0
+    # NaN compares False everywhere, so it falls through to `small`, which
+    # carries it.
+    return np.where((y <= _ERF_SMALL) | np.isnan(y), small, np.copysign(1.0 - erfc, x))
+
+
+def _erf(x) -> np.ndarray:
+    """Elementwise erf over a float64 array (see the _ERF_* constants)."""
+    x = np.asarray(x, dtype=np.float64)
+    if x.size <= _ERF_BLOCK:
+        return _erf_block(x)
+    flat = x.ravel()
+    out = np.empty_like(flat)
+    for lo in range(0, flat.size, _ERF_BLOCK):
+        out[lo : lo + _ERF_BLOCK] = _erf_block(flat[lo : lo + _ERF_BLOCK])
+    return out.reshape(x.shape)
+
+
+def state_arrays(states: list[dict], keys: tuple[str, ...] = STATE_KEYS) -> dict[str, np.ndarray]:
+    """Column arrays over `states` -- built once per calibration run and
+    reused for every sigma evaluated."""
+    return {
+        key: np.fromiter((s[key] for s in states), dtype=np.float64, count=len(states))
+        for key in keys
+    }
+
+
+def wp_terms(arrays: dict[str, np.ndarray], eps: float = WP_EPS) -> tuple[np.ndarray, np.ndarray]:
+    """The sigma-independent half of house_live_home_wp over every state:
+    ``(projected, sqrt(f))``. Computed once; each sigma is then a divide and
+    an erf."""
+    f = np.clip(arrays["seconds_remaining"] / 3600.0, eps, 1.0)
+    projected = arrays["current_margin"] + arrays["pregame_expected_margin"] * f
+    return projected, np.sqrt(f)
+
+
+def wp_from_terms(projected: np.ndarray, sqrt_f: np.ndarray, sigma: float) -> np.ndarray:
+    """Phi(projected / (sigma * sqrt(f))), in the scalar formula's operation
+    order."""
+    z = projected / (sigma * sqrt_f)
+    return 0.5 * (1.0 + _erf(z / math.sqrt(2.0)))
+
+
+def house_live_home_wp_array(
+    current_margin,
+    pregame_expected_margin,
+    seconds_remaining,
+    sigma: float,
+    eps: float = WP_EPS,
+) -> np.ndarray:
+    """poll_scoreboard.house_live_home_wp over arrays of states -- the same
+    formula for every element, to within an ulp or two of the scalar one
+    (`_erf` vs math.erf)."""
+    projected, sqrt_f = wp_terms(
+        {
+            "current_margin": np.asarray(current_margin, dtype=np.float64),
+            "pregame_expected_margin": np.asarray(pregame_expected_margin, dtype=np.float64),
+            "seconds_remaining": np.asarray(seconds_remaining, dtype=np.float64),
+        },
+        eps,
+    )
+    return wp_from_terms(projected, sqrt_f, sigma)
 
 
 def predict_states(states: list[dict], sigma: float) -> list[float]:
     """house_live_home_wp for every state at a given sigma. Each state dict
     needs current_margin, pregame_expected_margin, seconds_remaining."""
-    return [
-        house_live_home_wp(
-            s["current_margin"], s["pregame_expected_margin"], s["seconds_remaining"], sigma
-        )
-        for s in states
-    ]
+    arrays = state_arrays(states, WP_INPUT_KEYS)
+    projected, sqrt_f = wp_terms(arrays)
+    return wp_from_terms(projected, sqrt_f, sigma).tolist()
+
 
+def _brier_objective(arrays: dict[str, np.ndarray]):
+    """sigma -> Brier over `arrays`, with the sigma-free terms precomputed."""
+    projected, sqrt_f = wp_terms(arrays)
+    outcomes = arrays["home_win"]
+    return lambda sigma: brier_score(wp_from_terms(projected, sqrt_f, sigma), outcomes)
 
-def grid_search_sigma(states: list[dict], sigma_grid: list[float]) -> list[tuple[float, float]]:
+
+def grid_search_sigma(states, sigma_grid: list[float]) -> list[tuple[float, float]]:
     """[(sigma, brier), ...] for every sigma in `sigma_grid`, scored against
-    `states`' actual outcomes (state["home_win"], 0/1)."""
-    outcomes = [s["home_win"] for s in states]
-    return [(sigma, brier_score(predict_states(states, sigma), outcomes)) for sigma in sigma_grid]
+    the states' actual outcomes (home_win, 0/1). Accepts state dicts or
+    state_arrays output."""
+    arrays = states if isinstance(states, dict) else state_arrays(states)
+    objective = _brier_objective(arrays)
+    return [(sigma, objective(sigma)) for sigma in sigma_grid]
 
 
 def best_sigma(results: list[tuple[float, float]]) -> tuple[float, float]:
@@ -115,69 +331,196 @@ def best_sigma(results: list[tuple[float, float]]) -> tuple[float, float]:
     return min(results, key=lambda r: r[1])
 
 
-def decile_calibration(
-    predictions: list[float], outcomes: list[float], n_buckets: int = DEFAULT_N_DECILES
+def golden_section_min(fn, lo: float, hi: float, tol: float = SIGMA_TOL) -> tuple[float, float]:
+    """(x, fn(x)) minimizing a unimodal `fn` on [lo, hi] by golden-section
+    search, to within `tol` in x. Returns the best point evaluated, so a
+    minimum at a bracket end is found too."""
+    inv_phi = (math.sqrt(5.0) - 1.0) / 2.0
+    evaluated = {lo: fn(lo), hi: fn(hi)}
+    a, b = lo, hi
+    c = b - inv_phi * (b - a)
+    d = a + inv_phi * (b - a)
+    fc, fd = fn(c), fn(d)
+    evaluated[c], evaluated[d] = fc, fd
+    while b - a > tol:
+        if fc <= fd:
+            b, d, fd = d, c, fc
+            c = b - inv_phi * (b - a)
+            fc = evaluated[c] = fn(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + inv_phi * (b - a)
+            fd = evaluated[d] = fn(d)
+    return min(evaluated.items(), key=lambda kv: kv[1])
+
+
+def fit_sigma(
+    arrays: dict[str, np.ndarray], lo: float, hi: float, tol: float = SIGMA_TOL
+) -> tuple[float, float]:
+    """Continuous Brier-minimizing sigma on [lo, hi], rounded to
+    SIGMA_DECIMALS: ``(sigma, brier)``."""
+    objective = _brier_objective(arrays)
+    sigma, _ = golden_section_min(objective, lo, hi, tol)
+    sigma = round(sigma, SIGMA_DECIMALS)
+    return sigma, objective(sigma)
+
+
+def refine_bracket(
+    sigma_grid: list[float], results: list[tuple[float, float]]
+) -> tuple[float, float]:
+    """The grid cells either side of the grid winner -- where the continuous
+    optimizer searches. The Brier curve is smooth but not guaranteed
+    unimodal over a wide grid, so the grid picks the basin and golden
+    section only refines inside it."""
+    grid = sorted(sigma_grid)
+    i = grid.index(best_sigma(results)[0])
+    return grid[max(i - 1, 0)], grid[min(i + 1, len(grid) - 1)]
+
+
+def era_label(season: int | None) -> str | None:
+    """The --fit-by era a season falls in (see ERA_START_SEASONS)."""
+    if season is None:
+        return None
+    bounds = sorted(ERA_START_SEASONS)
+    starts = [b for b in bounds if b <= season]
+    if not starts:
+        return f"<{bounds[0]}"
+    i = bounds.index(starts[-1])
+    return f"{bounds[i]}-{bounds[i + 1] - 1}" if i + 1 < len(bounds) else f"{bounds[i]}+"
+
+
+def quarter_label(seconds_remaining: float) -> str:
+    """Regulation quarter of a state from its seconds remaining (3600 at
+    kickoff); overtime's zero lands in Q4."""
+    elapsed_quarters = int((3600.0 - min(max(seconds_remaining, 0.0), 3600.0)) // 900)
+    return f"Q{min(elapsed_quarters + 1, 4)}"
+
+
+def group_key(state: dict, fit_by: str) -> str | int | None:
+    if fit_by == "season":
+        return state.get("season")
+    if fit_by == "era":
+        return era_label(state.get("season"))
+    if fit_by == "quarter":
+        return quarter_label(state["seconds_remaining"])
+    raise ValueError(f"unknown --fit-by {fit_by!r}")
+
+
+def fit_sigma_by_group(
+    states: list[dict], fit_by: str, lo: float, hi: float, tol: float = SIGMA_TOL
 ) -> list[dict]:
+    """One continuous sigma per season / era / quarter: [{"group", "n_states",
+    "sigma", "brier"}] in group order. States whose group is unknown (no
+    season) are left out."""
+    grouped: dict = defaultdict(list)
+    for state in states:
+        key = group_key(state, fit_by)
+        if key is not None:
+            grouped[key].append(state)
+    fits = []
+    for key in sorted(grouped, key=str):
+        sigma, brier = fit_sigma(state_arrays(grouped[key]), lo, hi, tol)
+        fits.append({"group": key, "n_states": len(grouped[key]), "sigma": sigma, "brier": brier})
+    return fits
+
+
+def decile_calibration(predictions, outcomes, n_buckets: int = DEFAULT_N_DECILES) -> list[dict]:
     """Sort states by predicted probability, split into `n_buckets` equal-
     count buckets, and report each bucket's mean predicted probability vs.
     empirical (actual) win rate -- a calibration curve. Buckets with zero
     rows (fewer states than buckets) report n=0 rather than dividing by
-    zero."""
-    paired = sorted(zip(predictions, outcomes), key=lambda t: t[0])
-    n = len(paired)
+    zero. One stable sort plus one bincount per column, however many
+    buckets."""
+    predictions = np.asarray(predictions, dtype=np.float64)
+    outcomes = np.asarray(outcomes, dtype=np.float64)
+    n = predictions.size
+    order = np.argsort(predictions, kind="stable")
+    bounds = (np.arange(n_buckets + 1) * n) // n_buckets
+    bucket = np.searchsorted(bounds[1:], np.arange(n), side="right")
+    counts = np.bincount(bucket, minlength=n_buckets)
+    pred_sums = np.bincount(bucket, weights=predictions[order], minlength=n_buckets)
+    out_sums = np.bincount(bucket, weights=outcomes[order], minlength=n_buckets)
+
     buckets = []
     for i in range(n_buckets):
-        lo = (i * n) // n_buckets
-        hi = ((i + 1) * n) // n_buckets
-        chunk = paired[lo:hi]
-        if not chunk:
+        if counts[i] == 0:
             buckets.append(
                 {"decile": i + 1, "n": 0, "predicted_mean": None, "empirical_rate": None}
             )
             continue
-        preds = [p for p, _o in chunk]
-        outs = [o for _p, o in chunk]
         buckets.append(
             {
                 "decile": i + 1,
-                "n": len(chunk),
-                "predicted_mean": sum(preds) / len(preds),
-                "empirical_rate": sum(outs) / len(outs),
+                "n": int(counts[i]),
+                "predicted_mean": float(pred_sums[i] / counts[i]),
+                "empirical_rate": float(out_sums[i] / counts[i]),
             }
         )
     return buckets
 
 
-def build_states(rows: list[dict], columns: dict) -> list[dict]:
-    """Reconstruct in-game states from fetched metrics.win_probability rows
-    (already joined to core.games + analytics.house_elo_game -- see
-    fetch_wp_rows). Pure: takes plain dicts, does no I/O.
+def explode_wp_game(row: dict) -> list[dict]:
+    """Unpack one metrics.win_probability_game row into per-play dicts of the
+    shape build_states takes. Pure.
 
-    `rows` need: game_id, home_score, away_score, cfbd_wp, order_key,
+    The row's parallel arrays (play_numbers, home_wp, home_scores,
+    away_scores) are unpacked element-wise; every other key (game_id,
+    season, final score, pregame Elo) is game-level and copied onto each
+    play. order_key is the play_number, or the play's position in the
+    play_id-ordered arrays when any play_number is missing. Plays without a
+    CFBD WP or either score are dropped, as the per-play query filtered them.
+    """
+    arrays = ("play_numbers", "home_wp", "home_scores", "away_scores")
+    game = {k: v for k, v in row.items() if k not in arrays}
+    play_numbers = row["play_numbers"]
+    if any(n is None for n in play_numbers):
+        play_numbers = range(1, len(play_numbers) + 1)
+
+    plays = []
+    for order_key, cfbd_wp, home_score, away_score in zip(
+        play_numbers, row["home_wp"], row["home_scores"], row["away_scores"], strict=True
+    ):
+        if cfbd_wp is None or home_score is None or away_score is None:
+            continue
+        plays.append(
+            {
+                **game,
+                "order_key": order_key,
+                "cfbd_wp": cfbd_wp,
+                "home_score": home_score,
+                "away_score": away_score,
+            }
+        )
+    return plays
+
+
+def build_states(rows) -> list[dict]:
+    """Reconstruct in-game states from per-play win-probability rows
+    (explode_wp_game's output, already joined to core.games +
+    analytics.house_elo_game -- see fetch_wp_rows). Pure: takes plain dicts,
+    does no I/O.
+
+    `rows` is any iterable of dicts with each game's rows contiguous
+    (fetch_wp_rows streams them ORDER BY game_id); it is consumed one game
+    at a time, so only the states -- never the raw rows -- accumulate. Each
+    row needs game_id, home_score, away_score, cfbd_wp, order_key,
     home_points, away_points, home_pregame_elo, away_pregame_elo,
-    neutral_site, season, and (if `columns` has period/clock resolved)
-    period/clock.
-
-    seconds_remaining: uses period+clock via parse_clock when both columns
-    are present in the source table; otherwise (the expected case for
-    win_probability_by_game_resource today -- it carries no clock, only a
-    play_number ordinal) falls back to play-order-as-fraction-of-game: for
-    each game, seconds_remaining = round(3600 * (1 - rank/span)) where rank
-    is this row's order_key position between the game's min and max
-    order_key. This is a documented approximation, not a true per-play
-    clock read.
+    neutral_site, season, and optionally period/clock.
+
+    seconds_remaining: uses period+clock via parse_clock when the row carries
+    both; otherwise (the expected case for metrics.win_probability_game
+    today -- it carries no clock, only a play_number ordinal) falls back to
+    play-order-as-fraction-of-game: for each game, seconds_remaining =
+    round(3600 * (1 - rank/span)) where rank is this row's order_key position
+    between the game's min and max order_key. This is a documented
+    approximation, not a true per-play clock read.
 
     A game contributes no states if it's missing a pregame Elo pair or its
     final score is a tie (no meaningful home_win label).
     """
-    has_clock = bool(columns.get("period")) and bool(columns.get("clock"))
-
-    by_game: dict[int, list[dict]] = defaultdict(list)
-    for row in rows:
-        by_game[row["game_id"]].append(row)
-
     states: list[dict] = []
-    for game_id, game_rows in by_game.items():
+    for game_id, group in groupby(rows, key=lambda r: r["game_id"]):
+        game_rows = list(group)
         first = game_rows[0]
         home_points = first.get("home_points")
         away_points = first.get("away_points")
@@ -199,7 +542,7 @@ def build_states(rows: list[dict], columns: dict) -> list[dict]:
 
         for row in game_rows:
             seconds_remaining = None
-            if has_clock:
+            if row.get("period") is not None and row.get("clock") is not None:
                 seconds_remaining = parse_clock(row.get("clock"), row.get("period"))
             if seconds_remaining is None:
                 order_key = row.get("order_key")
@@ -231,7 +574,7 @@ def build_states(rows: list[dict], columns: dict) -> list[dict]:
 
 
 # =============================================================================
-# --- I/O layer --- (thin: verify columns, fetch + join, print, write)
+# --- I/O layer --- (thin: fetch + join, print, write)
 # =============================================================================
 
 
@@ -277,107 +620,37 @@ def table_exists(conn, schema: str, table: str) -> bool:
 
 
 WP_TABLE_SCHEMA = "metrics"
-WP_TABLE_NAME = "win_probability"
-
-# Primary candidates match src.pipelines.sources.metrics.win_probability_by_game_resource's
-# documented dlt-snake-cased columns (gameId -> game_id, homeScore ->
-# home_score, homeWinProbability -> home_win_probability, playNumber ->
-# play_number); extra fallbacks are defensive, not confirmed.
-_GAME_ID_CANDIDATES = ("game_id",)
-_HOME_SCORE_CANDIDATES = ("home_score",)
-_AWAY_SCORE_CANDIDATES = ("away_score",)
-_HOME_WIN_PROB_CANDIDATES = ("home_win_probability", "home_win_prob")
-_ORDER_CANDIDATES = ("play_number", "play_num", "play_id")
-_PERIOD_CANDIDATES = ("period",)
-_CLOCK_CANDIDATES = ("clock",)
-
-
-def discover_wp_columns(conn) -> dict:
-    """Resolve metrics.win_probability's logical columns via
-    information_schema instead of hardcoding names. Raises RuntimeError with
-    a clear message -- listing the columns that ARE there -- if a required
-    logical field can't be resolved to any actual column."""
-    with conn.cursor() as cur:
-        cur.execute(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_schema = %s AND table_name = %s",
-            (WP_TABLE_SCHEMA, WP_TABLE_NAME),
-        )
-        available = {row[0] for row in cur.fetchall()}
-
-    if not available:
-        raise RuntimeError(
-            f"{WP_TABLE_SCHEMA}.{WP_TABLE_NAME} does not exist or has no columns -- run "
-            "the metrics_wp backfill (load_season.py --sources metrics_wp) before "
-            "calibrating."
-        )
-
-    def pick(*candidates: str) -> str | None:
-        for candidate in candidates:
-            if candidate in available:
-                return candidate
-        return None
-
-    resolved = {
-        "game_id": pick(*_GAME_ID_CANDIDATES),
-        "home_score": pick(*_HOME_SCORE_CANDIDATES),
-        "away_score": pick(*_AWAY_SCORE_CANDIDATES),
-        "home_win_prob": pick(*_HOME_WIN_PROB_CANDIDATES),
-        "order_col": pick(*_ORDER_CANDIDATES),
-        "period": pick(*_PERIOD_CANDIDATES),
-        "clock": pick(*_CLOCK_CANDIDATES),
-    }
-
-    required = ("game_id", "home_score", "away_score", "home_win_prob", "order_col")
-    missing = [name for name in required if resolved[name] is None]
-    if missing:
-        raise RuntimeError(
-            f"{WP_TABLE_SCHEMA}.{WP_TABLE_NAME} is missing expected column(s) for: "
-            f"{', '.join(missing)}. Available columns: {sorted(available)}. Update "
-            "calibrate_live_wp.py's column candidates to match the actual "
-            "win_probability_by_game_resource schema."
-        )
-
-    return resolved
+WP_TABLE_NAME = "win_probability_game"
+
+_WP_GAMES_SQL = f"""
+    SELECT wp.game_id, wp.play_numbers, wp.home_wp, wp.home_scores, wp.away_scores,
+           g.season, g.home_points, g.away_points,
+           e.home_pregame_elo, e.away_pregame_elo, e.neutral_site
+    FROM {WP_TABLE_SCHEMA}.{WP_TABLE_NAME} wp
+    JOIN core.games g ON g.id = wp.game_id
+    JOIN analytics.house_elo_game e ON e.game_id = wp.game_id
+    WHERE g.completed = true
+      AND g.home_points IS NOT NULL
+      AND g.away_points IS NOT NULL
+    ORDER BY wp.game_id
+"""
 
 
-def fetch_wp_rows(conn, columns: dict) -> list[dict]:
-    """metrics.win_probability rows joined to core.games (final score) and
-    analytics.house_elo_game (pregame Elo), using the resolved column names
-    from discover_wp_columns."""
+def fetch_wp_rows(conn):
+    """Per-play win-probability rows joined to core.games (final score) and
+    analytics.house_elo_game (pregame Elo): one packed
+    metrics.win_probability_game row per game, unpacked by explode_wp_game.
+    A generator over a server-side cursor, so a fit over every season never
+    holds the raw result set client-side on top of the states built from it."""
     import psycopg2.extras
 
-    select_parts = [
-        f"w.{columns['game_id']} AS game_id",
-        f"w.{columns['home_score']} AS home_score",
-        f"w.{columns['away_score']} AS away_score",
-        f"w.{columns['home_win_prob']} AS cfbd_wp",
-        f"w.{columns['order_col']} AS order_key",
-    ]
-    if columns.get("period"):
-        select_parts.append(f"w.{columns['period']} AS period")
-    if columns.get("clock"):
-        select_parts.append(f"w.{columns['clock']} AS clock")
-
-    query = f"""
-        SELECT {", ".join(select_parts)},
-               g.season, g.home_points, g.away_points,
-               e.home_pregame_elo, e.away_pregame_elo, e.neutral_site
-        FROM {WP_TABLE_SCHEMA}.{WP_TABLE_NAME} w
-        JOIN core.games g ON g.id = w.{columns["game_id"]}
-        JOIN analytics.house_elo_game e ON e.game_id = w.{columns["game_id"]}
-        WHERE g.completed = true
-          AND g.home_points IS NOT NULL
-          AND g.away_points IS NOT NULL
-          AND w.{columns["home_win_prob"]} IS NOT NULL
-          AND w.{columns["home_score"]} IS NOT NULL
-          AND w.{columns["away_score"]} IS NOT NULL
-        ORDER BY w.{columns["game_id"]}, w.{columns["order_col"]}
-    """
-
-    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-        cur.execute(query)
-        return [dict(row) for row in cur.fetchall()]
+    with conn.cursor(
+        name="calibrate_live_wp_rows", cursor_factory=psycopg2.extras.RealDictCursor
+    ) as cur:
+        cur.itersize = FETCH_ITERSIZE
+        cur.execute(_WP_GAMES_SQL)
+        for row in cur:
+            yield from explode_wp_game(dict(row))
 
 
 _WRITE_WP_PARAMS_SQL = """
@@ -406,6 +679,22 @@ def print_sigma_table(results: list[tuple[float, float]]) -> None:
         print(f"sigma={sigma:g} brier={brier:.4f}")
 
 
+def print_fit(grid_sigma: float, fit: tuple[float, float], bracket: tuple[float, float]) -> None:
+    sigma, brier = fit
+    print("\n===== CONTINUOUS FIT (golden section) =====")
+    print(f"bracket=[{bracket[0]:g}, {bracket[1]:g}] grid_best={grid_sigma:g}")
+    print(f"sigma={sigma:g} brier={brier:.4f}")
+
+
+def print_group_fits(fit_by: str, fits: list[dict]) -> None:
+    print(f"\n===== SIGMA BY {fit_by.upper()} (advisory) =====")
+    for f in fits:
+        print(
+            f"{fit_by}={f['group']} n_states={f['n_states']} "
+            f"sigma={f['sigma']:g} brier={f['brier']:.4f}"
+        )
+
+
 def print_decile_table(deciles: list[dict]) -> None:
     print("\n===== DECILE CALIBRATION (house model, best sigma) =====")
     for d in deciles:
@@ -418,39 +707,54 @@ def print_decile_table(deciles: list[dict]) -> None:
         )
 
 
-def run(conn, sigma_grid: list[float], write: bool) -> int:
+def run(conn, sigma_grid: list[float], write: bool, fit_by: str | None = None) -> int:
     for schema, table in (("core", "games"), ("analytics", "house_elo_game")):
         if not table_exists(conn, schema, table):
             logger.error(f"{schema}.{table} is missing -- cannot reconstruct in-game states.")
             return 1
 
-    columns = discover_wp_columns(conn)
-    logger.info(f"metrics.win_probability columns resolved: {columns}")
-
-    rows = fetch_wp_rows(conn, columns)
-    if not rows:
+    if not table_exists(conn, WP_TABLE_SCHEMA, WP_TABLE_NAME):
         logger.error(
-            "No metrics.win_probability rows joined to core.games + "
-            "analytics.house_elo_game -- has the metrics_wp backfill run yet?"
+            f"{WP_TABLE_SCHEMA}.{WP_TABLE_NAME} is missing -- apply "
+            "src/schemas/migrations/054_win_probability_game.sql after the metrics_wp "
+            "backfill (load_season.py --sources metrics_wp)."
         )
         return 1
 
-    states = build_states(rows, columns)
+    # The packed rows carry no period/clock, so build_states takes its
+    # play-order fallback for seconds_remaining.
+    states = build_states(fetch_wp_rows(conn))
     if not states:
-        logger.error("Reconstructed zero usable in-game states from the fetched rows.")
+        logger.error(
+            "Reconstructed zero usable in-game states -- no metrics.win_probability_game "
+            "rows joined to core.games + analytics.house_elo_game, or none usable. "
+            "Has the metrics_wp backfill run yet?"
+        )
         return 1
 
-    results = grid_search_sigma(states, sigma_grid)
+    arrays = state_arrays(states)
+    results = grid_search_sigma(arrays, sigma_grid)
     print_sigma_table(results)
 
-    sigma, brier = best_sigma(results)
-    outcomes = [s["home_win"] for s in states]
-    house_preds = predict_states(states, sigma)
-    cfbd_preds = [s["cfbd_wp"] for s in states]
-    cfbd_brier = brier_score(cfbd_preds, outcomes)
+    bracket = refine_bracket(sigma_grid, results)
+    sigma, brier = fit_sigma(arrays, *bracket)
+    print_fit(best_sigma(results)[0], (sigma, brier), bracket)
+
+    outcomes = arrays["home_win"]
+    house_preds = house_live_home_wp_array(
+        arrays["current_margin"],
+        arrays["pregame_expected_margin"],
+        arrays["seconds_remaining"],
+        sigma,
+    )
+    cfbd_brier = brier_score([s["cfbd_wp"] for s in states], outcomes)
 
     print_decile_table(decile_calibration(house_preds, outcomes))
 
+    if fit_by:
+        grid = sorted(sigma_grid)
+        print_group_fits(fit_by, fit_sigma_by_group(states, fit_by, grid[0], grid[-1]))
+
     n_states = len(states)
     n_games = len({s["game_id"] for s in states})
     seasons = [s["season"] for s in states if s.get("season") is not None]
@@ -487,6 +791,12 @@ def main() -> None:
         help="Write the winning sigma (+ fit metadata) to live.wp_params id=1. "
         "Without this flag the run is advisory-only.",
     )
+    parser.add_argument(
+        "--fit-by",
+        choices=FIT_BY_CHOICES,
+        help="Also fit sigma separately per season, rule era, or game quarter and "
+        "print the table. Advisory: --write still writes the pooled sigma.",
+    )
     args = parser.parse_args()
 
     try:
@@ -499,7 +809,7 @@ def main() -> None:
 
     conn = psycopg2.connect(get_db_url())
     try:
-        exit_code = run(conn, sigma_grid, args.write)
+        exit_code = run(conn, sigma_grid, args.write, args.fit_by)
     except Exception:
         conn.rollback()
         logger.exception("Calibration failed")
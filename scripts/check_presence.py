@@ -55,6 +55,7 @@ TIER_2_GATE_TABLES: list[tuple[str, str]] = [
     ("analytics", "adjusted_epa_build"),
     ("predictions", "game_predictions"),
     ("betting", "line_snapshots"),
+    ("betting", "line_intervals"),
 ]
 
 # Tier 3 tables (walk-forward EPA, features, fitted models, live in-game)
@@ -67,6 +68,7 @@ TIER_3_GATE_TABLES: list[tuple[str, str]] = [
     ("features", "model_metadata"),
     ("live", "scoreboard_snapshots"),
     ("live", "wp_params"),
+    ("live", "latest_snapshot"),
     ("metrics", "win_probability"),
 ]
 
@@ -25,6 +25,7 @@ Usage:
     python scripts/compute_drive_chain.py --era 2021+       # one era
     python scripts/compute_drive_chain.py --full --validate # + gates 1/3
     python scripts/compute_drive_chain.py --full --no-bootstrap
+    python scripts/compute_drive_chain.py --full --workers 4  # bootstrap pool size
 
 Prints one machine-readable line per era after writing:
     EP_VALIDATION era=<e> states=<n> monotone_zone=<pass|FAIL> \
@@ -32,9 +33,12 @@ Prints one machine-readable line per era after writing:
 """
 
 import argparse
+import functools
 import logging
+import os
 import sys
 from collections import Counter, defaultdict
+from dataclasses import dataclass
 
 import numpy as np
 
@@ -209,6 +213,10 @@ def grandparent_key(state: str) -> str:
 def build_transitions(plays: list[dict]) -> tuple[Counter, Counter, int]:
     """Count snapshot->snapshot transitions from ordered scrimmage plays.
 
+    Row-dict reference implementation: run_era uses the columnar
+    build_transitions_columnar(), which must return identical counts
+    (tests/test_drive_chain.py holds the two together).
+
     `plays` rows need: game_id, drive_id, play_number, down, distance,
     yards_to_goal, drive_result. Rows are grouped by (game_id, drive_id) and
     ordered by play_number; the last play of a drive absorbs into
@@ -253,6 +261,118 @@ def build_transitions(plays: list[dict]) -> tuple[Counter, Counter, int]:
     return transitions, per_game, drive_outcomes, n_mapped, unmapped_drives
 
 
+# Integer state codes for the columnar path: code = ((down - 1) * len(BUCKETS)
+# + bucket) * 10 + (zone - 1), so STATE_KEYS[code] == state_key(...). The
+# absorbing outcomes follow the transient codes: ABSORB_CODE0 + ABSORBING
+# index.
+BUCKETS = ("goal", "standard", "short", "med", "long", "xlong")
+STATE_KEYS = tuple(
+    f"d{down}|{bucket}|z{zone}"
+    for down in range(1, 5)
+    for bucket in BUCKETS
+    for zone in range(1, 11)
+)
+ABSORB_CODE0 = len(STATE_KEYS)
+CODE_KEYS = STATE_KEYS + ABSORBING
+N_CODES = len(CODE_KEYS)
+
+
+def encode_states(down: np.ndarray, distance: np.ndarray, yards_to_goal: np.ndarray) -> np.ndarray:
+    """Vectorized state_key(): the integer code of each snapshot's state."""
+    down = np.asarray(down, dtype=np.int64)
+    distance = np.asarray(distance, dtype=np.int64)
+    ytg = np.asarray(yards_to_goal, dtype=np.int64)
+    zone = np.clip((ytg + 9) // 10, 1, 10)
+    first = np.select(
+        [distance == 10, distance < 10],
+        [BUCKETS.index("standard"), BUCKETS.index("short")],
+        BUCKETS.index("long"),
+    )
+    later = np.select(
+        [distance <= 3, distance <= 6, distance <= 10],
+        [BUCKETS.index("short"), BUCKETS.index("med"), BUCKETS.index("long")],
+        BUCKETS.index("xlong"),
+    )
+    bucket = np.where(distance >= ytg, BUCKETS.index("goal"), np.where(down == 1, first, later))
+    return ((down - 1) * len(BUCKETS) + bucket) * 10 + (zone - 1)
+
+
+def build_transitions_columnar(
+    game_id: np.ndarray,
+    new_drive: np.ndarray,
+    down: np.ndarray,
+    distance: np.ndarray,
+    yards_to_goal: np.ndarray,
+    absorb: np.ndarray,
+) -> tuple[Counter, tuple, Counter, int, int]:
+    """build_transitions() over column arrays, with no per-play Python.
+
+    Inputs are parallel arrays, one entry per scrimmage play, ALREADY sorted
+    by (game_id, drive_id, play_number) -- PLAYS_QUERY sorts in SQL.
+    `new_drive` is True on each drive's first play; `absorb` is the drive's
+    ABSORBING index, or -1 for an unmapped drive_result.
+
+    States are integer codes (encode_states); a drive's transitions are the
+    shifted-array pairs (code[i], code[i+1]) that stay inside the drive plus
+    its last code -> ABSORB_CODE0 + absorb, counted with np.unique.
+
+    Returns the same counts as build_transitions(), except per_game comes
+    back as game_transition_matrix()'s sparse (games x transitions) COO tuple
+    -- the form bootstrap_se consumes -- instead of a Counter, which at era
+    scale is millions of tuple keys.
+    """
+    game_id = np.asarray(game_id, dtype=np.int64)
+    new_drive = np.asarray(new_drive, dtype=bool)
+    absorb = np.asarray(absorb, dtype=np.int64)
+    n = len(game_id)
+    if n == 0:
+        return Counter(), game_transition_matrix(Counter()), Counter(), 0, 0
+
+    codes = encode_states(down, distance, yards_to_goal)
+    starts = np.flatnonzero(new_drive)
+    ends = np.append(starts[1:], n) - 1
+    drive_absorb = absorb[starts]
+    mapped = drive_absorb >= 0
+    n_mapped = int(mapped.sum())
+    unmapped = int(len(starts) - n_mapped)
+
+    drive_of_play = np.cumsum(new_drive) - 1
+    play_mapped = mapped[drive_of_play]
+    inner = ~new_drive[1:] & play_mapped[:-1]
+
+    src = np.concatenate([codes[:-1][inner], codes[ends[mapped]]])
+    dst = np.concatenate([codes[1:][inner], ABSORB_CODE0 + drive_absorb[mapped]])
+    games = np.concatenate([game_id[:-1][inner], game_id[ends[mapped]]])
+    pair = src * N_CODES + dst
+
+    def key_of(code: int) -> tuple[str, str]:
+        return CODE_KEYS[code // N_CODES], CODE_KEYS[code % N_CODES]
+
+    uniq_pairs, pair_n = np.unique(pair, return_counts=True)
+    pair_keys = [key_of(k) for k in uniq_pairs]
+    transitions = Counter(dict(zip(pair_keys, pair_n.tolist())))
+    starts_uniq, starts_n = np.unique(
+        codes[starts[mapped]] * N_CODES + ABSORB_CODE0 + drive_absorb[mapped], return_counts=True
+    )
+    drive_outcomes = Counter({key_of(k): n for k, n in zip(starts_uniq, starts_n.tolist())})
+
+    # per_game COO over unique (game, pair) cells. Columns follow
+    # game_transition_matrix()'s order (transitions sorted by string key).
+    order = sorted(range(len(pair_keys)), key=pair_keys.__getitem__)
+    column_of = np.empty(len(order), dtype=np.int64)
+    column_of[order] = np.arange(len(order))
+    game_list, game_idx = np.unique(games, return_inverse=True)
+    cells, cell_n = np.unique(game_idx * (N_CODES * N_CODES) + pair, return_counts=True)
+    per_game = (
+        game_list.tolist(),
+        [pair_keys[i] for i in order],
+        cells // (N_CODES * N_CODES),
+        column_of[np.searchsorted(uniq_pairs, cells % (N_CODES * N_CODES))],
+        cell_n.astype(np.float64),
+    )
+    return transitions, per_game, drive_outcomes, n_mapped, unmapped
+
+
 def shrink(transitions: Counter, alpha: float = DEFAULT_ALPHA) -> dict[tuple, float]:
     """Empirical-Bayes shrink each row toward its parent's distribution.
 
@@ -311,76 +431,372 @@ def shrink(transitions: Counter, alpha: float = DEFAULT_ALPHA) -> dict[tuple, fl
     return shrunk
 
 
-def _chain_matrices(probs: dict[tuple, float]):
-    """Shared chain assembly: transient ordering, N = (I-Q)^-1, and R.
-
-    (I - Q) is invertible because every state reaches an absorbing outcome
-    (every drive ends). A target that is neither transient nor absorbing
-    cannot occur: shrink() only emits observed/parent targets.
-    """
-    transient = sorted({a for (a, _) in probs})
-    t_index = {s: i for i, s in enumerate(transient)}
-    a_index = {s: i for i, s in enumerate(ABSORBING)}
-    nt, na = len(transient), len(ABSORBING)
-
-    Q = np.zeros((nt, nt))
-    R = np.zeros((nt, na))
-    for (a, b), p in probs.items():
-        if b in t_index:
-            Q[t_index[a], t_index[b]] = p
-        elif b in a_index:
-            R[t_index[a], a_index[b]] = p
+class AbsorbingChain:
+    """The drive-state absorbing chain for one set of shrunk probabilities.
 
-    N = np.linalg.solve(np.eye(nt) - Q, np.eye(nt))
-    return transient, t_index, a_index, N, R
+    Stored sparse: Q (transient -> transient) and R (transient -> absorbing)
+    are index/value arrays, assembled without per-cell dict lookups when the
+    caller already holds indices (the bootstrap). The fundamental matrix
+    N = (I - Q)^-1 is solved ONCE, lazily, and cached on the instance, so one
+    chain per era serves solve_ep, solve_net_ep and the validation gates
+    that consume their outputs. (I - Q) is invertible because every state
+    reaches an absorbing outcome (every drive ends).
 
+    The solve itself is dense LAPACK: at the current ~160 states (and well
+    past 1k with finer bucketing) one dense solve is cheaper than any sparse
+    factorization, and keeps numpy the compute extra's only dependency.
+    """
 
-def solve_ep(probs: dict[tuple, float]) -> tuple[dict[str, float], dict[tuple, float]]:
+    def __init__(
+        self,
+        transient: list[str],
+        q_src: np.ndarray,
+        q_dst: np.ndarray,
+        q_p: np.ndarray,
+        r_src: np.ndarray,
+        r_dst: np.ndarray,
+        r_p: np.ndarray,
+    ) -> None:
+        self.transient = transient
+        self.t_index = {s: i for i, s in enumerate(transient)}
+        self.a_index = {s: i for i, s in enumerate(ABSORBING)}
+        self.q = (q_src, q_dst, q_p)
+        self.r = (r_src, r_dst, r_p)
+
+    @classmethod
+    def from_probs(cls, probs: dict[tuple, float]) -> "AbsorbingChain":
+        """Chain from a shrink() dict. A target that is neither transient nor
+        absorbing cannot occur: shrink() only emits observed/parent targets
+        (and would be dropped here, as before)."""
+        transient = sorted({a for (a, _) in probs})
+        t_index = {s: i for i, s in enumerate(transient)}
+        a_index = {s: i for i, s in enumerate(ABSORBING)}
+        keys = list(probs)
+        src = np.fromiter((t_index[a] for a, _ in keys), dtype=np.int64, count=len(keys))
+        t_dst = np.fromiter((t_index.get(b, -1) for _, b in keys), dtype=np.int64, count=len(keys))
+        a_dst = np.fromiter((a_index.get(b, -1) for _, b in keys), dtype=np.int64, count=len(keys))
+        p = np.fromiter((probs[k] for k in keys), dtype=np.float64, count=len(keys))
+        is_t, is_a = t_dst >= 0, a_dst >= 0
+        return cls(transient, src[is_t], t_dst[is_t], p[is_t], src[is_a], a_dst[is_a], p[is_a])
+
+    @functools.cached_property
+    def R(self) -> np.ndarray:
+        src, dst, p = self.r
+        R = np.zeros((len(self.transient), len(ABSORBING)))
+        R[src, dst] = p
+        return R
+
+    @functools.cached_property
+    def fundamental(self) -> np.ndarray:
+        """N = (I - Q)^-1: expected visits to t starting from s."""
+        nt = len(self.transient)
+        src, dst, p = self.q
+        i_minus_q = np.eye(nt)
+        i_minus_q[src, dst] -= p
+        return np.linalg.solve(i_minus_q, np.eye(nt))
+
+    @functools.cached_property
+    def absorption(self) -> np.ndarray:
+        """B = N R: P(absorb in a | start s)."""
+        return self.fundamental @ self.R
+
+    @functools.cached_property
+    def zones(self) -> np.ndarray:
+        return np.array([zone_of(s) for s in self.transient])
+
+    def expected_points(self) -> np.ndarray:
+        """Drive-basis EP per transient state: B v."""
+        v = np.array([ABSORB_VALUES.get(s, 0.0) for s in ABSORBING])
+        return self.absorption @ v
+
+
+def as_chain(probs: "dict[tuple, float] | AbsorbingChain") -> AbsorbingChain:
+    return probs if isinstance(probs, AbsorbingChain) else AbsorbingChain.from_probs(probs)
+
+
+def solve_ep(
+    probs: "dict[tuple, float] | AbsorbingChain",
+) -> tuple[dict[str, float], dict[tuple, float]]:
     """Solve the absorbing chain: EP per transient state + absorption probs.
 
     EP = (I - Q)^-1 R v with Q transient->transient, R transient->absorbing,
     v the ABSORB_VALUES vector. Returns (ep by state, absorption probability
-    by (state, absorbing)).
+    by (state, absorbing)). Pass an AbsorbingChain to reuse its cached
+    fundamental matrix (run_era shares one with solve_net_ep).
     """
-    transient, t_index, a_index, N, R = _chain_matrices(probs)
-    B = N @ R  # absorption probabilities
-    v = np.array([ABSORB_VALUES.get(s, 0.0) for s in ABSORBING])
-    ep = B @ v
+    chain = as_chain(probs)
+    B = chain.absorption
+    ep = chain.expected_points()
 
-    ep_by_state = {s: float(ep[i]) for s, i in t_index.items()}
+    ep_by_state = {s: float(ep[i]) for s, i in chain.t_index.items()}
     absorb_probs = {
-        (s, abs_s): float(B[t_index[s], a_index[abs_s]]) for s in transient for abs_s in ABSORBING
+        (s, abs_s): float(B[i, j])
+        for s, i in chain.t_index.items()
+        for abs_s, j in chain.a_index.items()
     }
     return ep_by_state, absorb_probs
 
 
-def bootstrap_se(
+@dataclass(frozen=True)
+class ShrinkPlan:
+    """shrink() compiled to index arrays over one fixed set of observed
+    transitions, so any reweighting of their counts (a bootstrap replicate)
+    is shrunk with a few bincounts instead of dict-building per replicate.
+
+    obs_* arrays are indexed by observed transition (the order of
+    `transitions`); cell_* arrays by candidate output cell -- every (from,
+    to) pair shrink() can emit for the full sample. A replicate only ever
+    sees a subset of the observed transitions, so its own candidate set is a
+    subset of these cells; the extras evaluate to exactly 0.
+    """
+
+    transitions: list[tuple]
+    states: list[str]
+    targets: list[str]
+    obs_state: np.ndarray
+    obs_parent: np.ndarray
+    obs_grand: np.ndarray
+    obs_target: np.ndarray
+    cell_state: np.ndarray
+    cell_target: np.ndarray
+    cell_obs: np.ndarray  # index into `transitions`, or -1 if never observed
+    cell_parent: np.ndarray
+    cell_grand: np.ndarray
+    target_state: np.ndarray  # per target: index into `states`, or -1
+    target_absorb: np.ndarray  # per target: index into ABSORBING, or -1
+    n_parents: int
+    n_grands: int
+
+
+def shrink_plan(transitions: list[tuple]) -> ShrinkPlan:
+    """Compile shrink()'s bookkeeping for the observed (from, to) keys."""
+    states = sorted({a for (a, _) in transitions})
+    targets = sorted({b for (_, b) in transitions})
+    parents = sorted({parent_key(a) for a in states})
+    grands = sorted({grandparent_key(a) for a in states})
+    s_idx = {s: i for i, s in enumerate(states)}
+    t_idx = {b: i for i, b in enumerate(targets)}
+    p_idx = {k: i for i, k in enumerate(parents)}
+    g_idx = {k: i for i, k in enumerate(grands)}
+
+    # Same candidate rule as shrink(): observed targets plus every target the
+    # parent or grandparent has seen.
+    parent_targets: dict[str, set] = defaultdict(set)
+    grand_targets: dict[str, set] = defaultdict(set)
+    own_targets: dict[str, set] = defaultdict(set)
+    for a, b in transitions:
+        own_targets[a].add(b)
+        parent_targets[parent_key(a)].add(b)
+        grand_targets[grandparent_key(a)].add(b)
+    obs_index = {key: i for i, key in enumerate(transitions)}
+    cells = [
+        (a, b)
+        for a in states
+        for b in sorted(
+            own_targets[a] | parent_targets[parent_key(a)] | grand_targets[grandparent_key(a)]
+        )
+    ]
+
+    def arr(values) -> np.ndarray:
+        return np.fromiter(values, dtype=np.int64)
+
+    return ShrinkPlan(
+        transitions=list(transitions),
+        states=states,
+        targets=targets,
+        obs_state=arr(s_idx[a] for a, _ in transitions),
+        obs_parent=arr(p_idx[parent_key(a)] for a, _ in transitions),
+        obs_grand=arr(g_idx[grandparent_key(a)] for a, _ in transitions),
+        obs_target=arr(t_idx[b] for _, b in transitions),
+        cell_state=arr(s_idx[a] for a, _ in cells),
+        cell_target=arr(t_idx[b] for _, b in cells),
+        cell_obs=arr(obs_index.get(c, -1) for c in cells),
+        cell_parent=arr(p_idx[parent_key(a)] for a, _ in cells),
+        cell_grand=arr(g_idx[grandparent_key(a)] for a, _ in cells),
+        target_state=arr(s_idx.get(b, -1) for b in targets),
+        target_absorb=arr(ABSORBING.index(b) if b in ABSORBING else -1 for b in targets),
+        n_parents=len(parents),
+        n_grands=len(grands),
+    )
+
+
+def shrink_counts(
+    plan: ShrinkPlan, counts: np.ndarray, alpha: float = DEFAULT_ALPHA
+) -> tuple[np.ndarray, np.ndarray]:
+    """shrink() on a count vector aligned with plan.transitions.
+
+    Returns (p per plan cell, row totals per plan state). The same formula
+    as shrink(), evaluated with bincounts; a state with a zero row total is
+    absent from this sample and its cells must be dropped by the caller,
+    exactly as shrink() never emits them.
+    """
+    nt = len(plan.targets)
+    row_tot = np.bincount(plan.obs_state, counts, minlength=len(plan.states))
+    par_cnt = np.bincount(plan.obs_parent * nt + plan.obs_target, counts, plan.n_parents * nt)
+    par_tot = np.bincount(plan.obs_parent, counts, plan.n_parents)
+    grd_cnt = np.bincount(plan.obs_grand * nt + plan.obs_target, counts, plan.n_grands * nt)
+    grd_tot = np.bincount(plan.obs_grand, counts, plan.n_grands)
+
+    g_den = grd_tot[plan.cell_grand]
+    g = np.divide(
+        grd_cnt[plan.cell_grand * nt + plan.cell_target],
+        g_den,
+        out=np.zeros(len(plan.cell_state)),
+        where=g_den > 0,
+    )
+    p_den = par_tot[plan.cell_parent] + alpha
+    p_parent = np.divide(
+        par_cnt[plan.cell_parent * nt + plan.cell_target] + alpha * g,
+        p_den,
+        out=np.zeros(len(plan.cell_state)),
+        where=p_den > 0,
+    )
+    observed = np.where(plan.cell_obs >= 0, counts[plan.cell_obs], 0.0)
+    p = (observed + alpha * p_parent) / (row_tot[plan.cell_state] + alpha)
+    return p, row_tot
+
+
+def _solve_plan_ep(plan: ShrinkPlan, p: np.ndarray, row_tot: np.ndarray) -> np.ndarray:
+    """EP per plan state for one shrunk replicate; NaN where the state is
+    absent from the replicate (row total 0), matching solve_ep() over the
+    dict shrink() would have produced for the same counts."""
+    present = row_tot > 0
+    pos = np.full(len(plan.states), -1)
+    pos[present] = np.arange(int(present.sum()))
+
+    keep = present[plan.cell_state] & (p > 0)
+    src = pos[plan.cell_state[keep]]
+    to_t = plan.target_state[plan.cell_target[keep]]
+    to_a = plan.target_absorb[plan.cell_target[keep]]
+    pk = p[keep]
+    is_t, is_a = to_t >= 0, to_a >= 0
+    chain = AbsorbingChain(
+        [s for s, keep_s in zip(plan.states, present) if keep_s],
+        src[is_t],
+        pos[to_t[is_t]],
+        pk[is_t],
+        src[is_a],
+        to_a[is_a],
+        pk[is_a],
+    )
+    out = np.full(len(plan.states), np.nan)
+    out[present] = chain.expected_points()
+    return out
+
+
+def game_transition_matrix(
     per_game: Counter,
+) -> tuple[list, list[tuple], np.ndarray, np.ndarray, np.ndarray]:
+    """per_game counts as a sparse (games x transitions) matrix in COO form.
+
+    Returns (games, transitions, rows, cols, vals): entry k says game
+    games[rows[k]] made transition transitions[cols[k]] vals[k] times. A
+    reweighting of games w then gives transition counts w @ M as a single
+    np.bincount(cols, w[rows] * vals) -- the sparse matvec, without a
+    scipy dependency.
+    """
+    games = sorted({g for (g, _, _) in per_game})
+    transitions = sorted({(a, b) for (_, a, b) in per_game})
+    g_idx = {g: i for i, g in enumerate(games)}
+    t_idx = {t: i for i, t in enumerate(transitions)}
+    keys = list(per_game)
+    rows = np.fromiter((g_idx[g] for g, _, _ in keys), dtype=np.int64, count=len(keys))
+    cols = np.fromiter((t_idx[(a, b)] for _, a, b in keys), dtype=np.int64, count=len(keys))
+    vals = np.fromiter((per_game[k] for k in keys), dtype=np.float64, count=len(keys))
+    return games, transitions, rows, cols, vals
+
+
+# Per-process bootstrap context, installed once per worker by
+# _init_bootstrap_worker so each task ships only its replicate seeds.
+_BOOT_CTX: dict = {}
+
+
+def _init_bootstrap_worker(ctx: dict) -> None:
+    _BOOT_CTX.clear()
+    _BOOT_CTX.update(ctx)
+
+
+def _bootstrap_replicates(seeds: list) -> np.ndarray:
+    """EP per plan state for each replicate seed (rows), NaN where absent.
+
+    Drawing the game weights as Multinomial(n_games, 1/n_games) is exactly
+    resampling n_games games with replacement: the weight is how many times
+    each game was drawn.
+    """
+    ctx = _BOOT_CTX
+    plan: ShrinkPlan = ctx["plan"]
+    rows, cols, vals = ctx["rows"], ctx["cols"], ctx["vals"]
+    n_games = ctx["n_games"]
+    uniform = np.full(n_games, 1.0 / n_games)
+    out = np.empty((len(seeds), len(plan.states)))
+    for i, seed in enumerate(seeds):
+        w = np.random.default_rng(seed).multinomial(n_games, uniform)
+        counts = np.bincount(cols, w[rows] * vals, minlength=len(plan.transitions))
+        p, row_tot = shrink_counts(plan, counts, ctx["alpha"])
+        out[i] = _solve_plan_ep(plan, p, row_tot)
+    return out
+
+
+def bootstrap_se(
+    per_game: Counter | tuple,
     alpha: float = DEFAULT_ALPHA,
     n_boot: int = BOOTSTRAP_B,
     seed: int = BOOTSTRAP_SEED,
+    workers: int = 1,
 ) -> dict[str, float]:
     """Game-cluster bootstrap SE of ep_drive per state.
 
     Resample games with replacement, rebuild counts, re-shrink, re-solve.
     Clustering by game (not play) preserves within-game correlation --
     the Brill/Yurko/Wyner objection to naive play-level resampling.
+
+    Vectorized: per-game counts are held once as a sparse (games x
+    transitions) matrix (build_transitions_columnar() already returns it in
+    that form), each replicate is a multinomial game-weight vector (one
+    bincount matvec for its counts), and shrink() runs as precompiled
+    index arrays (ShrinkPlan). Replicates get independent child seeds of
+    `seed`, so the result is identical for any `workers`; workers > 1
+    spreads them over a process pool.
     """
-    games = sorted({g for (g, _, _) in per_game})
-    by_game: dict = defaultdict(Counter)
-    for (g, a, b), n in per_game.items():
-        by_game[g][(a, b)] += n
-
-    rng = np.random.default_rng(seed)
-    samples: dict[str, list[float]] = defaultdict(list)
-    for _ in range(n_boot):
-        counts: Counter = Counter()
-        for g in rng.choice(games, size=len(games), replace=True):
-            counts.update(by_game[g])
-        ep, _ = solve_ep(shrink(counts, alpha))
-        for s, val in ep.items():
-            samples[s].append(val)
-    return {s: float(np.std(vals, ddof=1)) for s, vals in samples.items() if len(vals) > 1}
+    if isinstance(per_game, Counter):
+        per_game = game_transition_matrix(per_game)
+    games, transitions, rows, cols, vals = per_game
+    if not games:
+        return {}
+    plan = shrink_plan(transitions)
+    ctx = {
+        "plan": plan,
+        "rows": rows,
+        "cols": cols,
+        "vals": vals,
+        "n_games": len(games),
+        "alpha": alpha,
+    }
+    seeds = np.random.SeedSequence(seed).spawn(n_boot)
+
+    if workers > 1 and n_boot > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        n_chunks = min(n_boot, workers * 4)
+        chunks = [seeds[i::n_chunks] for i in range(n_chunks)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_bootstrap_worker, initargs=(ctx,)
+        ) as pool:
+            parts = list(pool.map(_bootstrap_replicates, chunks))
+        # Undo the strided chunking so row r is replicate r again.
+        samples = np.empty((n_boot, len(plan.states)))
+        for i, part in enumerate(parts):
+            samples[i::n_chunks] = part
+    else:
+        _init_bootstrap_worker(ctx)
+        samples = _bootstrap_replicates(seeds)
+
+    n_obs = np.sum(~np.isnan(samples), axis=0)
+    se = {}
+    for j, state in enumerate(plan.states):
+        if n_obs[j] > 1:
+            se[state] = float(np.nanstd(samples[:, j], ddof=1))
+    return se
 
 
 # =============================================================================
@@ -449,12 +865,19 @@ def build_handoffs(
     return handoffs
 
 
+def handoff_matrix(rows: dict[int, dict[int, float]]) -> np.ndarray:
+    """One outcome's build_handoffs() rows as a 10x10 array: [exit_zone - 1,
+    opp_zone - 1]."""
+    return np.array([[rows[e][z] for z in range(1, 11)] for e in range(1, 11)])
+
+
 def zone_of(state: str) -> int:
     return int(state.rsplit("z", 1)[1])
 
 
 def solve_net_ep(
-    probs: dict[tuple, float], handoffs: dict[str, dict[int, dict[int, float]]]
+    probs: "dict[tuple, float] | AbsorbingChain",
+    handoffs: dict[str, dict[int, dict[int, float]]],
 ) -> dict[str, float]:
     """Next-score expected points per transient state (the CFBD-comparable
     basis: value of the NEXT scoring event in the half, sign = this offense).
@@ -470,26 +893,23 @@ def solve_net_ep(
     END_OF_HALF outcomes; a zero-leak chain (pure punt alternation) is
     singular and cannot occur in real data.
     """
-    transient, t_index, a_index, N, R = _chain_matrices(probs)
-    nt = len(transient)
-    zones = np.array([zone_of(s) for s in transient])
+    chain = as_chain(probs)
+    N, R, t_index = chain.fundamental, chain.R, chain.t_index
 
     # C[s]: terminal contributions. D[s, z]: handoff mass into opponent zone z.
     v_term = np.array([ABSORB_VALUES.get(a, 0.0) for a in ABSORBING])
     is_term = np.array([a not in HANDOFF_ABSORBING for a in ABSORBING])
     C = N @ (R[:, is_term] @ v_term[is_term])
 
-    D = np.zeros((nt, 10))
+    # mass(s, t, cls) = N[s, t] * R[t, cls], spread over opponent zones by
+    # the exit zone's handoff row: D = N @ sum_cls R[:, cls] * H_cls, where
+    # H_cls gathers each transient state's exit-zone row by index array.
+    exit_rows = chain.zones - 1
+    G = np.zeros((len(chain.transient), 10))
     for cls in HANDOFF_ABSORBING:
-        r_cls = R[:, a_index[cls]]  # P(absorb via cls | exit t)
-        # mass(s, t) = N[s, t] * r_cls[t]; spread over opponent zones by the
-        # exit zone's handoff row.
-        H = np.zeros((nt, 10))
-        for ti in range(nt):
-            row = handoffs[cls][int(zones[ti])]
-            for z in range(1, 11):
-                H[ti, z - 1] = row[z]
-        D += (N * r_cls[np.newaxis, :]) @ H
+        H_cls = handoff_matrix(handoffs[cls])[exit_rows]
+        G += R[:, chain.a_index[cls], np.newaxis] * H_cls
+    D = N @ G
 
     # Restrict to the 10 handoff states and solve (I + D_h) x = C_h.
     h_states = [handoff_state(z) for z in range(1, 11)]
@@ -599,14 +1019,19 @@ GARBAGE_TIME_SQL = """(
       (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
 )"""
 
+# Columnar: every column is an integer and rows arrive sorted by (game_id,
+# drive_id, play_number), so build_transitions_columnar() can read drive
+# boundaries off new_drive and pair consecutive plays by shifting arrays.
+# drive_result is mapped to its ABSORB_MAP key's position in %(results)s
+# (0 = unmapped) server-side, so no per-play strings cross the wire.
 PLAYS_QUERY = f"""
     SELECT p.game_id,
-           p.drive_id,
-           p.play_number,
+           (lag(p.drive_id) OVER w IS DISTINCT FROM p.drive_id
+            OR lag(p.game_id) OVER w IS DISTINCT FROM p.game_id)::int AS new_drive,
            p.down,
            p.distance,
            p.yards_to_goal,
-           d.drive_result
+           COALESCE(array_position(%(results)s::text[], upper(d.drive_result)), 0) AS result_pos
     FROM core.plays p
     JOIN core.drives d ON d.id = p.drive_id AND d.game_id = p.game_id
     WHERE p.season BETWEEN %(start)s AND %(end)s
@@ -616,8 +1041,12 @@ PLAYS_QUERY = f"""
       AND p.yards_to_goal BETWEEN 1 AND 99
       AND NOT {GARBAGE_TIME_SQL}
       AND d.drive_result <> 'POSSESSION (FOR OT DRIVES)'
+    WINDOW w AS (ORDER BY p.game_id, p.drive_id, p.play_number)
+    ORDER BY p.game_id, p.drive_id, p.play_number
 """
 
+PLAY_COLUMN_CHUNK = 200_000
+
 
 def get_db_url() -> str:
     """Get database URL from dlt secrets or environment.
@@ -626,8 +1055,6 @@ def get_db_url() -> str:
     compute_*.py script keeps its own copy rather than importing across
     scripts for this one utility).
     """
-    import os
-
     import dlt
 
     url = None
@@ -736,12 +1163,34 @@ def fetch_drive_pairs(conn, start: int, end: int) -> dict[tuple, int]:
     return pairs
 
 
-def fetch_plays(conn, start: int, end: int) -> list[dict]:
-    from psycopg2.extras import RealDictCursor
+def fetch_play_columns(conn, start: int, end: int) -> dict[str, np.ndarray]:
+    """PLAYS_QUERY as int64 column arrays (keys: game_id, new_drive, down,
+    distance, yards_to_goal, absorb), streamed through a server-side cursor
+    in PLAY_COLUMN_CHUNK-row blocks so only one block of row tuples is ever
+    alive. absorb is the ABSORBING index of the drive's outcome, -1 if
+    unmapped."""
+    results = sorted(ABSORB_MAP)
+    # result_pos is 1-based into `results`; 0 (unmapped) lands on the -1 slot.
+    pos_to_absorb = np.array([-1] + [ABSORBING.index(ABSORB_MAP[r]) for r in results])
 
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(PLAYS_QUERY, {"start": start, "end": end, "types": list(SCRIMMAGE_TYPES)})
-        return [dict(r) for r in cur.fetchall()]
+    blocks = []
+    with conn.cursor(name="drive_chain_plays") as cur:
+        cur.itersize = PLAY_COLUMN_CHUNK
+        cur.execute(
+            PLAYS_QUERY,
+            {"start": start, "end": end, "types": list(SCRIMMAGE_TYPES), "results": results},
+        )
+        while rows := cur.fetchmany(PLAY_COLUMN_CHUNK):
+            blocks.append(np.asarray(rows, dtype=np.int64))
+    data = np.concatenate(blocks) if blocks else np.empty((0, 6), dtype=np.int64)
+    return {
+        "game_id": data[:, 0],
+        "new_drive": data[:, 1].astype(bool),
+        "down": data[:, 2],
+        "distance": data[:, 3],
+        "yards_to_goal": data[:, 4],
+        "absorb": pos_to_absorb[data[:, 5]],
+    }
 
 
 def write_era(
@@ -800,17 +1249,26 @@ def write_era(
     logger.info("%s: wrote %d transitions, %d states", era, len(trans_rows), len(state_rows))
 
 
-def run_era(conn, era: str, alpha: float, do_bootstrap: bool, do_validate: bool) -> int:
+def run_era(
+    conn, era: str, alpha: float, do_bootstrap: bool, do_validate: bool, workers: int = 1
+) -> int:
     start, end = ERAS[era]
     end = end if end is not None else 9999
     logger.info("Era %s: fetching scrimmage plays %d..%s", era, start, end)
-    plays = fetch_plays(conn, start, end)
-    logger.info("Era %s: %d plays", era, len(plays))
-    if not plays:
+    cols = fetch_play_columns(conn, start, end)
+    logger.info("Era %s: %d plays", era, len(cols["game_id"]))
+    if not len(cols["game_id"]):
         logger.error("Era %s: no plays -- is marts.play_epa refreshed?", era)
         return 1
 
-    transitions, per_game, drive_outcomes, n_mapped, unmapped = build_transitions(plays)
+    transitions, per_game, drive_outcomes, n_mapped, unmapped = build_transitions_columnar(
+        cols["game_id"],
+        cols["new_drive"],
+        cols["down"],
+        cols["distance"],
+        cols["yards_to_goal"],
+        cols["absorb"],
+    )
     share = unmapped / max(1, n_mapped + unmapped)
     max_share = MAX_UNMAPPED_SHARE_BY_ERA.get(era, MAX_UNMAPPED_SHARE)
     logger.info(
@@ -825,12 +1283,16 @@ def run_era(conn, era: str, alpha: float, do_bootstrap: bool, do_validate: bool)
         return 1
 
     shrunk = shrink(transitions, alpha)
-    ep, absorb_probs = solve_ep(shrunk)
+    # One chain per era: its fundamental matrix is solved once and shared by
+    # the drive-basis solve, the net solve and (through their outputs) the
+    # validation gates.
+    chain = AbsorbingChain.from_probs(shrunk)
+    ep, absorb_probs = solve_ep(chain)
 
     end_season = ERAS[era][1] if ERAS[era][1] is not None else 9999
     pairs = fetch_drive_pairs(conn, ERAS[era][0], end_season)
     handoffs = build_handoffs(pairs)
-    ep_net = solve_net_ep(shrunk, handoffs)
+    ep_net = solve_net_ep(chain, handoffs)
 
     # Gates run BEFORE the write (PR #71 review, P1): write_era commits, so
     # validating afterwards published implausible values through
@@ -867,7 +1329,7 @@ def run_era(conn, era: str, alpha: float, do_bootstrap: bool, do_validate: bool)
             )
             return 1
 
-    se = bootstrap_se(per_game, alpha) if do_bootstrap else {}
+    se = bootstrap_se(per_game, alpha, workers=workers) if do_bootstrap else {}
     write_era(conn, era, transitions, shrunk, ep, ep_net, absorb_probs, se)
     return 0
 
@@ -880,6 +1342,12 @@ def main() -> None:
     parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
     parser.add_argument("--no-bootstrap", action="store_true")
     parser.add_argument("--validate", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for the bootstrap replicate solves (default: all cores)",
+    )
     args = parser.parse_args()
 
     import psycopg2
@@ -889,7 +1357,7 @@ def main() -> None:
         eras = sorted(ERAS) if args.full else [args.era]
         rc = 0
         for era in eras:
-            rc |= run_era(conn, era, args.alpha, not args.no_bootstrap, args.validate)
+            rc |= run_era(conn, era, args.alpha, not args.no_bootstrap, args.validate, args.workers)
     finally:
         conn.close()
     sys.exit(rc)
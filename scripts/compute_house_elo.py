@@ -27,10 +27,18 @@ Usage:
         the season + snapshot are rewritten.
 
     python scripts/compute_house_elo.py --incremental
-        Shorthand for `--season <max season in core.games with completed
-        games>`. What the daily workflow runs.
-
-Both modes print a validation line after writing:
+        What the daily workflow runs. Resumes the engine from
+        analytics.house_elo_state (migration 050, written by every --full /
+        --season run) for the current season (max season in core.games with
+        completed games), processes only games completed since the
+        watermark, and appends just those rows plus the snapshot/state rows
+        they touched -- O(new games). Falls back to `--season <current>`
+        when there is no state for this season, or an already-processed
+        game changed (score, kickoff, neutral site), the schedule moved a
+        team's pooling alias, or a new game sorts before the watermark.
+
+Every mode prints a validation line after writing (over the rows it
+computed -- just the appended games for an incremental append):
     ELO_VALIDATION n=<rows> pearson_r=<r to 4 decimals>
 comparing our home_pregame_elo to CFBD's own home_pregame_elo for
 season >= 2015 rows where CFBD's value is present (expect r >~ 0.9).
@@ -118,6 +126,16 @@ class EloEngine:
         for the season most recently started (itself, or POOLED)."""
         return self.alias.get(team, team)
 
+    @classmethod
+    def alias_map(cls, team_game_counts: dict[str, int]) -> dict[str, str]:
+        """{team: POOLED or itself} for a season's scheduled game counts --
+        the alias map start_season() installs, computed without touching
+        engine state (so --incremental can check whether it moved)."""
+        return {
+            team: cls.POOLED if count < cls.POOL_THRESHOLD else team
+            for team, count in team_game_counts.items()
+        }
+
     def start_season(self, season: int, team_game_counts: dict[str, int]) -> None:
         """Begin a new season: rebuild the pooling alias map and apply
         season-carryover regression to teams about to play.
@@ -136,10 +154,8 @@ class EloEngine:
         shot from its true last-played rating -- no compounding across
         empty seasons.
         """
-        self.alias = {}
+        self.alias = self.alias_map(team_game_counts)
         self.games_played = {}
-        for team, count in team_game_counts.items():
-            self.alias[team] = self.POOLED if count < self.POOL_THRESHOLD else team
 
         # The pooled bucket has no persistent identity of its own -- it
         # resets to the seed rating at the start of every season.
@@ -274,6 +290,90 @@ class EloEngine:
             )
         return rows
 
+    def export_state(self) -> list[dict]:
+        """Serialize the full engine state as one dict per rating key (every
+        real team plus POOLED), for analytics.house_elo_state. A key missing
+        from one of the engine's dicts exports None for that field, so
+        from_state() round-trips exactly."""
+        keys = (
+            set(self.ratings)
+            | set(self.last_season)
+            | set(self.alias)
+            | set(self.games_played)
+            | set(self.last_game_id)
+        )
+        return [
+            {
+                "team": key,
+                "rating": self.ratings.get(key),
+                "last_season": self.last_season.get(key),
+                "alias": self.alias.get(key),
+                "games_played": self.games_played.get(key),
+                "last_game_id": self.last_game_id.get(key),
+                "last_game_date": self.last_game_date.get(key),
+            }
+            for key in sorted(keys)
+        ]
+
+    @classmethod
+    def from_state(cls, rows: list[dict]) -> "EloEngine":
+        """Rebuild an engine mid-season from export_state() rows. The result
+        continues exactly where the exporting engine stopped: do NOT call
+        start_season() on it again, or carryover is applied twice."""
+        engine = cls()
+        for row in rows:
+            key = row["team"]
+            if row["rating"] is not None:
+                engine.ratings[key] = float(row["rating"])
+            if row["last_season"] is not None:
+                engine.last_season[key] = int(row["last_season"])
+            if row["alias"] is not None:
+                engine.alias[key] = row["alias"]
+            if row["games_played"] is not None:
+                engine.games_played[key] = int(row["games_played"])
+            if row["last_game_id"] is not None:
+                engine.last_game_id[key] = row["last_game_id"]
+                engine.last_game_date[key] = row["last_game_date"]
+        return engine
+
+
+def game_order_key(game: dict) -> tuple:
+    """Sort key matching GAMES_QUERY's ORDER BY start_date NULLS LAST, id,
+    for an engine-shaped game (or a watermark with the same two keys)."""
+    start_date = game.get("start_date")
+    if start_date is None:
+        return (1, 0, game["game_id"])
+    return (0, start_date, game["game_id"])
+
+
+def incremental_rebuild_reason(
+    engine: EloEngine,
+    watermark: dict,
+    scheduled_counts: dict[str, int],
+    changed_game_ids: list[int],
+    new_games: list[dict],
+) -> str | None:
+    """Decide whether --incremental can append `new_games` to the resumed
+    `engine`, or must rebuild the season. Returns None to append, else a
+    human-readable reason.
+
+    Appending is only equivalent to a rebuild when (a) nothing the engine
+    already consumed has changed, (b) the season's pooling aliases -- which
+    come from the full schedule -- are the ones the engine ran under, and (c)
+    every new game sorts after the last processed one, so replay order is
+    unchanged.
+    """
+    if changed_game_ids:
+        n = len(changed_game_ids)
+        return f"{n} already-processed game(s) changed (e.g. {changed_game_ids[0]})"
+    if EloEngine.alias_map(scheduled_counts) != engine.alias:
+        return "pooling aliases changed with the season schedule"
+    if new_games and watermark.get("game_id") is not None:
+        first = min(new_games, key=game_order_key)
+        if game_order_key(first) <= game_order_key(watermark):
+            return f"game {first['game_id']} completed out of order (before the watermark)"
+    return None
+
 
 def pearson_r(xs: list[float], ys: list[float]) -> float:
     """Pure-Python Pearson correlation coefficient (stdlib only, no numpy)."""
@@ -466,6 +566,91 @@ def seed_state(engine: EloEngine, conn, target_season: int) -> None:
             engine.last_season[team] = season
 
 
+# --incremental: completed games of the season with no house_elo_game row
+# yet. Same columns and order as GAMES_QUERY, so to_engine_game() applies.
+NEW_GAMES_QUERY = """
+    SELECT g.id, g.season, g.week, g.season_type, g.start_date, g.neutral_site,
+           g.home_team, g.away_team, g.home_points, g.away_points,
+           g.home_pregame_elo, g.away_pregame_elo
+    FROM core.games g
+    WHERE g.completed = true
+      AND g.home_points IS NOT NULL
+      AND g.away_points IS NOT NULL
+      AND g.season = %s
+      AND NOT EXISTS (
+          SELECT 1 FROM analytics.house_elo_game h WHERE h.game_id = g.id
+      )
+    ORDER BY g.start_date NULLS LAST, g.id
+"""
+
+# --incremental: already-processed games whose engine inputs no longer match
+# core.games -- a corrected score (only the margin reaches the engine), a
+# moved kickoff (replay order), a flipped neutral_site flag (HFA), or a game
+# that vanished or was un-completed. Any hit forces a season rebuild.
+CHANGED_GAMES_QUERY = """
+    SELECT h.game_id
+    FROM analytics.house_elo_game h
+    LEFT JOIN core.games g ON g.id = h.game_id
+    WHERE h.season = %s
+      AND (
+          g.id IS NULL
+          OR g.completed IS NOT TRUE
+          OR g.home_points IS NULL
+          OR g.away_points IS NULL
+          OR g.home_points - g.away_points <> h.actual_home_margin
+          OR g.start_date IS DISTINCT FROM h.start_date
+          OR COALESCE(g.neutral_site, false) <> h.neutral_site
+      )
+    ORDER BY h.game_id
+"""
+
+
+def load_state(conn) -> tuple[EloEngine, dict | None]:
+    """Restore the engine from analytics.house_elo_state. The watermark is
+    None when no state has been persisted yet."""
+    import psycopg2.extras
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(
+            """
+            SELECT season, last_start_date AS start_date, last_game_id AS game_id,
+                   games_processed
+            FROM analytics.house_elo_watermark
+            """
+        )
+        row = cur.fetchone()
+        watermark = dict(row) if row else None
+        cur.execute(
+            """
+            SELECT team, rating, last_season, alias, games_played, last_game_id,
+                   last_game_date
+            FROM analytics.house_elo_state
+            """
+        )
+        engine = EloEngine.from_state([dict(r) for r in cur.fetchall()])
+    return engine, watermark
+
+
+def fetch_new_games(conn, season: int) -> list[dict]:
+    import psycopg2.extras
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(NEW_GAMES_QUERY, (season,))
+        return [dict(r) for r in cur.fetchall()]
+
+
+def fetch_changed_game_ids(conn, season: int) -> list[int]:
+    with conn.cursor() as cur:
+        cur.execute(CHANGED_GAMES_QUERY, (season,))
+        return [row[0] for row in cur.fetchall()]
+
+
+def fetch_processed_count(conn, season: int) -> int:
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM analytics.house_elo_game WHERE season = %s", (season,))
+        return cur.fetchone()[0]
+
+
 def fetch_max_season(conn) -> int | None:
     with conn.cursor() as cur:
         cur.execute("SELECT MAX(season) FROM core.games")
@@ -480,50 +665,154 @@ def fetch_max_completed_season(conn) -> int | None:
     return row[0] if row else None
 
 
-def write_season(conn, season: int, rows: list[dict]) -> None:
-    """Idempotent per-season write: DELETE then bulk INSERT, one commit."""
+GAME_INSERT_SQL = """
+    INSERT INTO analytics.house_elo_game (
+        game_id, season, week, season_type, start_date, neutral_site,
+        home_team, away_team, home_pregame_elo, away_pregame_elo,
+        home_postgame_elo, away_postgame_elo, home_win_prob,
+        expected_home_margin, actual_home_margin, mov_multiplier,
+        cfbd_home_pregame_elo, cfbd_away_pregame_elo
+    ) VALUES %s
+"""
+
+SNAPSHOT_INSERT_SQL = """
+    INSERT INTO analytics.house_elo_current (
+        team, season, rating, games_played, last_game_id,
+        last_game_date, low_confidence, updated_at
+    ) VALUES %s
+"""
+
+STATE_INSERT_SQL = """
+    INSERT INTO analytics.house_elo_state (
+        team, rating, last_season, alias, games_played, last_game_id,
+        last_game_date, updated_at
+    ) VALUES %s
+"""
+
+UPSERT_SNAPSHOT_SUFFIX = """
+    ON CONFLICT (team) DO UPDATE SET
+        season = EXCLUDED.season,
+        rating = EXCLUDED.rating,
+        games_played = EXCLUDED.games_played,
+        last_game_id = EXCLUDED.last_game_id,
+        last_game_date = EXCLUDED.last_game_date,
+        low_confidence = EXCLUDED.low_confidence,
+        updated_at = EXCLUDED.updated_at
+"""
+
+UPSERT_STATE_SUFFIX = """
+    ON CONFLICT (team) DO UPDATE SET
+        rating = EXCLUDED.rating,
+        last_season = EXCLUDED.last_season,
+        alias = EXCLUDED.alias,
+        games_played = EXCLUDED.games_played,
+        last_game_id = EXCLUDED.last_game_id,
+        last_game_date = EXCLUDED.last_game_date,
+        updated_at = EXCLUDED.updated_at
+"""
+
+WATERMARK_UPSERT_SQL = """
+    INSERT INTO analytics.house_elo_watermark (
+        singleton, season, last_start_date, last_game_id, games_processed, updated_at
+    ) VALUES (true, %s, %s, %s, %s, now())
+    ON CONFLICT (singleton) DO UPDATE SET
+        season = EXCLUDED.season,
+        last_start_date = EXCLUDED.last_start_date,
+        last_game_id = EXCLUDED.last_game_id,
+        games_processed = EXCLUDED.games_processed,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def _insert_game_rows(cur, rows: list[dict]) -> None:
+    from psycopg2.extras import execute_values
+
+    if not rows:
+        return
+    values = [
+        (
+            r["game_id"],
+            r["season"],
+            r["week"],
+            r["season_type"],
+            r["start_date"],
+            r["neutral_site"],
+            r["home_team"],
+            r["away_team"],
+            r["home_pregame_elo"],
+            r["away_pregame_elo"],
+            r["home_postgame_elo"],
+            r["away_postgame_elo"],
+            r["home_win_prob"],
+            r["expected_home_margin"],
+            r["actual_home_margin"],
+            r["mov_multiplier"],
+            r["cfbd_home_pregame_elo"],
+            r["cfbd_away_pregame_elo"],
+        )
+        for r in rows
+    ]
+    execute_values(cur, GAME_INSERT_SQL, values)
+
+
+def _insert_snapshot_rows(cur, rows: list[dict], upsert: bool = False) -> None:
     from psycopg2.extras import execute_values
 
+    if not rows:
+        return
+    values = [
+        (
+            r["team"],
+            r["season"],
+            r["rating"],
+            r["games_played"],
+            r["last_game_id"],
+            r["last_game_date"],
+            r["low_confidence"],
+        )
+        for r in rows
+    ]
+    sql = SNAPSHOT_INSERT_SQL + (UPSERT_SNAPSHOT_SUFFIX if upsert else "")
+    execute_values(cur, sql, values, template="(%s, %s, %s, %s, %s, %s, %s, now())")
+
+
+def _insert_state_rows(cur, rows: list[dict], upsert: bool = False) -> None:
+    from psycopg2.extras import execute_values
+
+    if not rows:
+        return
+    values = [
+        (
+            r["team"],
+            r["rating"],
+            r["last_season"],
+            r["alias"],
+            r["games_played"],
+            r["last_game_id"],
+            r["last_game_date"],
+        )
+        for r in rows
+    ]
+    sql = STATE_INSERT_SQL + (UPSERT_STATE_SUFFIX if upsert else "")
+    execute_values(cur, sql, values, template="(%s, %s, %s, %s, %s, %s, %s, now())")
+
+
+def _write_watermark(cur, season: int, rows: list[dict], games_processed: int) -> None:
+    """Point the watermark at the last of `rows` in replay order (no rows --
+    a season with nothing completed yet -- leaves it unset)."""
+    last = max(rows, key=game_order_key) if rows else {"start_date": None, "game_id": None}
+    cur.execute(
+        WATERMARK_UPSERT_SQL,
+        (season, last["start_date"], last["game_id"], games_processed),
+    )
+
+
+def write_season(conn, season: int, rows: list[dict]) -> None:
+    """Idempotent per-season write: DELETE then bulk INSERT, one commit."""
     cur = conn.cursor()
     try:
         cur.execute("DELETE FROM analytics.house_elo_game WHERE season = %s", (season,))
-        if rows:
-            values = [
-                (
-                    r["game_id"],
-                    r["season"],
-                    r["week"],
-                    r["season_type"],
-                    r["start_date"],
-                    r["neutral_site"],
-                    r["home_team"],
-                    r["away_team"],
-                    r["home_pregame_elo"],
-                    r["away_pregame_elo"],
-                    r["home_postgame_elo"],
-                    r["away_postgame_elo"],
-                    r["home_win_prob"],
-                    r["expected_home_margin"],
-                    r["actual_home_margin"],
-                    r["mov_multiplier"],
-                    r["cfbd_home_pregame_elo"],
-                    r["cfbd_away_pregame_elo"],
-                )
-                for r in rows
-            ]
-            execute_values(
-                cur,
-                """
-                INSERT INTO analytics.house_elo_game (
-                    game_id, season, week, season_type, start_date, neutral_site,
-                    home_team, away_team, home_pregame_elo, away_pregame_elo,
-                    home_postgame_elo, away_postgame_elo, home_win_prob,
-                    expected_home_margin, actual_home_margin, mov_multiplier,
-                    cfbd_home_pregame_elo, cfbd_away_pregame_elo
-                ) VALUES %s
-                """,
-                values,
-            )
+        _insert_game_rows(cur, rows)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -534,35 +823,57 @@ def write_season(conn, season: int, rows: list[dict]) -> None:
 
 def write_snapshot(conn, rows: list[dict]) -> None:
     """Full replace of analytics.house_elo_current (updated_at = now() in SQL)."""
-    from psycopg2.extras import execute_values
-
     cur = conn.cursor()
     try:
         cur.execute("DELETE FROM analytics.house_elo_current")
-        if rows:
-            values = [
-                (
-                    r["team"],
-                    r["season"],
-                    r["rating"],
-                    r["games_played"],
-                    r["last_game_id"],
-                    r["last_game_date"],
-                    r["low_confidence"],
-                )
-                for r in rows
-            ]
-            execute_values(
-                cur,
-                """
-                INSERT INTO analytics.house_elo_current (
-                    team, season, rating, games_played, last_game_id,
-                    last_game_date, low_confidence, updated_at
-                ) VALUES %s
-                """,
-                values,
-                template="(%s, %s, %s, %s, %s, %s, %s, now())",
-            )
+        _insert_snapshot_rows(cur, rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def write_state(conn, engine: EloEngine, season: int, rows: list[dict]) -> None:
+    """Full replace of analytics.house_elo_state + the watermark after a
+    season rebuild. `rows` is everything written for `season`, in replay
+    order -- the last one becomes the watermark."""
+    cur = conn.cursor()
+    try:
+        cur.execute("DELETE FROM analytics.house_elo_state")
+        _insert_state_rows(cur, engine.export_state())
+        _write_watermark(cur, season, rows, len(rows))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def write_increment(
+    conn, engine: EloEngine, season: int, rows: list[dict], games_processed: int
+) -> None:
+    """Append `rows` to analytics.house_elo_game and upsert only the
+    snapshot/state rows they touched, plus the watermark -- one transaction,
+    so a crash can never leave appended games the persisted state has not
+    absorbed (the row-count check would force a rebuild anyway)."""
+    touched = {r["home_team"] for r in rows} | {r["away_team"] for r in rows}
+    # A pooled team's reported rating is the shared bucket's, which moves
+    # whenever ANY pooled team plays -- refresh every team aliased to it.
+    if any(engine.resolve(team) == EloEngine.POOLED for team in touched):
+        touched |= {t for t, a in engine.alias.items() if a == EloEngine.POOLED}
+        touched.add(EloEngine.POOLED)
+    snapshot = [r for r in engine.current_snapshot(season) if r["team"] in touched]
+    state = [r for r in engine.export_state() if r["team"] in touched]
+
+    cur = conn.cursor()
+    try:
+        _insert_game_rows(cur, rows)
+        _insert_snapshot_rows(cur, snapshot, upsert=True)
+        _insert_state_rows(cur, state, upsert=True)
+        _write_watermark(cur, season, rows, games_processed)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -578,6 +889,7 @@ def run_full(conn, start_season: int, end_season: int) -> list[dict]:
     engine = EloEngine()
     all_rows: list[dict] = []
     last_season_processed = None
+    last_season_rows: list[dict] = []
     for season in sorted(buckets):
         season_games = buckets[season]
         team_game_counts = scheduled_counts.get(season) or compute_team_game_counts(season_games)
@@ -586,11 +898,13 @@ def run_full(conn, start_season: int, end_season: int) -> list[dict]:
         write_season(conn, season, rows)
         all_rows.extend(rows)
         last_season_processed = season
+        last_season_rows = rows
         logger.info(f"  season {season}: {len(rows)} games written")
 
     if last_season_processed is not None:
         snapshot = engine.current_snapshot(last_season_processed)
         write_snapshot(conn, snapshot)
+        write_state(conn, engine, last_season_processed, last_season_rows)
         logger.info(
             f"Snapshot written: {len(snapshot)} teams (as of season {last_season_processed})"
         )
@@ -616,11 +930,52 @@ def run_season(conn, season: int) -> list[dict]:
 
     snapshot = engine.current_snapshot(season)
     write_snapshot(conn, snapshot)
+    write_state(conn, engine, season, rows)
     logger.info(f"Snapshot written: {len(snapshot)} teams (as of season {season})")
 
     return rows
 
 
+def run_incremental(conn, season: int) -> list[dict]:
+    """Resume the persisted engine and process only games completed since the
+    watermark; fall back to run_season() whenever appending would not match
+    a rebuild (see incremental_rebuild_reason). Returns only the rows it
+    computed -- the appended games, or the whole season after a rebuild."""
+    engine, watermark = load_state(conn)
+    reason = None
+    if watermark is None:
+        reason = "no persisted engine state"
+    elif watermark["season"] != season:
+        reason = f"persisted state is for season {watermark['season']}"
+    elif fetch_processed_count(conn, season) != watermark["games_processed"]:
+        reason = "analytics.house_elo_game row count disagrees with the watermark"
+
+    new_games: list[dict] = []
+    if reason is None:
+        scheduled_counts = fetch_scheduled_counts(conn, season, season).get(season, {})
+        new_games = [to_engine_game(g) for g in fetch_new_games(conn, season)]
+        reason = incremental_rebuild_reason(
+            engine,
+            watermark,
+            scheduled_counts,
+            fetch_changed_game_ids(conn, season),
+            new_games,
+        )
+
+    if reason is not None:
+        logger.info(f"Rebuilding season {season}: {reason}")
+        return run_season(conn, season)
+
+    if not new_games:
+        logger.info(f"Season {season}: no newly completed games since the watermark")
+        return []
+
+    rows = [engine.process_game(g) for g in new_games]
+    write_increment(conn, engine, season, rows, watermark["games_processed"] + len(rows))
+    logger.info(f"Season {season}: {len(rows)} new games appended")
+    return rows
+
+
 def print_validation(rows: list[dict]) -> None:
     pairs = [
         (r["home_pregame_elo"], r["cfbd_home_pregame_elo"])
@@ -650,7 +1005,10 @@ def main() -> None:
     mode.add_argument(
         "--incremental",
         action="store_true",
-        help="Recompute the current season (max season in core.games with completed games)",
+        help=(
+            "Process games completed since the last run for the current season "
+            "(max season in core.games with completed games), rebuilding it if needed"
+        ),
     )
     args = parser.parse_args()
 
@@ -671,7 +1029,7 @@ def main() -> None:
             if max_completed is None:
                 logger.error("No completed games found in core.games")
                 sys.exit(1)
-            rows = run_season(conn, max_completed)
+            rows = run_incremental(conn, max_completed)
 
         print_validation(rows)
     except Exception:
@@ -31,11 +31,12 @@ Usage:
         from the live analytics.house_elo_current snapshot (with carryover
         applied for teams whose snapshot predates the game's season) and the
         current analytics.adjusted_epa_build fit (current-or-previous season
-        only, per team). Market line: latest betting.line_snapshots per game
-        if that table exists, else betting.lines. prediction_date is written
-        as `(now() AT TIME ZONE 'utc')::date` -- a SQL-side expression, not a
-        Python-computed value -- so every row in the batch gets the exact
-        same date the DB itself would use, one single commit.
+        only, per team). Market line: latest captured line per game from
+        betting.line_intervals if that table exists, else betting.lines.
+        prediction_date is written as `(now() AT TIME ZONE 'utc')::date` -- a
+        SQL-side expression, not a Python-computed value -- so every row in
+        the batch gets the exact same date the DB itself would use, one
+        single commit.
 
     python scripts/compute_predictions.py --backfill 2015 2025
         Retroactively score completed games for seasons 2015-2025 (inclusive)
@@ -377,10 +378,20 @@ BACKFILL_GAMES_QUERY = """
     ORDER BY start_date NULLS LAST, game_id
 """
 
+# Line history lives in betting.line_intervals (migration 055); an interval's
+# last_captured_at is the latest capture that saw its line. Snapshots still
+# staged for compaction are newer than every interval, so they are read too.
 MARKET_SNAPSHOTS_QUERY = """
     SELECT DISTINCT ON (game_id) game_id, provider, spread, captured_at
-    FROM betting.line_snapshots
-    WHERE game_id = ANY(%s)
+    FROM (
+        SELECT game_id, provider, spread, last_captured_at AS captured_at
+        FROM betting.line_intervals
+        WHERE game_id = ANY(%(game_ids)s)
+        UNION ALL
+        SELECT game_id, provider, spread, captured_at
+        FROM betting.line_snapshots
+        WHERE game_id = ANY(%(game_ids)s)
+    ) s
     ORDER BY game_id, CASE WHEN provider = 'consensus' THEN 0 ELSE 1 END, captured_at DESC
 """
 
@@ -556,7 +567,7 @@ def fetch_market_from_snapshots(conn, game_ids: list[int]) -> dict[int, dict]:
         return {}
     result: dict[int, dict] = {}
     with conn.cursor() as cur:
-        cur.execute(MARKET_SNAPSHOTS_QUERY, (game_ids,))
+        cur.execute(MARKET_SNAPSHOTS_QUERY, {"game_ids": game_ids})
         for game_id, provider, spread, captured_at in cur.fetchall():
             result[game_id] = {
                 "provider": provider,
@@ -614,12 +625,12 @@ def run_upcoming(conn) -> None:
     epa_by_team_season = fetch_epa_coefs(conn)
 
     game_ids = [g["game_id"] for g in games]
-    if table_exists(conn, "betting", "line_snapshots"):
+    if table_exists(conn, "betting", "line_intervals"):
         market_by_game = fetch_market_from_snapshots(conn, game_ids)
-        logger.info("Market source: betting.line_snapshots (latest per game, consensus preferred)")
+        logger.info("Market source: betting.line_intervals (latest per game, consensus preferred)")
     else:
         market_by_game = fetch_market_from_lines(conn, game_ids)
-        logger.info("Market source: betting.lines (betting.line_snapshots not present)")
+        logger.info("Market source: betting.lines (betting.line_intervals not present)")
 
     rows: list[dict] = []
     n_with_market = 0
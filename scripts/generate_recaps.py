@@ -6,12 +6,22 @@ Selects completed FBS games (season >= 2014) that have no recap yet, or whose
 short recap from warehouse facts only: final + quarter scores (core.games +
 the games__home_line_scores / games__away_line_scores child tables), the
 top-5 |EPA| plays (marts.play_epa), win-probability swings
-(metrics.win_probability) when that table has rows for the game -- with an
+(metrics.win_probability_game) when that table has rows for the game -- with an
 EPA-only fallback and a `wp_available` flag when it doesn't -- top
 passer/rusher/receiver (api.game_player_leaders), and the betting-line result
 (api.game_detail). Facts are gathered with several small, single-table
-queries per game rather than one giant join, per this repo's usual pattern
-for per-game detail views (see e.g. api/012_game_line_scores.sql).
+queries rather than one giant join, per this repo's usual pattern for
+per-game detail views (see e.g. api/012_game_line_scores.sql) -- but each of
+those queries runs once per batch of games (`game_id = ANY(...)`,
+gather_facts_batch), not once per game, so a run costs a handful of round
+trips however many games it covers.
+
+Model calls run on a bounded thread pool (--concurrency) and finished
+recaps are upserted in batches as they complete. The client is pluggable:
+anything with the Anthropic SDK's `messages.create` shape works, and
+`--client stub` uses StubRecapClient, a local, deterministic stand-in that
+needs no API key and makes no network call -- for exercising the whole
+pipeline end to end without paying for it (stub runs never write).
 
 This script runs warehouse-side, so it is fine for it to read core.* and
 metrics.* directly (unlike a downstream consumer, which must go through
@@ -31,6 +41,8 @@ Usage:
     python scripts/generate_recaps.py --season 2025        # only 2025 games
     python scripts/generate_recaps.py --game-id 401628455   # a single specific game
     python scripts/generate_recaps.py --dry-run            # print prompts, no API call, no write
+    python scripts/generate_recaps.py --concurrency 8      # up to 8 model calls in flight
+    python scripts/generate_recaps.py --client stub        # full run on the local stub, no write
 
 Requires the `recaps` optional-dependency group (`pip install -e ".[recaps]"`)
 for the `anthropic` package; the rest of the pipeline install stays lean
@@ -51,6 +63,8 @@ import json
 import logging
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -76,6 +90,19 @@ MIN_SEASON = 2014
 MAX_RECAPS_PER_RUN = 30
 RECAP_MAX_TOKENS = 700  # generous ceiling for a 220-word recap + headline
 
+# Model calls in flight at once. The SDK retries 429s itself; this just keeps
+# a large backfill from opening more requests than the account's rate limit
+# will take.
+DEFAULT_CONCURRENCY = 4
+
+# Games per set-based facts fetch (gather_facts_batch), and finished recaps
+# per batched upsert. The upsert batch also bounds how much paid-for output a
+# crash mid-run can lose.
+FACTS_BATCH_SIZE = 200
+UPSERT_BATCH_SIZE = 25
+
+STUB_MODEL_ID = "stub"
+
 # =============================================================================
 # Pure functions -- no I/O, no DB, no Anthropic client. Unit-tested directly.
 # =============================================================================
@@ -179,7 +206,7 @@ def compute_wp_swings(rows: list[tuple[int, float]]) -> dict:
 def build_wp_section(wp_rows: list[tuple[int, float]], top_plays: list[dict]) -> dict:
     """Win-probability facts, with an EPA-only fallback when unavailable.
 
-    `wp_rows` empty means either metrics.win_probability has no rows for
+    `wp_rows` empty means either metrics.win_probability_game has no row for
     this game, or the table doesn't exist yet in this deployment (the
     caller is responsible for that check -- see table_exists()). Either
     way, fall back to the single largest |EPA| play already fetched for the
@@ -313,6 +340,37 @@ def parse_recap_response(text: str) -> tuple[str, str]:
     return headline, recap
 
 
+def group_by_game(rows: list[dict], *, key: str = "game_id") -> dict[int, list[dict]]:
+    """Split set-based query rows into per-game lists, in row order, with the
+    `key` column dropped -- so each list is exactly what the one-game query
+    returns for that game."""
+    grouped: dict[int, list[dict]] = {}
+    for row in rows:
+        rest = {k: v for k, v in row.items() if k != key}
+        grouped.setdefault(row[key], []).append(rest)
+    return grouped
+
+
+class StubRecapClient:
+    """Local stand-in for `anthropic.Anthropic()`: same `messages.create`
+    call shape, deterministic canned response, no network, no API key.
+    Token usage is estimated at ~4 characters per token so cost accounting
+    still has something to add up."""
+
+    def __init__(self):
+        self.messages = self
+        self.calls = 0
+
+    def create(self, *, model: str, max_tokens: int, messages: list[dict]):
+        self.calls += 1
+        prompt = messages[-1]["content"]
+        text = f"HEADLINE: Stub recap {compute_input_hash(prompt)[:8]}\n\nStub recap body."
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=len(prompt) // 4, output_tokens=len(text) // 4),
+        )
+
+
 def estimate_cost(input_tokens: int, output_tokens: int) -> float:
     """USD cost estimate from token counts, using the MODEL_ID pricing constants."""
     return (input_tokens / 1_000_000) * INPUT_COST_PER_MTOK + (
@@ -332,11 +390,15 @@ TOP_PLAYS_SQL = """
     LIMIT 5
 """
 
+# metrics.win_probability_game holds one row per game with the per-play
+# fields packed into arrays (migrations/054_win_probability_game.sql), so a
+# game's WP curve is one primary-key row unnested in place.
 WP_ROWS_SQL = """
-    SELECT play_id, home_win_probability
-    FROM metrics.win_probability
-    WHERE game_id = %s AND home_win_probability IS NOT NULL
-    ORDER BY play_id
+    SELECT u.play_id, u.home_win_probability
+    FROM metrics.win_probability_game wp
+    CROSS JOIN LATERAL unnest(wp.play_ids, wp.home_wp) AS u(play_id, home_win_probability)
+    WHERE wp.game_id = %s AND u.home_win_probability IS NOT NULL
+    ORDER BY u.play_id
 """
 
 TOP_LEADER_SQL = """
@@ -353,6 +415,54 @@ GAME_DETAIL_SQL = """
     WHERE game_id = %s
 """
 
+LINE_SCORES_BATCH_SQL = """
+    SELECT g.id AS game_id, 'home' AS side, ls._dlt_list_idx, ls.value
+    FROM core.games g
+    JOIN core.games__home_line_scores ls ON ls._dlt_parent_id = g._dlt_id
+    WHERE g.id = ANY(%(game_ids)s)
+    UNION ALL
+    SELECT g.id AS game_id, 'away' AS side, ls._dlt_list_idx, ls.value
+    FROM core.games g
+    JOIN core.games__away_line_scores ls ON ls._dlt_parent_id = g._dlt_id
+    WHERE g.id = ANY(%(game_ids)s)
+    ORDER BY game_id, side, _dlt_list_idx
+"""
+
+TOP_PLAYS_BATCH_SQL = """
+    SELECT game_id, play_text, epa, period, offense, defense
+    FROM (
+        SELECT game_id, play_text, epa, period, offense, defense,
+               ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY ABS(epa) DESC) AS rn
+        FROM marts.play_epa
+        WHERE game_id = ANY(%(game_ids)s) AND epa IS NOT NULL
+    ) ranked
+    WHERE rn <= 5
+    ORDER BY game_id, rn
+"""
+
+WP_ROWS_BATCH_SQL = """
+    SELECT wp.game_id, u.play_id, u.home_win_probability
+    FROM metrics.win_probability_game wp
+    CROSS JOIN LATERAL unnest(wp.play_ids, wp.home_wp) AS u(play_id, home_win_probability)
+    WHERE wp.game_id = ANY(%(game_ids)s) AND u.home_win_probability IS NOT NULL
+    ORDER BY wp.game_id, u.play_id
+"""
+
+LEADERS_BATCH_SQL = """
+    SELECT DISTINCT ON (game_id, category) game_id, category, player_name, team, stat
+    FROM api.game_player_leaders
+    WHERE game_id = ANY(%(game_ids)s)
+      AND category IN ('passing', 'rushing', 'receiving')
+      AND stat_type = 'YDS'
+    ORDER BY game_id, category, stat DESC
+"""
+
+GAME_DETAIL_BATCH_SQL = """
+    SELECT game_id, home_spread, spread_result, over_under, ou_result, excitement_index
+    FROM api.game_detail
+    WHERE game_id = ANY(%(game_ids)s)
+"""
+
 UPSERT_SQL = """
     INSERT INTO analytics.game_recaps (
         game_id, season, week, headline, recap, wp_available, model,
@@ -373,6 +483,11 @@ UPSERT_SQL = """
         regenerate = false
 """
 
+UPSERT_BATCH_SQL = UPSERT_SQL.replace(
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), false)", "VALUES %s"
+)
+UPSERT_BATCH_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), false)"
+
 
 def get_db_url() -> str:
     """Get database URL from dlt secrets or environment.
@@ -445,7 +560,7 @@ def fetch_top_plays(conn, game_id: int) -> list[dict]:
 
 
 def fetch_wp_rows(conn, game_id: int) -> list[tuple[int, float]]:
-    if not table_exists(conn, "metrics", "win_probability"):
+    if not table_exists(conn, "metrics", "win_probability_game"):
         return []
     with conn.cursor() as cur:
         cur.execute(WP_ROWS_SQL, (game_id,))
@@ -492,6 +607,53 @@ def gather_facts(conn, game: dict) -> dict:
     )
 
 
+def gather_facts_batch(conn, games: list[dict]) -> dict[int, dict]:
+    """gather_facts for every game in `games` with one query per fact kind
+    (game_id = ANY(...)) instead of ~7 per game. Returns {game_id: facts},
+    each identical to what gather_facts builds for that game."""
+    import psycopg2.extras
+
+    if not games:
+        return {}
+    params = {"game_ids": [g["game_id"] for g in games]}
+    has_wp = table_exists(conn, "metrics", "win_probability_game")
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(LINE_SCORES_BATCH_SQL, params)
+        line_scores = group_by_game([dict(r) for r in cur.fetchall()])
+        cur.execute(TOP_PLAYS_BATCH_SQL, params)
+        top_plays = group_by_game([dict(r) for r in cur.fetchall()])
+        wp_rows: dict[int, list[dict]] = {}
+        if has_wp:
+            cur.execute(WP_ROWS_BATCH_SQL, params)
+            wp_rows = group_by_game([dict(r) for r in cur.fetchall()])
+        cur.execute(LEADERS_BATCH_SQL, params)
+        leader_rows = group_by_game([dict(r) for r in cur.fetchall()])
+        cur.execute(GAME_DETAIL_BATCH_SQL, params)
+        details = {gid: rows[0] for gid, rows in group_by_game(cur.fetchall()).items()}
+
+    facts_by_game = {}
+    for game in games:
+        gid = game["game_id"]
+        lines = line_scores.get(gid, [])
+        home_quarters = pivot_line_scores(
+            [(r["_dlt_list_idx"], r["value"]) for r in lines if r["side"] == "home"]
+        )
+        away_quarters = pivot_line_scores(
+            [(r["_dlt_list_idx"], r["value"]) for r in lines if r["side"] == "away"]
+        )
+        plays = top_plays.get(gid, [])
+        wp_section = build_wp_section(
+            [(r["play_id"], r["home_win_probability"]) for r in wp_rows.get(gid, [])], plays
+        )
+        by_category = {r.pop("category"): r for r in leader_rows.get(gid, [])}
+        leaders = {c: by_category.get(c) for c in ("passing", "rushing", "receiving")}
+        facts_by_game[gid] = assemble_facts(
+            game, home_quarters, away_quarters, plays, wp_section, leaders, details.get(gid, {})
+        )
+    return facts_by_game
+
+
 def upsert_recap(
     conn,
     game: dict,
@@ -524,6 +686,73 @@ def upsert_recap(
     conn.commit()
 
 
+def upsert_recaps(conn, results: list[dict]) -> None:
+    """Batched upsert_recap: one statement and one commit for every result
+    (generate_recap output plus its game) in `results`."""
+    from psycopg2.extras import execute_values
+
+    if not results:
+        return
+    values = [
+        (
+            r["game"]["game_id"],
+            r["game"]["season"],
+            r["game"]["week"],
+            r["headline"],
+            r["recap"],
+            r["wp_available"],
+            r["model"],
+            r["prompt_version"],
+            r["input_hash"],
+            r["input_tokens"],
+            r["output_tokens"],
+        )
+        for r in results
+    ]
+    with conn.cursor() as cur:
+        execute_values(
+            cur, UPSERT_BATCH_SQL, values, template=UPSERT_BATCH_TEMPLATE, page_size=len(values)
+        )
+    conn.commit()
+
+
+def generate_recap(
+    client,
+    game: dict,
+    facts: dict,
+    *,
+    model: str = MODEL_ID,
+    prompt_version: int = PROMPT_VERSION,
+) -> dict:
+    """One model call for one game's facts. Touches no connection, so it is
+    safe to run on a worker thread. Returns everything upsert_recaps needs
+    plus the run summary fields (tokens, cost)."""
+    response = client.messages.create(
+        model=model,
+        max_tokens=RECAP_MAX_TOKENS,
+        messages=[{"role": "user", "content": build_prompt(facts)}],
+    )
+    text = "".join(
+        block.text for block in response.content if getattr(block, "type", None) == "text"
+    )
+    headline, recap = parse_recap_response(text)
+    input_tokens = response.usage.input_tokens
+    output_tokens = response.usage.output_tokens
+    return {
+        "game": game,
+        "game_id": game["game_id"],
+        "headline": headline,
+        "recap": recap,
+        "wp_available": bool(facts["wp_swing"].get("available", False)),
+        "model": model,
+        "prompt_version": prompt_version,
+        "input_hash": compute_input_hash(facts),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost": estimate_cost(input_tokens, output_tokens),
+    }
+
+
 def process_game(
     conn,
     client,
@@ -533,73 +762,125 @@ def process_game(
     prompt_version: int = PROMPT_VERSION,
     dry_run: bool = False,
 ) -> dict | None:
-    """Fetch facts, build the prompt, and either print it (dry-run) or call
-    Claude and write the result. Returns a summary dict (game_id, tokens,
-    cost) for non-dry-run games, or None for a dry run."""
+    """One game, start to finish: fetch facts, build the prompt, and either
+    print it (dry-run) or call Claude and write the result. Returns a summary
+    dict (game_id, tokens, cost) for non-dry-run games, or None for a dry
+    run. run() uses the batched path (gather_facts_batch + generate_batch)
+    instead; this is the same work for a single game."""
     facts = gather_facts(conn, game)
-    prompt = build_prompt(facts)
-    input_hash = compute_input_hash(facts)
 
     if dry_run:
         print(
             f"\n=== DRY RUN: game_id={game['game_id']} "
             f"({game['away_team']} @ {game['home_team']}) ==="
         )
-        print(prompt)
+        print(build_prompt(facts))
         return None
 
-    response = client.messages.create(
-        model=model,
-        max_tokens=RECAP_MAX_TOKENS,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    text = "".join(
-        block.text for block in response.content if getattr(block, "type", None) == "text"
-    )
-    headline, recap = parse_recap_response(text)
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
-
+    result = generate_recap(client, game, facts, model=model, prompt_version=prompt_version)
     upsert_recap(
         conn,
         game,
-        headline,
-        recap,
-        bool(facts["wp_swing"].get("available", False)),
+        result["headline"],
+        result["recap"],
+        result["wp_available"],
         model,
         prompt_version,
-        input_hash,
-        input_tokens,
-        output_tokens,
+        result["input_hash"],
+        result["input_tokens"],
+        result["output_tokens"],
     )
 
-    return {
-        "game_id": game["game_id"],
-        "input_tokens": input_tokens,
-        "output_tokens": output_tokens,
-        "cost": estimate_cost(input_tokens, output_tokens),
-    }
+    return {k: result[k] for k in ("game_id", "input_tokens", "output_tokens", "cost")}
 
 
-def run(conn, client, *, limit: int, season: int | None, game_id: int | None, dry_run: bool) -> int:
+def generate_batch(
+    conn,
+    client,
+    games: list[dict],
+    facts_by_game: dict[int, dict],
+    *,
+    concurrency: int,
+    model: str,
+    write: bool,
+) -> tuple[list[dict], int]:
+    """Generate recaps for `games` with at most `concurrency` model calls in
+    flight, upserting finished ones UPSERT_BATCH_SIZE at a time as they
+    complete (connection use stays on this thread). Returns (results,
+    failures)."""
+    results: list[dict] = []
+    pending: list[dict] = []
+    failures = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(generate_recap, client, g, facts_by_game[g["game_id"]], model=model): g
+            for g in games
+        }
+        for future in as_completed(futures):
+            game = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                logger.exception(f"Recap generation failed for game_id={game['game_id']}")
+                failures += 1
+                continue
+            results.append(result)
+            pending.append(result)
+            if write and len(pending) >= UPSERT_BATCH_SIZE:
+                upsert_recaps(conn, pending)
+                pending = []
+    if write:
+        upsert_recaps(conn, pending)
+    return results, failures
+
+
+def run(
+    conn,
+    client,
+    *,
+    limit: int,
+    season: int | None,
+    game_id: int | None,
+    dry_run: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str = MODEL_ID,
+) -> int:
     games = fetch_target_games(conn, limit, season=season, game_id=game_id)
     logger.info(f"Selected {len(games)} game(s) for recap generation")
+    # Stub recaps are never written: they would satisfy the recap-IS-NULL
+    # selection gate and keep the real recap from ever being generated.
+    write = not dry_run and model != STUB_MODEL_ID
 
     results = []
     failures = 0
-    for game in games:
-        try:
-            result = process_game(conn, client, game, dry_run=dry_run)
-        except Exception:
-            logger.exception(f"Recap generation failed for game_id={game['game_id']}")
-            failures += 1
+    for start in range(0, len(games), FACTS_BATCH_SIZE):
+        chunk = games[start : start + FACTS_BATCH_SIZE]
+        facts_by_game = gather_facts_batch(conn, chunk)
+        if dry_run:
+            for game in chunk:
+                print(
+                    f"\n=== DRY RUN: game_id={game['game_id']} "
+                    f"({game['away_team']} @ {game['home_team']}) ==="
+                )
+                print(build_prompt(facts_by_game[game["game_id"]]))
             continue
-        if result is not None:
-            results.append(result)
+        chunk_results, chunk_failures = generate_batch(
+            conn,
+            client,
+            chunk,
+            facts_by_game,
+            concurrency=concurrency,
+            model=model,
+            write=write,
+        )
+        results.extend(chunk_results)
+        failures += chunk_failures
 
     if dry_run:
         logger.info(f"Dry run complete: {len(games)} game(s) would be processed, no API calls made")
         return failures
+    if not write:
+        logger.info("Stub client: recaps generated but not written")
 
     total_input = sum(r["input_tokens"] for r in results)
     total_output = sum(r["output_tokens"] for r in results)
@@ -632,12 +913,31 @@ def main() -> None:
         action="store_true",
         help="Print prompts without calling the Anthropic API or writing to the database",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max model calls in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--client",
+        choices=("anthropic", "stub"),
+        default="anthropic",
+        help="Model client: the Anthropic API, or the local StubRecapClient "
+        "(no network, no API key, never writes)",
+    )
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
 
     import psycopg2
 
     client = None
-    if not args.dry_run:
+    model = MODEL_ID
+    if args.client == "stub":
+        client = StubRecapClient()
+        model = STUB_MODEL_ID
+    elif not args.dry_run:
         import anthropic
 
         client = anthropic.Anthropic()
@@ -651,6 +951,8 @@ def main() -> None:
             season=args.season,
             game_id=args.game_id,
             dry_run=args.dry_run,
+            concurrency=args.concurrency,
+            model=model,
         )
     except Exception:
         conn.rollback()
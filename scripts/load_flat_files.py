@@ -24,9 +24,22 @@ for a one-shot generator -- silently coming back empty. Instead we read
 counts from the normalize step that just ran, and sum the main/child table
 entries. This is a side-effect-free read of data dlt already computed.
 
+Conditional fetches: for a source's own fetch_url (not ``--file``) the
+ETag/Last-Modified validators of its last loaded bytes are sent along; a 304
+is recorded as a skipped ledger row and reported as ``status=not_modified``,
+the download-free twin of ``skipped_hash``. Fetched bodies are streamed to a
+spooled temp file and handed to the parser as a file-like, never as bytes.
+
+Ledger connections: a real run opens one autocommit connection
+(``load_ledger.connect``) and threads it through every ledger call and the
+crosswalk load; due-status for all sources is one ``last_successes()`` query.
+The connection is re-checked before each source and again after each long
+step inside one (download, ``pipeline.run()``), so a session the pooler
+dropped never turns a successful load's ledger write into a failure.
+
 Ledger unavailability: ``--dry-run`` must work with no DB configured (used in
 CI/sandboxes with no Supabase credentials) -- due-status lookups swallow any
-``last_success()`` failure (including ``get_db_url``'s ``RuntimeError`` for
+``last_successes()`` failure (including ``get_db_url``'s ``RuntimeError`` for
 missing creds) and fall back to "never loaded". Real runs make no such
 allowance: a missing DB surfaces as a per-source ``status=failed`` result
 (via the same try/except that catches parser errors), never a driver crash.
@@ -51,8 +64,16 @@ from src.pipelines.sources.flat_files import (
     resolve_parser,
     season_for_date,
 )
-from src.pipelines.utils.file_fetcher import fetch_file
-from src.pipelines.utils.load_ledger import already_loaded, last_success, record_load
+from src.pipelines.utils.file_fetcher import FetchedFile, Validators, fetch_file
+from src.pipelines.utils.load_ledger import (
+    already_loaded,
+    last_successes,
+    last_validators,
+    record_load,
+)
+from src.pipelines.utils.load_ledger import connect as ledger_connect
+from src.pipelines.utils.load_ledger import ensure_connected as ledger_ensure_connected
+from src.pipelines.utils.load_ledger import is_connected as ledger_is_connected
 from src.pipelines.utils.team_xwalk import XwalkResolver
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -87,17 +108,66 @@ def is_due(spec: FlatFileSpec, last: datetime | None, today: date) -> bool:
     raise ValueError(f"{spec.name}: unknown cadence {spec.cadence!r}")
 
 
-def _safe_last_success(name: str) -> datetime | None:
-    """``last_success()`` tolerating a missing/unreachable DB.
+def _safe_last_successes(names: list[str], conn=None) -> dict[str, datetime]:
+    """``last_successes()`` for every planned source, tolerating a missing/unreachable DB.
 
+    One query for the whole registry rather than one connection per source.
     Used only for informational due-status (``--dry-run``, ``--due``
     selection) -- a real load's ledger calls are left to raise and fail that
     source loudly inside ``run_source``.
     """
     try:
-        return last_success(name)
+        return last_successes(names, conn=conn)
+    except Exception as e:
+        logger.debug(f"last_successes unavailable ({e}); treating every source as never loaded")
+        return {}
+
+
+def _safe_ledger_connect(conn=None):
+    """One shared autocommit ledger connection for the run, or None.
+
+    Given the run's current connection, hands it back if it still answers
+    and reconnects if it has dropped (sources run for minutes apart).
+    None (no creds / unreachable) leaves every ledger call to open its own
+    connection -- and fail that source loudly -- exactly as without sharing.
+    """
+    try:
+        return ledger_connect() if conn is None else ledger_ensure_connected(conn)
     except Exception as e:
-        logger.debug(f"{name}: last_success unavailable ({e}); treating as never loaded")
+        logger.debug(f"shared ledger connection unavailable ({e}); connecting per call")
+        return None
+
+
+def _live_ledger_conn(conn):
+    """``conn`` if it still answers, else None.
+
+    ``main`` checks the shared connection between sources, but one source
+    can hold it idle through a long download or ``pipeline.run()``; a
+    connection the pooler dropped in that time would turn the ledger write
+    for a successful load into a failure. With None, the calls that follow
+    open their own connection; ``main`` replaces the shared one before the
+    next source.
+    """
+    if conn is None:
+        return None
+    try:
+        return conn if ledger_is_connected(conn) else None
+    except Exception as e:
+        logger.debug(f"shared ledger connection unusable ({e}); connecting per call")
+        return None
+
+
+def _safe_last_validators(name: str, conn=None) -> Validators | None:
+    """``last_validators()`` tolerating a missing/unreachable DB.
+
+    Validators only make the fetch conditional; without them the source is
+    downloaded in full and the hash-skip still applies, so a ledger problem
+    here is left for ``already_loaded``/``record_load`` to surface.
+    """
+    try:
+        return last_validators(name, conn=conn)
+    except Exception as e:
+        logger.debug(f"{name}: last_validators unavailable ({e}); fetching unconditionally")
         return None
 
 
@@ -138,6 +208,7 @@ def run_source(
     file_path: str | None = None,
     season: int | None = None,
     today: date | None = None,
+    conn=None,
 ) -> dict:
     """Fetch/parse/load one registry source.
 
@@ -167,11 +238,13 @@ def run_source(
         "gaps": None,
     }
     resolver: XwalkResolver | None = None
+    fetched: FetchedFile | None = None
 
     try:
         if spec.kind == "archiver":
             archiver = resolve_parser(spec.parser)
             archive_result = archiver(None, season=season)
+            conn = _live_ledger_conn(conn)
             rows = archive_result.get("new", 0)
             gaps = list(archive_result.get("gaps") or [])
             # Archiver runs aren't file-hash keyed (per-PDF dedupe happens
@@ -180,7 +253,7 @@ def run_source(
             # unique (source, file_sha256) WHERE status='loaded' index on a
             # same-day rerun, failing an otherwise harmless re-invocation.
             sha = f"archiver-{datetime.now(UTC).isoformat()}"
-            record_load(spec.name, sha, status="loaded", row_count=rows)
+            record_load(spec.name, sha, status="loaded", row_count=rows, conn=conn)
             result.update(
                 status="gap" if gaps else "loaded",
                 rows=rows,
@@ -193,17 +266,22 @@ def run_source(
             if not fetch_target:
                 result["error"] = f"{spec.name}: no fetch target -- pass --file or add fetch_url"
             else:
-                fetched = fetch_file(fetch_target)
+                validators = None if file_path else _safe_last_validators(spec.name, conn)
+                fetched = fetch_file(fetch_target, validators=validators)
                 result["sha"] = fetched.sha256
+                conn = _live_ledger_conn(conn)
 
-                if already_loaded(spec.name, fetched.sha256):
+                if fetched.not_modified or already_loaded(spec.name, fetched.sha256, conn=conn):
                     record_load(
                         spec.name,
                         fetched.sha256,
                         status="skipped",
                         source_url=fetched.source_url,
+                        etag=fetched.etag,
+                        last_modified=fetched.last_modified,
+                        conn=conn,
                     )
-                    result["status"] = "skipped_hash"
+                    result["status"] = "not_modified" if fetched.not_modified else "skipped_hash"
                 else:
                     ctx = ParseContext(
                         source=spec.name,
@@ -212,9 +290,9 @@ def run_source(
                         source_url=fetched.source_url,
                         file_name=os.path.basename(fetched.source_url),
                     )
-                    resolver = XwalkResolver.load(spec.name) if spec.uses_xwalk else None
+                    resolver = XwalkResolver.load(spec.name, conn=conn) if spec.uses_xwalk else None
 
-                    source_obj = build_flat_file_source(spec, fetched.content, ctx, resolver)
+                    source_obj = build_flat_file_source(spec, fetched.body, ctx, resolver)
 
                     pipeline = dlt.pipeline(
                         pipeline_name=f"flatfile_{spec.name}",
@@ -222,6 +300,7 @@ def run_source(
                         dataset_name=spec.schema,
                     )
                     pipeline.run(source_obj)
+                    conn = _live_ledger_conn(conn)
 
                     row_counts = pipeline.last_trace.last_normalize_info.row_counts
                     rows = row_counts.get(spec.table, 0)
@@ -234,6 +313,9 @@ def run_source(
                         status="loaded",
                         source_url=fetched.source_url,
                         row_count=rows,
+                        etag=fetched.etag,
+                        last_modified=fetched.last_modified,
+                        conn=conn,
                     )
                     result.update(status="loaded", rows=rows)
         else:
@@ -243,13 +325,19 @@ def run_source(
         msg = str(e)[:ERROR_MESSAGE_LIMIT]
         result["error"] = msg
         result["status"] = "no_op_offseason"
-        _safe_record_load(spec.name, result["sha"], status="skipped", error=msg)
+        _safe_record_load(
+            spec.name, result["sha"], status="skipped", error=msg, conn=_live_ledger_conn(conn)
+        )
     except Exception as e:
         msg = str(e)[:ERROR_MESSAGE_LIMIT]
         result["error"] = msg
         result["status"] = "failed"
-        _safe_record_load(spec.name, result["sha"], status="failed", error=msg)
+        _safe_record_load(
+            spec.name, result["sha"], status="failed", error=msg, conn=_live_ledger_conn(conn)
+        )
     finally:
+        if fetched is not None:
+            fetched.close()
         if resolver is not None:
             result["unmapped"] = len(resolver.misses)
         result["duration_s"] = time.time() - start
@@ -296,13 +384,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _planned_sources(args: argparse.Namespace, today: date) -> list[str]:
+def _planned_sources(args: argparse.Namespace, today: date, last: dict[str, datetime]) -> list[str]:
     if args.source:
         return list(args.source)
     if args.due:
-        return [
-            name for name, spec in REGISTRY.items() if is_due(spec, _safe_last_success(name), today)
-        ]
+        return [name for name, spec in REGISTRY.items() if is_due(spec, last.get(name), today)]
     return list(REGISTRY)
 
 
@@ -325,21 +411,34 @@ def main(argv: list[str] | None = None) -> int:
 
     today = date.today()
     season = args.season if args.season is not None else season_for_date(today)
-    names = _planned_sources(args, today)
 
     if args.dry_run:
+        last = _safe_last_successes(list(REGISTRY))
+        names = _planned_sources(args, today, last)
         print(f"[DRY RUN] {len(names)} flat-file source(s) planned for season {season}")
         for name in names:
             spec = REGISTRY[name]
-            due = is_due(spec, _safe_last_success(name), today)
+            due = is_due(spec, last.get(name), today)
             fetch_target = _fetch_target_display(spec, args.file)
             print(f"  {name:20s} cadence={spec.cadence:8s} due={due!s:5s} fetch={fetch_target}")
         return 0
 
-    results = [
-        run_source(REGISTRY[name], file_path=args.file, season=season, today=today)
-        for name in names
-    ]
+    conn = _safe_ledger_connect()
+    try:
+        last = _safe_last_successes(list(REGISTRY), conn) if args.due else {}
+        names = _planned_sources(args, today, last)
+        results = []
+        for name in names:
+            if conn is not None:
+                conn = _safe_ledger_connect(conn)
+            results.append(
+                run_source(
+                    REGISTRY[name], file_path=args.file, season=season, today=today, conn=conn
+                )
+            )
+    finally:
+        if conn is not None:
+            conn.close()
 
     print(f"\n{'=' * 60}")
     print("Flat-File Load Summary")
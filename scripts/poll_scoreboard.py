@@ -2,11 +2,12 @@
 """Poll CFBD /scoreboard and write live.scoreboard_snapshots rows.
 
 Tier 3 analytics (docs/plans/2026-07-21-tier3-analytics-plan.md), Pillar D,
-Phase 8 ("Live wiring"). Backs the Saturday in-game dashboard: one ONE call
-to /scoreboard per invocation (via .github/workflows/live-scoreboard.yml's
-5-minute cron), computing the house closed-form live win probability inline
-for every in-progress or completed-today game and appending a row to
-live.scoreboard_snapshots per game (src/schemas/migrations/029_live_schema.sql).
+Phase 8 ("Live wiring"). Backs the Saturday in-game dashboard: one call to
+/scoreboard per poll -- once per invocation, or on an adaptive cadence under
+--daemon (how .github/workflows/live-scoreboard.yml runs it) -- computing the
+house closed-form live win probability inline for every in-progress or
+completed-today game and appending a row to live.scoreboard_snapshots per
+game (src/schemas/migrations/029_live_schema.sql).
 
 Architecture mirrors scripts/compute_predictions.py: the WP math
 (`house_live_home_wp`, `clamp`), clock parsing (`parse_clock`), and the
@@ -45,11 +46,27 @@ Usage:
             SCOREBOARD_POLL games=<n> inserted=<i> deduped=<d> statuses={...}
         A clean no-op (games=0, exit 0) when /scoreboard returns nothing
         (off-season) or nothing is currently in-progress/completed-today.
+        Then rolls up games final for more than --retention-days (default
+        FINAL_RETENTION_DAYS) into live.game_summaries and prints:
+            SCOREBOARD_ROLLUP games=<n> final_days=<d>
 
     python scripts/poll_scoreboard.py --dry-run
         Same fetch + compute, but no DB writes -- for the workflow_dispatch
         manual smoke test. Still reads live.wp_params / house Elo (both
         read-only) to compute a realistic house_live_home_wp.
+
+    python scripts/poll_scoreboard.py --daemon [--max-minutes 55]
+        Stay up and keep polling (LiveScoreboardDaemon): client, connection,
+        house Elo, sigma, pregame margins and the latest hash per game are
+        held in memory across polls. Cadence adapts per poll
+        (next_poll_interval): POLL_SECONDS_CLOSE while any game is in a
+        close fourth quarter, POLL_SECONDS_LIVE while anything is in
+        progress, and a doubling backoff from POLL_SECONDS_IDLE when nothing
+        is. Rows are written in batches every FLUSH_SECONDS. Stops when
+        every game on the scoreboard is final or --max-minutes elapse, then
+        prints:
+            SCOREBOARD_DAEMON polls=<p> inserted=<i> deduped=<d> games_seen=<g>
+        Combines with --dry-run.
 """
 
 import argparse
@@ -57,7 +74,9 @@ import hashlib
 import logging
 import math
 import sys
+import time
 from collections import Counter
+from datetime import UTC, datetime
 
 from scripts.compute_predictions import elo_margin, fetch_elo_current, resolve_elo
 from src.pipelines.config.years import get_current_season
@@ -262,6 +281,140 @@ def parse_scoreboard_game(raw: dict) -> dict | None:
     }
 
 
+def parse_scoreboard(raw_games: list[dict]) -> list[dict]:
+    """parse_scoreboard_game over a whole /scoreboard response, dropping
+    (and logging) entries that fail to parse."""
+    parsed = []
+    for raw in raw_games:
+        try:
+            game = parse_scoreboard_game(raw)
+        except Exception:
+            logger.exception("Failed to parse a /scoreboard entry, skipping: %r", raw)
+            continue
+        if game is not None:
+            parsed.append(game)
+    return parsed
+
+
+def build_snapshot_row(
+    game: dict,
+    season: int,
+    pregame_expected_margin: float,
+    sigma: float,
+    captured_at: datetime,
+) -> dict:
+    """One live.scoreboard_snapshots row for a parsed game: house live WP
+    (None when the clock can't be read) and the dedup hash. Missing points
+    count as 0, in the row and the hash alike."""
+    seconds_remaining = parse_clock(game["clock"], game["period"])
+    home_points = game["home_points"] if game["home_points"] is not None else 0
+    away_points = game["away_points"] if game["away_points"] is not None else 0
+    current_margin = home_points - away_points
+
+    house_wp = None
+    if seconds_remaining is not None:
+        house_wp = house_live_home_wp(
+            current_margin, pregame_expected_margin, seconds_remaining, sigma
+        )
+
+    return {
+        "captured_at": captured_at,
+        "season": season,
+        "week": game["week"],
+        "season_type": game["season_type"],
+        "game_id": game["game_id"],
+        "status": game["status"],
+        "period": game["period"],
+        "clock": game["clock"],
+        "seconds_remaining": seconds_remaining,
+        "home_team": game["home_team"],
+        "away_team": game["away_team"],
+        "home_points": home_points,
+        "away_points": away_points,
+        "possession": game["possession"],
+        "spread": game["spread"],
+        "over_under": game["over_under"],
+        "cfbd_home_wp": game["cfbd_home_wp"],
+        "house_live_home_wp": house_wp,
+        "pregame_expected_margin": pregame_expected_margin,
+        "snapshot_hash": snapshot_hash(
+            game["game_id"],
+            game["period"],
+            game["clock"],
+            home_points,
+            away_points,
+            game["possession"],
+        ),
+    }
+
+
+def dedup_rows(rows: list[dict], latest_hashes: dict[int, str]) -> tuple[list[dict], int]:
+    """(rows whose hash differs from their game's latest, number skipped).
+
+    Updates `latest_hashes` in place with every row kept, so a long-running
+    poller's map always holds the hash of the last row it queued per game.
+    """
+    kept = []
+    deduped = 0
+    for row in rows:
+        if latest_hashes.get(row["game_id"]) == row["snapshot_hash"]:
+            deduped += 1
+            continue
+        latest_hashes[row["game_id"]] = row["snapshot_hash"]
+        kept.append(row)
+    return kept, deduped
+
+
+# --daemon cadence. A close fourth quarter is polled fastest -- that is where
+# the live WP moves most per play, and where a 5-minute cron tick missed the
+# finish entirely. Other live games get the normal cadence. With nothing in
+# progress (before kickoff, between windows) the interval doubles per idle
+# poll up to POLL_SECONDS_IDLE_MAX. Every poll is one /scoreboard call
+# against the monthly CFBD quota, which is what bounds the fast end.
+CLOSE_GAME_MARGIN = 8  # one score
+POLL_SECONDS_CLOSE = 30
+POLL_SECONDS_LIVE = 90
+POLL_SECONDS_IDLE = 300
+POLL_SECONDS_IDLE_MAX = 900
+
+# Full-resolution snapshots are kept while a game is live and for this many
+# days after it goes final; then live.rollup_final_snapshots folds them into
+# live.game_summaries (migration 056). Long enough to re-check a slate's
+# timelines the week after, short enough that the table holds ~one slate.
+FINAL_RETENTION_DAYS = 3
+
+# --daemon write batching: queued rows go out as one INSERT at most this
+# often (and always at exit). Rows carry their own captured_at, so batching
+# does not move a snapshot's timestamp.
+FLUSH_SECONDS = 60
+
+
+def is_close_late(game: dict) -> bool:
+    """In progress, fourth quarter or overtime, within one score."""
+    if game["status"] not in IN_PROGRESS_STATUSES or game["period"] is None:
+        return False
+    home_points = game["home_points"] if game["home_points"] is not None else 0
+    away_points = game["away_points"] if game["away_points"] is not None else 0
+    return game["period"] >= 4 and abs(home_points - away_points) <= CLOSE_GAME_MARGIN
+
+
+def next_poll_interval(games: list[dict], idle_polls: int) -> int:
+    """Seconds until the daemon's next /scoreboard call, given this poll's
+    parsed games and how many consecutive polls (before this one) found
+    nothing in progress."""
+    live = [g for g in games if g["status"] in IN_PROGRESS_STATUSES]
+    if any(is_close_late(g) for g in live):
+        return POLL_SECONDS_CLOSE
+    if live:
+        return POLL_SECONDS_LIVE
+    return min(POLL_SECONDS_IDLE * 2**idle_polls, POLL_SECONDS_IDLE_MAX)
+
+
+def slate_finished(games: list[dict]) -> bool:
+    """Every game on the scoreboard is final -- nothing left to poll for."""
+    return bool(games) and all(g["status"] in COMPLETED_STATUSES for g in games)
+
+
 # =============================================================================
 # --- I/O layer --- (thin: fetch /scoreboard + house Elo/wp_params, write)
 # =============================================================================
@@ -318,23 +471,39 @@ def fetch_wp_params(conn) -> tuple[float, float | None]:
 
 
 def fetch_latest_hashes(conn, game_ids: list[int]) -> dict[int, str]:
-    """Latest stored snapshot_hash per game_id, for the dedup check."""
+    """Latest stored snapshot_hash per game_id, for the dedup check.
+
+    Reads live.latest_snapshot (migration 056) -- one row per game, kept
+    current by an insert trigger on live.scoreboard_snapshots -- so the
+    lookup is a primary-key probe per game however much history is stored.
+    """
     if not game_ids:
         return {}
     query = """
-        SELECT DISTINCT ON (game_id) game_id, snapshot_hash
-        FROM live.scoreboard_snapshots
+        SELECT game_id, snapshot_hash
+        FROM live.latest_snapshot
         WHERE game_id = ANY(%s)
-        ORDER BY game_id, captured_at DESC
     """
     with conn.cursor() as cur:
         cur.execute(query, (game_ids,))
         return dict(cur.fetchall())
 
 
+def rollup_final_snapshots(conn, final_days: int) -> int:
+    """Summarize and drop the snapshots of games final for more than
+    `final_days` days (live.rollup_final_snapshots, migration 056). Keeps
+    live.scoreboard_snapshots at roughly one slate of full-resolution rows."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT live.rollup_final_snapshots(%s)", (final_days,))
+        rolled_up = cur.fetchone()[0]
+    conn.commit()
+    print(f"SCOREBOARD_ROLLUP games={rolled_up} final_days={final_days}")
+    return rolled_up
+
+
 _INSERT_SQL = """
     INSERT INTO live.scoreboard_snapshots (
-        season, week, season_type, game_id, status, period, clock,
+        captured_at, season, week, season_type, game_id, status, period, clock,
         seconds_remaining, home_team, away_team, home_points, away_points,
         possession, spread, over_under, cfbd_home_wp, house_live_home_wp,
         pregame_expected_margin, snapshot_hash
@@ -342,6 +511,7 @@ _INSERT_SQL = """
 """
 
 _ROW_COLUMNS = [
+    "captured_at",
     "season",
     "week",
     "season_type",
@@ -371,23 +541,31 @@ def write_snapshots(conn, rows: list[dict]) -> None:
         return
     values = [tuple(r[c] for c in _ROW_COLUMNS) for r in rows]
     with conn.cursor() as cur:
-        execute_values(cur, _INSERT_SQL, values)
+        execute_values(cur, _INSERT_SQL, values, page_size=len(values))
     conn.commit()
 
 
+def pregame_margin(game: dict, elo_current: dict) -> tuple[int, float]:
+    """(season, house Elo pregame expected home margin) for a parsed game."""
+    season = game["season"] if game["season"] is not None else get_current_season()
+    home_elo = resolve_elo(game["home_team"], season, elo_current)
+    away_elo = resolve_elo(game["away_team"], season, elo_current)
+    return season, elo_margin(home_elo, away_elo, game["neutral_site"])
+
+
+def log_dry_run_row(row: dict) -> None:
+    logger.info(
+        f"[dry-run] game_id={row['game_id']} {row['home_team']} {row['home_points']}-"
+        f"{row['away_points']} {row['away_team']} status={row['status']} "
+        f"period={row['period']} clock={row['clock']} "
+        f"house_wp={row['house_live_home_wp']} cfbd_wp={row['cfbd_home_wp']}"
+    )
+
+
 def run(conn, raw_games: list[dict], dry_run: bool = False) -> None:
     """Parse + filter /scoreboard, compute WP, write (or print) snapshot rows."""
-    all_parsed = []
-    for raw in raw_games:
-        try:
-            game = parse_scoreboard_game(raw)
-        except Exception:
-            logger.exception("Failed to parse a /scoreboard entry, skipping: %r", raw)
-            continue
-        if game is not None:
-            all_parsed.append(game)
-
-    relevant = [g for g in all_parsed if g["status"] in RELEVANT_STATUSES]
+    captured_at = datetime.now(UTC)
+    relevant = [g for g in parse_scoreboard(raw_games) if g["status"] in RELEVANT_STATUSES]
     status_counts = Counter(g["status"] for g in relevant)
 
     if not relevant:
@@ -400,74 +578,18 @@ def run(conn, raw_games: list[dict], dry_run: bool = False) -> None:
     game_ids = [g["game_id"] for g in relevant]
     latest_hashes = fetch_latest_hashes(conn, game_ids)
 
-    rows_to_insert: list[dict] = []
-    deduped = 0
+    rows = []
     for game in relevant:
-        season = game["season"] if game["season"] is not None else get_current_season()
-        home_elo = resolve_elo(game["home_team"], season, elo_current)
-        away_elo = resolve_elo(game["away_team"], season, elo_current)
-        pregame_expected_margin = elo_margin(home_elo, away_elo, game["neutral_site"])
-
-        seconds_remaining = parse_clock(game["clock"], game["period"])
-        home_points = game["home_points"] if game["home_points"] is not None else 0
-        away_points = game["away_points"] if game["away_points"] is not None else 0
-        current_margin = home_points - away_points
-
-        house_wp = None
-        if seconds_remaining is not None:
-            house_wp = house_live_home_wp(
-                current_margin, pregame_expected_margin, seconds_remaining, sigma
-            )
-
-        game_hash = snapshot_hash(
-            game["game_id"],
-            game["period"],
-            game["clock"],
-            home_points,
-            away_points,
-            game["possession"],
-        )
-
-        if latest_hashes.get(game["game_id"]) == game_hash:
-            deduped += 1
-            if dry_run:
-                logger.info(f"[dry-run] game_id={game['game_id']} DEDUP (hash unchanged)")
-            continue
-
-        row = {
-            "season": season,
-            "week": game["week"],
-            "season_type": game["season_type"],
-            "game_id": game["game_id"],
-            "status": game["status"],
-            "period": game["period"],
-            "clock": game["clock"],
-            "seconds_remaining": seconds_remaining,
-            "home_team": game["home_team"],
-            "away_team": game["away_team"],
-            "home_points": home_points,
-            "away_points": away_points,
-            "possession": game["possession"],
-            "spread": game["spread"],
-            "over_under": game["over_under"],
-            "cfbd_home_wp": game["cfbd_home_wp"],
-            "house_live_home_wp": house_wp,
-            "pregame_expected_margin": pregame_expected_margin,
-            "snapshot_hash": game_hash,
-        }
-        rows_to_insert.append(row)
-        if dry_run:
-            logger.info(
-                f"[dry-run] game_id={game['game_id']} {game['home_team']} {home_points}-"
-                f"{away_points} {game['away_team']} status={game['status']} "
-                f"period={game['period']} clock={game['clock']} "
-                f"house_wp={house_wp} cfbd_wp={game['cfbd_home_wp']}"
-            )
+        season, margin = pregame_margin(game, elo_current)
+        rows.append(build_snapshot_row(game, season, margin, sigma, captured_at))
+    rows_to_insert, deduped = dedup_rows(rows, latest_hashes)
 
-    if not dry_run:
-        write_snapshots(conn, rows_to_insert)
-    else:
+    if dry_run:
+        for row in rows_to_insert:
+            log_dry_run_row(row)
         conn.rollback()
+    else:
+        write_snapshots(conn, rows_to_insert)
 
     print(
         f"SCOREBOARD_POLL games={len(relevant)} inserted={len(rows_to_insert)} "
@@ -475,9 +597,157 @@ def run(conn, raw_games: list[dict], dry_run: bool = False) -> None:
     )
 
 
-def main() -> None:
+def connect():
+    import psycopg2
+
+    return psycopg2.connect(get_db_url())
+
+
+class LiveScoreboardDaemon:
+    """--daemon: one process polling /scoreboard for the whole window.
+
+    Everything a cron tick rebuilt on every run lives here for the
+    process's lifetime: the CFBD client, the DB connection, house Elo and
+    sigma (read once -- neither changes during a slate), each game's
+    pregame expected margin, and the latest snapshot hash per game (seeded
+    from live.latest_snapshot the first time a game is seen, then
+    kept current from the rows this process queues). A poll that changes
+    nothing costs one HTTP call and no queries.
+
+    Rows queue in memory and go out as one INSERT every FLUSH_SECONDS.
+    live.scoreboard_snapshots is append-only with no natural key (migration
+    029), so a batch is a multi-row insert; dedup is the hash map.
+    """
+
+    def __init__(self, client, conn, dry_run: bool = False):
+        self.client = client
+        # Autocommit: the process holds this connection for up to an hour,
+        # and a read would otherwise leave it idle in transaction between
+        # polls. Each flush is a single INSERT statement, so still atomic.
+        conn.autocommit = True
+        self.conn = conn
+        self.dry_run = dry_run
+        self.elo_current = fetch_elo_current(conn)
+        self.sigma, _blend_weight = fetch_wp_params(conn)
+        self.margins: dict[int, tuple[int, float]] = {}
+        self.latest_hashes: dict[int, str] = {}
+        self.pending: list[dict] = []
+        self.last_flush = time.monotonic()
+        self.idle_polls = 0
+        self.polls = 0
+        self.poll_errors = 0
+        self.inserted = 0
+        self.deduped = 0
+
+    def _seed_hashes(self, game_ids: list[int]) -> None:
+        unseen = [gid for gid in game_ids if gid not in self.margins]
+        if unseen:
+            self.latest_hashes.update(fetch_latest_hashes(self.conn, unseen))
+
+    def poll(self) -> tuple[int, bool]:
+        """One /scoreboard call. Returns (seconds until the next poll,
+        whether the slate is finished)."""
+        captured_at = datetime.now(UTC)
+        games = parse_scoreboard(self.client.get("/scoreboard", params={"classification": "fbs"}))
+        relevant = [g for g in games if g["status"] in RELEVANT_STATUSES]
+        self._seed_hashes([g["game_id"] for g in relevant])
+
+        rows = []
+        for game in relevant:
+            if game["game_id"] not in self.margins:
+                self.margins[game["game_id"]] = pregame_margin(game, self.elo_current)
+            season, margin = self.margins[game["game_id"]]
+            rows.append(build_snapshot_row(game, season, margin, self.sigma, captured_at))
+        queued, deduped = dedup_rows(rows, self.latest_hashes)
+        self.pending.extend(queued)
+        self.polls += 1
+        self.deduped += deduped
+
+        interval = next_poll_interval(games, self.idle_polls)
+        live = any(g["status"] in IN_PROGRESS_STATUSES for g in games)
+        self.idle_polls = 0 if live else self.idle_polls + 1
+        logger.info(
+            f"poll {self.polls}: games={len(relevant)} queued={len(queued)} "
+            f"deduped={deduped} next_in={interval}s"
+        )
+        return interval, slate_finished(games)
+
+    def flush(self, force: bool = False) -> None:
+        if not self.pending:
+            return
+        if not force and time.monotonic() - self.last_flush < FLUSH_SECONDS:
+            return
+        if self.dry_run:
+            for row in self.pending:
+                log_dry_run_row(row)
+        else:
+            import psycopg2
+
+            try:
+                write_snapshots(self.conn, self.pending)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                # A pooled connection dropped mid-slate: reconnect once and
+                # retry the same batch; the queued rows are still in memory.
+                logger.warning("Snapshot write failed; reconnecting and retrying once")
+                self._reconnect()
+                write_snapshots(self.conn, self.pending)
+        self.inserted += len(self.pending)
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+    def _reconnect(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+        self.conn = connect()
+        self.conn.autocommit = True
+
+    def close(self) -> None:
+        self.client.close()
+        self.conn.close()
+
+    def run(self, max_seconds: float, sleep=time.sleep) -> None:
+        """Poll until the slate is finished or `max_seconds` have passed,
+        flushing on the way and once more at exit.
+
+        A poll that raises (a /scoreboard call that failed past the client's
+        own retries, a dropped read) is logged and retried after
+        POLL_SECONDS_LIVE -- under cron, one bad call cost one 5-minute tick,
+        not the rest of the hour. If no poll succeeded at all, the last error
+        is re-raised so the run still fails."""
+        deadline = time.monotonic() + max_seconds
+        last_error: Exception | None = None
+        try:
+            while True:
+                try:
+                    interval, finished = self.poll()
+                except Exception as e:
+                    last_error = e
+                    self.poll_errors += 1
+                    logger.exception(f"poll failed; retrying in {POLL_SECONDS_LIVE}s")
+                    interval, finished = POLL_SECONDS_LIVE, False
+                self.flush()
+                if finished:
+                    logger.info("Every game on the scoreboard is final; stopping")
+                    break
+                if time.monotonic() + interval >= deadline:
+                    break
+                sleep(interval)
+        finally:
+            self.flush(force=True)
+            print(
+                f"SCOREBOARD_DAEMON polls={self.polls} inserted={self.inserted} "
+                f"deduped={self.deduped} games_seen={len(self.margins)} "
+                f"poll_errors={self.poll_errors}"
+            )
+        if self.polls == 0 and last_error is not None:
+            raise last_error
+
+
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
-        description="Poll CFBD /scoreboard once and write live.scoreboard_snapshots rows "
+        description="Poll CFBD /scoreboard and write live.scoreboard_snapshots rows "
         "with the house closed-form live win probability."
     )
     parser.add_argument(
@@ -485,9 +755,45 @@ def main() -> None:
         action="store_true",
         help="Fetch + compute + print only; no DB writes (workflow_dispatch smoke test).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep polling with an adaptive cadence until the slate is final or "
+        "--max-minutes elapse, instead of polling once.",
+    )
+    parser.add_argument(
+        "--max-minutes",
+        type=float,
+        default=55.0,
+        help="--daemon only: stop after this many minutes (default 55).",
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=FINAL_RETENTION_DAYS,
+        help="Roll up (summarize + delete) snapshots of games final for more than this "
+        f"many days after the poll (default {FINAL_RETENTION_DAYS}). Skipped with --dry-run.",
+    )
+    args = parser.parse_args(argv)
 
     client = get_client()
+    if args.daemon:
+        daemon = None
+        try:
+            daemon = LiveScoreboardDaemon(client, connect(), dry_run=args.dry_run)
+            daemon.run(args.max_minutes * 60)
+            if not args.dry_run:
+                rollup_final_snapshots(daemon.conn, args.retention_days)
+        except Exception:
+            logger.exception("Scoreboard daemon failed")
+            sys.exit(1)
+        finally:
+            if daemon is not None:
+                daemon.close()
+            else:
+                client.close()
+        return
+
     try:
         raw_games = client.get("/scoreboard", params={"classification": "fbs"})
     finally:
@@ -498,11 +804,11 @@ def main() -> None:
         print("SCOREBOARD_POLL games=0 inserted=0 deduped=0 statuses={}")
         return
 
-    import psycopg2
-
-    conn = psycopg2.connect(get_db_url())
+    conn = connect()
     try:
         run(conn, raw_games, dry_run=args.dry_run)
+        if not args.dry_run:
+            rollup_final_snapshots(conn, args.retention_days)
     except Exception:
         conn.rollback()
         logger.exception("Scoreboard poll failed")
@@ -10,6 +10,15 @@ Usage:
     python scripts/refresh_marts.py --views marts.house_elo,marts.house_elo_game
                                                          # Refresh exactly these views, in order,
                                                          # instead of the full layered list.
+    python scripts/refresh_marts.py --split-seasons 2014-2025
+                                                         # Also rebuild these seasons of
+                                                         # analytics.team_split_agg.
+
+A full (or --schema marts) refresh finishes by rebuilding
+analytics.team_split_agg -- the per-season sums behind the situational split
+RPCs (migrations/053_team_split_agg.sql) -- for the current season and any
+season not yet built. It runs after the matviews because its down/distance
+and field-position buckets read marts.play_epa.
 """
 
 import argparse
@@ -42,6 +51,7 @@ MARTS_VIEWS = [
     "marts.player_usage",
     "marts.team_ats_records",
     "marts.core_ratings",
+    "marts.player_search",
     "marts.penalty_log",
     "marts.team_penalty_box",
     # Layer 2: Depends on Layer 1
@@ -82,6 +92,18 @@ MARTS_VIEWS = [
     "marts.adjusted_epa_week",
 ]
 
+# Seasons analytics.team_split_agg is rebuilt for by default: the latest season
+# in core.games (the one still taking plays) plus any season never built.
+STALE_SPLIT_SEASONS_SQL = """
+SELECT DISTINCT g.season
+FROM core.games g
+WHERE g.season = (SELECT MAX(season) FROM core.games)
+   OR NOT EXISTS (
+       SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = g.season
+   )
+ORDER BY g.season
+"""
+
 ANALYTICS_VIEWS = [
     "analytics.team_season_summary",
     "analytics.player_career_stats",
@@ -151,11 +173,71 @@ def refresh_view(view_name: str, conn, concurrently: bool, dry_run: bool) -> boo
         cursor.close()
 
 
+def parse_seasons(spec: str) -> list[int]:
+    """Parse "2023", "2021,2023" or "2014-2025" (mixable) into sorted seasons."""
+    seasons: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(x) for x in part.split("-", 1))
+            if end < start:
+                raise ValueError(f"Invalid season range: {part}")
+            seasons.update(range(start, end + 1))
+        else:
+            seasons.add(int(part))
+    return sorted(seasons)
+
+
+def refresh_split_agg(conn, seasons: list[int], include_stale: bool, dry_run: bool) -> int:
+    """Rebuild analytics.team_split_agg for `seasons`, plus the stale ones
+    (STALE_SPLIT_SEASONS_SQL) if include_stale. Returns count of failed
+    seasons."""
+    if dry_run:
+        if include_stale:
+            print(f"  -- plus seasons from: {' '.join(STALE_SPLIT_SEASONS_SQL.split())}")
+        for season in seasons:
+            print(f"  SELECT analytics.refresh_team_split_agg({season});")
+        return 0
+
+    cursor = conn.cursor()
+    try:
+        if include_stale:
+            try:
+                cursor.execute(STALE_SPLIT_SEASONS_SQL)
+                seasons = sorted(set(seasons) | {int(row[0]) for row in cursor.fetchall()})
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"  ✗ analytics.team_split_agg: could not list stale seasons: {e}")
+                return 1
+
+        failures = 0
+        for season in seasons:
+            logger.info(f"Rebuilding analytics.team_split_agg for {season}...")
+            try:
+                start = datetime.now()
+                cursor.execute("SELECT analytics.refresh_team_split_agg(%s)", (season,))
+                rows = cursor.fetchone()[0]
+                conn.commit()
+                elapsed = (datetime.now() - start).total_seconds()
+                logger.info(f"  ✓ {season}: {rows} rows ({elapsed:.2f}s)")
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"  ✗ {season} failed: {e}")
+                failures += 1
+        return failures
+    finally:
+        cursor.close()
+
+
 def refresh_marts(
     schema: str | None = None,
     concurrently: bool = True,
     dry_run: bool = False,
     views: list[str] | None = None,
+    split_seasons: list[int] | None = None,
 ) -> int:
     """Refresh materialized views. Returns count of failures.
 
@@ -164,7 +246,12 @@ def refresh_marts(
     name must be schema-qualified as marts.* or analytics.*; a name that
     doesn't exist yet is not validated here -- Postgres will error on the
     REFRESH and that failure surfaces per-view like any other.
+
+    analytics.team_split_agg is rebuilt after a full or marts-schema refresh
+    (stale seasons, plus `split_seasons`), or for exactly `split_seasons`
+    when `views` is given. Each failed season counts as one failure.
     """
+    rebuild_splits = views is None and schema in (None, "marts")
     if views is not None:
         invalid = [v for v in views if not (v.startswith("marts.") or v.startswith("analytics."))]
         if invalid:
@@ -194,6 +281,8 @@ def refresh_marts(
     if dry_run:
         for view in views:
             refresh_view(view, conn=None, concurrently=concurrently, dry_run=True)
+        if rebuild_splits or split_seasons:
+            refresh_split_agg(None, split_seasons or [], rebuild_splits, dry_run=True)
         return 0
 
     import psycopg2
@@ -206,6 +295,8 @@ def refresh_marts(
         for view in views:
             if not refresh_view(view, conn, concurrently, dry_run):
                 failures += 1
+        if rebuild_splits or split_seasons:
+            failures += refresh_split_agg(conn, split_seasons or [], rebuild_splits, dry_run)
     finally:
         conn.close()
 
@@ -241,6 +332,13 @@ def main() -> None:
             "(overrides --schema and the full layered list)"
         ),
     )
+    parser.add_argument(
+        "--split-seasons",
+        help=(
+            "Seasons of analytics.team_split_agg to rebuild, e.g. 2024 or 2014-2025 "
+            "(in addition to the stale ones a full refresh rebuilds)"
+        ),
+    )
     args = parser.parse_args()
 
     view_list = [v.strip() for v in args.views.split(",") if v.strip()] if args.views else None
@@ -250,6 +348,7 @@ def main() -> None:
         concurrently=not args.no_concurrent,
         dry_run=args.dry_run,
         views=view_list,
+        split_seasons=parse_seasons(args.split_seasons) if args.split_seasons else None,
     )
     sys.exit(failures)
 
@@ -4,14 +4,15 @@
 Companion to scripts/train_model.py (which trains + freezes the walk-forward
 fits) and a sibling of scripts/compute_predictions.py (the Elo/blend writer).
 The feature vectorization + transforms (``build_feature_vector``, ``standardize``,
-``sigmoid``, ``platt_transform`` and the ``FEATURE_NAMES`` /
-``TEAM_WEEK_SOURCE_COLUMNS`` contract) are imported from ``train_model`` so train
-and score share one implementation; the market lookup, edge math and the exact
-``predictions.game_predictions`` upsert (``compute_edge``, ``write_backfill_season``,
-``write_upcoming``, the market fetchers, ``get_db_url``) are imported from
-``compute_predictions`` so ``fitted_v1`` rows are written byte-identically to the
-existing models -- same ``(game_id, model_version, prediction_date)`` conflict key,
-same ``edge = expected_home_margin + market_spread`` convention. ``fitted_v1``'s
+``sigmoid`` -- applied as ``platt_transform`` is, over a whole batch -- and the
+``FEATURE_NAMES`` / ``TEAM_WEEK_SOURCE_COLUMNS`` contract) are imported from
+``train_model`` so train and score share one implementation; the market lookup,
+edge math and the exact ``predictions.game_predictions`` upsert
+(``compute_edge``, ``write_backfill_season``, ``write_upcoming``, the market
+fetchers, ``get_db_url``) are imported from ``compute_predictions`` so
+``fitted_v1`` rows are written byte-identically to the existing models -- same
+``(game_id, model_version, prediction_date)`` conflict key, same
+``edge = expected_home_margin + market_spread`` convention. ``fitted_v1``'s
 ``elo_margin`` / ``epa_margin`` columns are always NULL (it is neither an Elo nor a
 blend model); ``home_elo_pregame`` / ``away_elo_pregame`` are populated from each
 side's ``team_week.elo_pregame`` (the pregame Elo the ``d_elo`` feature used).
@@ -31,7 +32,7 @@ Usage:
     python scripts/score_fitted.py            # or --upcoming
         Score pending games (current season / published next-season schedule)
         with the latest frozen fit. prediction_date = today (UTC, SQL-side).
-        Market: betting.line_snapshots if present else betting.lines, same
+        Market: betting.line_intervals if present else betting.lines, same
         fallback as compute_predictions upcoming mode.
 
 Each scored season prints:
@@ -56,10 +57,11 @@ from scripts.compute_predictions import (
     write_upcoming,
 )
 from scripts.train_model import (
+    FEATURE_NAMES,
     MODEL_VERSION,
     TEAM_WEEK_SOURCE_COLUMNS,
     build_feature_vector,
-    platt_transform,
+    sigmoid,
     standardize,
 )
 
@@ -124,19 +126,53 @@ def select_train_through(
     raise ValueError(f"unknown selection mode {mode!r}")
 
 
+def linear_predictor(X_std: np.ndarray, beta: np.ndarray) -> np.ndarray:
+    """``X_std @ beta`` for every row, accumulated one column at a time in
+    FEATURE_NAMES order.
+
+    A BLAS matrix-vector product picks its summation order by block size, so a
+    game's logit could move in the last bit depending on how many other games
+    were scored alongside it. Column-by-column elementwise accumulation gives
+    each row the same sequence of IEEE operations whatever the batch, which is
+    what makes ``score_game`` and ``score_games`` agree exactly."""
+    X_std = np.atleast_2d(X_std)
+    out = X_std[:, 0] * beta[0]
+    for j in range(1, X_std.shape[1]):
+        out = out + X_std[:, j] * beta[j]
+    return out
+
+
+def score_games(games: list[dict], fit: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Frozen-fit predictions for a batch: ``(expected_home_margin, home_win_prob)``
+    arrays aligned with ``games``.
+
+    The raw design is built once (``build_feature_vector`` per game, so the
+    imputation is the one contract), then standardization, both linear
+    predictors, the logistic and the Platt map run as array operations over the
+    whole batch. Every step is elementwise or ``linear_predictor``, so a game's
+    outputs do not depend on what else is in the batch."""
+    X_raw = np.empty((len(games), len(FEATURE_NAMES)), dtype=np.float64)
+    for i, game in enumerate(games):
+        X_raw[i] = build_feature_vector(
+            game, game["home_tw"], game["away_tw"], fit["feature_means"]
+        )
+    X_std = standardize(X_raw, fit["diff_means"], fit["diff_stds"])
+    margins = linear_predictor(X_std, fit["beta_margin"])
+    logits = linear_predictor(X_std, fit["beta_winprob"])
+    win_probs = sigmoid(fit["platt_a"] * logits + fit["platt_b"])
+    return margins, win_probs
+
+
 def score_game(game: dict, fit: dict) -> tuple[float, float]:
     """Frozen-fit prediction for one game: ``(expected_home_margin, home_win_prob)``.
 
     Vectorizes with the fit's frozen imputation means, applies its frozen z-score
     stats, dots with the ridge-margin beta for the expected margin and with the
-    IRLS beta for the logit, then Platt-calibrates. Returns Python floats (psycopg2
-    does not adapt numpy scalars)."""
-    x_raw = build_feature_vector(game, game["home_tw"], game["away_tw"], fit["feature_means"])
-    x_std = standardize(x_raw, fit["diff_means"], fit["diff_stds"])
-    expected_margin = float(x_std @ fit["beta_margin"])
-    logit = float(x_std @ fit["beta_winprob"])
-    win_prob = platt_transform(logit, fit["platt_a"], fit["platt_b"])
-    return expected_margin, win_prob
+    IRLS beta for the logit, then Platt-calibrates. A batch of one through
+    ``score_games``; returns Python floats (psycopg2 does not adapt numpy
+    scalars)."""
+    margins, win_probs = score_games([game], fit)
+    return float(margins[0]), float(win_probs[0])
 
 
 def build_score_row(
@@ -386,8 +422,10 @@ def run_backfill(conn, start: int, end: int) -> None:
         market_by_game = fetch_market_from_lines(conn, [g["game_id"] for g in games])
         rows: list[dict] = []
         n_with_market = 0
-        for game in games:
-            expected_margin, win_prob = score_game(game, fit)
+        margins, win_probs = score_games(games, fit)
+        for game, expected_margin, win_prob in zip(
+            games, margins.tolist(), win_probs.tolist(), strict=True
+        ):
             market = market_by_game.get(game["game_id"])
             if market and market.get("spread") is not None:
                 n_with_market += 1
@@ -446,17 +484,19 @@ def run_upcoming(conn) -> None:
         sys.exit(1)
 
     game_ids = [g["game_id"] for g in games]
-    if table_exists(conn, "betting", "line_snapshots"):
+    if table_exists(conn, "betting", "line_intervals"):
         market_by_game = fetch_market_from_snapshots(conn, game_ids)
-        logger.info("Market source: betting.line_snapshots (latest per game, consensus preferred)")
+        logger.info("Market source: betting.line_intervals (latest per game, consensus preferred)")
     else:
         market_by_game = fetch_market_from_lines(conn, game_ids)
-        logger.info("Market source: betting.lines (betting.line_snapshots not present)")
+        logger.info("Market source: betting.lines (betting.line_intervals not present)")
 
     rows: list[dict] = []
     n_with_market = 0
-    for game in games:
-        expected_margin, win_prob = score_game(game, fit)
+    margins, win_probs = score_games(games, fit)
+    for game, expected_margin, win_prob in zip(
+        games, margins.tolist(), win_probs.tolist(), strict=True
+    ):
         market = market_by_game.get(game["game_id"])
         if market and market.get("spread") is not None:
             n_with_market += 1
@@ -77,12 +77,27 @@ Usage:
 
     python scripts/simulate_season.py --season 2026
     python scripts/simulate_season.py --season 2026 --model fitted_v1 --sims 10000
+    python scripts/simulate_season.py --season 2026 --sims 100000 --chunk-size 10000 --workers 4
+        100k simulations for tighter tail probabilities in bounded memory: blocks
+        of --chunk-size sims, each from its own spawned seed, spread over
+        --workers processes (results do not depend on the worker count), each
+        reduced to per-team win counts and title shares before the next.
+
+    python scripts/simulate_season.py --incremental
+        Daily in-season refresh: load the persisted common-random-numbers
+        simulation (analytics.season_sim_state, migration 051), re-evaluate
+        only the games whose result or prediction changed, and patch the
+        per-team tallies. Unchanged games keep their draws, so projections do
+        not jitter from run to run. Sigma stays pinned at the value the state
+        was built with; add --reset-sigma to re-pin it (a full rebuild). See
+        CrnSeasonSimulation.
 
 Each season prints:
     SIM_GATE season={s} model={m} teams={t} sims={n} sigma={g} complete={c}
 """
 
 import argparse
+import functools
 import logging
 import math
 import sys
@@ -192,6 +207,28 @@ PROJECTION_SEASON_TYPE = "regular"
 # doing its job -- the point estimate is untouched and only the spread moves.
 DEFAULT_STRENGTH_SHARE = 0.15
 
+# --- Chunked simulation ------------------------------------------------------
+# Per-team win tallies within a block. No team plays anywhere near 32,767
+# games, and the two (n_teams, block) tally arrays are the largest allocation
+# after the draw itself -- int16 halves them. simulate_win_counts folds each
+# block down to per-team counts, so nothing outlives the block at n_sims size.
+WINS_DTYPE = "int16"
+
+# Pending games per in-place offset slab in _simulate_block. Bounds the
+# gathered u[home]/u[away] temporaries to this many rows of the block.
+MARGIN_SLAB_ROWS = 64
+
+# --- Common-random-numbers incremental mode (--incremental) -------------------
+# Stream identity for CrnSeasonSimulation: each team's offsets and each game's
+# noise come from SeedSequence(seed, spawn_key=(kind, identity)). Bump the
+# version if that mapping ever changes; a persisted state from another version
+# is rebuilt rather than patched.
+CRN_STREAM_VERSION = 1
+CRN_TEAM_STREAM = 0
+CRN_GAME_STREAM = 1
+
+_MISSING = object()
+
 
 # =============================================================================
 # Pure functions -- no I/O, no DB, unit-tested directly
@@ -253,52 +290,151 @@ def strength_sd(sigma: float, strength_share: float) -> tuple[float, float]:
     return tau, game_sd
 
 
-def simulate_wins(games, n_sims, sigma, seed=DEFAULT_SEED, strength_share=DEFAULT_STRENGTH_SHARE):
-    """Simulate `n_sims` seasons over `games`.
+def _team_row_groups(team_idx, rows=None):
+    """Precomputed grouping for summing game rows into team rows.
 
-    Returns a dict of per-team results:
+    Returns ``(order, bounds, teams)``: ``order`` lists game rows sorted by
+    team and ``bounds[k]:bounds[k + 1]`` is the run of ``order`` belonging to
+    ``teams[k]``. ``rows`` restricts the grouping to a subset of games
+    (conference games). Built once per ``simulate_wins`` call and reused by
+    every block.
+    """
+    import numpy as np
 
-    ``wins``            {team: ndarray[n_sims]} -- wins over all counted games
-    ``conf_wins``       {team: ndarray[n_sims]} -- wins in conference games only
-    ``games_simulated`` {team: int}             -- games that actually counted
-    ``conf_games``      {team: int}             -- conference games that counted
+    rows = np.arange(len(team_idx)) if rows is None else np.asarray(rows, dtype=np.intp)
+    order = rows[np.argsort(team_idx[rows], kind="stable")]
+    keys = team_idx[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else keys
+    bounds = np.r_[starts, len(keys)].astype(np.intp)
+    return order, bounds, keys[starts]
 
-    ``games`` is a list of dicts with ``home_team``, ``away_team``,
-    ``completed``, ``home_win`` (read only when completed),
-    ``expected_home_margin`` (read only when pending) and ``conference_game``.
 
-    Completed games add a deterministic win to the actual winner in every
-    simulation -- results already in the book are not re-rolled. Remaining games
-    draw a margin per simulation.
+def _scatter_team_rows(target, values, groups):
+    """``target[team] += values[game]`` summed over each team's games.
 
-    Vectorized: one ``(n_pending, n_sims)`` normal draw, then per-team
-    accumulation. At ~1,600 games x 10,000 sims this is ~16M doubles (~128MB)
-    and runs in about a second, where a per-simulation Python loop would take
-    minutes.
+    One gather of the game rows into team order, then one reduction per
+    TEAM over a contiguous slab. Measured against the alternatives at
+    realistic sizes: ``np.add.at`` is ~100x slower (unbuffered) and
+    ``np.add.reduceat(axis=0)`` ~5x slower than these slab sums.
+    """
+    order, bounds, teams = groups
+    if not len(teams):
+        return
+    rows = values[order]
+    for k, team in enumerate(teams):
+        target[team] += rows[bounds[k] : bounds[k + 1]].sum(axis=0, dtype=target.dtype)
 
-    **Conference wins are accumulated from the SAME draws**, not a second
-    simulation. Re-simulating would let a game be a win in the overall tally and
-    a loss in the conference tally within one "season", making title odds
-    inconsistent with the win totals shown beside them.
 
-    A game whose ``expected_home_margin`` is None is SKIPPED entirely -- it
-    counts toward neither wins nor ``games_simulated``. Inventing a 50/50 game
-    would bias projections toward .500, and counting it in the denominator
-    without letting it produce a win would make it a guaranteed loss. Callers
-    must use ``games_simulated``, not the raw schedule length, as the
-    denominator.
+def _simulate_block(plan, rng, n):
+    """Wins and conference wins from the PENDING games for `n` simulations.
+
+    ``plan`` is the dict ``simulate_wins`` builds (per-game means, team
+    indices, row groups, the two SDs). Draw order -- team offsets, then game
+    noise -- is the v1.1 order, so a single block seeded with
+    ``default_rng(seed)`` reproduces the unchunked results exactly.
     """
     import numpy as np
 
-    # Normalized once, up front: everything below -- and the value returned
-    # for the writer to record -- uses this exact number.
-    strength_share = normalize_strength_share(strength_share)
+    n_teams, tau = plan["n_teams"], plan["tau"]
+    home, away, mu = plan["home"], plan["away"], plan["mu"]
+    wins = np.zeros((n_teams, n), dtype=WINS_DTYPE)
+    conf_wins = np.zeros((n_teams, n), dtype=WINS_DTYPE)
+
+    u = (
+        rng.normal(0.0, tau, size=(n_teams, n))
+        if tau > 0.0
+        else np.zeros((n_teams, n), dtype=np.float64)
+    )
+    eps = rng.normal(loc=0.0, scale=plan["game_sd"], size=(len(mu), n))
+
+    # Offsets are added in place, a slab of games at a time, so the gathered
+    # u[home] / u[away] temporaries stay small next to eps itself. Same
+    # elementwise operations in the same order as the old per-game loop.
+    for lo in range(0, len(mu), MARGIN_SLAB_ROWS):
+        hi = lo + MARGIN_SLAB_ROWS
+        margin = eps[lo:hi]
+        margin += mu[lo:hi, None]
+        if tau > 0.0:
+            margin += u[home[lo:hi]]
+            margin -= u[away[lo:hi]]
+    home_won = eps > 0.0
+    del eps, u
+    away_won = ~home_won
+
+    _scatter_team_rows(wins, home_won, plan["home_groups"])
+    _scatter_team_rows(wins, away_won, plan["away_groups"])
+    _scatter_team_rows(conf_wins, home_won, plan["conf_home_groups"])
+    _scatter_team_rows(conf_wins, away_won, plan["conf_away_groups"])
+    return wins, conf_wins
+
+
+def _reduce_block(plan, wins, conf_wins, weight=1):
+    """Fold one block's per-simulation tallies down to per-team counts.
+
+    ``wins`` / ``conf_wins`` hold the block's PENDING-game wins and are
+    completed in place with the completed-game baseline. Returns ``(hist,
+    title)``: ``hist[team, w]`` counts the block's simulations in which the
+    team won ``w`` games, and ``title[team]`` sums its share of the best
+    conference win percentage over them (ties split evenly, as in
+    ``conference_title_probs``). ``weight`` scales a block that stands for
+    that many identical simulations (a schedule with nothing left to draw).
+    """
+    import numpy as np
+
+    n_teams, slots = plan["n_teams"], plan["slots"]
+    wins += plan["base_wins"][:, None]
+    conf_wins += plan["base_conf_wins"][:, None]
+
+    keys = wins.astype(np.intp)
+    keys += (np.arange(n_teams, dtype=np.intp) * slots)[:, None]
+    hist = np.bincount(keys.ravel(), minlength=n_teams * slots).reshape(n_teams, slots)
+    hist *= weight
+
+    title = np.zeros(n_teams, dtype=np.float64)
+    for members, played in plan["conf_groups"]:
+        pct = conf_wins[members] / played[:, None]
+        is_best = pct >= pct.max(axis=0)
+        title[members] += (is_best / is_best.sum(axis=0)).sum(axis=1) * weight
+    return hist, title
+
+
+def _block_result(plan, rng, n):
+    """One block: the raw tallies, or their per-team counts when the plan reduces."""
+    wins, conf_wins = _simulate_block(plan, rng, n)
+    if plan.get("reduce"):
+        return _reduce_block(plan, wins, conf_wins)
+    return wins, conf_wins
+
+
+_SIM_PLAN: dict = {}
+
+
+def _init_sim_worker(plan: dict) -> None:
+    _SIM_PLAN.clear()
+    _SIM_PLAN.update(plan)
+
+
+def _simulate_chunk(task):
+    """Worker entry point: one chunk from its own spawned seed."""
+    import numpy as np
+
+    seed_seq, n = task
+    return _block_result(_SIM_PLAN, np.random.default_rng(seed_seq), n)
+
+
+def _simulation_plan(games, sigma, strength_share):
+    """Team index, per-team counts, the completed-game baseline and the
+    pending-game draw plan shared by ``simulate_wins`` and
+    ``simulate_win_counts``.
+
+    Returns ``(teams, plan, games_simulated, conf_games)``. ``plan["pending"]``
+    is False when no game is left to draw; the draw keys are absent then.
+    """
+    import numpy as np
 
     teams = sorted({g["home_team"] for g in games} | {g["away_team"] for g in games})
     index = {t: i for i, t in enumerate(teams)}
     n_teams = len(teams)
-    wins = np.zeros((n_teams, n_sims), dtype=np.int32)
-    conf_wins = np.zeros((n_teams, n_sims), dtype=np.int32)
     games_simulated = dict.fromkeys(teams, 0)
     conf_games = dict.fromkeys(teams, 0)
 
@@ -309,52 +445,157 @@ def simulate_wins(games, n_sims, sigma, seed=DEFAULT_SEED, strength_share=DEFAUL
             conf_games[g["home_team"]] += 1
             conf_games[g["away_team"]] += 1
 
+    # Completed games are the same in every simulation: tallied once per team
+    # and broadcast across the sims axis.
+    base_wins = np.zeros(n_teams, dtype=WINS_DTYPE)
+    base_conf_wins = np.zeros(n_teams, dtype=WINS_DTYPE)
     pending = []
     for g in games:
         if g["completed"]:
-            winner = g["home_team"] if g["home_win"] else g["away_team"]
-            wins[index[winner], :] += 1
+            winner = index[g["home_team"] if g["home_win"] else g["away_team"]]
+            base_wins[winner] += 1
             if g.get("conference_game"):
-                conf_wins[index[winner], :] += 1
+                base_conf_wins[winner] += 1
             _count(g)
         elif g.get("expected_home_margin") is not None:
             pending.append(g)
             _count(g)
 
+    plan = {
+        "n_teams": n_teams,
+        "index": index,
+        "base_wins": base_wins,
+        "base_conf_wins": base_conf_wins,
+        "slots": max(games_simulated.values(), default=0) + 1,
+        "pending": bool(pending),
+    }
     if pending:
-        rng = np.random.default_rng(seed)
-        mu = np.array([g["expected_home_margin"] for g in pending], dtype=np.float64)
         tau, game_sd = strength_sd(sigma, strength_share)
+        home = np.array([index[g["home_team"]] for g in pending], dtype=np.intp)
+        away = np.array([index[g["away_team"]] for g in pending], dtype=np.intp)
+        conf_rows = [i for i, g in enumerate(pending) if g.get("conference_game")]
+        plan.update(
+            {
+                "tau": tau,
+                "game_sd": game_sd,
+                "mu": np.array([g["expected_home_margin"] for g in pending], dtype=np.float64),
+                "home": home,
+                "away": away,
+                "home_groups": _team_row_groups(home),
+                "away_groups": _team_row_groups(away),
+                "conf_home_groups": _team_row_groups(home, conf_rows),
+                "conf_away_groups": _team_row_groups(away, conf_rows),
+            }
+        )
+    return teams, plan, games_simulated, conf_games
+
+
+def _run_blocks(plan, n_sims, seed, chunk_size, workers):
+    """``(first_sim, block_result)`` for every block of the ``n_sims`` draws.
+
+    ``chunk_size=None`` is one block straight from ``default_rng(seed)`` --
+    the v1.1 stream. Otherwise blocks of at most ``chunk_size`` sims, each
+    from its own child of ``SeedSequence(seed).spawn(n_chunks)``, in order,
+    spread over ``workers`` processes when there is more than one.
+    """
+    import numpy as np
+
+    if chunk_size is None:
+        yield 0, _block_result(plan, np.random.default_rng(seed), n_sims)
+        return
 
-        # One season-strength offset per team per simulation, reused across
-        # every game that team plays. This is what makes outcomes correlate:
-        # in a simulation where a team drew a positive offset it is better
-        # than its rating against ALL its opponents, which is how real seasons
-        # produce 11-win and 3-win records far more often than independent
-        # coin flips do.
-        u = (
-            rng.normal(0.0, tau, size=(n_teams, n_sims))
-            if tau > 0.0
-            else np.zeros((n_teams, n_sims), dtype=np.float64)
+    bounds = list(range(0, n_sims, chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(len(bounds))
+    tasks = [(s, min(chunk_size, n_sims - lo)) for s, lo in zip(seeds, bounds)]
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_sim_worker, initargs=(plan,)
         )
+        with pool:
+            yield from zip(bounds, pool.map(_simulate_chunk, tasks))
+    else:
+        for lo, (s, n) in zip(bounds, tasks):
+            yield lo, _block_result(plan, np.random.default_rng(s), n)
 
-        # Game noise generated in one block, as in v1. The per-row offsets are
-        # then added in place, so peak memory is unchanged -- no second
-        # (n_pending, n_sims) array is ever materialized.
-        eps = rng.normal(loc=0.0, scale=game_sd, size=(len(pending), n_sims))
-        for row, g in enumerate(pending):
-            h, a = index[g["home_team"]], index[g["away_team"]]
-            margin = eps[row]
-            margin += mu[row]
-            if tau > 0.0:
-                margin += u[h]
-                margin -= u[a]
-            home_won_row = margin > 0.0
-            wins[h, :] += home_won_row
-            wins[a, :] += ~home_won_row
-            if g.get("conference_game"):
-                conf_wins[h, :] += home_won_row
-                conf_wins[a, :] += ~home_won_row
+
+def simulate_wins(
+    games,
+    n_sims,
+    sigma,
+    seed=DEFAULT_SEED,
+    strength_share=DEFAULT_STRENGTH_SHARE,
+    chunk_size=None,
+    workers=1,
+):
+    """Simulate `n_sims` seasons over `games`.
+
+    Returns a dict of per-team results:
+
+    ``wins``            {team: ndarray[n_sims]} -- wins over all counted games
+    ``conf_wins``       {team: ndarray[n_sims]} -- wins in conference games only
+    ``games_simulated`` {team: int}             -- games that actually counted
+    ``conf_games``      {team: int}             -- conference games that counted
+
+    ``games`` is a list of dicts with ``home_team``, ``away_team``,
+    ``completed``, ``home_win`` (read only when completed),
+    ``expected_home_margin`` (read only when pending) and ``conference_game``.
+
+    Completed games add a deterministic win to the actual winner in every
+    simulation -- results already in the book are not re-rolled. Remaining games
+    draw a margin per simulation.
+
+    Vectorized: one ``(n_pending, n_sims)`` normal draw, then per-team
+    scatter-adds of the home/away outcomes (``_scatter_team_rows``). At ~1,600
+    games x 10,000 sims the draw is ~16M doubles (~128MB) and runs in about a
+    second, where a per-simulation Python loop would take minutes.
+
+    ``chunk_size`` bounds that draw: simulations are generated in blocks of
+    at most ``chunk_size``, each from its own child of
+    ``SeedSequence(seed).spawn(n_chunks)``. Chunked results are reproducible
+    for a given ``(seed, chunk_size)`` but are a DIFFERENT stream from the
+    unchunked default, which stays bit-identical to every projection already
+    written. ``workers > 1`` spreads the chunks over processes; the chunk
+    seeds do not depend on the worker count, so neither do the results.
+
+    The returned per-simulation tallies are themselves ``(n_teams, n_sims)``
+    -- what the CRN patching and tests need, but not bounded. The projection
+    path uses ``simulate_win_counts``, which draws the same blocks and keeps
+    only per-team counts.
+
+    **Conference wins are accumulated from the SAME draws**, not a second
+    simulation. Re-simulating would let a game be a win in the overall tally and
+    a loss in the conference tally within one "season", making title odds
+    inconsistent with the win totals shown beside them.
+
+    A game whose ``expected_home_margin`` is None is SKIPPED entirely -- it
+    counts toward neither wins nor ``games_simulated``. Inventing a 50/50 game
+    would bias projections toward .500, and counting it in the denominator
+    without letting it produce a win would make it a guaranteed loss. Callers
+    must use ``games_simulated``, not the raw schedule length, as the
+    denominator.
+    """
+    import numpy as np
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size!r}")
+
+    # Normalized once, up front: everything below -- and the value returned
+    # for the writer to record -- uses this exact number.
+    strength_share = normalize_strength_share(strength_share)
+    teams, plan, games_simulated, conf_games = _simulation_plan(games, sigma, strength_share)
+    index, n_teams = plan["index"], plan["n_teams"]
+
+    wins = np.empty((n_teams, n_sims), dtype=WINS_DTYPE)
+    conf_wins = np.empty((n_teams, n_sims), dtype=WINS_DTYPE)
+    wins[:] = plan["base_wins"][:, None]
+    conf_wins[:] = plan["base_conf_wins"][:, None]
+
+    if plan["pending"]:
+        for lo, (w, cw) in _run_blocks(plan, n_sims, seed, chunk_size, workers):
+            wins[:, lo : lo + w.shape[1]] += w
+            conf_wins[:, lo : lo + w.shape[1]] += cw
 
     return {
         "wins": {t: wins[index[t], :] for t in teams},
@@ -371,6 +612,327 @@ def simulate_wins(games, n_sims, sigma, seed=DEFAULT_SEED, strength_share=DEFAUL
     }
 
 
+def simulate_win_counts(
+    games,
+    n_sims,
+    sigma,
+    seed=DEFAULT_SEED,
+    strength_share=DEFAULT_STRENGTH_SHARE,
+    chunk_size=None,
+    workers=1,
+    conf_by_team=None,
+):
+    """``simulate_wins`` reduced to per-team counts inside the block loop.
+
+    Same draws, same blocks and the same rules, but no tally ever spans
+    ``n_sims``: each block is folded (``_reduce_block``) into
+
+    ``win_counts``      {team: ndarray[slots]} -- simulations per win total,
+                        i.e. ``np.bincount`` of simulate_wins' ``wins``
+    ``conf_title_prob`` {team: float}          -- ``conference_title_probs``
+                        over the same draws, for the teams it would score
+
+    plus ``games_simulated``, ``conf_games`` and ``strength_share`` as in
+    ``simulate_wins``. Working memory is one block plus ``(n_teams, slots)``
+    -- with ``chunk_size`` set, 100,000+ simulations cost time, not RAM. The
+    conference title needs the joint draw across a league, so it is scored
+    per block and summed rather than derived from the counts afterwards.
+    ``conf_by_team`` omitted leaves ``conf_title_prob`` empty. With workers,
+    each process returns only its blocks' counts.
+    """
+    import numpy as np
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size!r}")
+
+    strength_share = normalize_strength_share(strength_share)
+    teams, plan, games_simulated, conf_games = _simulation_plan(games, sigma, strength_share)
+    index, n_teams = plan["index"], plan["n_teams"]
+
+    # Same membership rule as conference_title_probs.
+    by_conf = {}
+    for team, conf in (conf_by_team or {}).items():
+        if conf and team in index and conf_games.get(team, 0) > 0:
+            by_conf.setdefault(conf, []).append(team)
+    titled = [members for members in by_conf.values() if len(members) >= 2]
+    plan["conf_groups"] = [
+        (
+            np.array([index[t] for t in members], dtype=np.intp),
+            np.array([conf_games[t] for t in members], dtype=np.float64),
+        )
+        for members in titled
+    ]
+    plan["reduce"] = True
+
+    hist = np.zeros((n_teams, plan["slots"]), dtype=np.int64)
+    title = np.zeros(n_teams, dtype=np.float64)
+    if plan["pending"]:
+        for _lo, (h, t) in _run_blocks(plan, n_sims, seed, chunk_size, workers):
+            hist += h
+            title += t
+    else:
+        # Nothing to draw: every simulation is the completed-games baseline.
+        empty = np.zeros((n_teams, 1), dtype=WINS_DTYPE)
+        hist, title = _reduce_block(plan, empty, empty.copy(), weight=n_sims)
+
+    return {
+        "win_counts": {t: hist[index[t]] for t in teams},
+        "conf_title_prob": {
+            t: float(title[index[t]]) / n_sims for members in titled for t in members
+        },
+        "games_simulated": games_simulated,
+        "conf_games": conf_games,
+        "strength_share": strength_share,
+    }
+
+
+def crn_team_normals(seed, team, n_sims):
+    """Team ``team``'s standard-normal strength draws, one per simulation.
+
+    Keyed by the team's NAME under ``seed`` rather than by its row in a
+    sorted team list, so the draw a team gets does not move when another
+    team joins or leaves the schedule.
+    """
+    import numpy as np
+
+    key = (CRN_TEAM_STREAM, *str(team).encode("utf-8"))
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key)).standard_normal(
+        n_sims
+    )
+
+
+def crn_game_normals(seed, game_id, n_sims):
+    """Game ``game_id``'s standard-normal noise draws, keyed by its id."""
+    import numpy as np
+
+    key = (CRN_GAME_STREAM, int(game_id))
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key)).standard_normal(
+        n_sims
+    )
+
+
+def _crn_signature(g):
+    """Everything about a game that can change its contribution to the tallies.
+
+    A completed game's margin is irrelevant (the result is in the book) and a
+    pending game's ``home_win`` is not read, so each is blanked on the side
+    that does not apply -- a prediction refresh on a finished game is not a
+    change.
+    """
+    completed = bool(g["completed"])
+    return (
+        g["home_team"],
+        g["away_team"],
+        bool(g.get("conference_game")),
+        completed,
+        bool(g["home_win"]) if completed else None,
+        None if completed else g.get("expected_home_margin"),
+    )
+
+
+class CrnSeasonSimulation:
+    """Season simulation that can be patched game by game (common random numbers).
+
+    ``simulate_wins`` draws the whole season from one stream, so changing a
+    single game's prediction reshuffles every other game's draw and the
+    projections jitter from run to run by simulation noise alone. Here every
+    random quantity has a fixed identity instead:
+
+    - each team's season-strength offset is ``tau * crn_team_normals(seed,
+      team)``;
+    - each pending game's noise is ``game_sd * crn_game_normals(seed,
+      game_id)``.
+
+    A game's per-simulation outcome is therefore a function of its own
+    inputs alone, and is kept (bit-packed) per game. ``apply(games)`` diffs
+    the schedule against the last one it saw, backs the changed games'
+    old outcomes out of the per-team tallies and adds the new ones: work is
+    O(changed games), and an unchanged game keeps exactly the outcome it had.
+    Whatever order updates arrive in, the tallies equal a fresh instance fed
+    the final schedule -- the property that makes the incremental path safe.
+
+    The model is the one ``simulate_wins`` implements (same sigma split,
+    same completed/skipped rules, same return shape from ``result()``); only
+    the stream differs, so for a given seed the numbers are equally valid
+    but not identical to a ``simulate_wins`` run. A change to ``sigma``,
+    ``strength_share``, ``n_sims`` or ``seed`` changes every pending game,
+    which is why callers compare ``params()`` and start a fresh instance
+    instead of patching -- and why ``--incremental`` pins sigma rather than
+    following the daily re-measurement (``resume_crn_simulation``).
+    """
+
+    def __init__(self, n_sims, sigma, seed=DEFAULT_SEED, strength_share=DEFAULT_STRENGTH_SHARE):
+        self.n_sims = int(n_sims)
+        self.sigma = float(sigma)
+        self.seed = int(seed)
+        self.strength_share = normalize_strength_share(strength_share)
+        self.tau, self.game_sd = strength_sd(self.sigma, self.strength_share)
+        self.signatures = {}  # game_id -> _crn_signature
+        self.outcomes = {}  # game_id -> packed home-win bits, counted games only
+        self.wins = {}
+        self.conf_wins = {}
+        self._team_z = {}
+
+    def params(self) -> dict:
+        return {
+            "seed": self.seed,
+            "n_sims": self.n_sims,
+            "sigma": self.sigma,
+            "strength_share": self.strength_share,
+            "stream_version": CRN_STREAM_VERSION,
+        }
+
+    def _team_normals(self, team):
+        if team not in self._team_z:
+            self._team_z[team] = crn_team_normals(self.seed, team, self.n_sims)
+        return self._team_z[team]
+
+    def _evaluate(self, pending):
+        """Home-win matrix ``(len(pending), n_sims)`` for ``(game_id, sig)`` pairs."""
+        import numpy as np
+
+        z = np.vstack([crn_game_normals(self.seed, gid, self.n_sims) for gid, _ in pending])
+        margin = z * self.game_sd
+        margin += np.array([sig[5] for _, sig in pending], dtype=np.float64)[:, None]
+        if self.tau > 0.0:
+            margin += self.tau * np.vstack([self._team_normals(sig[0]) for _, sig in pending])
+            margin -= self.tau * np.vstack([self._team_normals(sig[1]) for _, sig in pending])
+        return margin > 0.0
+
+    def _tally(self, sig, home_won, sign):
+        import numpy as np
+
+        home, away, conference_game = sig[0], sig[1], sig[2]
+        targets = [self.wins] + ([self.conf_wins] if conference_game else [])
+        for tally in targets:
+            for team, won in ((home, home_won), (away, ~home_won)):
+                row = tally.get(team)
+                if row is None:
+                    row = tally[team] = np.zeros(self.n_sims, dtype=WINS_DTYPE)
+                if sign > 0:
+                    row += won
+                else:
+                    row -= won
+
+    def _unpack(self, game_id):
+        import numpy as np
+
+        bits = np.unpackbits(self.outcomes[game_id], count=self.n_sims)
+        return bits.astype(bool)
+
+    def _commit(self, game_id, sig, home_won):
+        import numpy as np
+
+        self.signatures[game_id] = sig
+        if home_won is not None:
+            self.outcomes[game_id] = np.packbits(home_won)
+            self._tally(sig, home_won, +1)
+
+    def _retract(self, game_id):
+        sig = self.signatures.pop(game_id)
+        if game_id in self.outcomes:
+            self._tally(sig, self._unpack(game_id), -1)
+            del self.outcomes[game_id]
+
+    def apply(self, games) -> list:
+        """Bring the tallies up to date with ``games``; returns the game ids
+        whose contribution changed (added, removed or re-evaluated)."""
+        import numpy as np
+
+        current = {g["game_id"]: _crn_signature(g) for g in games}
+        changed = [gid for gid in self.signatures if gid not in current]
+        changed += [
+            gid for gid, sig in current.items() if self.signatures.get(gid, _MISSING) != sig
+        ]
+        for gid in changed:
+            if gid in self.signatures:
+                self._retract(gid)
+
+        pending = []
+        for gid in changed:
+            sig = current.get(gid)
+            if sig is None:
+                continue
+            if sig[3]:
+                self._commit(gid, sig, np.full(self.n_sims, sig[4], dtype=bool))
+            elif sig[5] is not None:
+                pending.append((gid, sig))
+            else:
+                # Skipped, exactly as simulate_wins skips it -- but remembered,
+                # so the team still appears with games_simulated = 0.
+                self._commit(gid, sig, None)
+        if pending:
+            for (gid, sig), home_won in zip(pending, self._evaluate(pending)):
+                self._commit(gid, sig, home_won)
+        return changed
+
+    def result(self) -> dict:
+        """Same shape as ``simulate_wins``' return value."""
+        import numpy as np
+
+        teams = sorted(
+            {sig[0] for sig in self.signatures.values()}
+            | {sig[1] for sig in self.signatures.values()}
+        )
+        games_simulated = dict.fromkeys(teams, 0)
+        conf_games = dict.fromkeys(teams, 0)
+        for gid, sig in self.signatures.items():
+            if gid not in self.outcomes:
+                continue
+            for team in sig[:2]:
+                games_simulated[team] += 1
+                if sig[2]:
+                    conf_games[team] += 1
+        zeros = np.zeros(self.n_sims, dtype=WINS_DTYPE)
+        return {
+            "wins": {t: self.wins.get(t, zeros).copy() for t in teams},
+            "conf_wins": {t: self.conf_wins.get(t, zeros).copy() for t in teams},
+            "games_simulated": games_simulated,
+            "conf_games": conf_games,
+            "strength_share": self.strength_share,
+            "sigma": self.sigma,
+        }
+
+    def export_state(self) -> tuple[dict, list[dict]]:
+        """``(params, per-game rows)`` for analytics.season_sim_state/_game."""
+        return self.params(), [self.game_row(gid) for gid in sorted(self.signatures)]
+
+    def game_row(self, game_id) -> dict:
+        home, away, conference_game, completed, home_win, margin = self.signatures[game_id]
+        bits = self.outcomes.get(game_id)
+        return {
+            "game_id": game_id,
+            "home_team": home,
+            "away_team": away,
+            "conference_game": conference_game,
+            "completed": completed,
+            "home_win": home_win,
+            "expected_home_margin": margin,
+            # Completed games are reconstructed from home_win; only simulated
+            # outcomes need their bits kept.
+            "home_wins": bits.tobytes() if bits is not None and not completed else None,
+        }
+
+    @classmethod
+    def from_state(cls, params: dict, rows: list[dict]) -> "CrnSeasonSimulation":
+        """Rebuild from ``export_state()`` output. Tallies are re-summed from
+        the stored outcomes; no random numbers are drawn."""
+        import numpy as np
+
+        sim = cls(params["n_sims"], params["sigma"], params["seed"], params["strength_share"])
+        for r in rows:
+            sig = _crn_signature(r)
+            if sig[3]:
+                home_won = np.full(sim.n_sims, sig[4], dtype=bool)
+            elif r.get("home_wins") is not None:
+                packed = np.frombuffer(bytes(r["home_wins"]), dtype=np.uint8)
+                home_won = np.unpackbits(packed, count=sim.n_sims).astype(bool)
+            else:
+                home_won = None
+            sim._commit(r["game_id"], sig, home_won)
+        return sim
+
+
 def win_distribution(team_wins, games_simulated):
     """``{win_count: probability}`` over 0..games_simulated, summing to 1.
 
@@ -384,8 +946,14 @@ def win_distribution(team_wins, games_simulated):
     """
     import numpy as np
 
-    n_sims = len(team_wins)
-    counts = np.bincount(team_wins, minlength=games_simulated + 1)
+    return win_distribution_from_counts(np.bincount(team_wins), games_simulated)
+
+
+def win_distribution_from_counts(win_counts, games_simulated):
+    """``win_distribution`` from per-win-total counts (``simulate_win_counts``)."""
+    n_sims = int(sum(win_counts))
+    counts = list(win_counts)[: games_simulated + 1]
+    counts += [0] * (games_simulated + 1 - len(counts))
     return {w: float(counts[w]) / n_sims for w in range(games_simulated + 1)}
 
 
@@ -519,18 +1087,48 @@ def summarize(team_wins, games_simulated, bowl_eligible=True):
     """
     import numpy as np
 
+    return summarize_win_counts(np.bincount(team_wins), games_simulated, bowl_eligible)
+
+
+@functools.lru_cache(maxsize=64)
+def _lower_rank(n_sims, q):
+    """Position in the sorted draws that ``np.percentile(..., method="lower")``
+    reads -- taken from numpy itself so the counts path cannot drift from it."""
+    import numpy as np
+
+    return int(np.percentile(np.arange(n_sims), q, method="lower"))
+
+
+def summarize_win_counts(win_counts, games_simulated, bowl_eligible=True):
+    """``summarize`` from per-win-total counts (``simulate_win_counts``).
+
+    Exactly the same numbers as ``summarize`` over the per-simulation wins:
+    the mean is an integer total over ``n_sims`` either way, and each
+    ``lower`` percentile is the win total at numpy's rank in the sorted draws.
+    """
+    import numpy as np
+
+    counts = np.asarray(win_counts, dtype=np.int64)
+    n_sims = int(counts.sum())
+    cumulative = np.cumsum(counts)
+    mean = float(int(np.dot(np.arange(len(counts)), counts))) / n_sims
+
+    def pct(q):
+        return float(np.searchsorted(cumulative, _lower_rank(n_sims, q), side="right"))
+
+    def p_at_least(w):
+        return float(int(counts[w:].sum())) / n_sims
+
     return {
-        "projected_wins": float(np.mean(team_wins)),
-        "projected_losses": float(games_simulated - np.mean(team_wins)),
-        "median_wins": float(np.percentile(team_wins, 50, method="lower")),
-        "wins_p10": float(np.percentile(team_wins, 10, method="lower")),
-        "wins_p25": float(np.percentile(team_wins, 25, method="lower")),
-        "wins_p75": float(np.percentile(team_wins, 75, method="lower")),
-        "wins_p90": float(np.percentile(team_wins, 90, method="lower")),
-        "p_bowl_eligible": (
-            float(np.mean(team_wins >= BOWL_ELIGIBLE_WINS)) if bowl_eligible else None
-        ),
-        "p_ten_plus": float(np.mean(team_wins >= TEN_PLUS_WINS)),
+        "projected_wins": mean,
+        "projected_losses": float(games_simulated - mean),
+        "median_wins": pct(50),
+        "wins_p10": pct(10),
+        "wins_p25": pct(25),
+        "wins_p75": pct(75),
+        "wins_p90": pct(90),
+        "p_bowl_eligible": p_at_least(BOWL_ELIGIBLE_WINS) if bowl_eligible else None,
+        "p_ten_plus": p_at_least(TEN_PLUS_WINS),
     }
 
 
@@ -608,9 +1206,13 @@ def build_projection_row(
     strength_share,
     classification=None,
     expected_slate=None,
+    win_counts=None,
 ):
     """One predictions.season_projections row dict for `team`.
 
+    ``team_wins`` is the team's per-simulation wins; ``win_counts`` (from
+    ``simulate_win_counts``) may be passed instead, with ``team_wins=None``.
+
     ``games_scheduled`` is reported for transparency, but every projected
     quantity is computed over ``games_simulated`` -- the games that actually
     contributed an outcome. When a pending game has no prediction the two
@@ -629,6 +1231,10 @@ def build_projection_row(
     expected_slate_games. Omitted, it falls back to the division's standard
     slate minus one, which is the loosest the cohort rule can ever be.
     """
+    import numpy as np
+
+    if win_counts is None:
+        win_counts = np.bincount(team_wins)
     team_games = [g for g in games if team in (g["home_team"], g["away_team"])]
     completed = [g for g in team_games if g["completed"]]
     actual_wins = sum(
@@ -651,7 +1257,9 @@ def build_projection_row(
         "games_completed": len(completed),
         "actual_wins": actual_wins,
         "schedule_complete": games_scheduled >= expected_slate,
-        "p_win_dist": {str(k): v for k, v in win_distribution(team_wins, games_simulated).items()},
+        "p_win_dist": {
+            str(k): v for k, v in win_distribution_from_counts(win_counts, games_simulated).items()
+        },
         "sos_rating": schedule_strength(team, team_games, ratings),
         "sos_rank": None,  # filled after all teams are summarized
         "conf_title_prob": conf_title_prob,
@@ -666,7 +1274,9 @@ def build_projection_row(
         # else. Idempotent for the normal path.
         "strength_share": normalize_strength_share(strength_share),
     }
-    row.update(summarize(team_wins, games_simulated, bowl_eligible=bowls_apply(classification)))
+    row.update(
+        summarize_win_counts(win_counts, games_simulated, bowl_eligible=bowls_apply(classification))
+    )
     return row
 
 
@@ -930,10 +1540,211 @@ def write_projections(conn, rows: list[dict]) -> None:
     conn.commit()
 
 
+_SIM_GAME_COLUMNS = (
+    "game_id",
+    "home_team",
+    "away_team",
+    "conference_game",
+    "completed",
+    "home_win",
+    "expected_home_margin",
+    "home_wins",
+)
+
+
+def load_sim_state(conn, season: int, model: str) -> CrnSeasonSimulation | None:
+    """The persisted CRN simulation for (season, model), or None if there is
+    none or it was written under another stream version."""
+    import psycopg2.extras
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(
+            """
+            SELECT seed, n_sims, sigma, strength_share, stream_version
+            FROM analytics.season_sim_state
+            WHERE season = %s AND model_version = %s
+            """,
+            (season, model),
+        )
+        params = cur.fetchone()
+        if params is None or params["stream_version"] != CRN_STREAM_VERSION:
+            return None
+        cur.execute(
+            f"""
+            SELECT {", ".join(_SIM_GAME_COLUMNS)}
+            FROM analytics.season_sim_game
+            WHERE season = %s AND model_version = %s
+            """,
+            (season, model),
+        )
+        rows = [dict(r) for r in cur.fetchall()]
+    params = dict(params, strength_share=float(params["strength_share"]))
+    return CrnSeasonSimulation.from_state(params, rows)
+
+
+def write_sim_state(
+    conn, season: int, model: str, sim: CrnSeasonSimulation, changed, rebuilt: bool
+) -> None:
+    """Persist `sim` for the next --incremental run. Does not commit: it rides
+    the projections' transaction, so state and rows can never disagree.
+
+    A rebuild replaces every game row; otherwise only the `changed` games are
+    upserted or deleted.
+    """
+    import psycopg2
+    from psycopg2.extras import execute_values
+
+    params = sim.params()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO analytics.season_sim_state
+                (season, model_version, seed, n_sims, sigma, strength_share, stream_version)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (season, model_version) DO UPDATE SET
+                seed = EXCLUDED.seed,
+                n_sims = EXCLUDED.n_sims,
+                sigma = EXCLUDED.sigma,
+                strength_share = EXCLUDED.strength_share,
+                stream_version = EXCLUDED.stream_version,
+                updated_at = now()
+            """,
+            (
+                season,
+                model,
+                params["seed"],
+                params["n_sims"],
+                params["sigma"],
+                params["strength_share"],
+                params["stream_version"],
+            ),
+        )
+        if rebuilt:
+            cur.execute(
+                "DELETE FROM analytics.season_sim_game WHERE season = %s AND model_version = %s",
+                (season, model),
+            )
+            upsert_ids = sorted(sim.signatures)
+        else:
+            removed = [gid for gid in changed if gid not in sim.signatures]
+            if removed:
+                cur.execute(
+                    """
+                    DELETE FROM analytics.season_sim_game
+                    WHERE season = %s AND model_version = %s AND game_id = ANY(%s)
+                    """,
+                    (season, model, removed),
+                )
+            upsert_ids = sorted(gid for gid in changed if gid in sim.signatures)
+        if not upsert_ids:
+            return
+        values = []
+        for gid in upsert_ids:
+            row = sim.game_row(gid)
+            if row["home_wins"] is not None:
+                row["home_wins"] = psycopg2.Binary(row["home_wins"])
+            values.append((season, model, *(row[c] for c in _SIM_GAME_COLUMNS)))
+        assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in _SIM_GAME_COLUMNS if c != "game_id")
+        execute_values(
+            cur,
+            f"""
+            INSERT INTO analytics.season_sim_game
+                (season, model_version, {", ".join(_SIM_GAME_COLUMNS)})
+            VALUES %s
+            ON CONFLICT (season, model_version, game_id) DO UPDATE SET {assignments}
+            """,
+            values,
+        )
+
+
+def resume_crn_simulation(
+    stored: CrnSeasonSimulation | None,
+    n_sims: int,
+    sigma: float,
+    seed: int,
+    strength_share: float,
+    reset_sigma: bool = False,
+) -> tuple[CrnSeasonSimulation, bool]:
+    """``(simulation, rebuilt)``: the stored state to patch, or a fresh one.
+
+    Sigma is PINNED per (season, model) by the stored state rather than
+    compared against today's measurement. It is re-measured from every
+    completed game, so each new result nudges it -- as part of the rebuild
+    key that made nearly every in-season day a full re-simulation. A stored
+    state is resumed, at the sigma it was drawn with, whenever seed / n_sims /
+    strength_share match; otherwise, or with ``reset_sigma``, the rebuild
+    pins the freshly measured ``sigma``.
+    """
+    if stored is not None and not reset_sigma:
+        wanted = CrnSeasonSimulation(n_sims, stored.sigma, seed, strength_share)
+        if stored.params() == wanted.params():
+            return stored, False
+    return CrnSeasonSimulation(n_sims, sigma, seed, strength_share), True
+
+
+def simulate_incremental(
+    conn,
+    season: int,
+    model: str,
+    games: list[dict],
+    n_sims: int,
+    sigma: float,
+    seed: int,
+    strength_share: float,
+    reset_sigma: bool = False,
+) -> dict:
+    """--incremental: patch the persisted CRN simulation with today's games.
+
+    Resumes the stored state at its pinned sigma (``resume_crn_simulation``)
+    and re-evaluates only the games whose result or prediction changed; a
+    rebuild happens only when there is no state, seed / n_sims /
+    strength_share differ from the stored run, or ``reset_sigma`` re-pins
+    sigma to today's measurement. The result's ``sigma`` is the one the
+    tallies were drawn with, which is what the rows must record.
+    """
+    sim, rebuilt = resume_crn_simulation(
+        load_sim_state(conn, season, model),
+        n_sims,
+        sigma,
+        seed,
+        strength_share,
+        reset_sigma=reset_sigma,
+    )
+    if sim.sigma != sigma:
+        logger.info(
+            "season=%d: sigma pinned at %.2f by the stored state (measured today: %.2f; "
+            "--reset-sigma re-pins)",
+            season,
+            sim.sigma,
+            sigma,
+        )
+    changed = sim.apply(games)
+    logger.info(
+        "season=%d: CRN state %s, %d of %d game(s) re-evaluated",
+        season,
+        "rebuilt" if rebuilt else "patched",
+        len(changed),
+        len(games),
+    )
+    write_sim_state(conn, season, model, sim, changed, rebuilt)
+    return sim.result()
+
+
 def simulate_one_season(
-    conn, season: int, model: str, n_sims: int, seed: int, strength_share: float
+    conn,
+    season: int,
+    model: str,
+    n_sims: int,
+    seed: int,
+    strength_share: float,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    incremental: bool = False,
+    reset_sigma: bool = False,
 ) -> int:
     """Simulate and write one season. Returns the number of team rows written."""
+    import numpy as np
+
     games = fetch_season_games(conn, season, model)
     if not games:
         logger.info("season=%d: no games in core.games, skipping", season)
@@ -952,14 +1763,45 @@ def simulate_one_season(
 
     sigma = fetch_sigma(conn, model)
     ratings = fetch_team_ratings(conn)
-    sim = simulate_wins(games, n_sims, sigma, seed=seed, strength_share=strength_share)
-    wins_by_team = sim["wins"]
 
     conf_by_team = {}
     for g in games:
         for side, conf in (("home_team", "home_conference"), ("away_team", "away_conference")):
             conf_by_team.setdefault(g[side], g[conf])
 
+    if incremental:
+        sim = simulate_incremental(
+            conn,
+            season,
+            model,
+            games,
+            n_sims,
+            sigma,
+            seed,
+            strength_share,
+            reset_sigma=reset_sigma,
+        )
+        # The pinned sigma the tallies were drawn with, not today's measurement.
+        sigma = sim["sigma"]
+        # The CRN state keeps per-simulation tallies by design (it patches
+        # them); reduce them here like simulate_win_counts does in its loop.
+        win_counts = {t: np.bincount(w) for t, w in sim["wins"].items()}
+        # Conference-only records, from the same draws as the overall tally.
+        title_probs = conference_title_probs(sim["conf_wins"], conf_by_team, sim["conf_games"])
+    else:
+        sim = simulate_win_counts(
+            games,
+            n_sims,
+            sigma,
+            seed=seed,
+            strength_share=strength_share,
+            chunk_size=chunk_size,
+            workers=workers,
+            conf_by_team=conf_by_team,
+        )
+        win_counts = sim["win_counts"]
+        title_probs = sim["conf_title_prob"]
+
     # Division per team, and from it the slate length a complete schedule has
     # and whether bowl eligibility is a concept. Both were previously FBS
     # constants applied to all four divisions.
@@ -982,16 +1824,13 @@ def simulate_one_season(
             ", ".join(sorted(unclassified)[:5]),
         )
 
-    # Conference-only records, from the same draws as the overall tally.
-    title_probs = conference_title_probs(sim["conf_wins"], conf_by_team, sim["conf_games"])
-
     # A team none of whose games could be scored gets NO row rather than a row
     # of zeros. `projected_wins = 0.0` with `p_bowl_eligible = 0.0` reads as
     # "the model expects this team to win nothing", when the truth is that the
     # model has no opinion at all -- the same plausible-number-instead-of-an-
     # absence failure the games_simulated split exists to prevent, reintroduced
     # one level up.
-    unprojectable = [t for t in wins_by_team if sim["games_simulated"][t] == 0]
+    unprojectable = [t for t in win_counts if sim["games_simulated"][t] == 0]
     if unprojectable:
         logger.warning(
             "season=%d: %d team(s) had no scorable game and are omitted from "
@@ -1004,7 +1843,7 @@ def simulate_one_season(
     rows = [
         build_projection_row(
             team,
-            team_wins,
+            None,
             games,
             ratings,
             conf_by_team.get(team),
@@ -1016,8 +1855,9 @@ def simulate_one_season(
             sim["strength_share"],
             classification=class_by_team.get(team),
             expected_slate=expected_slate.get(team),
+            win_counts=counts,
         )
-        for team, team_wins in wins_by_team.items()
+        for team, counts in win_counts.items()
         if sim["games_simulated"][team] > 0
     ]
     assign_sos_ranks(rows)
@@ -1078,7 +1918,38 @@ def main() -> None:
         help=f"Share of margin variance carried by the per-team season-strength "
         f"offset (default {DEFAULT_STRENGTH_SHARE}; 0 reproduces v1)",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Simulate in blocks of this many sims with per-block seeds, bounding "
+        "memory (default: one block, the stream existing projections used)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to spread --chunk-size blocks over (default 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Patch the persisted common-random-numbers simulation "
+        "(analytics.season_sim_state) with only the games that changed",
+    )
+    parser.add_argument(
+        "--reset-sigma",
+        action="store_true",
+        help="With --incremental: re-pin sigma to today's measurement, rebuilding "
+        "the persisted simulation (default: keep the sigma it was built with)",
+    )
     args = parser.parse_args()
+    if args.reset_sigma and not args.incremental:
+        parser.error("--reset-sigma only applies to --incremental")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.incremental and (args.chunk_size is not None or args.workers > 1):
+        parser.error("--incremental does not combine with --chunk-size/--workers")
 
     try:
         args.strength_share = normalize_strength_share(args.strength_share)
@@ -1100,7 +1971,16 @@ def main() -> None:
         total = 0
         for season in seasons:
             total += simulate_one_season(
-                conn, season, args.model, args.sims, args.seed, args.strength_share
+                conn,
+                season,
+                args.model,
+                args.sims,
+                args.seed,
+                args.strength_share,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                incremental=args.incremental,
+                reset_sigma=args.reset_sigma,
             )
         logger.info("Wrote %d projection row(s) across %d season(s)", total, len(seasons))
     except Exception:
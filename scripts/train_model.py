@@ -23,7 +23,14 @@ seasons. For each score season ``S`` in ``--seasons START END`` (default
 ``features.model_coefficients`` + ``features.model_metadata`` (migration 028).
 The imputation means (section 2b) and z-score stats (section 2c) are computed on
 the TRAIN window only and frozen in the metadata row -- scoring never recomputes
-them, which is what makes the NULL-imputation leak-free.
+them, which is what makes the NULL-imputation leak-free. The ladder is trained
+by one ``ExpandingWindow``: each season is fetched and vectorized once (no
+re-fetching, re-vectorizing or re-stacking earlier seasons, no recomputed
+imputation means), the margin ridge is solved from running normal equations,
+and each window's IRLS warm-starts from the previous fit, with the frozen
+stats unchanged. Imputation, z-score stats, standardization, IRLS and Platt
+still pass over every row of the window, so a full ladder remains quadratic
+in the number of windows -- with a much smaller constant.
 
 Usage:
     python scripts/train_model.py                     # walk-forward 2018..2025
@@ -245,11 +252,26 @@ def compute_feature_means(team_week_rows: list[dict]) -> dict:
     ``TEAM_WEEK_SOURCE_COLUMNS`` value over the given team-week rows (both home
     and away sides of the TRAIN games), ignoring NULLs. A column that is NULL in
     every row maps to None (``_impute_value`` then falls back to 0.0)."""
-    means: dict = {}
-    for col in TEAM_WEEK_SOURCE_COLUMNS:
-        vals = [float(r[col]) for r in team_week_rows if r.get(col) is not None]
-        means[col] = (sum(vals) / len(vals)) if vals else None
-    return means
+    totals = dict.fromkeys(TEAM_WEEK_SOURCE_COLUMNS, 0.0)
+    counts = dict.fromkeys(TEAM_WEEK_SOURCE_COLUMNS, 0)
+    _accumulate_source_values(team_week_rows, totals, counts)
+    return _means_from_totals(totals, counts)
+
+
+def _accumulate_source_values(team_week_rows: list[dict], totals: dict, counts: dict) -> None:
+    """Add each non-NULL source value to its column's running total, in row
+    order. A plain left-to-right ``+=`` (not ``sum()``, which compensates on
+    3.12+) so a total carried across calls equals one over all the rows."""
+    for r in team_week_rows:
+        for col in TEAM_WEEK_SOURCE_COLUMNS:
+            val = r.get(col)
+            if val is not None:
+                totals[col] += float(val)
+                counts[col] += 1
+
+
+def _means_from_totals(totals: dict, counts: dict) -> dict:
+    return {col: (totals[col] / counts[col]) if counts[col] else None for col in totals}
 
 
 def compute_diff_stats(X_raw: np.ndarray) -> tuple[dict, dict]:
@@ -281,9 +303,15 @@ def ridge_fit(X: np.ndarray, y: np.ndarray, alpha: float, penalize_mask: np.ndar
     """
     X = np.asarray(X, dtype=np.float64)
     y = np.asarray(y, dtype=np.float64)
+    return ridge_solve(X.T @ X, X.T @ y, alpha, penalize_mask)
+
+
+def ridge_solve(
+    xtx: np.ndarray, xty: np.ndarray, alpha: float, penalize_mask: np.ndarray
+) -> np.ndarray:
+    """``ridge_fit`` from precomputed ``X^T X`` / ``X^T y`` -- the form the
+    expanding walk-forward window keeps running (``ExpandingWindow``)."""
     penalize_mask = np.asarray(penalize_mask, dtype=np.float64)
-    xtx = X.T @ X
-    xty = X.T @ y
     return np.linalg.solve(xtx + alpha * np.diag(penalize_mask), xty)
 
 
@@ -304,6 +332,7 @@ def irls_logistic(
     penalize_mask: np.ndarray,
     max_iter: int = 25,
     tol: float = 1e-8,
+    beta0: np.ndarray | None = None,
 ) -> np.ndarray:
     """Ridge-penalized logistic regression by Newton/IRLS.
 
@@ -314,13 +343,21 @@ def irls_logistic(
     are clipped for stability. Converges on ``max|delta beta| < tol`` and logs
     iterations. On non-convergence returns the lowest-NLL beta seen, with a
     warning, rather than a diverged final step.
+
+    ``beta0`` warm-starts Newton from a nearby solution (the previous
+    walk-forward window's fit) instead of zeros; the objective is strictly
+    convex, so only the iteration count changes, not the optimum.
     """
     X = np.asarray(X, dtype=np.float64)
     y = np.asarray(y, dtype=np.float64)
     penalize_mask = np.asarray(penalize_mask, dtype=np.float64)
     P = np.diag(penalize_mask)
 
-    beta = np.zeros(X.shape[1], dtype=np.float64)
+    beta = (
+        np.zeros(X.shape[1], dtype=np.float64)
+        if beta0 is None
+        else np.array(beta0, dtype=np.float64, copy=True)
+    )
     best_beta = beta.copy()
     best_nll = _penalized_nll(X, y, beta, alpha, penalize_mask)
     converged = False
@@ -407,6 +444,237 @@ def collect_team_week_rows(games: list[dict]) -> list[dict]:
     return rows
 
 
+def split_design(games: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """``build_design`` with the imputation factored out: ``(A, B, y_margin, y_win)``.
+
+    ``A`` is the design with every NULL side read as 0.0 and ``B`` the
+    null-indicator difference (``1[home NULL] - 1[away NULL]``, zero for the
+    intercept and ``neutral_site``), so for any frozen ``feature_means``
+
+        build_design(games, feature_means)[0] == A + B * mean_vector(feature_means)
+
+    **bit for bit** -- each entry is the same single IEEE subtraction
+    ``build_feature_vector`` performs. A season's ``(A, B)`` therefore never
+    has to be rebuilt when a later season moves the imputation means.
+    """
+    n, p = len(games), len(FEATURE_NAMES)
+    A = np.zeros((n, p), dtype=np.float64)
+    B = np.zeros((n, p), dtype=np.float64)
+    y_margin = np.empty(n, dtype=np.float64)
+    y_win = np.empty(n, dtype=np.float64)
+    for i, g in enumerate(games):
+        A[i, INTERCEPT_IDX] = 1.0
+        A[i, NEUTRAL_SITE_IDX] = 1.0 if g.get("neutral_site") else 0.0
+        home_tw, away_tw = g["home_tw"], g["away_tw"]
+        for offset, (_feat_name, col) in enumerate(DIFF_FEATURE_COLUMNS):
+            home_val, away_val = home_tw.get(col), away_tw.get(col)
+            A[i, 2 + offset] = (0.0 if home_val is None else float(home_val)) - (
+                0.0 if away_val is None else float(away_val)
+            )
+            B[i, 2 + offset] = float(home_val is None) - float(away_val is None)
+        y_margin[i] = float(g["home_points"] - g["away_points"])
+        y_win[i] = 1.0 if g["home_points"] > g["away_points"] else 0.0
+    return A, B, y_margin, y_win
+
+
+def mean_vector(feature_means: dict) -> np.ndarray:
+    """Imputation means in design-column order (0.0 where ``_impute_value``
+    would fall back to 0.0, and for the intercept / neutral_site)."""
+    m = np.zeros(len(FEATURE_NAMES), dtype=np.float64)
+    for offset, (_feat_name, col) in enumerate(DIFF_FEATURE_COLUMNS):
+        if feature_means.get(col) is not None:
+            m[2 + offset] = float(feature_means[col])
+    return m
+
+
+def standardization_transform(diff_means: dict, diff_stds: dict) -> np.ndarray:
+    """``T`` with ``standardize(X, diff_means, diff_stds) == X @ T`` for any raw
+    design ``X`` (whose column 0 is the all-ones intercept).
+
+    Diff column j becomes ``X_j / std_j - mean_j / std_j``: the scale sits on
+    the diagonal and the shift rides on the intercept row. A zero-std column
+    maps to 0, as in ``standardize``. This is what lets running raw sums
+    ``X^T X`` / ``X^T y`` be turned into the standardized normal equations
+    ``T^T X^T X T`` / ``T^T X^T y`` without touching a row.
+    """
+    p = len(FEATURE_NAMES)
+    T = np.eye(p, dtype=np.float64)
+    for i, feat_name in enumerate(FEATURE_NAMES):
+        if feat_name in (INTERCEPT, NEUTRAL_SITE):
+            continue
+        std = float(diff_stds[feat_name])
+        if std > 0.0:
+            T[i, i] = 1.0 / std
+            T[INTERCEPT_IDX, i] = -float(diff_means[feat_name]) / std
+        else:
+            T[i, i] = 0.0
+    return T
+
+
+def raw_to_standardized(gamma: np.ndarray, diff_means: dict, diff_stds: dict) -> np.ndarray:
+    """Coefficients ``beta`` over the standardized design that reproduce the
+    raw-scale linear predictor ``X @ gamma`` (inverse of ``T @ beta``).
+
+    Used to carry one window's win-prob fit into the next window's z-score
+    space as an IRLS warm start. A zero-std column cannot carry weight in the
+    standardized design, so its raw coefficient is dropped.
+    """
+    beta = np.array(gamma, dtype=np.float64, copy=True)
+    for i, feat_name in enumerate(FEATURE_NAMES):
+        if feat_name in (INTERCEPT, NEUTRAL_SITE):
+            continue
+        std = float(diff_stds[feat_name])
+        if std > 0.0:
+            beta[i] = gamma[i] * std
+            beta[INTERCEPT_IDX] += float(diff_means[feat_name]) * gamma[i]
+        else:
+            beta[i] = 0.0
+    return beta
+
+
+class ExpandingWindow:
+    """The walk-forward train window, grown one season at a time.
+
+    Fitting score season S used to mean re-fetching 2015..S-1, rebuilding the
+    design game by game and solving from scratch. The window removes that
+    repeated per-season work; it keeps, per season added:
+
+    - the imputation-free design rows ``(A, B)`` from ``split_design`` and
+      both targets, built once and appended to preallocated buffers that grow
+      geometrically, so a window never re-stacks earlier seasons;
+    - a running total and count of the observed team-week source values per
+      column (both sides), for the frozen imputation means;
+
+    and running cross-products ``A^T A``, ``A^T B``, ``B^T B``, ``A^T y``,
+    ``B^T y`` from which the raw normal equations for ANY imputation means
+    follow (``raw_normal_equations``).
+
+    The frozen stats are exactly today's: ``feature_means()`` accumulates the
+    same values in the same order as ``compute_feature_means``, ``design()``
+    reproduces ``build_design`` bit for bit, and the z-score stats are
+    ``compute_diff_stats`` of that matrix -- all over the TRAIN window only.
+    What still costs O(window) rows per window: the imputation itself
+    (``A + B * m``, one vectorized pass, since ``m`` moves with every season
+    added), and in ``fit_window`` the diff stats, standardization, IRLS and
+    Platt over that design. A full ladder is therefore still quadratic in the
+    number of windows; what is gone is the re-fetching, per-game rebuilding,
+    re-stacking and recomputed means.
+    """
+
+    def __init__(self) -> None:
+        p = len(FEATURE_NAMES)
+        self.seasons: list[int] = []
+        self.n = 0
+        self._totals = dict.fromkeys(TEAM_WEEK_SOURCE_COLUMNS, 0.0)
+        self._counts = dict.fromkeys(TEAM_WEEK_SOURCE_COLUMNS, 0)
+        self._A = np.zeros((0, p), dtype=np.float64)
+        self._B = np.zeros((0, p), dtype=np.float64)
+        self._y_margin = np.zeros(0, dtype=np.float64)
+        self._y_win = np.zeros(0, dtype=np.float64)
+        self._ata = np.zeros((p, p), dtype=np.float64)
+        self._atb = np.zeros((p, p), dtype=np.float64)
+        self._btb = np.zeros((p, p), dtype=np.float64)
+        self._aty = np.zeros(p, dtype=np.float64)
+        self._bty = np.zeros(p, dtype=np.float64)
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the row buffers (doubling) to hold at least ``rows`` rows."""
+        capacity = len(self._y_margin)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity)
+        for name in ("_A", "_B", "_y_margin", "_y_win"):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=np.float64)
+            grown[: self.n] = old[: self.n]
+            setattr(self, name, grown)
+
+    def add_season(self, season: int, games: list[dict]) -> None:
+        _accumulate_source_values(collect_team_week_rows(games), self._totals, self._counts)
+        A, B, y_margin, y_win = split_design(games)
+        lo, hi = self.n, self.n + len(games)
+        self._reserve(hi)
+        self._A[lo:hi] = A
+        self._B[lo:hi] = B
+        self._y_margin[lo:hi] = y_margin
+        self._y_win[lo:hi] = y_win
+        self._ata += A.T @ A
+        self._atb += A.T @ B
+        self._btb += B.T @ B
+        self._aty += A.T @ y_margin
+        self._bty += B.T @ y_margin
+        self.seasons.append(season)
+        self.n = hi
+
+    def feature_means(self) -> dict:
+        return _means_from_totals(self._totals, self._counts)
+
+    def design(self, feature_means: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``build_design`` over every game in the window, from the row buffers.
+
+        The targets are views into the buffers; rows already written are never
+        overwritten, so they stay valid after later ``add_season`` calls."""
+        n = self.n
+        X_raw = np.multiply(self._B[:n], mean_vector(feature_means))
+        X_raw += self._A[:n]
+        return X_raw, self._y_margin[:n], self._y_win[:n]
+
+    def raw_normal_equations(self, feature_means: dict) -> tuple[np.ndarray, np.ndarray]:
+        """``(X^T X, X^T y_margin)`` for ``X = A + B diag(m)``, from running sums."""
+        m = mean_vector(feature_means)
+        atb_m = self._atb * m  # A^T B diag(m)
+        xtx = self._ata + atb_m + atb_m.T + (self._btb * m) * m[:, None]
+        xty = self._aty + m * self._bty
+        return xtx, xty
+
+
+def fit_window(window: ExpandingWindow, warm_start: np.ndarray | None = None) -> dict:
+    """Design section 3 steps 3-7 over the window's TRAIN games.
+
+    The ridge margin model is solved from the window's running normal
+    equations mapped into z-score space; IRLS and Platt still need the rows
+    and get the standardized design. ``warm_start`` is a previous window's
+    ``winprob_raw`` (raw-scale win-prob coefficients), re-expressed in this
+    window's z-score space to start IRLS near the answer. Returns the frozen
+    fit plus the train-window diagnostics the gate line prints.
+    """
+    # Step 3: frozen imputation means over the TRAIN team-week rows.
+    feature_means = window.feature_means()
+    X_raw, y_margin, y_win = window.design(feature_means)
+
+    # Step 4: z-score stats over the imputed TRAIN design.
+    diff_means, diff_stds = compute_diff_stats(X_raw)
+    T = standardization_transform(diff_means, diff_stds)
+    X_std = standardize(X_raw, diff_means, diff_stds)
+
+    mask = penalty_mask()
+    # Step 5: ridge margin, from the running sums.
+    xtx, xty = window.raw_normal_equations(feature_means)
+    beta_margin = ridge_solve(T.T @ xtx @ T, T.T @ xty, RIDGE_ALPHA, mask)
+    # Step 6: IRLS win-prob.
+    beta0 = None if warm_start is None else raw_to_standardized(warm_start, diff_means, diff_stds)
+    beta_winprob = irls_logistic(X_std, y_win, WINPROB_ALPHA, mask, beta0=beta0)
+    # Step 7: Platt-calibrate the TRAIN logits.
+    train_logits = X_std @ beta_winprob
+    platt_a, platt_b = platt_fit(train_logits, y_win)
+
+    margin_pred = X_std @ beta_margin
+    calibrated = np.array([platt_transform(z, platt_a, platt_b) for z in train_logits])
+    return {
+        "n_train": window.n,
+        "feature_means": feature_means,
+        "diff_means": diff_means,
+        "diff_stds": diff_stds,
+        "beta_margin": beta_margin,
+        "beta_winprob": beta_winprob,
+        "platt_a": platt_a,
+        "platt_b": platt_b,
+        "winprob_raw": T @ beta_winprob,
+        "margin_mae": float(np.mean(np.abs(margin_pred - y_margin))),
+        "winprob_brier": float(np.mean((calibrated - y_win) ** 2)),
+    }
+
+
 # =============================================================================
 # --- I/O layer --- (thin: fetch team_week+games, drive the math, persist fits)
 # =============================================================================
@@ -580,73 +848,76 @@ def persist_fit(
         cur.close()
 
 
-def fit_one(conn, train_through: int, train_seasons: list[int]) -> None:
-    """Train and persist a single walk-forward fit for ``train_through_season``.
-
-    Runs design section 3 steps 3-8: impute means, vectorize, scale, fit ridge
-    margin, fit IRLS win-prob, Platt-calibrate the train logits, persist, and
-    print the FITTED_GATE line.
-    """
-    games = fetch_games(conn, train_seasons)
-    if not games:
+def fit_and_persist(
+    conn,
+    train_through: int,
+    train_seasons: list[int],
+    window: ExpandingWindow,
+    warm_start: np.ndarray | None = None,
+) -> np.ndarray | None:
+    """Fit ``window`` (which must hold exactly ``train_seasons``), persist it
+    and print the FITTED_GATE line. Returns the raw-scale win-prob
+    coefficients for the next window's warm start, or None when skipped."""
+    if window.n == 0:
         logger.warning(
             "train_through=%d: no completed games with team_week features for seasons %s; "
             "skipping (has build_features.py run?)",
             train_through,
             train_seasons,
         )
-        return
-
-    # Step 3: frozen imputation means over the TRAIN team-week rows, then
-    # vectorize (imputation applied inside build_feature_vector).
-    feature_means = compute_feature_means(collect_team_week_rows(games))
-    X_raw, y_margin, y_win = build_design(games, feature_means)
+        return None
 
-    # Step 4: z-score stats over the imputed TRAIN design, then apply.
-    diff_means, diff_stds = compute_diff_stats(X_raw)
-    X_std = standardize(X_raw, diff_means, diff_stds)
-
-    mask = penalty_mask()
-    # Step 5: ridge margin.
-    beta_margin = ridge_fit(X_std, y_margin, RIDGE_ALPHA, mask)
-    # Step 6: IRLS win-prob.
-    beta_winprob = irls_logistic(X_std, y_win, WINPROB_ALPHA, mask)
-    # Step 7: Platt-calibrate the TRAIN logits.
-    train_logits = X_std @ beta_winprob
-    platt_a, platt_b = platt_fit(train_logits, y_win)
-
-    # Train-window diagnostics for the gate line.
-    margin_pred = X_std @ beta_margin
-    margin_mae = float(np.mean(np.abs(margin_pred - y_margin)))
-    calibrated = np.array([platt_transform(z, platt_a, platt_b) for z in train_logits])
-    winprob_brier = float(np.mean((calibrated - y_win) ** 2))
+    fit = fit_window(window, warm_start)
 
     # Step 8: persist the frozen fit.
     persist_fit(
         conn,
         train_through,
         train_seasons,
-        len(games),
-        feature_means,
-        diff_means,
-        diff_stds,
-        beta_margin,
-        beta_winprob,
-        platt_a,
-        platt_b,
+        fit["n_train"],
+        fit["feature_means"],
+        fit["diff_means"],
+        fit["diff_stds"],
+        fit["beta_margin"],
+        fit["beta_winprob"],
+        fit["platt_a"],
+        fit["platt_b"],
     )
 
     print(
-        f"FITTED_GATE train_through={train_through} n_train={len(games)} "
-        f"margin_train_mae={margin_mae:.3f} winprob_train_brier={winprob_brier:.4f} "
-        f"platt_a={platt_a:.4f} platt_b={platt_b:.4f}"
+        f"FITTED_GATE train_through={train_through} n_train={fit['n_train']} "
+        f"margin_train_mae={fit['margin_mae']:.3f} "
+        f"winprob_train_brier={fit['winprob_brier']:.4f} "
+        f"platt_a={fit['platt_a']:.4f} platt_b={fit['platt_b']:.4f}"
     )
+    return fit["winprob_raw"]
+
+
+def fit_one(conn, train_through: int, train_seasons: list[int]) -> None:
+    """Train and persist a single walk-forward fit for ``train_through_season``.
+
+    Runs design section 3 steps 3-8: impute means, vectorize, scale, fit ridge
+    margin, fit IRLS win-prob, Platt-calibrate the train logits, persist, and
+    print the FITTED_GATE line.
+    """
+    games = fetch_games(conn, train_seasons)
+    window = ExpandingWindow()
+    for season in train_seasons:
+        window.add_season(season, [g for g in games if g["season"] == season])
+    fit_and_persist(conn, train_through, train_seasons, window)
 
 
 def train_walk_forward(conn, score_start: int, score_end: int) -> None:
     """Expanding-window walk-forward over score seasons ``score_start..score_end``
     (design section 3): each season ``S`` trains on ``2015..S-1`` and persists a
-    fit keyed ``train_through_season=S-1``."""
+    fit keyed ``train_through_season=S-1``.
+
+    One ``ExpandingWindow`` carries the whole ladder: each season's games are
+    fetched and vectorized once, when the window first reaches them, and each
+    fit warm-starts IRLS from the previous one.
+    """
+    window = ExpandingWindow()
+    warm_start = None
     for score_season in range(score_start, score_end + 1):
         train_through = score_season - 1
         train_seasons = list(range(TRAIN_START_SEASON, score_season))
@@ -661,7 +932,11 @@ def train_walk_forward(conn, score_start: int, score_end: int) -> None:
             train_through,
             train_seasons,
         )
-        fit_one(conn, train_through, train_seasons)
+        for season in train_seasons[len(window.seasons) :]:
+            window.add_season(season, fetch_games(conn, [season]))
+        fitted = fit_and_persist(conn, train_through, train_seasons, window, warm_start)
+        if fitted is not None:
+            warm_start = fitted
 
 
 def stale_score_seasons(
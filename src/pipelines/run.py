@@ -404,24 +404,110 @@ def run_recruiting_pipeline(years: list[int] | None = None, mode: str = "increme
 
 
 def run_betting_pipeline(years: list[int] | None = None, mode: str = "incremental"):
-    """Run the betting data pipeline."""
+    """Run the betting data pipeline.
+
+    Line snapshots are delta-encoded: the current line_hash per pending
+    (game_id, provider) is read first and handed to line_snapshots_resource,
+    which writes full rows only for moved lines. After the load the staged
+    snapshots are compacted into betting.line_intervals (migration 055).
+    """
     years_str = f"years={years}" if years else f"mode={mode}"
     print(f"\n=== Loading Betting Data ({years_str}) ===\n")
 
+    known_line_hashes = _fetch_known_line_hashes()
+    print(f"  {len(known_line_hashes)} current (game, provider) line(s) to delta against")
+
     pipeline = dlt.pipeline(
         pipeline_name="cfbd_betting",
         destination="postgres",
         dataset_name="betting",
     )
 
-    source = betting_source(years=years, mode=mode)
+    source = betting_source(years=years, mode=mode, known_line_hashes=known_line_hashes)
     info = pipeline.run(source)
 
     print(f"\nLoad info: {info}")
 
+    _compact_line_snapshots()
+
     return info
 
 
+# Latest line_hash per pending (game, provider): the open interval, or a newer
+# snapshot still waiting to be compacted. Completed games are never
+# snapshotted again, so they are left out of the baseline.
+_LINE_HASHES_QUERY = """
+    SELECT DISTINCT ON (s.game_id, s.provider) s.game_id, s.provider, s.line_hash
+    FROM (
+        SELECT game_id, provider, line_hash, last_captured_at AS captured_at
+        FROM betting.line_intervals
+        WHERE valid_to IS NULL
+        UNION ALL
+        SELECT game_id, provider, line_hash, captured_at
+        FROM betting.line_snapshots
+    ) s
+    JOIN core.games g ON g.id = s.game_id
+    WHERE NOT COALESCE(g.completed, false)
+    ORDER BY s.game_id, s.provider, s.captured_at DESC
+"""
+
+_LINE_COMPACT_QUERY = "SELECT betting.compact_line_snapshots()"
+
+
+def _fetch_known_line_hashes() -> dict[tuple[int, str], str]:
+    """Current line_hash per pending (game_id, provider).
+
+    Empty -- i.e. snapshot every line in full, the pre-delta behaviour --
+    while betting.line_snapshots or betting.line_intervals doesn't exist yet
+    (first load, or migration 055 not applied).
+    """
+    import psycopg2
+    import psycopg2.errors
+
+    conn = psycopg2.connect(_warehouse_db_url())
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            try:
+                cur.execute(_LINE_HASHES_QUERY)
+            except psycopg2.errors.UndefinedTable:
+                logger.info("line snapshot tables not present yet; snapshotting every line")
+                return {}
+            return {(game_id, provider): line_hash for game_id, provider, line_hash in cur}
+    finally:
+        conn.close()
+
+
+def _compact_line_snapshots() -> int | None:
+    """Fold staged line snapshots/confirms into betting.line_intervals.
+
+    Returns the staged rows consumed, or None when migration 055 hasn't been
+    applied yet -- logged, not raised: the snapshots stay staged and the next
+    run compacts them.
+    """
+    import psycopg2
+    import psycopg2.errors
+
+    conn = psycopg2.connect(_warehouse_db_url())
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            try:
+                cur.execute(_LINE_COMPACT_QUERY)
+            except psycopg2.errors.UndefinedFunction:
+                logger.warning(
+                    "betting.compact_line_snapshots does not exist; apply "
+                    "src/schemas/migrations/055_line_intervals.sql"
+                )
+                return None
+            compacted = cur.fetchone()[0]
+    finally:
+        conn.close()
+
+    print(f"  Compacted {compacted} staged line capture(s) into betting.line_intervals")
+    return compacted
+
+
 def run_draft_pipeline(years: list[int] | None = None, mode: str = "incremental"):
     """Run the draft data pipeline."""
     years_str = f"years={years}" if years else f"mode={mode}"
@@ -460,8 +546,12 @@ def run_metrics_pipeline(years: list[int] | None = None, mode: str = "incrementa
     return info
 
 
-def _metrics_wp_db_url() -> str:
-    """Get database URL from dlt secrets or environment.
+def _warehouse_db_url() -> str:
+    """Get the warehouse database URL from dlt secrets or environment.
+
+    The one DSN every raw-psycopg2 step in this module uses (metrics_wp
+    checks and packing, betting line snapshots, the rosters team list) -- they all
+    read and write the same warehouse the dlt pipelines load into.
 
     Copied from scripts/refresh_marts.py's get_db_url pattern (the convention
     every script that needs a raw psycopg2 connection follows -- see
@@ -578,9 +668,14 @@ def run_metrics_wp_pipeline(
             first. None disables the cap for a deliberate full backfill. See
             MAX_WP_GAMES_PER_RUN for why the default is not None.
 
+    After the batches, the loaded seasons are repacked into
+    metrics.win_probability_game (one row per game) -- the table every
+    win-probability reader consumes; see _pack_win_probability.
+
     Returns:
         Summary dict: seasons, games considered, `missing` (the FULL backlog,
-        not the capped slice), `loaded_this_run`, `deferred`, batches run, and
+        not the capped slice), `loaded_this_run`, `deferred`, batches run,
+        `packed` (games repacked, None if migration 054 isn't applied), and
         the list of dlt LoadInfo objects (one per batch).
     """
     import psycopg2
@@ -593,7 +688,7 @@ def run_metrics_wp_pipeline(
 
     print(f"\n=== Loading Win Probability Data (seasons={seasons}) ===\n")
 
-    conn = psycopg2.connect(_metrics_wp_db_url())
+    conn = psycopg2.connect(_warehouse_db_url())
     conn.autocommit = True  # each statement stands alone; no transaction to poison on error
     try:
         with conn.cursor() as cur:
@@ -646,6 +741,7 @@ def run_metrics_wp_pipeline(
             "loaded_this_run": 0,
             "deferred": 0,
             "batches": 0,
+            "packed": _pack_win_probability(seasons),
         }
 
     rate_limiter = get_rate_limiter()
@@ -683,6 +779,8 @@ def run_metrics_wp_pipeline(
         all_info.append(info)
         print(f"  Batch {i} complete: {info}")
 
+    packed = _pack_win_probability(seasons)
+
     print(f"\n=== Win probability load complete: {len(batches)} batches ===")
     return {
         "seasons": seasons,
@@ -691,10 +789,49 @@ def run_metrics_wp_pipeline(
         "loaded_this_run": len(game_ids),
         "deferred": deferred,
         "batches": len(batches),
+        "packed": packed,
         "info": all_info,
     }
 
 
+# Repacks metrics.win_probability_game (one row per game, per-play fields as
+# arrays -- src/schemas/migrations/054_win_probability_game.sql) for every game
+# in these seasons whose packed row is missing or stale. Run even when there was
+# nothing to load, so a game whose pack failed on an earlier run is picked up by
+# the next one.
+_METRICS_WP_PACK_QUERY = "SELECT metrics.pack_win_probability(%s::integer[])"
+
+
+def _pack_win_probability(seasons: list[int]) -> int | None:
+    """Bring metrics.win_probability_game up to date for `seasons` after a load.
+
+    Returns the games (re)packed, or None when migration 054 hasn't been
+    applied yet -- logged, not raised: the per-play rows just loaded are
+    intact and the next run packs them.
+    """
+    import psycopg2
+    import psycopg2.errors
+
+    conn = psycopg2.connect(_warehouse_db_url())
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            try:
+                cur.execute(_METRICS_WP_PACK_QUERY, (seasons,))
+            except psycopg2.errors.UndefinedFunction:
+                logger.warning(
+                    "metrics.pack_win_probability does not exist; apply "
+                    "src/schemas/migrations/054_win_probability_game.sql"
+                )
+                return None
+            packed = cur.fetchone()[0]
+    finally:
+        conn.close()
+
+    print(f"  Packed {packed} game(s) into metrics.win_probability_game")
+    return packed
+
+
 def run_rankings_pipeline(years: list[int] | None = None, mode: str = "incremental"):
     """Run the rankings data pipeline."""
     years_str = f"years={years}" if years else f"mode={mode}"
@@ -752,7 +889,7 @@ def run_rosters_pipeline(
             raise ValueError("rosters needs either an explicit team list or years to resolve one")
         import psycopg2
 
-        conn = psycopg2.connect(_metrics_wp_db_url())
+        conn = psycopg2.connect(_warehouse_db_url())
         try:
             teams = scheduled_teams(conn, years)
         finally:
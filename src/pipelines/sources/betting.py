@@ -7,7 +7,11 @@ lines and is append-only: no primary key, ``write_disposition="append"``.
 Each pipeline run stamps every row it yields with a single ``captured_at``
 timestamp, so one run == one capture. Only pending games (no final score
 yet) are snapshotted -- completed games' lines are immutable and already
-covered by ``lines_resource``. Because ``betting.lines`` merge-overwrites on
+covered by ``lines_resource``. Writes are delta-encoded against the caller's
+``known_hashes``: only moved lines get a full row, unchanged ones a narrow
+``line_snapshot_confirms`` row, and ``betting.compact_line_snapshots()``
+(src/schemas/migrations/055_line_intervals.sql) folds both into
+``betting.line_intervals``. Because ``betting.lines`` merge-overwrites on
 ``(game_id, provider)``, prior line values are destroyed on every load, so
 snapshot history can only start accruing from the day this resource first
 runs -- it cannot be backfilled from historical data.
@@ -32,12 +36,15 @@ logger = logging.getLogger(__name__)
 def betting_source(
     years: list[int] | None = None,
     mode: str = "incremental",
+    known_line_hashes: dict[tuple[int, str], str] | None = None,
 ) -> DltSource:
     """Source for betting lines data.
 
     Args:
         years: Specific years to load. If None, uses mode to determine years.
         mode: "incremental" loads current season, "backfill" loads all historical.
+        known_line_hashes: Current line_hash per (game_id, provider), passed
+            to line_snapshots_resource as its delta baseline.
     """
     if years is None:
         if mode == "incremental":
@@ -48,7 +55,7 @@ def betting_source(
     return [
         lines_resource(years),
         team_ats_resource(years),
-        line_snapshots_resource(years),
+        line_snapshots_resource(years, known_hashes=known_line_hashes),
     ]
 
 
@@ -126,7 +133,10 @@ def team_ats_resource(years: list[int]) -> Iterator[dict]:
     name="line_snapshots",
     write_disposition="append",
 )
-def line_snapshots_resource(years: list[int]) -> Iterator[dict]:
+def line_snapshots_resource(
+    years: list[int],
+    known_hashes: dict[tuple[int, str], str] | None = None,
+) -> Iterator[dict]:
     """Capture a snapshot of betting lines for pending (not-yet-final) games.
 
     Append-only time series: no primary key, no merge/dedup. Every row
@@ -136,9 +146,17 @@ def line_snapshots_resource(years: list[int]) -> Iterator[dict]:
     ``lines_resource``. Makes its own API calls rather than sharing a
     generator with ``lines_resource`` (a handful of extra calls/run).
 
+    A line whose hash matches ``known_hashes[(game_id, provider)]`` has not
+    moved since the last capture: instead of another full snapshot row it
+    yields a ``line_snapshot_confirms`` row (captured_at, game_id, provider,
+    line_hash) that extends the current interval's last-seen time.
+
     Args:
         years: List of years to snapshot lines for
+        known_hashes: Current line_hash per (game_id, provider) -- see
+            run_betting_pipeline. None snapshots every line in full.
     """
+    known_hashes = known_hashes or {}
     captured_at = datetime.now(UTC)
     client = get_client()
     try:
@@ -175,6 +193,19 @@ def line_snapshots_resource(years: list[int]) -> Iterator[dict]:
                     )
                     line_hash = hashlib.md5(hash_input.encode()).hexdigest()
 
+                    provider = line.get("provider")
+                    if known_hashes.get((game_id, provider)) == line_hash:
+                        yield dlt.mark.with_table_name(
+                            {
+                                "captured_at": captured_at,
+                                "game_id": game_id,
+                                "provider": provider,
+                                "line_hash": line_hash,
+                            },
+                            "line_snapshot_confirms",
+                        )
+                        continue
+
                     yield {
                         "captured_at": captured_at,
                         "game_id": game_id,
@@ -182,7 +213,7 @@ def line_snapshots_resource(years: list[int]) -> Iterator[dict]:
                         "week": game.get("week"),
                         "home_team": game.get("homeTeam"),
                         "away_team": game.get("awayTeam"),
-                        "provider": line.get("provider"),
+                        "provider": provider,
                         "spread": spread,
                         "formatted_spread": formatted_spread,
                         "over_under": over_under,
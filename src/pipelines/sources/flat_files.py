@@ -12,7 +12,12 @@ This module is the contract surface for the flat-file subsystem
   resources merge into pre-created tables (migration 041).
 
 Parser contract (modules under ``flatfile_parsers/``): a pure function
-``parse(raw: bytes, ctx: ParseContext) -> Iterator[dict]`` -- no I/O, no DB.
+``parse(raw: bytes | BinaryIO, ctx: ParseContext) -> Iterator[dict]`` -- no
+I/O, no DB. The driver hands over ``FetchedFile.body`` (a spooled temp file or
+read-only mmap) so large files are never copied into one more bytes object;
+tests pass plain bytes. Parsers go through ``as_binary_io`` to accept both.
+Columnar parsers (nflverse) may yield ``pyarrow.RecordBatch`` items instead of
+dicts; dlt loads those without a per-row dict ever being built.
 Each yielded dict targets ``spec.table`` unless it carries the reserved key
 ``"_table"`` naming an alternate table (used for Massey's per-system child
 rows). Parsers must fail loud on structural surprises (raise
@@ -29,8 +34,11 @@ new name variants surface in CI instead of silently dropping rows.
 """
 
 import importlib
+import io
+import itertools
 from dataclasses import dataclass
 from datetime import date
+from typing import BinaryIO
 
 import dlt
 from dlt.sources import DltSource
@@ -212,6 +220,18 @@ def season_for_date(d: date) -> int:
     return d.year if d.month >= 8 else d.year - 1
 
 
+def as_binary_io(raw: bytes | BinaryIO) -> BinaryIO:
+    """A parser's input as a seekable binary file-like, rewound to the start.
+
+    Bytes-likes are wrapped in ``io.BytesIO``; file-likes (spooled temp file,
+    mmap, open file) are passed through without copying.
+    """
+    if isinstance(raw, bytes | bytearray | memoryview):
+        return io.BytesIO(raw)
+    raw.seek(0)
+    return raw
+
+
 def unmapped_gate(total_rows: int, unmapped_rows: int, threshold: float) -> bool:
     """Return True when the unmapped fraction breaches the threshold (=> fail).
 
@@ -225,7 +245,7 @@ def unmapped_gate(total_rows: int, unmapped_rows: int, threshold: float) -> bool
 
 def build_flat_file_source(
     spec: FlatFileSpec,
-    raw: bytes,
+    raw: bytes | BinaryIO,
     ctx: ParseContext,
     resolver=None,
 ) -> DltSource:
@@ -233,7 +253,12 @@ def build_flat_file_source(
 
     Implemented in T3. Behavior contract:
     1. Resolve ``spec.parser`` under ``flatfile_parsers`` and run it over
-       ``raw`` (materialize -- these files are small).
+       ``raw`` (materialize -- these files are small). A columnar parser
+       (nflverse) yields ``pyarrow.RecordBatch`` items instead of dicts; those
+       skip steps 2-3 and stream straight into one resource for
+       ``spec.table`` -- the first batch is pulled here so structure errors
+       still raise before ``pipeline.run()``. Such specs may not use the
+       crosswalk or a child table.
     2. If ``spec.uses_xwalk``: resolve each ``xwalk_fields`` value through
        ``resolver`` (an ``XwalkResolver``); drop rows with any unmapped field,
        preserving originals to ``{field}_source`` when ``keep_source_names``;
@@ -244,13 +269,33 @@ def build_flat_file_source(
 
     Args:
         spec: Registry entry (must be kind="dlt").
-        raw: Fetched file bytes.
+        raw: Fetched file body (file-like or bytes; see ``as_binary_io``).
         ctx: Parse context handed through to the parser.
         resolver: XwalkResolver bound to ``spec.name`` (required when
             ``spec.uses_xwalk``).
     """
     parser = resolve_parser(spec.parser)
-    rows = list(parser(raw, ctx))
+    items = iter(parser(raw, ctx))
+    first = next(items, None)
+
+    if first is not None and _is_record_batch(first):
+        if spec.uses_xwalk or spec.child_table:
+            raise ValueError(
+                f"{spec.name}: record-batch parsers support neither the crosswalk nor a child table"
+            )
+        batches = dlt.resource(
+            itertools.chain([first], items),
+            name=spec.table,
+            write_disposition=spec.write_disposition,
+            primary_key=list(spec.primary_key),
+        )
+
+        def _batch_resources() -> list:
+            return [batches]
+
+        return dlt.source(_batch_resources, name=f"flatfile_{spec.name}")()
+
+    rows = [] if first is None else [first, *items]
 
     if spec.uses_xwalk:
         if resolver is None:
@@ -326,6 +371,15 @@ def build_flat_file_source(
     return source_factory()
 
 
+def _is_record_batch(item) -> bool:
+    """True for a ``pyarrow.RecordBatch`` (pyarrow is the optional flatfiles extra)."""
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+    return isinstance(item, pyarrow.RecordBatch)
+
+
 def resolve_parser(parser_ref: str):
     """Import "<module>.<function>" under flatfile_parsers and return the callable.
 
@@ -355,6 +409,7 @@ __all__ = [
     "ParserStructureError",
     "StaleSnapshotError",
     "UnmappedNamesError",
+    "as_binary_io",
     "build_flat_file_source",
     "resolve_parser",
     "season_for_date",
@@ -199,6 +199,7 @@ def _discover_bigten_links(season: int, fetch) -> tuple[list[str], int, bool]:
 
         any_ok = True
         html = fetched.content.decode("utf-8", errors="replace")
+        fetched.close()
         for link in extract_pdf_links(html, index_url):
             if link not in seen:
                 seen.add(link)
@@ -266,6 +267,7 @@ def archive(db_url: str | None, *, season: int, fetch=None) -> dict:
                             psycopg2.Binary(pdf.content),
                         ),
                     )
+                    pdf.close()
                     new += cur.rowcount
             conn.commit()
     finally:
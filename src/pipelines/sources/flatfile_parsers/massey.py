@@ -42,12 +42,14 @@ Parsing notes (see FINDINGS.md for the full writeup):
 import re
 from collections.abc import Iterator
 from datetime import date, datetime
+from typing import BinaryIO
 
 from ..flat_files import (
     TABLE_KEY,
     ParseContext,
     ParserStructureError,
     StaleSnapshotError,
+    as_binary_io,
     season_for_date,
 )
 
@@ -143,9 +145,9 @@ def _parse_header(lines: list[str], idx: int) -> tuple[list[str], int, int]:
     return header_system_codes, header_line_no, idx + 1
 
 
-def parse(raw: bytes, ctx: ParseContext) -> Iterator[dict]:
+def parse(raw: bytes | BinaryIO, ctx: ParseContext) -> Iterator[dict]:
     """Parse the Massey comparison CSV into composite + per-system rows."""
-    text = raw.decode("utf-8")
+    text = as_binary_io(raw).read().decode("utf-8")
     lines = text.splitlines()
 
     thru_date = _parse_thru_date(lines)
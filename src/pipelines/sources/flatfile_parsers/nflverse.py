@@ -7,143 +7,76 @@ Sources (annual, stable GitHub release URLs):
 Column names/types are captured verbatim in tests/fixtures/flatfiles/FINDINGS.md;
 map them 1:1 (no renames beyond snake_case normalization) with light defensive
 munging only: coerce numerics, pass nulls through, drop rows missing a primary
-key component (log-worthy but expected for ancient combine rows). Read with
-``pyarrow.parquet.read_table(io.BytesIO(raw))`` -- pandas is intentionally not
-a dependency. Raise ParserStructureError if an expected PK column is absent
-from the file's schema.
+key component (log-worthy but expected for ancient combine rows). Raise
+ParserStructureError if an expected PK column is absent from the file's schema.
+
+Columnar end to end -- pandas is intentionally not a dependency, and no row
+is ever a Python dict: ``pyarrow.parquet.ParquetFile`` reads the fetched
+file-like (or a zero-copy view of bytes) with column projection down to the
+columns the target table knows (``COMBINE_COLUMNS`` / ``DRAFT_PICK_COLUMNS``;
+anything else the release grows is never decoded), ``BATCH_ROWS`` rows at a
+time. Each batch has its null-PK rows filtered and its columns cast with
+pyarrow.compute, and is yielded as a ``pyarrow.RecordBatch`` that
+``build_flat_file_source`` hands to dlt as-is.
 """
 
-import io
 import logging
 from collections.abc import Iterator
+from typing import BinaryIO
 
+import pyarrow
+import pyarrow.compute
 import pyarrow.parquet
 
-from ..flat_files import ParseContext, ParserStructureError
+from ..flat_files import ParseContext, ParserStructureError, as_binary_io
 
 logger = logging.getLogger(__name__)
 
-
-def _height_inches(value) -> float:
-    """Height as float inches; tolerates legacy PFR "6-2" feet-inches strings."""
-    if isinstance(value, str) and "-" in value:
-        feet, _, inches = value.partition("-")
-        return float(feet) * 12 + float(inches)
-    return float(value)
-
-
-def parse_combine(raw: bytes, ctx: ParseContext) -> Iterator[dict]:
-    """Parse combine.parquet into draft.combine rows.
-
-    PK columns: season, player_name, pos
-    Rows missing any PK column are dropped with a log message.
-    Numerics are coerced defensively: ints for season, floats for measurables.
-    Null values pass through.
-    """
-    table = pyarrow.parquet.read_table(io.BytesIO(raw))
-
-    # Verify PK columns exist in schema
-    pk_columns = {"season", "player_name", "pos"}
-    schema_names = set(table.column_names)
-    missing = pk_columns - schema_names
-    if missing:
-        raise ParserStructureError(f"nflverse_combine: missing PK column(s): {sorted(missing)}")
-
-    rows = table.to_pylist()
-    dropped_count = 0
-
-    for row in rows:
-        # Check for null PK columns
-        if row.get("season") is None or row.get("player_name") is None or row.get("pos") is None:
-            dropped_count += 1
-            continue
-
-        # Coerce numerics defensively
-        if row.get("season") is not None:
-            row["season"] = int(row["season"])
-
-        if row.get("draft_year") is not None:
-            row["draft_year"] = int(row["draft_year"])
-
-        if row.get("draft_round") is not None:
-            row["draft_round"] = int(row["draft_round"])
-
-        if row.get("draft_ovr") is not None:
-            row["draft_ovr"] = int(row["draft_ovr"])
-
-        if row.get("wt") is not None:
-            row["wt"] = int(row["wt"])
-
-        # Coerce measurables to float. ht is numeric inches in current nflverse
-        # releases, but older vintages shipped PFR-style "6-2" strings.
-        if row.get("ht") is not None:
-            row["ht"] = _height_inches(row["ht"])
-        for measurable in ["forty", "vertical", "cone", "shuttle"]:
-            if row.get(measurable) is not None:
-                row[measurable] = float(row[measurable])
-
-        if row.get("bench") is not None:
-            row["bench"] = int(row["bench"])
-
-        if row.get("broad_jump") is not None:
-            row["broad_jump"] = int(row["broad_jump"])
-
-        yield row
-
-    if dropped_count > 0:
-        logger.info(f"nflverse_combine: dropped {dropped_count} row(s) with null PK column(s)")
-
-
-def parse_draft_picks(raw: bytes, ctx: ParseContext) -> Iterator[dict]:
-    """Parse draft_picks.parquet into draft.nflverse_draft_picks rows.
-
-    PK columns: season, round, pick
-    Rows missing any PK column are dropped with a log message.
-    Numerics are coerced defensively: ints for season/round/pick, floats for stats.
-    Null values pass through.
-    Extra columns in the file pass through untouched.
-    """
-    table = pyarrow.parquet.read_table(io.BytesIO(raw))
-
-    # Verify PK columns exist in schema
-    pk_columns = {"season", "round", "pick"}
-    schema_names = set(table.column_names)
-    missing = pk_columns - schema_names
-    if missing:
-        raise ParserStructureError(f"nflverse_draft_picks: missing PK column(s): {sorted(missing)}")
-
-    rows = table.to_pylist()
-    dropped_count = 0
-
-    for row in rows:
-        # Check for null PK columns
-        if row.get("season") is None or row.get("round") is None or row.get("pick") is None:
-            dropped_count += 1
-            continue
-
-        # Coerce PK columns to int
-        row["season"] = int(row["season"])
-        row["round"] = int(row["round"])
-        row["pick"] = int(row["pick"])
-
-        # "to" (final NFL season) is a SQL reserved word; the migration names
-        # the column to_year -- rename so dlt merges into it instead of
-        # evolving a quoted "to" column.
-        if "to" in row:
-            to_value = row.pop("to")
-            row["to_year"] = int(to_value) if to_value is not None else None
-
-        # Coerce age to int if present
-        if row.get("age") is not None:
-            row["age"] = int(row["age"])
-
-        # Coerce hof to bool if present
-        if row.get("hof") is not None:
-            row["hof"] = bool(row["hof"])
-
-        # Coerce stat/numeric columns to float (most are already float in parquet)
-        # but we ensure consistency for defensive munging
-        for stat_col in [
+# Rows decoded per record batch; bounds memory regardless of release size.
+BATCH_ROWS = 16_384
+
+# Target type per projected column; None passes the file's type through.
+# Order is the output column order.
+COMBINE_COLUMNS: dict[str, pyarrow.DataType | None] = {
+    "season": pyarrow.int64(),
+    "player_name": None,
+    "pos": None,
+    "school": None,
+    "pfr_id": None,
+    "cfb_id": None,
+    "draft_year": pyarrow.int64(),
+    "draft_round": pyarrow.int64(),
+    "draft_ovr": pyarrow.int64(),
+    "draft_team": None,
+    "ht": pyarrow.float64(),
+    "wt": pyarrow.int64(),
+    "forty": pyarrow.float64(),
+    "bench": pyarrow.int64(),
+    "vertical": pyarrow.float64(),
+    "broad_jump": pyarrow.int64(),
+    "cone": pyarrow.float64(),
+    "shuttle": pyarrow.float64(),
+}
+
+DRAFT_PICK_COLUMNS: dict[str, pyarrow.DataType | None] = {
+    "season": pyarrow.int64(),
+    "round": pyarrow.int64(),
+    "pick": pyarrow.int64(),
+    "team": None,
+    "gsis_id": None,
+    "pfr_player_id": None,
+    "cfb_player_id": None,
+    "pfr_player_name": None,
+    "hof": pyarrow.bool_(),
+    "position": None,
+    "category": None,
+    "side": None,
+    "college": None,
+    "age": pyarrow.int64(),
+    "to": pyarrow.int64(),
+    **{
+        stat_col: pyarrow.float64()
+        for stat_col in (
             "allpro",
             "probowls",
             "seasons_started",
@@ -165,11 +98,112 @@ def parse_draft_picks(raw: bytes, ctx: ParseContext) -> Iterator[dict]:
             "def_solo_tackles",
             "def_ints",
             "def_sacks",
-        ]:
-            if row.get(stat_col) is not None:
-                row[stat_col] = float(row[stat_col])
+        )
+    },
+}
+
+# "to" (final NFL season) is a SQL reserved word; the migration names the
+# column to_year -- rename so dlt merges into it instead of evolving a quoted
+# "to" column.
+DRAFT_PICK_RENAMES = {"to": "to_year"}
+
+
+def _height_inches(value) -> float:
+    """Height as float inches; tolerates legacy PFR "6-2" feet-inches strings."""
+    if isinstance(value, str) and "-" in value:
+        feet, _, inches = value.partition("-")
+        return float(feet) * 12 + float(inches)
+    return float(value)
 
-        yield row
+
+def _coerce(name: str, column: pyarrow.Array, target: pyarrow.DataType | None) -> pyarrow.Array:
+    """Cast one column to its target type (truncating floats to ints, as int() did)."""
+    if target is None or column.type == target:
+        return column
+    if name == "ht" and pyarrow.types.is_string(column.type):
+        # ht is numeric inches in current nflverse releases, but older
+        # vintages shipped PFR-style "6-2" strings -- rare enough to convert
+        # per value.
+        return pyarrow.array(
+            [None if v is None else _height_inches(v) for v in column.to_pylist()],
+            type=pyarrow.float64(),
+        )
+    return pyarrow.compute.cast(column, target, safe=False)
+
+
+def _parquet_file(raw: bytes | BinaryIO) -> pyarrow.parquet.ParquetFile:
+    if isinstance(raw, bytes | bytearray | memoryview):
+        return pyarrow.parquet.ParquetFile(pyarrow.BufferReader(raw))
+    return pyarrow.parquet.ParquetFile(as_binary_io(raw))
+
+
+def _record_batches(
+    raw: bytes | BinaryIO,
+    *,
+    label: str,
+    columns: dict[str, pyarrow.DataType | None],
+    pk_columns: tuple[str, ...],
+    renames: dict[str, str] | None = None,
+) -> Iterator[pyarrow.RecordBatch]:
+    """Projected, PK-filtered, type-coerced record batches of a parquet file."""
+    renames = renames or {}
+    with _parquet_file(raw) as parquet_file:
+        schema_names = set(parquet_file.schema_arrow.names)
+        missing = set(pk_columns) - schema_names
+        if missing:
+            raise ParserStructureError(f"{label}: missing PK column(s): {sorted(missing)}")
+
+        projected = [name for name in columns if name in schema_names]
+        dropped_count = 0
+
+        for batch in parquet_file.iter_batches(batch_size=BATCH_ROWS, columns=projected):
+            keep = pyarrow.compute.is_valid(batch.column(pk_columns[0]))
+            for pk in pk_columns[1:]:
+                keep = pyarrow.compute.and_(keep, pyarrow.compute.is_valid(batch.column(pk)))
+            kept = batch.filter(keep)
+            dropped_count += batch.num_rows - kept.num_rows
+            if kept.num_rows == 0:
+                continue
+
+            yield pyarrow.RecordBatch.from_arrays(
+                [_coerce(name, kept.column(name), columns[name]) for name in kept.schema.names],
+                names=[renames.get(name, name) for name in kept.schema.names],
+            )
 
     if dropped_count > 0:
-        logger.info(f"nflverse_draft_picks: dropped {dropped_count} row(s) with null PK column(s)")
+        logger.info(f"{label}: dropped {dropped_count} row(s) with null PK column(s)")
+
+
+def parse_combine(raw: bytes | BinaryIO, ctx: ParseContext) -> Iterator[pyarrow.RecordBatch]:
+    """Parse combine.parquet into draft.combine record batches.
+
+    PK columns: season, player_name, pos
+    Rows missing any PK column are dropped with a log message.
+    Numerics are coerced defensively: ints for season/draft fields/wt/bench/
+    broad_jump, floats for ht and the timed/measured drills.
+    Null values pass through.
+    """
+    yield from _record_batches(
+        raw,
+        label="nflverse_combine",
+        columns=COMBINE_COLUMNS,
+        pk_columns=("season", "player_name", "pos"),
+    )
+
+
+def parse_draft_picks(raw: bytes | BinaryIO, ctx: ParseContext) -> Iterator[pyarrow.RecordBatch]:
+    """Parse draft_picks.parquet into draft.nflverse_draft_picks record batches.
+
+    PK columns: season, round, pick
+    Rows missing any PK column are dropped with a log message.
+    Numerics are coerced defensively: ints for season/round/pick/age/to_year,
+    bool for hof, floats for career stats.
+    Null values pass through. Columns outside DRAFT_PICK_COLUMNS are not read.
+    """
+    yield from _record_batches(
+        raw,
+        label="nflverse_draft_picks",
+        columns=DRAFT_PICK_COLUMNS,
+        pk_columns=("season", "round", "pick"),
+        renames=DRAFT_PICK_RENAMES,
+    )
@@ -40,14 +40,14 @@ Required behavior:
   broken pairing, non-numeric junk that isn't NL/pk) rather than guessing.
 """
 
-import io
 import re
 from collections.abc import Iterator
 from datetime import date
+from typing import BinaryIO
 
 from openpyxl import load_workbook
 
-from ..flat_files import ParseContext, ParserStructureError
+from ..flat_files import ParseContext, ParserStructureError, as_binary_io
 
 # Confirmed column set per FINDINGS.md section 4 (live HTML table, 2022-23 season).
 EXPECTED_COLUMNS = frozenset(
@@ -58,9 +58,9 @@ _PICKEM_TOKENS = frozenset({"PK", "P"})
 _NO_LINE_TOKEN = "NL"
 
 
-def parse(raw: bytes, ctx: ParseContext) -> Iterator[dict]:
+def parse(raw: bytes | BinaryIO, ctx: ParseContext) -> Iterator[dict]:
     """Parse an SBR season Excel file into betting.sbr_historical rows."""
-    wb = load_workbook(io.BytesIO(raw), read_only=True, data_only=True)
+    wb = load_workbook(as_binary_io(raw), read_only=True, data_only=True)
     ws = wb.worksheets[0]
     rows_iter = ws.iter_rows(values_only=True)
 
@@ -4,13 +4,28 @@ httpx GET with the retry posture of api_client.CFBDClient (429 Retry-After,
 5xx/RequestError backoff, MAX_RETRIES=3) minus auth and minus the CFBD rate
 limiter (public flat files have no call budget). Also accepts local filesystem
 paths so ``--file`` overrides ride the same code path.
+
+Bodies are streamed, never held whole: an HTTP response is written chunk by
+chunk to a ``SpooledTemporaryFile`` (in memory up to SPOOL_MAX_BYTES, then on
+disk) while its sha256 is updated incrementally, and a local file is hashed in
+chunks and handed over memory-mapped. Parsers read the result as a file-like
+``FetchedFile.body``.
+
+Conditional GET: given the ``Validators`` the ledger stored for the last bytes
+it loaded (``load_ledger.last_validators``), the request carries
+``If-None-Match`` / ``If-Modified-Since``; a 304 comes back as a body-less
+``FetchedFile`` (``not_modified``) keyed by the stored sha256, so an unchanged
+weekly/annual source costs one round trip instead of a download.
 """
 
 import hashlib
 import logging
+import mmap
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 
@@ -21,20 +36,91 @@ MAX_RETRIES = 3
 RETRY_DELAY = 1.0
 USER_AGENT = "cfb-database/0.1 (+https://github.com/rstover-fo/cfb-database)"
 
+# Read/hash granularity, and how much of a download stays in memory before the
+# spool rolls over to a temp file (the nflverse parquets are tens of MB).
+CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Cache validators recorded for a source's last loaded bytes.
+
+    Attributes:
+        sha256: Hex digest of those bytes (what a 304 resolves to).
+        etag: ETag response header they were served with, if any.
+        last_modified: Last-Modified response header, if any (sent back verbatim).
+    """
+
+    sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
 
 @dataclass(frozen=True)
 class FetchedFile:
-    """A fetched file: raw bytes + provenance.
+    """A fetched file: readable body + provenance.
 
     Attributes:
-        content: Raw file bytes.
-        sha256: Hex digest of content (ledger hash-skip key).
+        body: Binary file-like positioned at 0 (spooled temp file for HTTP,
+            read-only mmap for local files); None when the server answered
+            304 Not Modified.
+        sha256: Hex digest of the body (ledger hash-skip key); for a 304, the
+            digest of the previously loaded bytes the validators named.
         source_url: URL fetched, or absolute local path for file inputs.
+        etag: ETag response header (HTTP only).
+        last_modified: Last-Modified response header (HTTP only).
     """
 
-    content: bytes
+    body: BinaryIO | None
     sha256: str
     source_url: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        """True for a 304: the source still serves the bytes last loaded."""
+        return self.body is None
+
+    @property
+    def content(self) -> bytes:
+        """The whole body as bytes -- for small files (index pages, PDFs)."""
+        if self.body is None:
+            raise ValueError(f"{self.source_url}: 304 Not Modified has no content")
+        self.body.seek(0)
+        data = self.body.read()
+        self.body.seek(0)
+        return data
+
+    def close(self) -> None:
+        if self.body is not None:
+            self.body.close()
+
+
+def _conditional_headers(validators: Validators | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators is not None:
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+    return headers
+
+
+def _spool_response(response: httpx.Response) -> tuple[BinaryIO, str]:
+    """Stream a response body into a spooled temp file, hashing as it goes."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    digest = hashlib.sha256()
+    try:
+        for chunk in response.iter_bytes(CHUNK_SIZE):
+            digest.update(chunk)
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, digest.hexdigest()
 
 
 def _get_with_retries(
@@ -43,18 +129,37 @@ def _get_with_retries(
     timeout: float,
     retries: int,
     headers: dict[str, str] | None,
-) -> bytes:
+    validators: Validators | None = None,
+) -> FetchedFile:
     """GET a URL, retrying on 429/5xx/connection errors. Raises on terminal failure."""
     request_headers = {"User-Agent": USER_AGENT}
+    request_headers.update(_conditional_headers(validators))
     if headers:
         request_headers.update(headers)
 
     with httpx.Client(follow_redirects=True, timeout=timeout) as client:
         for attempt in range(retries + 1):
             try:
-                response = client.get(url, headers=request_headers)
-                response.raise_for_status()
-                return response.content
+                with client.stream("GET", url, headers=request_headers) as response:
+                    if response.status_code == 304 and validators is not None:
+                        return FetchedFile(
+                            body=None,
+                            sha256=validators.sha256,
+                            source_url=url,
+                            etag=response.headers.get("ETag", validators.etag),
+                            last_modified=response.headers.get(
+                                "Last-Modified", validators.last_modified
+                            ),
+                        )
+                    response.raise_for_status()
+                    body, sha256 = _spool_response(response)
+                    return FetchedFile(
+                        body=body,
+                        sha256=sha256,
+                        source_url=url,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
                     retry_after = int(e.response.headers.get("Retry-After", 60))
@@ -81,27 +186,46 @@ def _get_with_retries(
     raise RuntimeError(f"Exhausted retries fetching {url}")  # pragma: no cover - unreachable
 
 
+def _open_local(path: Path) -> FetchedFile:
+    """Hash a local file in chunks and map it read-only for the parser."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+        # mmap rejects zero-length files; an empty file is still a valid
+        # (if useless) input for the parser to reject.
+        if f.tell() == 0:
+            body = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        else:
+            body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return FetchedFile(body=body, sha256=digest.hexdigest(), source_url=str(path.resolve()))
+
+
 def fetch_file(
     url_or_path: str,
     *,
     timeout: float = DEFAULT_TIMEOUT,
     retries: int = MAX_RETRIES,
     headers: dict[str, str] | None = None,
+    validators: Validators | None = None,
 ) -> FetchedFile:
-    """Fetch a URL (http/https) or read a local path into a FetchedFile.
+    """Fetch a URL (http/https) or open a local path into a FetchedFile.
 
-    Follows redirects. Raises httpx.HTTPStatusError on terminal HTTP errors,
-    FileNotFoundError for missing local paths. Implemented in T3.
+    Follows redirects. ``validators`` (HTTP only) makes the GET conditional;
+    check ``not_modified`` on the result. The caller owns the body and should
+    ``close()`` it when done. Raises httpx.HTTPStatusError on terminal HTTP
+    errors, FileNotFoundError for missing local paths. Implemented in T3.
     """
     if url_or_path.startswith("http://") or url_or_path.startswith("https://"):
-        content = _get_with_retries(url_or_path, timeout=timeout, retries=retries, headers=headers)
-        source_url = url_or_path
-    else:
-        path = Path(url_or_path)
-        if not path.is_file():
-            raise FileNotFoundError(f"No such file: {url_or_path}")
-        content = path.read_bytes()
-        source_url = str(path.resolve())
-
-    sha256 = hashlib.sha256(content).hexdigest()
-    return FetchedFile(content=content, sha256=sha256, source_url=source_url)
+        return _get_with_retries(
+            url_or_path,
+            timeout=timeout,
+            retries=retries,
+            headers=headers,
+            validators=validators,
+        )
+
+    path = Path(url_or_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"No such file: {url_or_path}")
+    return _open_local(path)
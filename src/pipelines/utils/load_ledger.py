@@ -3,17 +3,33 @@
 The ledger makes the daily cron idempotent: a (source, sha256) pair recorded
 with status='loaded' means those exact bytes are already in the warehouse, so
 re-fetching an unchanged weekly/annual file is a cheap no-op
-(status=skipped_hash in the driver). psycopg2 (repo idiom B); DSN resolution
+(status=skipped_hash in the driver). Loaded/skipped rows also carry the HTTP
+cache validators (ETag / Last-Modified, migration 057) the bytes were served
+with; ``last_validators`` hands them back so the next fetch is a conditional
+GET and an unchanged file is a 304 (status=not_modified in the driver).
+psycopg2 (repo idiom B); DSN resolution
 mirrors the copy-pasted get_db_url() convention (dlt secrets first, then
 SUPABASE_DB_URL / DATABASE_URL env). Lives in src/ so both the dlt source
 layer and scripts/ can import it (src never imports scripts).
+
+Every function takes an optional ``conn``: a multi-source run opens one
+autocommit connection with ``connect()`` and threads it through (each
+psycopg2.connect against the Supabase pooler is a TLS + auth round trip);
+without one, the call opens and closes its own as before. A run that holds
+the connection across long downloads checks it with ``ensure_connected``
+before reuse, since the pooler drops idle sessions.
 """
 
 import logging
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 
 import psycopg2
+import psycopg2.errors
+
+from .file_fetcher import Validators
 
 logger = logging.getLogger(__name__)
 
@@ -47,25 +63,90 @@ def get_db_url() -> str:
     return url
 
 
-def already_loaded(source: str, sha256: str, db_url: str | None = None) -> bool:
-    """True if (source, sha256) has a status='loaded' ledger row. Implemented in T3."""
-    dsn = db_url or get_db_url()
-    conn = psycopg2.connect(dsn)
+def connect(db_url: str | None = None):
+    """An autocommit connection to share across ledger calls in one run.
+
+    Autocommit so reads between writes never leave the session idle in a
+    transaction, and a failed statement doesn't poison the rest of the run.
+    The caller closes it.
+    """
+    conn = psycopg2.connect(db_url or get_db_url())
+    conn.autocommit = True
+    return conn
+
+
+def is_connected(conn) -> bool:
+    """True if ``conn`` still answers a ``SELECT 1``.
+
+    A shared connection can be closed under a long run (pooler idle timeout,
+    server restart); ``conn.closed`` only notices once psycopg2 has seen the
+    socket fail, so the probe round trip is what catches a silently dropped
+    one.
+    """
+    if conn.closed:
+        return False
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT EXISTS (
-                    SELECT 1 FROM meta.flat_file_loads
-                    WHERE source = %s AND file_sha256 = %s AND status = 'loaded'
-                )
-                """,
-                (source, sha256),
-            )
-            (exists,) = cur.fetchone()
-            return bool(exists)
-    finally:
+            cur.execute("SELECT 1")
+    except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+        logger.info(f"shared ledger connection dropped ({e})")
+        return False
+    return True
+
+
+def ensure_connected(conn, db_url: str | None = None):
+    """``conn`` if ``is_connected``, else a fresh ``connect()``; the dead
+    connection is closed before reconnecting."""
+    if is_connected(conn):
+        return conn
+    try:
         conn.close()
+    except psycopg2.Error:
+        pass
+    return connect(db_url)
+
+
+@contextmanager
+def _cursor(conn, db_url: str | None) -> Iterator:
+    """Cursor on ``conn`` (left open), or on a one-shot connection that is
+    committed and closed on exit."""
+    if conn is not None:
+        with conn.cursor() as cur:
+            yield cur
+        if not conn.autocommit:
+            conn.commit()
+        return
+
+    own = psycopg2.connect(db_url or get_db_url())
+    try:
+        with own.cursor() as cur:
+            yield cur
+        own.commit()
+    finally:
+        own.close()
+
+
+def already_loaded(source: str, sha256: str, db_url: str | None = None, conn=None) -> bool:
+    """True if (source, sha256) has a status='loaded' ledger row. Implemented in T3."""
+    with _cursor(conn, db_url) as cur:
+        cur.execute(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM meta.flat_file_loads
+                WHERE source = %s AND file_sha256 = %s AND status = 'loaded'
+            )
+            """,
+            (source, sha256),
+        )
+        (exists,) = cur.fetchone()
+    return bool(exists)
+
+
+def _undefined_column_fallback(cur, message: str) -> None:
+    """Recover from a pre-057 ledger's UndefinedColumn and log why."""
+    if not cur.connection.autocommit:
+        cur.connection.rollback()
+    logger.warning(message)
 
 
 def record_load(
@@ -76,43 +157,105 @@ def record_load(
     source_url: str | None = None,
     row_count: int | None = None,
     error: str | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
     db_url: str | None = None,
+    conn=None,
 ) -> None:
-    """Insert a ledger row (append-only; status in VALID_STATUSES). Implemented in T3."""
+    """Insert a ledger row (append-only; status in VALID_STATUSES). Implemented in T3.
+
+    ``etag`` / ``last_modified`` are written when given; against a ledger that
+    predates migration 057 the row is recorded without them.
+    """
     if status not in VALID_STATUSES:
         raise ValueError(f"Invalid status {status!r}; must be one of {VALID_STATUSES}")
 
-    dsn = db_url or get_db_url()
-    conn = psycopg2.connect(dsn)
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO meta.flat_file_loads
-                    (source, file_sha256, source_url, row_count, status, error)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """,
-                (source, sha256, source_url, row_count, status, error),
-            )
-        conn.commit()
-    finally:
-        conn.close()
+    base = (source, sha256, source_url, row_count, status, error)
+    with _cursor(conn, db_url) as cur:
+        if etag is not None or last_modified is not None:
+            try:
+                cur.execute(
+                    """
+                    INSERT INTO meta.flat_file_loads
+                        (source, file_sha256, source_url, row_count, status, error,
+                         etag, last_modified)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    """,
+                    (*base, etag, last_modified),
+                )
+                return
+            except psycopg2.errors.UndefinedColumn:
+                _undefined_column_fallback(
+                    cur,
+                    f"{source}: meta.flat_file_loads has no validator columns -- "
+                    "apply 057_flat_file_validators.sql; recording without them",
+                )
+        cur.execute(
+            """
+            INSERT INTO meta.flat_file_loads
+                (source, file_sha256, source_url, row_count, status, error)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            base,
+        )
 
 
-def last_success(source: str, db_url: str | None = None) -> datetime | None:
-    """Latest loaded_at with status='loaded' for the source (drives --due). Implemented in T3."""
-    dsn = db_url or get_db_url()
-    conn = psycopg2.connect(dsn)
-    try:
-        with conn.cursor() as cur:
+def last_validators(source: str, db_url: str | None = None, conn=None) -> Validators | None:
+    """Cache validators of the newest ledger row whose bytes are loaded.
+
+    Only a row whose sha256 also has a status='loaded' row qualifies -- a 304
+    against validators for bytes that were skipped as stale or failed to load
+    would wrongly vouch for data the warehouse never received. None when no
+    such row exists or the ledger predates migration 057.
+    """
+    with _cursor(conn, db_url) as cur:
+        try:
             cur.execute(
                 """
-                SELECT MAX(loaded_at) FROM meta.flat_file_loads
-                WHERE source = %s AND status = 'loaded'
+                SELECT l.file_sha256, l.etag, l.last_modified
+                FROM meta.flat_file_loads l
+                WHERE l.source = %s
+                  AND l.status IN ('loaded', 'skipped')
+                  AND (l.etag IS NOT NULL OR l.last_modified IS NOT NULL)
+                  AND EXISTS (
+                      SELECT 1 FROM meta.flat_file_loads ok
+                      WHERE ok.source = l.source
+                        AND ok.file_sha256 = l.file_sha256
+                        AND ok.status = 'loaded'
+                  )
+                ORDER BY l.loaded_at DESC
+                LIMIT 1
                 """,
                 (source,),
             )
-            (loaded_at,) = cur.fetchone()
-            return loaded_at
-    finally:
-        conn.close()
+        except psycopg2.errors.UndefinedColumn:
+            _undefined_column_fallback(
+                cur,
+                "meta.flat_file_loads has no validator columns -- apply "
+                "057_flat_file_validators.sql; fetching unconditionally",
+            )
+            return None
+        row = cur.fetchone()
+    if row is None:
+        return None
+    sha256, etag, last_modified = row
+    return Validators(sha256=sha256, etag=etag, last_modified=last_modified)
+
+
+def last_success(source: str, db_url: str | None = None, conn=None) -> datetime | None:
+    """Latest loaded_at with status='loaded' for the source (drives --due). Implemented in T3."""
+    return last_successes([source], db_url=db_url, conn=conn).get(source)
+
+
+def last_successes(sources: list[str], db_url: str | None = None, conn=None) -> dict[str, datetime]:
+    """``last_success`` for many sources in one query; never-loaded sources are absent."""
+    with _cursor(conn, db_url) as cur:
+        cur.execute(
+            """
+            SELECT source, MAX(loaded_at) FROM meta.flat_file_loads
+            WHERE source = ANY(%s) AND status = 'loaded'
+            GROUP BY source
+            """,
+            (list(sources),),
+        )
+        return dict(cur.fetchall())
@@ -6,6 +6,15 @@ External flat files spell teams their own way ("Ohio St", "OhioState",
 loads the source's mapping once and resolves per row; misses are counted so
 the framework's unmapped gate can fail loud (see
 flat_files.UnmappedNamesError) instead of silently dropping rows.
+
+The crosswalk is small (hundreds of rows across all sources) and only changes
+by migration/seed, so the first ``XwalkResolver.load`` against a database
+reads the whole table in one query and keeps it for the life of the process;
+later loads -- other sources in the same driver run -- build their resolver
+from the cache. The cache is keyed by database (the DSN), so a process that
+talks to two warehouses never resolves one's rows with the other's
+crosswalk. ``clear_xwalk_cache()`` drops it (tests, or after reseeding
+in-process).
 """
 
 import logging
@@ -16,6 +25,46 @@ from .load_ledger import get_db_url
 
 logger = logging.getLogger(__name__)
 
+# Process-wide {dsn: {source: {normalized_source_name: cfbd_name}}} cache of
+# ref.team_name_xwalk, filled on first XwalkResolver.load per database.
+_xwalk_mappings: dict[str, dict[str, dict[str, str]]] = {}
+
+
+def _load_xwalk_mappings(db_url: str | None = None, conn=None) -> dict[str, dict[str, str]]:
+    """Every source's mapping, read once per process per database.
+
+    Keyed by ``db_url`` when given, else by the passed connection's DSN, else
+    by the resolved ``get_db_url()``.
+    """
+    own = conn is None
+    if db_url:
+        key = db_url
+    elif not own:
+        key = conn.dsn
+    else:
+        key = db_url = get_db_url()
+    if key not in _xwalk_mappings:
+        if own:
+            conn = psycopg2.connect(db_url)
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT source, source_name, cfbd_name FROM ref.team_name_xwalk")
+                rows = cur.fetchall()
+        finally:
+            if own:
+                conn.close()
+
+        mappings: dict[str, dict[str, str]] = {}
+        for source, source_name, cfbd_name in rows:
+            mappings.setdefault(source, {})[normalize_name(source_name)] = cfbd_name
+        _xwalk_mappings[key] = mappings
+    return _xwalk_mappings[key]
+
+
+def clear_xwalk_cache() -> None:
+    """Forget every cached crosswalk; the next load re-reads ref.team_name_xwalk."""
+    _xwalk_mappings.clear()
+
 
 def normalize_name(name: str) -> str:
     """Canonicalize a source spelling for matching: trim, collapse whitespace.
@@ -37,22 +86,14 @@ class XwalkResolver:
         self._misses: dict[str, int] = {}
 
     @classmethod
-    def load(cls, source: str, db_url: str | None = None) -> "XwalkResolver":
-        """Load the source's rows from ref.team_name_xwalk. Implemented in T3."""
-        dsn = db_url or get_db_url()
-        conn = psycopg2.connect(dsn)
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT source_name, cfbd_name FROM ref.team_name_xwalk WHERE source = %s",
-                    (source,),
-                )
-                rows = cur.fetchall()
-        finally:
-            conn.close()
+    def load(cls, source: str, db_url: str | None = None, conn=None) -> "XwalkResolver":
+        """Resolver for the source's rows of ref.team_name_xwalk (process-wide cache).
 
-        mapping = {normalize_name(source_name): cfbd_name for source_name, cfbd_name in rows}
-        return cls(source, mapping)
+        Implemented in T3. ``conn`` reuses the caller's connection for the
+        one cache-filling query.
+        """
+        mapping = _load_xwalk_mappings(db_url, conn).get(source, {})
+        return cls(source, dict(mapping))
 
     def resolve(self, source_name: str) -> str | None:
         """CFBD name for a source spelling, or None (recorded as a miss). Implemented in T3."""
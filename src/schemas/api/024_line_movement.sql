@@ -1,13 +1,22 @@
 -- api.line_movement
--- Thin view over betting.line_snapshots for line-movement history.
--- One row per (game, provider, captured_at) snapshot; pending games only.
+-- Betting line-movement history, reconstructed from betting.line_intervals
+-- (src/schemas/migrations/055_line_intervals.sql): one row per stretch of an
+-- unchanged line for a (game, provider), pending games only.
+--
+-- captured_at is the capture at which the line first appeared, so ordering
+-- by it walks the line's moves exactly as the per-snapshot rows did, minus
+-- the repeats. valid_to is the capture that replaced it (NULL while current),
+-- last_captured_at the latest capture that still saw it, and captures how
+-- many captures it spans.
 --
 -- PostgREST usage:
 --   GET /api/line_movement?game_id=eq.401628455&order=provider,captured_at
 
-CREATE OR REPLACE VIEW api.line_movement AS
+DROP VIEW IF EXISTS api.line_movement;
+
+CREATE VIEW api.line_movement AS
 SELECT
-    captured_at,
+    valid_from AS captured_at,
     game_id,
     season,
     week,
@@ -19,13 +28,17 @@ SELECT
     over_under,
     home_moneyline,
     away_moneyline,
-    line_hash
-FROM betting.line_snapshots
-ORDER BY game_id, provider, captured_at;
+    line_hash,
+    valid_to,
+    last_captured_at,
+    captures
+FROM betting.line_intervals
+ORDER BY game_id, provider, valid_from;
 
 COMMENT ON VIEW api.line_movement IS
-'Betting line movement history from append-only daily snapshots of pending games. '
-'line_hash lets consumers detect no-movement streaks between captures.';
+'Betting line movement history for pending games: one row per interval of an unchanged '
+'line per (game, provider). captured_at is when the line first appeared, valid_to when it '
+'was replaced (NULL while current), last_captured_at the latest capture that saw it.';
 
 -- Grants are part of the definition: an apply that DROPs/recreates the
 -- view would otherwise leave the PostgREST roles without read access
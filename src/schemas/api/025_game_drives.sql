@@ -7,8 +7,12 @@
 -- same pattern as core.plays), and core.drives.is_home_offense already exists
 -- as a native column -- it does not need to be derived from games.home_team.
 --
+-- public.get_game_drives (src/schemas/public/013_game_lookup_functions.sql)
+-- is the season-pinned RPC counterpart, paired with get_game_plays.
+--
 -- PostgREST usage:
 --   GET /api/game_drives?game_id=eq.401628455&order=drive_number
+--   POST /rpc/get_game_drives {"p_game_id": 401628455}
 
 CREATE OR REPLACE VIEW api.game_drives AS
 SELECT
@@ -9,10 +9,15 @@
 -- client-side (kickoffs, timeouts, administrative plays, etc. are all included).
 --
 -- Callers should always filter by game_id: core.plays has no season predicate
--- by default, so an unfiltered query scans every season partition.
+-- by default, so an unfiltered query scans every season partition. A game_id
+-- filter alone still probes every partition's game_id index; add
+-- season=eq.<season> when it is known, or call public.get_game_plays
+-- (src/schemas/public/013_game_lookup_functions.sql), which resolves the
+-- season from core.games and reads one partition.
 --
 -- PostgREST usage:
---   GET /api/game_plays?game_id=eq.401628455&order=drive_number,play_number
+--   POST /rpc/get_game_plays {"p_game_id": 401628455}        (one partition)
+--   GET /api/game_plays?game_id=eq.401628455&season=eq.<season>&order=drive_number,play_number
 
 CREATE OR REPLACE VIEW api.game_plays AS
 SELECT
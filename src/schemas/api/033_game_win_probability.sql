@@ -15,9 +15,10 @@
 --
 -- Column provenance:
 --   game_id, season, play_id, home_win_probability, down, distance,
---   yard_line, play_text -- straight from metrics.win_probability, whose
---   shape mirrors CFBD's /metrics/wp response. down/distance/yard_line may
---   be NULL on some plays (e.g. kickoffs) per CFBD's own data, not a load bug.
+--   yard_line, play_text -- from metrics.win_probability (via its packed
+--   copy, see Storage below), whose shape mirrors CFBD's /metrics/wp
+--   response. down/distance/yard_line may be NULL on some plays (e.g.
+--   kickoffs) per CFBD's own data, not a load bug.
 --   home_team, away_team -- LEFT JOIN core.games on game_id (a table CFBD's
 --   response may or may not also carry team names on; core.games is the
 --   verified source, so it's used here instead of trusting an unconfirmed
@@ -31,6 +32,14 @@
 --   every row rather than breaking the view or dropping win-probability
 --   rows (it's a LEFT JOIN, not an inner join).
 --
+-- Storage: reads metrics.win_probability_game, the one-row-per-game packed
+-- form of metrics.win_probability (migrations/054_win_probability_game.sql,
+-- maintained by the metrics_wp loader). A game_id filter is a single-row
+-- primary-key fetch whose arrays are unnested in place. The column list and
+-- types are unchanged from the per-play table (int elements are widened back
+-- to bigint, text back to varchar), so CREATE OR REPLACE applies over the old
+-- definition. Apply 054 first.
+--
 -- Ordering: no confirmed per-game play-sequence field exists in the
 -- /metrics/wp payload (see 026's header) -- play_id ascending is the working
 -- ordering assumption pending probe confirmation.
@@ -41,23 +50,26 @@
 CREATE OR REPLACE VIEW api.game_win_probability AS
 SELECT
     wp.game_id,
-    wp.season,
-    wp.play_id,
+    wp.season::bigint AS season,
+    u.play_id,
     g.home_team,
     g.away_team,
-    wp.home_win_probability,
-    wp.down,
-    wp.distance,
-    wp.yard_line,
-    wp.play_text,
+    u.home_win_probability,
+    u.down::bigint AS down,
+    u.distance::bigint AS distance,
+    u.yard_line::bigint AS yard_line,
+    u.play_text::varchar AS play_text,
     p.period,
     p.clock__minutes AS clock_minutes,
     p.clock__seconds AS clock_seconds
-FROM metrics.win_probability wp
+FROM metrics.win_probability_game wp
+CROSS JOIN LATERAL unnest(
+    wp.play_ids, wp.home_wp, wp.downs, wp.distances, wp.yard_lines, wp.play_texts
+) AS u(play_id, home_win_probability, down, distance, yard_line, play_text)
 LEFT JOIN core.games g ON g.id = wp.game_id
-LEFT JOIN core.plays p ON p.id = wp.play_id::varchar
-ORDER BY wp.game_id, wp.play_id;
+LEFT JOIN core.plays p ON p.id = u.play_id::varchar
+ORDER BY wp.game_id, u.play_id;
 
 GRANT SELECT ON api.game_win_probability TO anon, authenticated;
 
-COMMENT ON VIEW api.game_win_probability IS 'In-game (per-play) win probability for a game, CFBD''s own in-play model (not the Tier 2 house pregame win probability in api.game_elo_history/api.game_predictions). Columns: game_id, season, play_id, home_team, away_team, home_win_probability, down, distance, yard_line, play_text, period, clock_minutes, clock_seconds. period/clock_minutes/clock_seconds come from a defensive LEFT JOIN to core.plays on play_id -- NULL if that id correspondence does not hold (unconfirmed as of deploy; see scripts/probe_metrics_wp.py). Coverage starts 2014 (metrics year range) but is only as complete as the per-game backfill in deploys/p32-backfill-manifests.md. Backed by metrics.win_probability.';
+COMMENT ON VIEW api.game_win_probability IS 'In-game (per-play) win probability for a game, CFBD''s own in-play model (not the Tier 2 house pregame win probability in api.game_elo_history/api.game_predictions). Columns: game_id, season, play_id, home_team, away_team, home_win_probability, down, distance, yard_line, play_text, period, clock_minutes, clock_seconds. period/clock_minutes/clock_seconds come from a defensive LEFT JOIN to core.plays on play_id -- NULL if that id correspondence does not hold (unconfirmed as of deploy; see scripts/probe_metrics_wp.py). Coverage starts 2014 (metrics year range) but is only as complete as the per-game backfill in deploys/p32-backfill-manifests.md. Backed by metrics.win_probability_game (one row per game, per-play arrays).';
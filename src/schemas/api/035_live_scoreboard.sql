@@ -10,19 +10,22 @@
 -- its last REFRESH, so on that poll cadence a matview would always be lagging
 -- the current game state by up to a refresh cycle -- exactly the opposite of
 -- what a live scoreboard needs. A plain view re-executes its query (the
--- DISTINCT ON below) on every request instead, so it is always current as of
--- the latest poll tick with zero refresh-lag risk.
+-- latest_snapshot join below) on every request instead, so it is always
+-- current as of the latest poll tick with zero refresh-lag risk.
 --
 -- LATEST-PER-GAME: live.scoreboard_snapshots is append-only, one row per
 -- game per poll tick with no unique constraint on (game_id, captured_at)
--- (see migration 029's header), so DISTINCT ON (game_id) ORDER BY game_id,
--- captured_at DESC picks the single most recent snapshot per game.
+-- (see migration 029's header). live.latest_snapshot (migration 056) holds
+-- each game's newest snapshot id, kept current by an insert trigger, so this
+-- view is a primary-key join from it rather than a DISTINCT ON over the
+-- season's history.
 --
 -- 24-HOUR WINDOW: restricted to snapshots captured within the last 24 hours
 -- so finished games age themselves out of this view -- a game that ended
 -- Saturday afternoon should not still surface here on a Sunday query. Full
 -- poll-tick history remains queryable directly from
--- live.scoreboard_snapshots.
+-- live.scoreboard_snapshots until the game has been final for the retention
+-- window; after that live.game_summaries holds its rollup (migration 056).
 --
 -- house_live_home_wp is the closed-form house live win probability (formula
 -- documented in migration 029's header: f = clamp(seconds_remaining/3600,
@@ -35,30 +38,31 @@
 --   GET /api/live_scoreboard?game_id=eq.401628455
 
 CREATE OR REPLACE VIEW api.live_scoreboard AS
-SELECT DISTINCT ON (game_id)
-    game_id,
-    season,
-    week,
-    season_type,
-    status,
-    period,
-    clock,
-    seconds_remaining,
-    home_team,
-    away_team,
-    home_points,
-    away_points,
-    possession,
-    spread,
-    over_under,
-    cfbd_home_wp,
-    house_live_home_wp,
-    pregame_expected_margin,
-    captured_at
-FROM live.scoreboard_snapshots
-WHERE captured_at > now() - INTERVAL '24 hours'
-ORDER BY game_id, captured_at DESC;
+SELECT
+    s.game_id,
+    s.season,
+    s.week,
+    s.season_type,
+    s.status,
+    s.period,
+    s.clock,
+    s.seconds_remaining,
+    s.home_team,
+    s.away_team,
+    s.home_points,
+    s.away_points,
+    s.possession,
+    s.spread,
+    s.over_under,
+    s.cfbd_home_wp,
+    s.house_live_home_wp,
+    s.pregame_expected_margin,
+    s.captured_at
+FROM live.latest_snapshot l
+JOIN live.scoreboard_snapshots s ON s.id = l.snapshot_id
+WHERE l.captured_at > now() - INTERVAL '24 hours'
+ORDER BY s.game_id;
 
 GRANT SELECT ON api.live_scoreboard TO anon, authenticated;
 
-COMMENT ON VIEW api.live_scoreboard IS 'Latest /scoreboard poll snapshot per game captured within the last 24 hours (stale finished games age out on their own). Columns: game_id, season, week, season_type, status, period, clock, seconds_remaining, home_team, away_team, home_points, away_points, possession, spread, over_under, cfbd_home_wp, house_live_home_wp, pregame_expected_margin, captured_at. Plain view, not materialized, so it is always current as of the latest 5-minute poll tick -- see file header. DISTINCT ON (game_id) ORDER BY captured_at DESC selects the latest snapshot; query live.scoreboard_snapshots directly for full poll-tick history. Backed by live.scoreboard_snapshots.';
+COMMENT ON VIEW api.live_scoreboard IS 'Latest /scoreboard poll snapshot per game captured within the last 24 hours (stale finished games age out on their own). Columns: game_id, season, week, season_type, status, period, clock, seconds_remaining, home_team, away_team, home_points, away_points, possession, spread, over_under, cfbd_home_wp, house_live_home_wp, pregame_expected_margin, captured_at. Plain view, not materialized, so it is always current as of the latest 5-minute poll tick -- see file header. live.latest_snapshot selects the latest snapshot; query live.scoreboard_snapshots directly for full poll-tick history (rolled up into live.game_summaries once a game has been final for the retention window). Backed by live.latest_snapshot + live.scoreboard_snapshots.';
@@ -19,9 +19,13 @@
 --   - src/schemas/marts/005_defensive_havoc.sql
 --   - src/schemas/marts/010_play_epa.sql
 --   - src/schemas/marts/019_team_tempo_metrics.sql
+--   - src/schemas/public/005_team_split_functions.sql (live fallbacks)
+--   - src/schemas/public/006_play_analysis_functions.sql (red-zone fallback)
+--   - src/schemas/migrations/053_team_split_agg.sql (split mart refresh)
 --
 -- tests/test_garbage_time_consistency.py enforces this: it regex-extracts the
--- inline predicate from every file in src/schemas/marts/ and fails the build
+-- inline predicate from every file in src/schemas/marts/ (plus the split-RPC
+-- files above) and fails the build
 -- if any occurrence drifts from the canonical constant above.
 
 CREATE OR REPLACE FUNCTION public.is_garbage_time(
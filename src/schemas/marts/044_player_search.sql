@@ -0,0 +1,56 @@
+-- marts.player_search
+-- Search projection of core.roster behind public.get_player_search
+-- (src/schemas/public/009_player_search_function.sql): the display name, its
+-- lowercased form under a GIN trigram index, and each athlete's best
+-- recruiting profile (highest-rated recruits row) precomputed.
+-- Grain: (player_id, team, season) -- one row per core.roster row, whose
+-- primary key is (id, team, year): a player appears once per team-season.
+-- Refreshed with every mart refresh, i.e. after each roster/recruiting load.
+--
+-- The RPC used to evaluate lower(first_name || ' ' || last_name) % query over
+-- core.roster -- an expression no index covered -- and run a top-1
+-- recruiting.recruits lookup per candidate. Against this mart the trigram
+-- match is a GIN index scan on search_name and the recruit columns are
+-- already on the row.
+
+DROP MATERIALIZED VIEW IF EXISTS marts.player_search CASCADE;
+
+CREATE MATERIALIZED VIEW marts.player_search AS
+WITH best_recruit AS (
+    -- Same pick as the RPC's former LATERAL: highest rating, NULLs last.
+    SELECT DISTINCT ON (rr.athlete_id)
+        rr.athlete_id,
+        rr.stars,
+        rr.rating
+    FROM recruiting.recruits rr
+    WHERE rr.athlete_id IS NOT NULL
+    ORDER BY rr.athlete_id, rr.rating DESC NULLS LAST
+)
+SELECT
+    r.id::text AS player_id,
+    (r.first_name || ' ' || r.last_name)::text AS name,
+    lower(r.first_name || ' ' || r.last_name) AS search_name,
+    r.team::text AS team,
+    r.position::text AS position,
+    r.year AS season,
+    r.height,
+    r.weight,
+    r.jersey,
+    br.stars,
+    br.rating AS recruit_rating
+FROM core.roster r
+LEFT JOIN best_recruit br ON br.athlete_id = r.id
+-- A NULL name part makes the full name NULL, which never matched the search.
+WHERE r.first_name IS NOT NULL
+  AND r.last_name IS NOT NULL;
+
+-- Required for REFRESH CONCURRENTLY; the core.roster primary key.
+CREATE UNIQUE INDEX idx_player_search_pk ON marts.player_search (player_id, team, season);
+
+-- Trigram index serving get_player_search's `search_name % query` match
+CREATE INDEX ON marts.player_search USING gin (search_name public.gin_trgm_ops);
+
+-- Re-grant on every apply: this file DROPs the matview, which discards its
+-- grants, and public.get_player_search() runs as the CALLER (see
+-- 028_data_freshness.sql for why not to re-run the blanket grant migration).
+GRANT SELECT ON marts.player_search TO anon, authenticated;
@@ -0,0 +1,62 @@
+-- House Elo: persisted engine state + processing watermark
+-- =============================================================================
+-- Tier 2 analytics (docs/plans/2026-07-21-tier2-analytics-plan.md), house Elo
+-- incremental mode.
+--
+-- Until now `compute_house_elo.py --incremental` was shorthand for `--season
+-- <current>`: reseed from the prior season's analytics.house_elo_game rows,
+-- then recompute and rewrite the whole current season every morning. These
+-- two tables let the daily run resume the engine exactly where the last run
+-- stopped and process only games completed since then:
+--
+--   analytics.house_elo_state -- one row per rating key: every real team the
+--     engine has ever seen, plus the shared pooled bucket ('__FCS__'). Holds
+--     the full EloEngine state (rating, last_season, this season's alias,
+--     games_played, last game id/date). rating is DOUBLE PRECISION, not the
+--     NUMERIC(8, 2) of house_elo_game, so a resumed engine continues from the
+--     unrounded value and an incremental run matches a same-day rebuild.
+--     Columns are NULL where the engine has no entry for that key (e.g. a team
+--     on this season's schedule that has not played yet has an alias but no
+--     games_played).
+--
+--   analytics.house_elo_watermark -- single row: the season the state
+--     belongs to, the (start_date, game_id) of the last game processed, and
+--     how many house_elo_game rows that season should have. A row-count
+--     mismatch, a season change, or any change to an already-processed game
+--     sends the script back to a full season rebuild.
+--
+-- Both tables are fully replaced by --full / --season and upserted in the
+-- same transaction as the appended house_elo_game rows by --incremental.
+--
+-- analytics.* is contract-internal (docs/SCHEMA_CONTRACT.md) -- nothing but
+-- scripts/compute_house_elo.py reads these tables.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-049. Idempotent (IF NOT EXISTS throughout).
+
+CREATE SCHEMA IF NOT EXISTS analytics;
+
+CREATE TABLE IF NOT EXISTS analytics.house_elo_state (
+    team VARCHAR PRIMARY KEY,
+    rating DOUBLE PRECISION,
+    last_season BIGINT,
+    alias VARCHAR,
+    games_played BIGINT,
+    last_game_id BIGINT,
+    last_game_date TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS analytics.house_elo_watermark (
+    singleton BOOLEAN PRIMARY KEY DEFAULT true CHECK (singleton),
+    season BIGINT NOT NULL,
+    last_start_date TIMESTAMPTZ,
+    last_game_id BIGINT,
+    games_processed BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE analytics.house_elo_state IS
+    'Persisted EloEngine state for scripts/compute_house_elo.py --incremental: one row per real team plus the pooled __FCS__ bucket. rating is unrounded (double precision) so a resumed engine matches a rebuild.';
+COMMENT ON TABLE analytics.house_elo_watermark IS
+    'Single-row processing watermark for house Elo --incremental: season, last processed (start_date, game_id), and the expected analytics.house_elo_game row count for that season.';
@@ -0,0 +1,66 @@
+-- Season simulation: persisted common-random-numbers state
+-- =============================================================================
+-- Backs `scripts/simulate_season.py --incremental` (CrnSeasonSimulation).
+--
+-- A plain run redraws the whole season from one stream, so a single changed
+-- prediction reshuffles every other game's draw and the daily projections
+-- jitter by simulation noise alone. The incremental mode keys every random
+-- quantity by identity instead -- each team's strength offsets by team name,
+-- each game's noise by game_id, both under the run's seed -- and keeps each
+-- game's simulated outcome, so a daily refresh re-evaluates only the games
+-- whose result or prediction changed and patches the per-team tallies.
+--
+--   analytics.season_sim_state -- one row per (season, model_version): the
+--     parameters the stored outcomes were drawn under (seed, n_sims, sigma,
+--     strength_share) plus stream_version. sigma is pinned here for the
+--     season (a patch keeps it; --reset-sigma re-pins). Any other mismatch
+--     with today's run, or a stream_version the script does not know, means a
+--     rebuild rather than a patch.
+--
+--   analytics.season_sim_game -- one row per game in the simulated schedule:
+--     the inputs that decide its contribution (teams, conference flag,
+--     completed/home_win, expected_home_margin) and, for pending games, the
+--     per-simulation home-win outcomes bit-packed into home_wins (n_sims / 8
+--     bytes; ~1.25KB per game at 10,000 sims). Completed games store no bits:
+--     their result is the same in every simulation. expected_home_margin is
+--     DOUBLE PRECISION so the change check compares exactly the value the
+--     outcome was drawn from.
+--
+-- analytics.* is contract-internal (docs/SCHEMA_CONTRACT.md) -- nothing but
+-- scripts/simulate_season.py reads these tables.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-050. Idempotent (IF NOT EXISTS throughout).
+
+CREATE SCHEMA IF NOT EXISTS analytics;
+
+CREATE TABLE IF NOT EXISTS analytics.season_sim_state (
+    season BIGINT NOT NULL,
+    model_version VARCHAR NOT NULL,
+    seed BIGINT NOT NULL,
+    n_sims BIGINT NOT NULL,
+    sigma DOUBLE PRECISION NOT NULL,
+    strength_share NUMERIC(4, 3) NOT NULL,
+    stream_version INTEGER NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (season, model_version)
+);
+
+CREATE TABLE IF NOT EXISTS analytics.season_sim_game (
+    season BIGINT NOT NULL,
+    model_version VARCHAR NOT NULL,
+    game_id BIGINT NOT NULL,
+    home_team VARCHAR NOT NULL,
+    away_team VARCHAR NOT NULL,
+    conference_game BOOLEAN NOT NULL,
+    completed BOOLEAN NOT NULL,
+    home_win BOOLEAN,
+    expected_home_margin DOUBLE PRECISION,
+    home_wins BYTEA,
+    PRIMARY KEY (season, model_version, game_id)
+);
+
+COMMENT ON TABLE analytics.season_sim_state IS
+    'Parameters of the persisted common-random-numbers season simulation per (season, model_version), for scripts/simulate_season.py --incremental. sigma is pinned for the season; a seed/n_sims/strength_share mismatch with the current run forces a rebuild.';
+COMMENT ON TABLE analytics.season_sim_game IS
+    'Per-game inputs and bit-packed per-simulation home-win outcomes (pending games only) of the persisted season simulation. Lets --incremental re-evaluate only changed games.';
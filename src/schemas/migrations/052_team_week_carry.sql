@@ -0,0 +1,76 @@
+-- features.team_week: season-to-date carry + incremental watermark
+-- =============================================================================
+-- Backs `scripts/build_features.py --incremental`.
+--
+-- Until now --incremental rewrote every projection season whole each morning:
+-- one INSERT ... SELECT summing every prior week's plays, drives and havoc
+-- rows per spine row, then a DELETE + INSERT of the season. A row keyed at
+-- week_index = WI only reads data from weeks below WI (design doc section 0),
+-- so in season everything up to the last settled week is already final, and
+-- the rows after it need only the season-to-date sums through that week.
+-- These two tables carry those sums forward so a daily run rebuilds only the
+-- last completed week plus the upcoming rows:
+--
+--   features.team_week_carry -- one row per (season, through_week_index,
+--     team): the per-week aggregates FEATURE_ROWS_QUERY's LATERAL joins add
+--     up (EPA/success/explosive sums and play counts on both sides, drive
+--     points and counts, havoc events and plays) plus completed games,
+--     pre-summed over every week_index < through_week_index. Column types
+--     match what those SUMs produce, so a carried sum is the same value the
+--     full build would add up. NULL where the team had no source row. A
+--     season keeps one through_week_index at a time.
+--
+--   features.team_week_watermark -- one row per season: the carry's
+--     through_week_index, and a fingerprint of the weeks below it (games,
+--     completed games, summed stored pregame Elo). A fingerprint mismatch, a
+--     build-version change, or the carried week reopening sends the script
+--     back to a full season build.
+--
+-- Both are reseeded by every full build (--season / --from) and advanced in
+-- the same transaction as the rebuilt features.team_week rows by
+-- --incremental.
+--
+-- features.* internals are contract-internal (docs/SCHEMA_CONTRACT.md) --
+-- nothing but scripts/build_features.py reads these tables.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-051. Idempotent (IF NOT EXISTS throughout).
+
+CREATE SCHEMA IF NOT EXISTS features;
+
+CREATE TABLE IF NOT EXISTS features.team_week_carry (
+    season BIGINT NOT NULL,
+    through_week_index BIGINT NOT NULL,
+    team VARCHAR NOT NULL,
+    games_played BIGINT NOT NULL,
+    off_sum_epa DOUBLE PRECISION,
+    off_sum_success NUMERIC,
+    off_sum_explosive NUMERIC,
+    off_n_plays NUMERIC,
+    def_sum_epa DOUBLE PRECISION,
+    def_sum_success NUMERIC,
+    def_sum_explosive NUMERIC,
+    def_n_plays NUMERIC,
+    drive_sum_points NUMERIC,
+    drive_n_drives NUMERIC,
+    def_havoc_events DOUBLE PRECISION,
+    def_plays NUMERIC,
+    off_havoc_events_allowed DOUBLE PRECISION,
+    off_plays_allowed NUMERIC,
+    PRIMARY KEY (season, through_week_index, team)
+);
+
+CREATE TABLE IF NOT EXISTS features.team_week_watermark (
+    season BIGINT PRIMARY KEY,
+    through_week_index BIGINT NOT NULL,
+    games_below BIGINT NOT NULL,
+    completed_below BIGINT NOT NULL,
+    elo_below NUMERIC NOT NULL,
+    feature_build_version VARCHAR NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE features.team_week_carry IS
+    'Season-to-date sums per team over every week_index below through_week_index -- the per-week aggregates features.team_week''s season-to-date columns add up -- for scripts/build_features.py --incremental.';
+COMMENT ON TABLE features.team_week_watermark IS
+    'Per-season carry position for build_features --incremental: through_week_index plus a fingerprint (games, completed games, summed pregame Elo) of the weeks below it. A mismatch forces a full season build.';
@@ -0,0 +1,341 @@
+-- Situational splits: precomputed per-(team, season, split_type, bucket) sums
+-- =============================================================================
+-- Backs the five split RPCs (public.get_home_away_splits,
+-- get_conference_splits, get_red_zone_splits, get_down_distance_splits,
+-- get_field_position_splits) behind the MCP situational_splits tool and the
+-- cfb-app team pages.
+--
+-- Each RPC used to answer from the play tables per request: a core.plays scan
+-- through core.games (the home/away and conference variants filtered on
+-- g.season, which cannot prune the season partitions), public.is_garbage_time
+-- called per row, and per-bucket averages recomputed by correlated
+-- subqueries. They now read a handful of rows from this mart by primary key
+-- and only fall back to the live query for a season that has not been built.
+--
+--   analytics.team_split_agg -- one row per (team, season, split_type, side,
+--     bucket). Columns are additive sums and their denominators (games, wins,
+--     points; plays, EPA sum and count, successes, yards sum and count,
+--     conversions, scores; red-zone trips and outcomes), so each RPC derives
+--     exactly the ratios its live query computes. Only the columns a
+--     split_type uses are filled; the rest are NULL. Buckets:
+--       home_away      -- side 'offense', bucket 'home' | 'away'
+--       conference     -- side 'offense', bucket 'conference' | 'non_conference'
+--       red_zone       -- side 'offense' | 'defense', bucket 'inside_20'
+--       down_distance  -- side 'offense' | 'defense', bucket '<down>|<distance>'
+--                         e.g. '3|4-6'
+--       field_position -- side 'offense' | 'defense', bucket the zone key
+--     home_away/conference rows carry the team's results in games/wins/
+--     points_* and its offensive snaps in the play columns, as the RPCs do.
+--
+--   analytics.team_split_agg_season -- one row per built season. Its
+--     presence is what routes an RPC to the mart; the RPCs fall back to
+--     their live query for any season without one.
+--
+-- analytics.refresh_team_split_agg(season) rebuilds one season in a single
+-- transaction (readers keep the previous rows until it commits). Every
+-- play read filters the partition key p.season, and garbage time is the
+-- canonical predicate inlined (see functions/is_garbage_time.sql) or
+-- marts.play_epa's precomputed flag. scripts/refresh_marts.py calls it after
+-- the matviews (down/distance and field position read marts.play_epa) for
+-- the current season and any season not yet built; pass --split-seasons to
+-- rebuild others.
+--
+-- analytics.* is contract-internal (docs/SCHEMA_CONTRACT.md) -- nothing but
+-- the split RPCs above and scripts/refresh_marts.py read these tables.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-052. Idempotent (IF NOT EXISTS throughout).
+
+CREATE SCHEMA IF NOT EXISTS analytics;
+
+CREATE TABLE IF NOT EXISTS analytics.team_split_agg (
+    team VARCHAR NOT NULL,
+    season BIGINT NOT NULL,
+    split_type VARCHAR NOT NULL,
+    side VARCHAR NOT NULL,
+    bucket VARCHAR NOT NULL,
+    games BIGINT,
+    wins BIGINT,
+    points_for NUMERIC,
+    points_against NUMERIC,
+    trips BIGINT,
+    touchdowns BIGINT,
+    field_goals BIGINT,
+    turnovers BIGINT,
+    plays BIGINT,
+    epa_sum DOUBLE PRECISION,
+    epa_n BIGINT,
+    successes BIGINT,
+    yards_sum NUMERIC,
+    yards_n BIGINT,
+    conversions BIGINT,
+    scores BIGINT,
+    PRIMARY KEY (team, season, split_type, side, bucket)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_split_agg_season
+    ON analytics.team_split_agg (season);
+
+CREATE TABLE IF NOT EXISTS analytics.team_split_agg_season (
+    season BIGINT PRIMARY KEY,
+    row_count BIGINT NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE analytics.team_split_agg IS
+    'Additive per-(team, season, split_type, side, bucket) sums behind the five situational split RPCs. Rebuilt per season by analytics.refresh_team_split_agg.';
+COMMENT ON TABLE analytics.team_split_agg_season IS
+    'Seasons built into analytics.team_split_agg. The split RPCs read the mart only for these seasons and fall back to their live query otherwise.';
+
+GRANT SELECT ON analytics.team_split_agg TO anon, authenticated;
+GRANT SELECT ON analytics.team_split_agg_season TO anon, authenticated;
+
+CREATE OR REPLACE FUNCTION analytics.refresh_team_split_agg(p_season integer)
+RETURNS bigint
+LANGUAGE plpgsql
+SET search_path = ''
+AS $function$
+DECLARE
+    v_rows bigint := 0;
+    v_inserted bigint;
+BEGIN
+    DELETE FROM analytics.team_split_agg a WHERE a.season = p_season;
+
+    -- home_away + conference: per-team game results and offensive snaps,
+    -- bucketed by the game's location and the opponent's conference. The
+    -- INNER join to the opponent's public.teams row mirrors
+    -- get_conference_splits, so games against unlisted opponents carry no
+    -- conference bucket.
+    WITH team_games AS (
+        SELECT
+            tg.game_id,
+            tg.team,
+            tg.location,
+            CASE
+                WHEN opp.school IS NULL THEN NULL
+                WHEN opp.conference = tm.conference THEN 'conference'
+                ELSE 'non_conference'
+            END AS opponent_type,
+            tg.points_for,
+            tg.points_against,
+            tg.final
+        FROM (
+            SELECT g.id AS game_id, g.home_team AS team, g.away_team AS opponent,
+                   'home' AS location, g.home_points AS points_for,
+                   g.away_points AS points_against, g.home_points IS NOT NULL AS final
+            FROM core.games g
+            WHERE g.season = p_season
+            UNION ALL
+            SELECT g.id, g.away_team, g.home_team,
+                   'away', g.away_points,
+                   g.home_points, g.home_points IS NOT NULL
+            FROM core.games g
+            WHERE g.season = p_season
+        ) tg
+        LEFT JOIN public.teams tm ON tm.school = tg.team
+        LEFT JOIN public.teams opp ON opp.school = tg.opponent
+        WHERE tg.team IS NOT NULL
+    ),
+    game_buckets AS (
+        SELECT tg.*, b.split_type, b.bucket
+        FROM team_games tg
+        CROSS JOIN LATERAL (
+            VALUES ('home_away', tg.location), ('conference', tg.opponent_type)
+        ) AS b(split_type, bucket)
+        WHERE b.bucket IS NOT NULL
+    ),
+    game_sums AS (
+        SELECT
+            gb.team,
+            gb.split_type,
+            gb.bucket,
+            COUNT(*) AS games,
+            COUNT(*) FILTER (WHERE gb.points_for > gb.points_against) AS wins,
+            SUM(gb.points_for) AS points_for,
+            SUM(gb.points_against) AS points_against
+        FROM game_buckets gb
+        WHERE gb.final
+        GROUP BY gb.team, gb.split_type, gb.bucket
+    ),
+    play_sums AS (
+        SELECT
+            gb.team,
+            gb.split_type,
+            gb.bucket,
+            COUNT(*) AS plays,
+            SUM(p.ppa) AS epa_sum,
+            COUNT(p.ppa) AS epa_n,
+            COUNT(*) FILTER (WHERE p.ppa > 0) AS successes,
+            SUM(p.yards_gained) AS yards_sum,
+            COUNT(p.yards_gained) AS yards_n
+        FROM core.plays p
+        JOIN game_buckets gb ON gb.game_id = p.game_id AND gb.team = p.offense
+        WHERE p.season = p_season
+          AND NOT (
+              (p.period = 4 AND ABS(COALESCE(p.score_diff, 0)) > 28) OR
+              (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
+          )
+        GROUP BY gb.team, gb.split_type, gb.bucket
+    )
+    INSERT INTO analytics.team_split_agg (
+        team, season, split_type, side, bucket,
+        games, wins, points_for, points_against,
+        plays, epa_sum, epa_n, successes, yards_sum, yards_n
+    )
+    SELECT
+        gs.team, p_season, gs.split_type, 'offense', gs.bucket,
+        gs.games, gs.wins, gs.points_for, gs.points_against,
+        COALESCE(ps.plays, 0), ps.epa_sum, COALESCE(ps.epa_n, 0),
+        COALESCE(ps.successes, 0), ps.yards_sum, COALESCE(ps.yards_n, 0)
+    FROM game_sums gs
+    LEFT JOIN play_sums ps
+      ON ps.team = gs.team AND ps.split_type = gs.split_type AND ps.bucket = gs.bucket;
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    v_rows := v_rows + v_inserted;
+
+    -- red_zone: trips are drives with any snap at yards_to_goal <= 20 (no
+    -- garbage-time filter: drive-level facts), outcomes from the drive row;
+    -- EPA over the non-garbage red-zone snaps. Same definitions as
+    -- get_red_zone_splits.
+    WITH red_zone_trips AS (
+        SELECT DISTINCT s.team, s.side, p.game_id, p.drive_number
+        FROM core.plays p
+        CROSS JOIN LATERAL (
+            VALUES (p.offense, 'offense'), (p.defense, 'defense')
+        ) AS s(team, side)
+        WHERE p.season = p_season
+          AND p.yards_to_goal <= 20
+          AND p.drive_number IS NOT NULL
+          AND s.team IS NOT NULL
+    ),
+    trip_sums AS (
+        SELECT
+            t.team,
+            t.side,
+            COUNT(*) AS trips,
+            COUNT(*) FILTER (WHERE d.drive_result IN ('TD', 'Touchdown')) AS touchdowns,
+            COUNT(*) FILTER (WHERE d.drive_result IN ('FG', 'Field Goal')) AS field_goals,
+            COUNT(*) FILTER (WHERE d.drive_result IN ('INT', 'FUMBLE', 'INT TD', 'FUMBLE RETURN TD', 'Interception', 'Fumble', 'Fumble Lost', 'Interception Return')) AS turnovers
+        FROM red_zone_trips t
+        LEFT JOIN core.drives d
+          ON d.game_id = t.game_id AND d.drive_number = t.drive_number
+        GROUP BY t.team, t.side
+    ),
+    epa_sums AS (
+        SELECT s.team, s.side, SUM(p.ppa) AS epa_sum, COUNT(p.ppa) AS epa_n
+        FROM core.plays p
+        CROSS JOIN LATERAL (
+            VALUES (p.offense, 'offense'), (p.defense, 'defense')
+        ) AS s(team, side)
+        WHERE p.season = p_season
+          AND p.yards_to_goal <= 20
+          AND s.team IS NOT NULL
+          AND NOT (
+              (p.period = 4 AND ABS(COALESCE(p.score_diff, 0)) > 28) OR
+              (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
+          )
+        GROUP BY s.team, s.side
+    )
+    INSERT INTO analytics.team_split_agg (
+        team, season, split_type, side, bucket,
+        trips, touchdowns, field_goals, turnovers, epa_sum, epa_n
+    )
+    SELECT
+        ts.team, p_season, 'red_zone', ts.side, 'inside_20',
+        ts.trips, ts.touchdowns, ts.field_goals, ts.turnovers,
+        es.epa_sum, COALESCE(es.epa_n, 0)
+    FROM trip_sums ts
+    LEFT JOIN epa_sums es ON es.team = ts.team AND es.side = ts.side;
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    v_rows := v_rows + v_inserted;
+
+    -- down_distance: get_down_distance_splits' 4-bucket distance scheme over
+    -- marts.play_epa (already garbage-flagged and season-indexed).
+    INSERT INTO analytics.team_split_agg (
+        team, season, split_type, side, bucket,
+        plays, epa_sum, epa_n, successes, conversions
+    )
+    SELECT
+        s.team, p_season, 'down_distance', s.side,
+        pe.down || '|' ||
+        CASE
+            WHEN pe.distance BETWEEN 1 AND 3 THEN '1-3'
+            WHEN pe.distance BETWEEN 4 AND 6 THEN '4-6'
+            WHEN pe.distance BETWEEN 7 AND 10 THEN '7-10'
+            ELSE '11+'
+        END AS bucket,
+        COUNT(*),
+        SUM(pe.epa),
+        COUNT(pe.epa),
+        SUM(pe.success),
+        COUNT(*) FILTER (WHERE pe.down IN (3, 4) AND pe.yards_gained >= pe.distance)
+    FROM marts.play_epa pe
+    CROSS JOIN LATERAL (
+        VALUES (pe.offense, 'offense'), (pe.defense, 'defense')
+    ) AS s(team, side)
+    WHERE pe.season = p_season
+      AND s.team IS NOT NULL
+      AND pe.down IS NOT NULL
+      AND pe.down BETWEEN 1 AND 4
+      AND pe.distance IS NOT NULL
+      AND pe.distance > 0
+      AND NOT pe.is_garbage_time
+    GROUP BY s.team, s.side, 5;
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    v_rows := v_rows + v_inserted;
+
+    -- field_position: get_field_position_splits' 4 zones, flipped for the
+    -- defense (yards_to_goal is from the offense's perspective).
+    INSERT INTO analytics.team_split_agg (
+        team, season, split_type, side, bucket,
+        plays, epa_sum, epa_n, successes, yards_sum, yards_n, scores
+    )
+    SELECT
+        s.team, p_season, 'field_position', s.side,
+        CASE
+            WHEN s.side = 'offense' THEN
+                CASE
+                    WHEN pe.yards_to_goal >= 80 THEN 'own_1_20'
+                    WHEN pe.yards_to_goal >= 50 THEN 'own_21_50'
+                    WHEN pe.yards_to_goal >= 20 THEN 'opp_49_21'
+                    ELSE 'opp_20_1'
+                END
+            ELSE
+                CASE
+                    WHEN pe.yards_to_goal <= 20 THEN 'own_1_20'
+                    WHEN pe.yards_to_goal <= 50 THEN 'own_21_50'
+                    WHEN pe.yards_to_goal <= 80 THEN 'opp_49_21'
+                    ELSE 'opp_20_1'
+                END
+        END AS bucket,
+        COUNT(*),
+        SUM(pe.epa),
+        COUNT(pe.epa),
+        SUM(pe.success),
+        SUM(pe.yards_gained),
+        COUNT(pe.yards_gained),
+        COUNT(*) FILTER (WHERE pe.scoring = true)
+    FROM marts.play_epa pe
+    CROSS JOIN LATERAL (
+        VALUES (pe.offense, 'offense'), (pe.defense, 'defense')
+    ) AS s(team, side)
+    WHERE pe.season = p_season
+      AND s.team IS NOT NULL
+      AND pe.yards_to_goal IS NOT NULL
+      AND NOT pe.is_garbage_time
+    GROUP BY s.team, s.side, 5;
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    v_rows := v_rows + v_inserted;
+
+    INSERT INTO analytics.team_split_agg_season (season, row_count, refreshed_at)
+    VALUES (p_season, v_rows, now())
+    ON CONFLICT (season) DO UPDATE
+        SET row_count = EXCLUDED.row_count,
+            refreshed_at = EXCLUDED.refreshed_at;
+
+    RETURN v_rows;
+END;
+$function$;
+
+COMMENT ON FUNCTION analytics.refresh_team_split_agg(integer) IS
+    'Rebuild one season of analytics.team_split_agg and mark it built. Returns the rows written.';
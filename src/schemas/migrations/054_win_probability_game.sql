@@ -0,0 +1,142 @@
+-- In-game win probability, one row per game
+-- =============================================================================
+-- metrics.win_probability (dlt merge table, see
+-- src/pipelines/sources/metrics.py::win_probability_resource) holds ~150+ rows
+-- per game, one per play, each with its own tuple header, dlt bookkeeping
+-- columns and an entry in ux_win_probability_game_play (026). Every reader
+-- wants a whole game at a time -- api.game_win_probability,
+-- scripts/generate_recaps.py's WP chart facts and
+-- scripts/calibrate_live_wp.py's state reconstruction -- so they paid for
+-- ~150 index probes and heap rows to read one game.
+--
+--   metrics.win_probability_game -- one row per game_id. The per-play fields
+--     the readers use are packed into parallel typed arrays, all ordered by
+--     play_id (the per-game ordering 026/033 settled on): element i of every
+--     array is the same play. play_count is the array length. source_load_id
+--     is the newest _dlt_load_id among the game's per-play rows when it was
+--     packed: dlt stamps every row a merge writes with that load's id, so a
+--     game whose plays were re-merged -- even with the same play count, e.g.
+--     a corrected WP or score -- shows a newer max(_dlt_load_id) and gets
+--     repacked. Arrays hold NULLs where the per-play row does (e.g. down on a
+--     kickoff); readers filter after unnest exactly as they did per row.
+--
+-- metrics.win_probability stays the load target (dlt merges per-play rows, and
+-- run_metrics_wp_pipeline's "already loaded" check reads it); this table is
+-- derived from it. metrics.pack_win_probability(seasons) repacks every game in
+-- `seasons` whose packed row is missing, whose play count no longer matches
+-- (a play deleted upstream leaves no newer load id behind) or whose
+-- source_load_id is older than the game's newest per-play row -- NULL packs
+-- every season. src/pipelines/run.py::run_metrics_wp_pipeline
+-- calls it for the seasons it loaded; this migration calls it once to pack
+-- the games loaded before it existed.
+--
+-- Apply AFTER 026 -- same precondition: metrics.win_probability must exist
+-- (dlt creates it on the first metrics_wp load).
+--
+-- metrics.* is contract-internal (docs/SCHEMA_CONTRACT.md) -- readers go
+-- through api.game_win_probability.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-053. Idempotent (IF NOT EXISTS throughout;
+-- the backfill call is an upsert).
+
+CREATE TABLE IF NOT EXISTS metrics.win_probability_game (
+    game_id BIGINT PRIMARY KEY,
+    season INTEGER,
+    play_count INTEGER NOT NULL,
+    play_ids BIGINT[] NOT NULL,
+    play_numbers INTEGER[] NOT NULL,
+    home_wp DOUBLE PRECISION[] NOT NULL,
+    spreads DOUBLE PRECISION[] NOT NULL,
+    home_scores SMALLINT[] NOT NULL,
+    away_scores SMALLINT[] NOT NULL,
+    downs SMALLINT[] NOT NULL,
+    distances SMALLINT[] NOT NULL,
+    yard_lines SMALLINT[] NOT NULL,
+    play_texts TEXT[] NOT NULL,
+    source_load_id TEXT,
+    packed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Tables created before source_load_id existed: their rows start NULL, so the
+-- backfill call below repacks them once.
+ALTER TABLE metrics.win_probability_game ADD COLUMN IF NOT EXISTS source_load_id TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_win_probability_game_season
+    ON metrics.win_probability_game (season);
+
+COMMENT ON TABLE metrics.win_probability_game IS
+    'One row per game of metrics.win_probability: per-play fields packed into parallel arrays ordered by play_id. Maintained by metrics.pack_win_probability from the metrics_wp loader.';
+
+CREATE OR REPLACE FUNCTION metrics.pack_win_probability(p_seasons integer[] DEFAULT NULL)
+RETURNS bigint
+LANGUAGE plpgsql
+SET search_path = ''
+AS $function$
+DECLARE
+    v_rows bigint;
+BEGIN
+    WITH per_game AS (
+        SELECT w.game_id, count(*) AS n, max(w._dlt_load_id)::text AS load_id
+        FROM metrics.win_probability w
+        WHERE p_seasons IS NULL OR w.season = ANY(p_seasons)
+        GROUP BY w.game_id
+    ),
+    stale AS (
+        SELECT pg.game_id
+        FROM per_game pg
+        LEFT JOIN metrics.win_probability_game c ON c.game_id = pg.game_id
+        WHERE c.game_id IS NULL
+           OR c.play_count <> pg.n
+           OR c.source_load_id IS DISTINCT FROM pg.load_id
+    )
+    INSERT INTO metrics.win_probability_game (
+        game_id, season, play_count, play_ids, play_numbers, home_wp, spreads,
+        home_scores, away_scores, downs, distances, yard_lines, play_texts,
+        source_load_id, packed_at
+    )
+    SELECT
+        w.game_id,
+        max(w.season)::integer,
+        count(*)::integer,
+        array_agg(w.play_id ORDER BY w.play_id),
+        array_agg(w.play_number::integer ORDER BY w.play_id),
+        array_agg(w.home_win_probability::double precision ORDER BY w.play_id),
+        array_agg(w.spread::double precision ORDER BY w.play_id),
+        array_agg(w.home_score::smallint ORDER BY w.play_id),
+        array_agg(w.away_score::smallint ORDER BY w.play_id),
+        array_agg(w.down::smallint ORDER BY w.play_id),
+        array_agg(w.distance::smallint ORDER BY w.play_id),
+        array_agg(w.yard_line::smallint ORDER BY w.play_id),
+        array_agg(w.play_text::text ORDER BY w.play_id),
+        max(w._dlt_load_id)::text,
+        now()
+    FROM metrics.win_probability w
+    WHERE w.game_id IN (SELECT s.game_id FROM stale s)
+    GROUP BY w.game_id
+    ON CONFLICT (game_id) DO UPDATE SET
+        season = EXCLUDED.season,
+        play_count = EXCLUDED.play_count,
+        play_ids = EXCLUDED.play_ids,
+        play_numbers = EXCLUDED.play_numbers,
+        home_wp = EXCLUDED.home_wp,
+        spreads = EXCLUDED.spreads,
+        home_scores = EXCLUDED.home_scores,
+        away_scores = EXCLUDED.away_scores,
+        downs = EXCLUDED.downs,
+        distances = EXCLUDED.distances,
+        yard_lines = EXCLUDED.yard_lines,
+        play_texts = EXCLUDED.play_texts,
+        source_load_id = EXCLUDED.source_load_id,
+        packed_at = EXCLUDED.packed_at;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$function$;
+
+COMMENT ON FUNCTION metrics.pack_win_probability(integer[]) IS
+    'Repack metrics.win_probability_game for games in the given seasons (NULL = all) whose packed row is missing or out of date. Returns the games written.';
+
+-- Pack everything loaded before this table existed.
+SELECT metrics.pack_win_probability();
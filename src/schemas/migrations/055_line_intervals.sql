@@ -0,0 +1,233 @@
+-- Betting line history as validity intervals
+-- =============================================================================
+-- betting.line_snapshots (dlt append table, see
+-- src/pipelines/sources/betting.py::line_snapshots_resource) used to get
+-- every pending game's every provider line on every betting run, moved or
+-- not -- a line that sat at -3.5 for a week was ~7+ identical rows, and
+-- api.line_movement / compute_predictions' market lookup scanned all of them.
+--
+-- Writes are now delta-encoded: run_betting_pipeline passes the current line
+-- hash per (game_id, provider) into the resource, which appends a full
+-- line_snapshots row only when the line moved. An unchanged line is recorded
+-- as a narrow (captured_at, game_id, provider, line_hash) row in
+-- betting.line_snapshot_confirms, so "last seen" stays exact.
+--
+--   betting.line_intervals -- one row per run of identical lines for a
+--     (game_id, provider): the line's values, line_hash, valid_from (the
+--     capture at which it first appeared), valid_to (the capture at which
+--     the next line replaced it; NULL while current), last_captured_at (the
+--     latest capture that saw it) and captures (how many did).
+--
+-- betting.compact_line_snapshots() moves everything in line_snapshots and
+-- line_snapshot_confirms into line_intervals: rows are removed from the
+-- staging tables by the same DELETE that reads them, consecutive captures
+-- with the same line_hash collapse into one interval, the open interval is
+-- extended or closed, and new intervals are opened. run_betting_pipeline
+-- calls it after every load; this migration calls it once to compact the
+-- history captured before it existed. Returns the staged rows consumed.
+--
+-- Apply AFTER 020 -- same precondition: betting.line_snapshots must exist
+-- (dlt creates it on the first betting load). line_snapshot_confirms is
+-- created by dlt on the first run with an unchanged line, so the function
+-- only reads it once it exists.
+--
+-- betting.* is contract-internal (docs/SCHEMA_CONTRACT.md); readers go through
+-- api.line_movement.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-054. Idempotent (IF NOT EXISTS throughout;
+-- the backfill call consumes whatever is staged and is a no-op on re-apply).
+
+CREATE TABLE IF NOT EXISTS betting.line_intervals (
+    game_id BIGINT NOT NULL,
+    provider VARCHAR NOT NULL,
+    valid_from TIMESTAMPTZ NOT NULL,
+    valid_to TIMESTAMPTZ,
+    last_captured_at TIMESTAMPTZ NOT NULL,
+    captures INTEGER NOT NULL,
+    season BIGINT,
+    week BIGINT,
+    home_team VARCHAR,
+    away_team VARCHAR,
+    spread DOUBLE PRECISION,
+    formatted_spread VARCHAR,
+    over_under DOUBLE PRECISION,
+    home_moneyline BIGINT,
+    away_moneyline BIGINT,
+    line_hash VARCHAR,
+    PRIMARY KEY (game_id, provider, valid_from)
+);
+
+-- The open interval per (game, provider): the delta check's and the market
+-- lookup's current line.
+CREATE INDEX IF NOT EXISTS ix_line_intervals_open
+    ON betting.line_intervals (game_id, provider)
+    WHERE valid_to IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_line_intervals_season_week
+    ON betting.line_intervals (season, week);
+
+COMMENT ON TABLE betting.line_intervals IS
+    'Betting line history per (game_id, provider) as validity intervals: one row per run of identical captured lines. Built from betting.line_snapshots by betting.compact_line_snapshots.';
+
+CREATE OR REPLACE FUNCTION betting.compact_line_snapshots()
+RETURNS bigint
+LANGUAGE plpgsql
+SET search_path = ''
+AS $function$
+DECLARE
+    v_staged bigint;
+    v_confirms bigint := 0;
+BEGIN
+    DROP TABLE IF EXISTS pg_temp.line_capture_batch;
+    CREATE TEMP TABLE pg_temp.line_capture_batch (
+        game_id BIGINT,
+        provider VARCHAR,
+        captured_at TIMESTAMPTZ,
+        is_confirm BOOLEAN,
+        season BIGINT,
+        week BIGINT,
+        home_team VARCHAR,
+        away_team VARCHAR,
+        spread DOUBLE PRECISION,
+        formatted_spread VARCHAR,
+        over_under DOUBLE PRECISION,
+        home_moneyline BIGINT,
+        away_moneyline BIGINT,
+        line_hash VARCHAR
+    ) ON COMMIT DROP;
+
+    -- Read-and-remove in one statement: rows a concurrent load appends after
+    -- this point stay staged for the next call.
+    WITH moved AS (
+        DELETE FROM betting.line_snapshots s
+        WHERE s.game_id IS NOT NULL AND s.provider IS NOT NULL AND s.captured_at IS NOT NULL
+        RETURNING s.game_id, s.provider, s.captured_at, s.season, s.week, s.home_team,
+                  s.away_team, s.spread, s.formatted_spread, s.over_under,
+                  s.home_moneyline, s.away_moneyline, s.line_hash
+    )
+    INSERT INTO pg_temp.line_capture_batch
+    SELECT m.game_id, m.provider, m.captured_at, false, m.season, m.week, m.home_team,
+           m.away_team, m.spread, m.formatted_spread, m.over_under,
+           m.home_moneyline, m.away_moneyline, m.line_hash
+    FROM moved m;
+    GET DIAGNOSTICS v_staged = ROW_COUNT;
+
+    IF to_regclass('betting.line_snapshot_confirms') IS NOT NULL THEN
+        EXECUTE $sql$
+            WITH moved AS (
+                DELETE FROM betting.line_snapshot_confirms c
+                WHERE c.game_id IS NOT NULL AND c.provider IS NOT NULL
+                  AND c.captured_at IS NOT NULL
+                RETURNING c.game_id, c.provider, c.captured_at, c.line_hash
+            )
+            INSERT INTO pg_temp.line_capture_batch (game_id, provider, captured_at, is_confirm, line_hash)
+            SELECT m.game_id, m.provider, m.captured_at, true, m.line_hash
+            FROM moved m
+        $sql$;
+        GET DIAGNOSTICS v_confirms = ROW_COUNT;
+    END IF;
+
+    IF v_staged + v_confirms = 0 THEN
+        RETURN 0;
+    END IF;
+
+    -- Gaps and islands per (game, provider) over the open interval (as the
+    -- seed, positioned at its last capture) followed by the staged captures
+    -- in time order: a capture whose line_hash differs from the previous one
+    -- starts a new interval. The starting row of each island carries the
+    -- line's values.
+    DROP TABLE IF EXISTS pg_temp.line_interval_islands;
+    CREATE TEMP TABLE pg_temp.line_interval_islands ON COMMIT DROP AS
+    WITH seq AS (
+        SELECT i.game_id, i.provider, i.last_captured_at AS captured_at, i.valid_from AS seed_from,
+               true AS is_seed, false AS is_confirm, i.captures, i.season, i.week,
+               i.home_team, i.away_team, i.spread, i.formatted_spread, i.over_under,
+               i.home_moneyline, i.away_moneyline, i.line_hash
+        FROM betting.line_intervals i
+        WHERE i.valid_to IS NULL
+          AND EXISTS (
+              SELECT 1 FROM pg_temp.line_capture_batch b
+              WHERE b.game_id = i.game_id AND b.provider = i.provider
+          )
+        UNION ALL
+        (
+            SELECT DISTINCT ON (b.game_id, b.provider, b.captured_at)
+                   b.game_id, b.provider, b.captured_at, NULL::timestamptz,
+                   false, b.is_confirm, 1, b.season, b.week, b.home_team, b.away_team,
+                   b.spread, b.formatted_spread, b.over_under, b.home_moneyline,
+                   b.away_moneyline, b.line_hash
+            FROM pg_temp.line_capture_batch b
+            -- A full row wins over a confirm captured in the same run.
+            ORDER BY b.game_id, b.provider, b.captured_at, b.is_confirm
+        )
+    ),
+    flagged AS (
+        SELECT seq.*,
+               CASE WHEN seq.line_hash IS NOT DISTINCT FROM lag(seq.line_hash) OVER w
+                    THEN 0 ELSE 1 END AS starts
+        FROM seq
+        WINDOW w AS (PARTITION BY seq.game_id, seq.provider ORDER BY seq.captured_at, seq.is_seed DESC)
+    ),
+    numbered AS (
+        SELECT flagged.*,
+               sum(flagged.starts) OVER (
+                   PARTITION BY flagged.game_id, flagged.provider
+                   ORDER BY flagged.captured_at, flagged.is_seed DESC
+                   ROWS UNBOUNDED PRECEDING
+               ) AS island
+        FROM flagged
+    ),
+    island_totals AS (
+        SELECT n.game_id, n.provider, n.island,
+               max(n.captured_at) AS last_captured_at,
+               sum(n.captures)::integer AS captures
+        FROM numbered n
+        GROUP BY n.game_id, n.provider, n.island
+    )
+    SELECT n.game_id, n.provider, n.is_seed, n.is_confirm,
+           COALESCE(n.seed_from, n.captured_at) AS valid_from,
+           lead(COALESCE(n.seed_from, n.captured_at)) OVER (
+               PARTITION BY n.game_id, n.provider ORDER BY n.island
+           ) AS valid_to,
+           t.last_captured_at, t.captures, n.season, n.week, n.home_team, n.away_team,
+           n.spread, n.formatted_spread, n.over_under, n.home_moneyline,
+           n.away_moneyline, n.line_hash
+    FROM numbered n
+    JOIN island_totals t
+      ON t.game_id = n.game_id AND t.provider = n.provider AND t.island = n.island
+    WHERE n.starts = 1;
+
+    UPDATE betting.line_intervals i
+    SET valid_to = x.valid_to,
+        last_captured_at = x.last_captured_at,
+        captures = x.captures
+    FROM pg_temp.line_interval_islands x
+    WHERE x.is_seed
+      AND i.game_id = x.game_id
+      AND i.provider = x.provider
+      AND i.valid_from = x.valid_from;
+
+    -- An island that starts with a confirm has no line values to record (its
+    -- interval was never compacted); it is dropped rather than stored empty.
+    INSERT INTO betting.line_intervals (
+        game_id, provider, valid_from, valid_to, last_captured_at, captures,
+        season, week, home_team, away_team, spread, formatted_spread, over_under,
+        home_moneyline, away_moneyline, line_hash
+    )
+    SELECT x.game_id, x.provider, x.valid_from, x.valid_to, x.last_captured_at, x.captures,
+           x.season, x.week, x.home_team, x.away_team, x.spread, x.formatted_spread,
+           x.over_under, x.home_moneyline, x.away_moneyline, x.line_hash
+    FROM pg_temp.line_interval_islands x
+    WHERE NOT x.is_seed AND NOT x.is_confirm
+    ON CONFLICT (game_id, provider, valid_from) DO NOTHING;
+
+    RETURN v_staged + v_confirms;
+END;
+$function$;
+
+COMMENT ON FUNCTION betting.compact_line_snapshots() IS
+    'Move staged betting.line_snapshots / line_snapshot_confirms rows into betting.line_intervals, collapsing runs of identical lines. Returns the staged rows consumed.';
+
+-- Compact the snapshot history captured before this migration.
+SELECT betting.compact_line_snapshots();
@@ -0,0 +1,203 @@
+-- Live scoreboard retention: latest-snapshot index table + final-game rollup
+-- =============================================================================
+-- live.scoreboard_snapshots (029) grows by a row per game per poll tick, all
+-- season, and two hot paths searched it for each game's newest row:
+-- scripts/poll_scoreboard.py's fetch_latest_hashes (the dedup check, every
+-- poll) and api.live_scoreboard's DISTINCT ON. Both got slower as the
+-- season's history piled up behind them.
+--
+--   live.latest_snapshot -- one row per game: the id, snapshot_hash, status
+--     and captured_at of its newest snapshot. Kept current by a
+--     statement-level AFTER INSERT trigger on scoreboard_snapshots, so every
+--     writer maintains it in the same transaction as its insert. The dedup
+--     lookup and api.live_scoreboard read it by primary key.
+--
+--   live.game_summaries -- one row per rolled-up game: its final snapshot's
+--     values (score, status, line, final house/CFBD WP, pregame margin), the
+--     capture window, how many snapshots it had, and the house WP range and
+--     number of 0.5 crossings over the game.
+--
+-- live.rollup_final_snapshots(final_days) keeps full-resolution snapshots
+-- only while they can still matter: every game whose latest snapshot has
+-- been final (completed/final/closed) for more than `final_days` days is
+-- summarized into game_summaries and its snapshot rows deleted. The
+-- latest_snapshot row stays, so a final game that reappears on /scoreboard
+-- still dedups. scripts/poll_scoreboard.py calls it after each run
+-- (--retention-days, default 3).
+--
+-- Apply BEFORE deploying the poll_scoreboard.py that reads
+-- live.latest_snapshot. The backfill below seeds latest_snapshot from the
+-- existing history; the first poll's rollup then trims it.
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-055. Idempotent (IF NOT EXISTS / DROP
+-- TRIGGER IF EXISTS / ON CONFLICT throughout).
+
+CREATE TABLE IF NOT EXISTS live.latest_snapshot (
+    game_id BIGINT PRIMARY KEY,
+    snapshot_id BIGINT NOT NULL,
+    snapshot_hash TEXT,
+    status TEXT,
+    captured_at TIMESTAMPTZ NOT NULL
+);
+
+-- The rollup's "final for N days" scan.
+CREATE INDEX IF NOT EXISTS latest_snapshot_status_captured_idx
+    ON live.latest_snapshot (status, captured_at);
+
+COMMENT ON TABLE live.latest_snapshot IS
+    'Newest live.scoreboard_snapshots row per game (id, hash, status, captured_at), maintained by an AFTER INSERT trigger. Backs poll_scoreboard.py''s dedup lookup and api.live_scoreboard.';
+
+CREATE TABLE IF NOT EXISTS live.game_summaries (
+    game_id BIGINT PRIMARY KEY,
+    season INTEGER,
+    week INTEGER,
+    season_type TEXT,
+    status TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    home_points INTEGER,
+    away_points INTEGER,
+    spread NUMERIC,
+    over_under NUMERIC,
+    pregame_expected_margin NUMERIC,
+    final_house_live_home_wp NUMERIC,
+    final_cfbd_home_wp NUMERIC,
+    first_captured_at TIMESTAMPTZ NOT NULL,
+    final_captured_at TIMESTAMPTZ NOT NULL,
+    snapshots INTEGER NOT NULL,
+    house_wp_min NUMERIC,
+    house_wp_max NUMERIC,
+    house_wp_crossings INTEGER NOT NULL,
+    rolled_up_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE live.game_summaries IS
+    'Per-game rollup of live.scoreboard_snapshots for games final for more than the retention window: final snapshot values, capture window, snapshot count, house WP range and 0.5 crossings. Written by live.rollup_final_snapshots.';
+
+GRANT SELECT ON live.latest_snapshot TO anon, authenticated;
+GRANT SELECT ON live.game_summaries TO anon, authenticated;
+
+CREATE OR REPLACE FUNCTION live.track_latest_snapshot()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = ''
+AS $function$
+BEGIN
+    INSERT INTO live.latest_snapshot (game_id, snapshot_id, snapshot_hash, status, captured_at)
+    SELECT DISTINCT ON (n.game_id)
+        n.game_id, n.id, n.snapshot_hash, n.status, n.captured_at
+    FROM inserted n
+    ORDER BY n.game_id, n.captured_at DESC, n.id DESC
+    ON CONFLICT (game_id) DO UPDATE SET
+        snapshot_id = EXCLUDED.snapshot_id,
+        snapshot_hash = EXCLUDED.snapshot_hash,
+        status = EXCLUDED.status,
+        captured_at = EXCLUDED.captured_at
+    WHERE live.latest_snapshot.captured_at <= EXCLUDED.captured_at;
+    RETURN NULL;
+END;
+$function$;
+
+DROP TRIGGER IF EXISTS scoreboard_snapshots_track_latest ON live.scoreboard_snapshots;
+
+CREATE TRIGGER scoreboard_snapshots_track_latest
+    AFTER INSERT ON live.scoreboard_snapshots
+    REFERENCING NEW TABLE AS inserted
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION live.track_latest_snapshot();
+
+-- Seed from the history already stored.
+INSERT INTO live.latest_snapshot (game_id, snapshot_id, snapshot_hash, status, captured_at)
+SELECT DISTINCT ON (s.game_id)
+    s.game_id, s.id, s.snapshot_hash, s.status, s.captured_at
+FROM live.scoreboard_snapshots s
+ORDER BY s.game_id, s.captured_at DESC, s.id DESC
+ON CONFLICT (game_id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION live.rollup_final_snapshots(p_final_days integer DEFAULT 3)
+RETURNS bigint
+LANGUAGE plpgsql
+SET search_path = ''
+AS $function$
+DECLARE
+    v_games bigint[];
+BEGIN
+    SELECT array_agg(l.game_id) INTO v_games
+    FROM live.latest_snapshot l
+    WHERE l.status IN ('completed', 'final', 'closed')
+      AND l.captured_at < now() - make_interval(days => p_final_days)
+      AND EXISTS (SELECT 1 FROM live.scoreboard_snapshots s WHERE s.game_id = l.game_id);
+
+    IF v_games IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    WITH ordered AS (
+        SELECT s.*,
+               lag(s.house_live_home_wp) OVER w AS prev_house_wp,
+               row_number() OVER (
+                   PARTITION BY s.game_id ORDER BY s.captured_at DESC, s.id DESC
+               ) AS rn_desc
+        FROM live.scoreboard_snapshots s
+        WHERE s.game_id = ANY(v_games)
+        WINDOW w AS (PARTITION BY s.game_id ORDER BY s.captured_at, s.id)
+    ),
+    totals AS (
+        SELECT o.game_id,
+               min(o.captured_at) AS first_captured_at,
+               count(*)::integer AS snapshots,
+               min(o.house_live_home_wp) AS house_wp_min,
+               max(o.house_live_home_wp) AS house_wp_max,
+               (count(*) FILTER (
+                   WHERE (o.prev_house_wp - 0.5) * (o.house_live_home_wp - 0.5) < 0
+               ))::integer AS house_wp_crossings
+        FROM ordered o
+        GROUP BY o.game_id
+    )
+    INSERT INTO live.game_summaries (
+        game_id, season, week, season_type, status, home_team, away_team,
+        home_points, away_points, spread, over_under, pregame_expected_margin,
+        final_house_live_home_wp, final_cfbd_home_wp, first_captured_at,
+        final_captured_at, snapshots, house_wp_min, house_wp_max,
+        house_wp_crossings, rolled_up_at
+    )
+    SELECT f.game_id, f.season, f.week, f.season_type, f.status, f.home_team, f.away_team,
+           f.home_points, f.away_points, f.spread, f.over_under, f.pregame_expected_margin,
+           f.house_live_home_wp, f.cfbd_home_wp, t.first_captured_at,
+           f.captured_at, t.snapshots, t.house_wp_min, t.house_wp_max,
+           t.house_wp_crossings, now()
+    FROM ordered f
+    JOIN totals t ON t.game_id = f.game_id
+    WHERE f.rn_desc = 1
+    -- A game rolled up before and polled again since: fold the new stretch in.
+    ON CONFLICT (game_id) DO UPDATE SET
+        season = EXCLUDED.season,
+        week = EXCLUDED.week,
+        season_type = EXCLUDED.season_type,
+        status = EXCLUDED.status,
+        home_team = EXCLUDED.home_team,
+        away_team = EXCLUDED.away_team,
+        home_points = EXCLUDED.home_points,
+        away_points = EXCLUDED.away_points,
+        spread = EXCLUDED.spread,
+        over_under = EXCLUDED.over_under,
+        pregame_expected_margin = EXCLUDED.pregame_expected_margin,
+        final_house_live_home_wp = EXCLUDED.final_house_live_home_wp,
+        final_cfbd_home_wp = EXCLUDED.final_cfbd_home_wp,
+        first_captured_at = LEAST(live.game_summaries.first_captured_at, EXCLUDED.first_captured_at),
+        final_captured_at = EXCLUDED.final_captured_at,
+        snapshots = live.game_summaries.snapshots + EXCLUDED.snapshots,
+        house_wp_min = LEAST(live.game_summaries.house_wp_min, EXCLUDED.house_wp_min),
+        house_wp_max = GREATEST(live.game_summaries.house_wp_max, EXCLUDED.house_wp_max),
+        house_wp_crossings = live.game_summaries.house_wp_crossings + EXCLUDED.house_wp_crossings,
+        rolled_up_at = EXCLUDED.rolled_up_at;
+
+    DELETE FROM live.scoreboard_snapshots s WHERE s.game_id = ANY(v_games);
+
+    RETURN cardinality(v_games);
+END;
+$function$;
+
+COMMENT ON FUNCTION live.rollup_final_snapshots(integer) IS
+    'Summarize into live.game_summaries, then delete, the snapshots of every game final for more than p_final_days days. Returns the games rolled up.';
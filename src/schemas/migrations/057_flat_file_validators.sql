@@ -0,0 +1,32 @@
+-- Flat-file ledger: HTTP cache validators for conditional fetches
+-- =============================================================================
+-- scripts/load_flat_files.py downloaded every due source in full and only then
+-- hash-skipped unchanged bytes against meta.flat_file_loads (041) -- the
+-- weekly Massey CSV and the annual nflverse parquets were re-downloaded to
+-- learn they had not changed.
+--
+--   meta.flat_file_loads.etag / last_modified -- the ETag and Last-Modified
+--     response headers the row's bytes were served with (NULL for local
+--     --file inputs and servers that send neither). Written on loaded and
+--     hash-skipped rows.
+--
+-- src/pipelines/utils/load_ledger.py::last_validators returns the newest
+-- validators whose sha256 has a status='loaded' row, and
+-- src/pipelines/utils/file_fetcher.py sends them as If-None-Match /
+-- If-Modified-Since. A 304 is recorded as a skipped row against that sha256
+-- (status=not_modified in the driver's gate line).
+--
+-- meta.* is contract-internal (docs/SCHEMA_CONTRACT.md).
+--
+-- Not in MIGRATION_ORDER: applied via run_migrations.py --file (deploy
+-- manifest), like 019-028 and 041-056. Idempotent (ADD COLUMN IF NOT EXISTS).
+-- The loader works without it (unconditional fetches), so apply order is free.
+
+ALTER TABLE meta.flat_file_loads
+    ADD COLUMN IF NOT EXISTS etag text,
+    ADD COLUMN IF NOT EXISTS last_modified text;
+
+COMMENT ON COLUMN meta.flat_file_loads.etag IS
+    'ETag response header the file was served with; sent back as If-None-Match on the next fetch.';
+COMMENT ON COLUMN meta.flat_file_loads.last_modified IS
+    'Last-Modified response header the file was served with; sent back as If-Modified-Since on the next fetch.';
@@ -1,6 +1,11 @@
 -- Team split analysis functions
 -- RPC functions called by the app for team detail pages.
 -- Created ad-hoc in Supabase; now tracked in version control.
+-- Both read analytics.team_split_agg (migrations/053_team_split_agg.sql) when
+-- the season has been built, and otherwise fall back to a live query that
+-- filters core.plays on its partition key (p.season) and inlines the
+-- canonical garbage-time predicate (functions/is_garbage_time.sql) instead
+-- of calling public.is_garbage_time per row.
 
 CREATE OR REPLACE FUNCTION public.get_home_away_splits(p_team TEXT, p_season INT)
 RETURNS TABLE(
@@ -18,6 +23,26 @@ LANGUAGE plpgsql
 SET search_path = ''
 AS $function$
 BEGIN
+    IF EXISTS (SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = p_season) THEN
+        RETURN QUERY
+        SELECT
+            a.bucket::TEXT,
+            a.games,
+            a.wins,
+            ROUND(a.wins::NUMERIC / NULLIF(a.games, 0), 3),
+            ROUND(a.points_for / NULLIF(a.games, 0), 1),
+            ROUND(a.points_against / NULLIF(a.games, 0), 1),
+            ROUND((a.epa_sum / NULLIF(a.epa_n, 0))::NUMERIC, 3),
+            ROUND(a.successes::NUMERIC / NULLIF(a.plays, 0), 3),
+            ROUND(a.yards_sum / NULLIF(a.yards_n, 0), 1)
+        FROM analytics.team_split_agg a
+        WHERE a.team = p_team
+          AND a.season = p_season
+          AND a.split_type = 'home_away'
+        ORDER BY a.bucket DESC;
+        RETURN;
+    END IF;
+
     RETURN QUERY
     WITH game_results AS (
         SELECT
@@ -36,16 +61,26 @@ BEGIN
           AND g.home_points IS NOT NULL
     ),
     play_stats AS (
+        -- One pass over the team's offensive snaps, aggregated per location
+        -- (was three correlated subqueries per output row).
         SELECT
             CASE WHEN g.home_team = p_team THEN 'home' ELSE 'away' END AS location,
-            p.ppa,
-            CASE WHEN p.ppa > 0 THEN 1 ELSE 0 END AS successful,
-            p.yards_gained
+            AVG(p.ppa) AS epa_per_play,
+            AVG(CASE WHEN p.ppa > 0 THEN 1 ELSE 0 END) AS success_rate,
+            AVG(p.yards_gained) AS yards_per_play
         FROM core.plays p
         JOIN core.games g ON p.game_id = g.id
-        WHERE g.season = p_season
+        -- p.season predicate enables partition pruning on core.plays
+        -- (season-partitioned); g.season alone cannot prune.
+        WHERE p.season = p_season
+          AND g.season = p_season
           AND p.offense = p_team
-          AND NOT public.is_garbage_time(p.period::integer, p.score_diff::integer)
+          -- public.is_garbage_time, inlined
+          AND NOT (
+              (p.period = 4 AND ABS(COALESCE(p.score_diff, 0)) > 28) OR
+              (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
+          )
+        GROUP BY 1
     )
     SELECT
         gr.location::TEXT,
@@ -54,10 +89,11 @@ BEGIN
         ROUND(SUM(gr.won)::NUMERIC / NULLIF(COUNT(DISTINCT gr.game_id), 0), 3) AS win_pct,
         ROUND(AVG(gr.points_for)::NUMERIC, 1) AS points_per_game,
         ROUND(AVG(gr.points_against)::NUMERIC, 1) AS points_allowed_per_game,
-        ROUND((SELECT AVG(ps.ppa) FROM play_stats ps WHERE ps.location = gr.location)::NUMERIC, 3) AS epa_per_play,
-        ROUND((SELECT AVG(ps.successful) FROM play_stats ps WHERE ps.location = gr.location)::NUMERIC, 3) AS success_rate,
-        ROUND((SELECT AVG(ps.yards_gained) FROM play_stats ps WHERE ps.location = gr.location)::NUMERIC, 1) AS yards_per_play
+        ROUND(MAX(ps.epa_per_play)::NUMERIC, 3) AS epa_per_play,
+        ROUND(MAX(ps.success_rate)::NUMERIC, 3) AS success_rate,
+        ROUND(MAX(ps.yards_per_play)::NUMERIC, 1) AS yards_per_play
     FROM game_results gr
+    LEFT JOIN play_stats ps ON ps.location = gr.location
     GROUP BY gr.location
     ORDER BY gr.location DESC;
 END;
@@ -81,6 +117,26 @@ AS $function$
 DECLARE
     v_team_conference TEXT;
 BEGIN
+    IF EXISTS (SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = p_season) THEN
+        RETURN QUERY
+        SELECT
+            a.bucket::TEXT,
+            a.games,
+            a.wins,
+            ROUND(a.wins::NUMERIC / NULLIF(a.games, 0), 3),
+            ROUND(a.points_for / NULLIF(a.games, 0), 1),
+            ROUND(a.points_against / NULLIF(a.games, 0), 1),
+            ROUND((a.epa_sum / NULLIF(a.epa_n, 0))::NUMERIC, 3),
+            ROUND(a.successes::NUMERIC / NULLIF(a.plays, 0), 3),
+            ROUND((a.points_for - a.points_against) / NULLIF(a.games, 0), 1)
+        FROM analytics.team_split_agg a
+        WHERE a.team = p_team
+          AND a.season = p_season
+          AND a.split_type = 'conference'
+        ORDER BY a.bucket;
+        RETURN;
+    END IF;
+
     SELECT conference INTO v_team_conference
     FROM public.teams
     WHERE school = p_team;
@@ -112,14 +168,21 @@ BEGIN
                 WHEN opp.conference = v_team_conference THEN 'conference'
                 ELSE 'non_conference'
             END AS opponent_type,
-            p.ppa,
-            CASE WHEN p.ppa > 0 THEN 1 ELSE 0 END AS successful
+            AVG(p.ppa) AS epa_per_play,
+            AVG(CASE WHEN p.ppa > 0 THEN 1 ELSE 0 END) AS success_rate
         FROM core.plays p
         JOIN core.games g ON p.game_id = g.id
         JOIN public.teams opp ON opp.school = CASE WHEN g.home_team = p_team THEN g.away_team ELSE g.home_team END
-        WHERE g.season = p_season
+        -- p.season predicate enables partition pruning on core.plays.
+        WHERE p.season = p_season
+          AND g.season = p_season
           AND p.offense = p_team
-          AND NOT public.is_garbage_time(p.period::integer, p.score_diff::integer)
+          -- public.is_garbage_time, inlined
+          AND NOT (
+              (p.period = 4 AND ABS(COALESCE(p.score_diff, 0)) > 28) OR
+              (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
+          )
+        GROUP BY 1
     )
     SELECT
         gr.opponent_type::TEXT,
@@ -128,10 +191,11 @@ BEGIN
         ROUND(SUM(gr.won)::NUMERIC / NULLIF(COUNT(DISTINCT gr.game_id), 0), 3) AS win_pct,
         ROUND(AVG(gr.points_for)::NUMERIC, 1) AS points_per_game,
         ROUND(AVG(gr.points_against)::NUMERIC, 1) AS points_allowed_per_game,
-        ROUND((SELECT AVG(ps.ppa) FROM play_stats ps WHERE ps.opponent_type = gr.opponent_type)::NUMERIC, 3) AS epa_per_play,
-        ROUND((SELECT AVG(ps.successful) FROM play_stats ps WHERE ps.opponent_type = gr.opponent_type)::NUMERIC, 3) AS success_rate,
+        ROUND(MAX(ps.epa_per_play)::NUMERIC, 3) AS epa_per_play,
+        ROUND(MAX(ps.success_rate)::NUMERIC, 3) AS success_rate,
         ROUND(AVG(gr.points_for - gr.points_against)::NUMERIC, 1) AS margin_per_game
     FROM game_results gr
+    LEFT JOIN play_stats ps ON ps.opponent_type = gr.opponent_type
     GROUP BY gr.opponent_type
     ORDER BY gr.opponent_type;
 END;
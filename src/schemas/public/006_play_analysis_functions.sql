@@ -3,6 +3,8 @@
 -- Created ad-hoc in Supabase; now tracked in version control.
 -- Refactored: get_down_distance_splits and get_field_position_splits now use
 -- marts.play_epa instead of core.plays JOIN core.games for ~10x performance.
+-- All three read analytics.team_split_agg (migrations/053_team_split_agg.sql)
+-- when the season has been built, falling back to the live query otherwise.
 
 CREATE OR REPLACE FUNCTION public.get_down_distance_splits(p_team text, p_season integer)
 RETURNS TABLE(
@@ -19,6 +21,28 @@ STABLE
 SET search_path = ''
 AS $function$
 BEGIN
+    IF EXISTS (SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = p_season) THEN
+        RETURN QUERY
+        SELECT
+            split_part(a.bucket, '|', 1)::INT,
+            split_part(a.bucket, '|', 2)::TEXT,
+            a.side::TEXT,
+            a.plays,
+            ROUND(a.successes::NUMERIC / NULLIF(a.plays, 0), 3),
+            ROUND((a.epa_sum / NULLIF(a.epa_n, 0))::NUMERIC, 3),
+            CASE
+                WHEN split_part(a.bucket, '|', 1)::INT IN (3, 4)
+                THEN ROUND(a.conversions::NUMERIC / NULLIF(a.plays, 0), 3)
+                ELSE NULL
+            END
+        FROM analytics.team_split_agg a
+        WHERE a.team = p_team
+          AND a.season = p_season
+          AND a.split_type = 'down_distance'
+        ORDER BY a.side, split_part(a.bucket, '|', 1)::INT, split_part(a.bucket, '|', 2);
+        RETURN;
+    END IF;
+
     RETURN QUERY
     WITH bucketed_plays AS (
         SELECT
@@ -83,6 +107,36 @@ STABLE
 SET search_path = ''
 AS $function$
 BEGIN
+    IF EXISTS (SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = p_season) THEN
+        RETURN QUERY
+        SELECT
+            a.bucket::TEXT,
+            CASE a.bucket
+                WHEN 'own_1_20' THEN 'Own 1-20'
+                WHEN 'own_21_50' THEN 'Own 21-50'
+                WHEN 'opp_49_21' THEN 'Opp 49-21'
+                WHEN 'opp_20_1' THEN 'Red Zone'
+            END::TEXT,
+            a.side::TEXT,
+            a.plays,
+            ROUND(a.successes::NUMERIC / NULLIF(a.plays, 0), 3),
+            ROUND((a.epa_sum / NULLIF(a.epa_n, 0))::NUMERIC, 3),
+            ROUND(a.yards_sum / NULLIF(a.yards_n, 0), 1),
+            ROUND(a.scores::NUMERIC / NULLIF(a.plays, 0), 3)
+        FROM analytics.team_split_agg a
+        WHERE a.team = p_team
+          AND a.season = p_season
+          AND a.split_type = 'field_position'
+        ORDER BY a.side,
+            CASE a.bucket
+                WHEN 'own_1_20' THEN 1
+                WHEN 'own_21_50' THEN 2
+                WHEN 'opp_49_21' THEN 3
+                WHEN 'opp_20_1' THEN 4
+            END;
+        RETURN;
+    END IF;
+
     RETURN QUERY
     WITH zoned_plays AS (
         SELECT
@@ -163,6 +217,26 @@ STABLE
 SET search_path = ''
 AS $function$
 BEGIN
+    IF EXISTS (SELECT 1 FROM analytics.team_split_agg_season s WHERE s.season = p_season) THEN
+        RETURN QUERY
+        SELECT
+            a.side::TEXT,
+            a.trips,
+            a.touchdowns,
+            a.field_goals,
+            a.turnovers,
+            ROUND(a.touchdowns::NUMERIC / NULLIF(a.trips, 0), 3),
+            ROUND(a.field_goals::NUMERIC / NULLIF(a.trips, 0), 3),
+            ROUND((a.touchdowns + a.field_goals)::NUMERIC / NULLIF(a.trips, 0), 3),
+            ROUND((a.touchdowns * 7 + a.field_goals * 3)::NUMERIC / NULLIF(a.trips, 0), 2),
+            ROUND((a.epa_sum / NULLIF(a.epa_n, 0))::NUMERIC, 3)
+        FROM analytics.team_split_agg a
+        WHERE a.team = p_team
+          AND a.season = p_season
+          AND a.split_type = 'red_zone';
+        RETURN;
+    END IF;
+
     RETURN QUERY
     -- Fixed 2026-07-23: the previous version filtered core.drives on
     -- start_yardline >= 80 -- the ABSOLUTE yardline column (direction-
@@ -206,17 +280,23 @@ BEGIN
         LEFT JOIN core.drives d
           ON d.game_id = t.game_id AND d.drive_number = t.drive_number
     ),
-    red_zone_plays AS (
+    red_zone_epa AS (
+        -- Aggregated once per side (was a correlated subquery per output row).
         SELECT
             CASE WHEN p.offense = p_team THEN 'offense' ELSE 'defense' END AS side,
-            p.ppa
+            AVG(p.ppa) AS epa_per_play
         FROM core.plays p
         JOIN core.games g ON p.game_id = g.id
         WHERE p.season = p_season
           AND g.season = p_season
           AND (p.offense = p_team OR p.defense = p_team)
           AND p.yards_to_goal <= 20
-          AND NOT public.is_garbage_time(p.period::integer, p.score_diff::integer)
+          -- public.is_garbage_time, inlined
+          AND NOT (
+              (p.period = 4 AND ABS(COALESCE(p.score_diff, 0)) > 28) OR
+              (p.period >= 3 AND ABS(COALESCE(p.score_diff, 0)) > 35)
+          )
+        GROUP BY 1
     )
     SELECT
         rzd.side::TEXT,
@@ -228,8 +308,9 @@ BEGIN
         ROUND(COUNT(*) FILTER (WHERE rzd.drive_result IN ('FG', 'Field Goal'))::NUMERIC / NULLIF(COUNT(*), 0), 3) AS fg_rate,
         ROUND(COUNT(*) FILTER (WHERE rzd.drive_result IN ('TD', 'FG', 'Touchdown', 'Field Goal'))::NUMERIC / NULLIF(COUNT(*), 0), 3) AS scoring_rate,
         ROUND((COUNT(*) FILTER (WHERE rzd.drive_result IN ('TD', 'Touchdown')) * 7 + COUNT(*) FILTER (WHERE rzd.drive_result IN ('FG', 'Field Goal')) * 3)::NUMERIC / NULLIF(COUNT(*), 0), 2) AS points_per_trip,
-        ROUND((SELECT AVG(rzp.ppa) FROM red_zone_plays rzp WHERE rzp.side = rzd.side)::NUMERIC, 3) AS epa_per_play
+        ROUND(MAX(rze.epa_per_play)::NUMERIC, 3) AS epa_per_play
     FROM red_zone_drives rzd
+    LEFT JOIN red_zone_epa rze ON rze.side = rzd.side
     GROUP BY rzd.side;
 END;
 $function$;
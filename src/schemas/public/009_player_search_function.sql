@@ -2,6 +2,10 @@
 -- Fuzzy name search using pg_trgm with optional position/team/season filters
 -- Called via supabase.rpc('get_player_search', {...})
 -- Extracted from deployed Supabase database on 2026-02-06
+-- Reads marts.player_search (src/schemas/marts/044_player_search.sql): the
+-- name match is a GIN trigram index scan on its precomputed search_name, and
+-- the best recruit rating is already on each row, so this is one index-driven
+-- query instead of a core.roster scan plus a recruits lookup per candidate.
 
 CREATE OR REPLACE FUNCTION public.get_player_search(p_query text, p_position text DEFAULT NULL::text, p_team text DEFAULT NULL::text, p_season integer DEFAULT NULL::integer, p_limit integer DEFAULT 25)
  RETURNS TABLE(player_id text, name text, team text, "position" text, season bigint, height bigint, weight bigint, jersey bigint, stars bigint, recruit_rating double precision, similarity_score real)
@@ -9,32 +13,27 @@ CREATE OR REPLACE FUNCTION public.get_player_search(p_query text, p_position tex
  STABLE
 SET search_path = ''
 AS $function$
+DECLARE
+    v_query text := lower(p_query);
 BEGIN
     RETURN QUERY
     SELECT
-        r.id::text AS player_id,
-        (r.first_name || ' ' || r.last_name)::text AS "name",
-        r.team::text,
-        r.position::text AS "position",
-        r.year AS season,
-        r.height,
-        r.weight,
-        r.jersey,
-        rec.stars,
-        rec.rating AS recruit_rating,
-        public.similarity(lower(r.first_name || ' ' || r.last_name), lower(p_query)) AS similarity_score
-    FROM core.roster r
-    LEFT JOIN LATERAL (
-        SELECT rr.stars, rr.rating
-        FROM recruiting.recruits rr
-        WHERE rr.athlete_id = r.id
-        ORDER BY rr.rating DESC NULLS LAST
-        LIMIT 1
-    ) rec ON true
-    WHERE lower(r.first_name || ' ' || r.last_name) OPERATOR(public.%) lower(p_query)
-      AND (p_position IS NULL OR r.position = p_position)
-      AND (p_team IS NULL OR r.team = p_team)
-      AND (p_season IS NULL OR r.year = p_season)
+        ps.player_id,
+        ps.name,
+        ps.team,
+        ps.position,
+        ps.season,
+        ps.height,
+        ps.weight,
+        ps.jersey,
+        ps.stars,
+        ps.recruit_rating,
+        public.similarity(ps.search_name, v_query) AS similarity_score
+    FROM marts.player_search ps
+    WHERE ps.search_name OPERATOR(public.%) v_query
+      AND (p_position IS NULL OR ps.position = p_position)
+      AND (p_team IS NULL OR ps.team = p_team)
+      AND (p_season IS NULL OR ps.season = p_season)
     ORDER BY similarity_score DESC
     LIMIT p_limit;
 END;
@@ -0,0 +1,75 @@
+-- Per-game play and drive lookups that resolve the game's season first
+--
+-- core.plays is partitioned by season (src/schemas/011_partition_plays.sql).
+-- A caller filtering api.game_plays on game_id alone gives the planner no
+-- partition-key predicate, so every season partition is probed for the game.
+-- These RPCs look the season up from core.games (one row by its unique id
+-- index) and filter on it, so exactly one partition is read. Rows and columns
+-- are the api views' own (RETURNS SETOF the view); an unknown game_id returns
+-- no rows.
+--
+-- core.drives is not partitioned -- get_game_drives pins the season too so
+-- the pair reads the same way, and stays correct if drives are ever
+-- partitioned like plays.
+--
+-- Usage:
+--   SELECT * FROM get_game_plays(401628455);
+--   POST /rest/v1/rpc/get_game_plays {"p_game_id": 401628455}
+--   POST /rest/v1/rpc/get_game_drives {"p_game_id": 401628455}
+
+CREATE OR REPLACE FUNCTION public.get_game_plays(p_game_id bigint)
+RETURNS SETOF api.game_plays
+LANGUAGE plpgsql
+STABLE
+SET search_path = ''
+AS $function$
+DECLARE
+    v_season bigint;
+BEGIN
+    SELECT g.season INTO v_season
+    FROM core.games g
+    WHERE g.id = p_game_id;
+
+    IF v_season IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT gp.*
+    FROM api.game_plays gp
+    WHERE gp.season = v_season
+      AND gp.game_id = p_game_id
+    ORDER BY gp.drive_number, gp.play_number;
+END;
+$function$;
+
+CREATE OR REPLACE FUNCTION public.get_game_drives(p_game_id bigint)
+RETURNS SETOF api.game_drives
+LANGUAGE plpgsql
+STABLE
+SET search_path = ''
+AS $function$
+DECLARE
+    v_season bigint;
+BEGIN
+    SELECT g.season INTO v_season
+    FROM core.games g
+    WHERE g.id = p_game_id;
+
+    IF v_season IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT gd.*
+    FROM api.game_drives gd
+    WHERE gd.season = v_season
+      AND gd.game_id = p_game_id
+    ORDER BY gd.drive_number;
+END;
+$function$;
+
+COMMENT ON FUNCTION public.get_game_plays(bigint) IS
+    'Play-by-play for one game (api.game_plays rows), with the season resolved from core.games so only that season''s core.plays partition is read.';
+COMMENT ON FUNCTION public.get_game_drives(bigint) IS
+    'Drive-by-drive summary for one game (api.game_drives rows), season-pinned via core.games like get_game_plays.';
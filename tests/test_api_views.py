@@ -4,6 +4,9 @@ Verifies API views exist, return expected row counts,
 expose the correct columns, and respond to filtered queries.
 """
 
+import re
+from decimal import Decimal
+
 import pytest
 
 
@@ -1303,6 +1306,52 @@ class TestGamePlays:
         assert pairs == sorted(pairs), "Plays are not ordered by drive_number, play_number"
 
 
+# ---------------------------------------------------------------------------
+# Test: get_game_plays / get_game_drives season-pinned RPCs
+# ---------------------------------------------------------------------------
+
+
+class TestGameLookupRpcs:
+    """public.get_game_plays / get_game_drives — the views' rows for one game,
+    with the season resolved from core.games first."""
+
+    def test_plays_match_view_rows(self, db_conn):
+        view_count = _fetch_count(
+            db_conn, "SELECT COUNT(*) FROM api.game_plays WHERE game_id = %s", (EXAMPLE_GAME_ID,)
+        )
+        rpc_count = _fetch_count(
+            db_conn, "SELECT COUNT(*) FROM public.get_game_plays(%s)", (EXAMPLE_GAME_ID,)
+        )
+        assert rpc_count == view_count > 0
+
+    def test_drives_match_view_rows(self, db_conn):
+        view_count = _fetch_count(
+            db_conn, "SELECT COUNT(*) FROM api.game_drives WHERE game_id = %s", (EXAMPLE_GAME_ID,)
+        )
+        rpc_count = _fetch_count(
+            db_conn, "SELECT COUNT(*) FROM public.get_game_drives(%s)", (EXAMPLE_GAME_ID,)
+        )
+        assert rpc_count == view_count > 0
+
+    def test_unknown_game_returns_no_rows(self, db_conn):
+        assert _fetch_count(db_conn, "SELECT COUNT(*) FROM public.get_game_plays(-1)") == 0
+
+    def test_season_pinned_query_reads_one_partition(self, db_conn):
+        """The RPC's query shape (game_id AND season) prunes core.plays to a
+        single season partition."""
+        season = _fetch_count(
+            db_conn, "SELECT season FROM core.games WHERE id = %s", (EXAMPLE_GAME_ID,)
+        )
+        rows, _ = _fetch_all(
+            db_conn,
+            "EXPLAIN SELECT * FROM api.game_plays WHERE game_id = %s AND season = %s",
+            (EXAMPLE_GAME_ID, season),
+        )
+        plan = "\n".join(r[0] for r in rows)
+        partitions = set(re.findall(r"\bon (plays_y\d{4})\b", plan))
+        assert partitions == {f"plays_y{season}"}, plan
+
+
 # ---------------------------------------------------------------------------
 # Test: poll_rankings filters
 # ---------------------------------------------------------------------------
@@ -1808,3 +1857,111 @@ class TestSeasonOutlook:
             """,
         )
         assert not rows, f"full Ivy slates flagged short (re-run simulate_season.py?): {rows}"
+
+
+# ---------------------------------------------------------------------------
+# Test: api.live_scoreboard + live retention (migration 056)
+# ---------------------------------------------------------------------------
+
+
+_TEST_GAME_ID = -56001  # never a CFBD id; every write below is rolled back
+
+
+def _insert_snapshots(cur, rows):
+    """rows: (hours_ago, status, house_live_home_wp) in capture order."""
+    cur.execute(
+        """
+        INSERT INTO live.scoreboard_snapshots
+            (captured_at, game_id, season, status, home_points, away_points,
+             house_live_home_wp, snapshot_hash)
+        SELECT now() - make_interval(hours => r.hours_ago), %s, 2025, r.status,
+               21, 17, r.wp, md5(r.hours_ago::text)
+        FROM unnest(%s::int[], %s::text[], %s::numeric[]) AS r(hours_ago, status, wp)
+        """,
+        (
+            _TEST_GAME_ID,
+            [r[0] for r in rows],
+            [r[1] for r in rows],
+            [r[2] for r in rows],
+        ),
+    )
+
+
+class TestLiveScoreboard:
+    """api.live_scoreboard reads live.latest_snapshot, which an insert
+    trigger keeps current; live.rollup_final_snapshots summarizes and drops
+    the history of long-final games."""
+
+    def test_view_serves_each_games_newest_snapshot(self, db_conn):
+        rows, _ = _fetch_all(
+            db_conn,
+            """
+            SELECT v.game_id
+            FROM api.live_scoreboard v
+            JOIN live.scoreboard_snapshots s
+              ON s.game_id = v.game_id AND s.captured_at > v.captured_at
+            LIMIT 10
+            """,
+        )
+        assert not rows, f"api.live_scoreboard lags a newer snapshot for {rows}"
+
+    @pytest.fixture
+    def txn(self, db_conn):
+        """A cursor inside a transaction that is always rolled back."""
+        db_conn.autocommit = False
+        try:
+            with db_conn.cursor() as cur:
+                yield cur
+        finally:
+            db_conn.rollback()
+            db_conn.autocommit = True
+
+    def test_trigger_tracks_the_newest_row_of_a_multi_row_insert(self, txn):
+        _insert_snapshots(txn, [(3, "in_progress", 0.4), (2, "in_progress", 0.6)])
+        txn.execute(
+            """
+            SELECT l.snapshot_id = max(s.id), l.status
+            FROM live.latest_snapshot l
+            JOIN live.scoreboard_snapshots s ON s.game_id = l.game_id
+            WHERE l.game_id = %s
+            GROUP BY l.snapshot_id, l.status
+            """,
+            (_TEST_GAME_ID,),
+        )
+        assert txn.fetchone() == (True, "in_progress")
+
+    def test_rollup_summarizes_then_deletes_and_merges_a_re_poll(self, txn):
+        days = 24 * 10
+        _insert_snapshots(
+            txn,
+            [
+                (days + 3, "in_progress", 0.4),
+                (days + 2, "in_progress", 0.6),
+                (days + 1, "in_progress", 0.45),
+                (days, "final", 0.3),
+            ],
+        )
+        txn.execute("SELECT live.rollup_final_snapshots(3)")
+        assert txn.fetchone()[0] >= 1
+        txn.execute(
+            "SELECT snapshots, house_wp_crossings, house_wp_min, house_wp_max "
+            "FROM live.game_summaries WHERE game_id = %s",
+            (_TEST_GAME_ID,),
+        )
+        # 0.4 -> 0.6 -> 0.45 -> 0.3 crosses 0.5 twice.
+        assert txn.fetchone() == (4, 2, Decimal("0.3"), Decimal("0.6"))
+        txn.execute(
+            "SELECT count(*) FROM live.scoreboard_snapshots WHERE game_id = %s",
+            (_TEST_GAME_ID,),
+        )
+        assert txn.fetchone()[0] == 0
+
+        # Re-polled after the rollup: the new stretch folds into the summary.
+        _insert_snapshots(txn, [(days - 1, "final", 0.7), (days - 2, "final", 0.2)])
+        txn.execute("SELECT live.rollup_final_snapshots(3)")
+        txn.execute(
+            "SELECT snapshots, house_wp_crossings, house_wp_min, house_wp_max "
+            "FROM live.game_summaries WHERE game_id = %s",
+            (_TEST_GAME_ID,),
+        )
+        assert txn.fetchone() == (6, 3, Decimal("0.2"), Decimal("0.7"))
@@ -11,9 +11,14 @@ from scripts.backtest_preseason import (
     build_backtest_row,
     calibration_table,
     drop_outcome_dependent,
+    fetch_games_fingerprint,
     interval_coverage,
+    load_scored_season,
+    merge_passes,
     preseason_sigma,
     residual_quantiles,
+    scored_cache_key,
+    store_scored_season,
     win_error_metrics,
 )
 
@@ -654,3 +659,139 @@ class TestBowlCalibrationStaysFBS:
         wins = np.array([7, 8, 6, 9])
         assert summarize(wins, 12)["p_bowl_eligible"] is not None
         assert summarize(wins, 12, bowl_eligible=False)["p_bowl_eligible"] is None
+
+
+def _scored_season(season, n_teams=10, seed=0):
+    """A scored-season entry shaped like run_backtest's PASS 1 output."""
+    from scripts.backtest_preseason import actual_wins_over
+
+    rng = np.random.default_rng(seed)
+    teams = [f"T{i}" for i in range(n_teams)]
+    games = []
+    for k in range(n_teams * 5):
+        h, a = rng.choice(n_teams, size=2, replace=False)
+        games.append(
+            {
+                "game_id": season * 1000 + k,
+                "home_team": teams[h],
+                "away_team": teams[a],
+                "completed": False,
+                "conference_game": True,
+                "expected_home_margin": float(rng.normal(0, 8)),
+                "actual_margin": float(rng.normal(0, 15)) or 1.0,
+            }
+        )
+    return {
+        "season": season,
+        "train_through": season - 1,
+        "games": games,
+        "sigma": 16.0,
+        "sigma_n": 500,
+        "dropped": 0,
+        "gp_max": 0,
+        "margin_mae": 12.0,
+        "truth": actual_wins_over(games),
+        "prior": {},
+        "scheduled": {},
+        "fbs": None,
+        "bowl_teams": set(teams),
+    }
+
+
+class TestSimulationGrid:
+    """The (season x share) grid must reproduce the serial sweep exactly."""
+
+    @staticmethod
+    def _scored():
+        return [_scored_season(2019 + i, seed=i) for i in range(3)]
+
+    def test_merged_single_season_passes_equal_the_full_pass(self):
+        from scripts.backtest_preseason import _simulate_pass
+
+        scored = self._scored()
+        full = _simulate_pass(scored, n_sims=300, seed=4, strength_share=0.15)
+        parts = [_simulate_pass([s], n_sims=300, seed=4, strength_share=0.15) for s in scored]
+        assert merge_passes(parts) == full
+
+    def test_parallel_grid_equals_serial_sweep(self):
+        from scripts.backtest_preseason import _simulate_grid
+
+        scored = self._scored()
+        shares = [0.0, 0.15, 0.3]
+        serial = _simulate_grid(scored, n_sims=200, seed=2, shares=shares, workers=1)
+        parallel = _simulate_grid(scored, n_sims=200, seed=2, shares=shares, workers=2)
+        assert [r["strength_share"] for r in parallel] == shares
+        assert parallel == serial
+
+    def test_merge_refuses_mixed_shares(self):
+        from scripts.backtest_preseason import _simulate_pass
+
+        s = self._scored()[0]
+        parts = [_simulate_pass([s], 50, 1, sh) for sh in (0.0, 0.2)]
+        with pytest.raises(ValueError, match="strength_share"):
+            merge_passes(parts)
+
+
+class TestScoredSeasonCache:
+    FIT = "2026-07-25T00:00:00+00:00"
+    GAMES = "812:6f1ed002ab5595859014ebf0951522d9"
+
+    def test_key_tracks_fit_and_feature_build(self):
+        base = scored_cache_key(2023, 2022, self.FIT, "tw_v1", True, self.GAMES)
+        assert base == scored_cache_key(2023, 2022, self.FIT, "tw_v1", True, self.GAMES)
+        assert base != scored_cache_key(
+            2023, 2022, "2026-08-01T00:00:00+00:00", "tw_v1", True, self.GAMES
+        )
+        assert base != scored_cache_key(2023, 2022, self.FIT, "tw_v2", True, self.GAMES)
+        assert base != scored_cache_key(2023, 2022, self.FIT, "tw_v1", False, self.GAMES)
+        assert base != scored_cache_key(2024, 2023, self.FIT, "tw_v1", True, self.GAMES)
+
+    def test_key_tracks_the_game_data(self):
+        """A re-loaded or corrected game changes the season's fingerprint, and
+        with it the key -- the cached scores are not served for new data."""
+        base = scored_cache_key(2023, 2022, self.FIT, "tw_v1", True, self.GAMES)
+        assert base != scored_cache_key(
+            2023, 2022, self.FIT, "tw_v1", True, "812:0cc175b9c0f1b6a831c399e269772661"
+        )
+        assert base != scored_cache_key(
+            2023, 2022, self.FIT, "tw_v1", True, "813:6f1ed002ab5595859014ebf0951522d9"
+        )
+
+    def test_unknown_provenance_is_never_cached(self):
+        """An unset fit stamp, feature build or game fingerprint cannot be told
+        apart from a changed one; caching it could re-report an old model's
+        numbers."""
+        assert scored_cache_key(2023, 2022, None, "tw_v1", True, self.GAMES) is None
+        assert scored_cache_key(2023, 2022, "2026-07-25", None, True, self.GAMES) is None
+        assert scored_cache_key(2023, 2022, self.FIT, "tw_v1", True, None) is None
+
+    def test_games_fingerprint_reads_count_and_digest(self):
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params):
+                assert "FROM core.games" in sql and params == {"season": 2023}
+
+            def fetchone(self):
+                return (812, "6f1ed002ab5595859014ebf0951522d9")
+
+        class Conn:
+            def cursor(self):
+                return Cursor()
+
+        assert fetch_games_fingerprint(Conn(), 2023) == self.GAMES
+
+    def test_round_trip_and_miss(self, tmp_path):
+        bundle = {"games": [{"game_id": 1, "expected_home_margin": 2.5}], "dropped": 0}
+        assert load_scored_season(tmp_path, "k") is None
+        store_scored_season(tmp_path / "nested", "k", bundle)
+        assert load_scored_season(tmp_path / "nested", "k") == bundle
+        assert not list((tmp_path / "nested").glob("*.tmp"))
+
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        (tmp_path / "k.pkl").write_bytes(b"not a pickle")
+        assert load_scored_season(tmp_path, "k") is None
@@ -488,3 +488,152 @@ class TestBackfillCoversTheUpcomingSeason:
 
         src = inspect.getsource(build_features.main)
         assert "max([*projection_seasons, get_current_season()])" in src
+
+
+def _schedule(*weeks):
+    """[(week_index, completed, elo), ...] -> fetch_season_schedule-shaped rows."""
+    return [{"week_index": wi, "completed": done, "elo": elo} for wi, done, elo in weeks]
+
+
+class TestIncrementalCarry:
+    """--incremental rebuilds only the rows from the carry's through_week_index
+    on. These pin where the carry stops and when it may not be trusted."""
+
+    def test_carry_stops_at_the_last_completed_week(self):
+        # Weeks 1-3 played, week 4 has a Thursday game done and the rest open.
+        schedule = _schedule(
+            (1, True, 3000.0),
+            (2, True, 3010.0),
+            (3, True, 2990.0),
+            (4, True, 3005.0),
+            (4, False, None),
+            (5, False, None),
+        )
+        from scripts.build_features import season_carry_through
+
+        # Week 3 is re-read by the next run (late plays), week 4 is open.
+        assert season_carry_through(schedule) == 3
+
+    def test_nothing_completed_carries_nothing(self):
+        from scripts.build_features import season_carry_through
+
+        schedule = _schedule((1, False, None), (2, False, None))
+        assert season_carry_through(schedule) == 1
+
+    def test_finished_season_carries_through_its_last_week(self):
+        from scripts.build_features import season_carry_through
+
+        schedule = _schedule((1, True, 3000.0), (14, True, 3000.0), (101, True, 3000.0))
+        assert season_carry_through(schedule) == 101
+
+    def test_empty_schedule(self):
+        from scripts.build_features import season_carry_through
+
+        assert season_carry_through([]) is None
+
+    def test_fingerprint_counts_only_weeks_below(self):
+        from scripts.build_features import schedule_fingerprint
+
+        schedule = _schedule((1, True, 3000.0), (2, True, 3010.0), (3, True, 2990.0))
+        assert schedule_fingerprint(schedule, 3) == {
+            "games_below": 2,
+            "completed_below": 2,
+            "elo_below": 6010.0,
+        }
+
+    def _watermark(self, schedule, through):
+        from scripts.build_features import FEATURE_BUILD_VERSION, schedule_fingerprint
+
+        return {
+            "through_week_index": through,
+            "feature_build_version": FEATURE_BUILD_VERSION,
+            **schedule_fingerprint(schedule, through),
+        }
+
+    def test_unchanged_weeks_go_incremental(self):
+        from scripts.build_features import incremental_rebuild_reason
+
+        before = _schedule((1, True, 3000.0), (2, True, 3010.0), (3, False, None))
+        watermark = self._watermark(before, 2)
+        # Week 3 has since been played: it is above the carry, so still incremental.
+        after = _schedule((1, True, 3000.0), (2, True, 3010.0), (3, True, 2995.0))
+        assert incremental_rebuild_reason(watermark, after) is None
+
+    def test_missing_watermark_rebuilds(self):
+        from scripts.build_features import incremental_rebuild_reason
+
+        assert incremental_rebuild_reason(None, _schedule((1, True, 3000.0))) is not None
+
+    def test_other_build_version_rebuilds(self):
+        from scripts.build_features import incremental_rebuild_reason
+
+        schedule = _schedule((1, True, 3000.0), (2, False, None))
+        watermark = dict(self._watermark(schedule, 1), feature_build_version="tw_v1")
+        assert "tw_v1" in incremental_rebuild_reason(watermark, schedule)
+
+    def test_game_added_below_the_carry_rebuilds(self):
+        from scripts.build_features import incremental_rebuild_reason
+
+        schedule = _schedule((1, True, 3000.0), (2, True, 3000.0), (3, False, None))
+        watermark = self._watermark(schedule, 2)
+        schedule.append({"week_index": 1, "completed": True, "elo": 3000.0})
+        assert "schedule changed" in incremental_rebuild_reason(watermark, schedule)
+
+    def test_changed_elo_below_the_carry_rebuilds(self):
+        """A house Elo season rebuild moves pregame Elo on rows --incremental
+        never rewrites, so it must force the full season."""
+        from scripts.build_features import incremental_rebuild_reason
+
+        schedule = _schedule((1, True, 3000.0), (2, True, 3000.0), (3, False, None))
+        watermark = self._watermark(schedule, 2)
+        schedule[0]["elo"] = 3001.5
+        assert "Elo" in incremental_rebuild_reason(watermark, schedule)
+
+    def test_reopened_carry_week_rebuilds(self):
+        """The carry only moves forward: a new unplayed game in the carried
+        week would otherwise advance it backwards over sums it already holds."""
+        from scripts.build_features import incremental_rebuild_reason
+
+        schedule = _schedule((1, True, 3000.0), (2, True, 3000.0), (3, False, None))
+        watermark = self._watermark(schedule, 2)
+        schedule.append({"week_index": 2, "completed": False, "elo": None})
+        assert "no longer settled" in incremental_rebuild_reason(watermark, schedule)
+
+
+class TestIncrementalQuery:
+    def test_full_query_reads_no_carry(self):
+        from scripts.build_features import FEATURE_ROWS_QUERY
+
+        assert "team_week_carry" not in FEATURE_ROWS_QUERY
+        assert "from_week_index" not in FEATURE_ROWS_QUERY
+
+    def test_incremental_query_keeps_the_leak_rule(self):
+        """Same LATERAL predicates as the full build -- the carried bucket sits
+        below every rebuilt row, so it never admits a same-week game."""
+        from scripts.build_features import INCREMENTAL_FEATURE_ROWS_QUERY
+
+        for alias in ("owa", "dwa", "odwa", "hwa"):
+            assert f"{alias}.week_index < s.week_index" in INCREMENTAL_FEATURE_ROWS_QUERY
+        assert "through_week_index - 1" in INCREMENTAL_FEATURE_ROWS_QUERY
+        assert "through_week_index = %(from_week_index)s" in INCREMENTAL_FEATURE_ROWS_QUERY
+
+    def test_incremental_query_reads_only_the_rebuilt_weeks(self):
+        from scripts.build_features import INCREMENTAL_FEATURE_ROWS_QUERY
+
+        for cte in ("plays_wi AS", "drives_wi AS", "havoc_wi AS", "spine AS"):
+            block = INCREMENTAL_FEATURE_ROWS_QUERY[INCREMENTAL_FEATURE_ROWS_QUERY.index(cte) :]
+            block = block[: block.index("\n)")]
+            assert ">= %(from_week_index)s" in block, cte
+
+    def test_queries_bind(self):
+        from scripts.build_features import CARRY_ADVANCE_SQL, INCREMENTAL_FEATURE_ROWS_QUERY
+
+        INCREMENTAL_FEATURE_ROWS_QUERY % {"season": 2026, "from_week_index": 5}
+        CARRY_ADVANCE_SQL % {"season": 2026, "from_week_index": 5, "to_week_index": 6}
+
+    def test_carry_columns_cover_every_carried_bucket(self):
+        from scripts.build_features import _CARRY_COLUMNS, INCREMENTAL_FEATURE_ROWS_QUERY
+
+        for col in _CARRY_COLUMNS:
+            if col != "games_played":
+                assert col in INCREMENTAL_FEATURE_ROWS_QUERY, col
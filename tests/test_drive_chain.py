@@ -6,6 +6,7 @@ exercises the pure layer of scripts/compute_drive_chain.py.
 
 from collections import Counter
 
+import numpy as np
 import pytest
 
 from scripts.compute_drive_chain import (
@@ -13,13 +14,19 @@ from scripts.compute_drive_chain import (
     ABSORB_VALUES,
     ABSORBING,
     TD_VALUE,
+    bootstrap_se,
     build_transitions,
+    build_transitions_columnar,
     check_monotone_down,
     check_monotone_zone,
     distance_bucket,
+    encode_states,
     field_zone,
+    game_transition_matrix,
     parent_key,
     shrink,
+    shrink_counts,
+    shrink_plan,
     solve_ep,
     state_key,
 )
@@ -445,6 +452,43 @@ class TestSolveNetEP:
             solve_net_ep({("d1|standard|z5", "TD"): 1.0}, _uniform_handoffs(8))
 
 
+class TestAbsorbingChain:
+    def test_one_fundamental_solve_serves_both_bases(self, monkeypatch):
+        """run_era shares one chain per era: solve_ep and solve_net_ep must
+        reuse its cached (I - Q)^-1 rather than each re-solving."""
+        from scripts.compute_drive_chain import AbsorbingChain, solve_net_ep
+
+        calls = []
+        real_solve = np.linalg.solve
+
+        def counting_solve(a, b):
+            calls.append(a.shape)
+            return real_solve(a, b)
+
+        probs = _full_d1_grid({("d1|standard|z6", "TD"): 0.5, ("d1|standard|z6", "PUNT"): 0.5})
+        # An 11th state, so the (n, n) fundamental solve is distinguishable
+        # from the 10x10 handoff system.
+        probs[("d2|med|z6", "PUNT")] = 1.0
+        chain = AbsorbingChain.from_probs(probs)
+        monkeypatch.setattr(np.linalg, "solve", counting_solve)
+        ep, _ = solve_ep(chain)
+        net = solve_net_ep(chain, _uniform_handoffs(6))
+
+        n = len(chain.transient)
+        assert calls.count((n, n)) == 1
+        assert ep == solve_ep(probs)[0]
+        assert net["d1|standard|z6"] == pytest.approx(TD_VALUE / 3)
+
+    def test_handoff_matrix_is_exit_by_opponent_zone(self):
+        from scripts.compute_drive_chain import handoff_matrix
+
+        rows = _uniform_handoffs(4)["PUNT"]
+        H = handoff_matrix(rows)
+        assert H.shape == (10, 10)
+        assert H[7, 3] == 1.0
+        assert H.sum(axis=1) == pytest.approx(np.ones(10))
+
+
 class TestBuildHandoffs:
     def test_observed_rows_dominate_with_support(self):
         from scripts.compute_drive_chain import build_handoffs
@@ -566,3 +610,152 @@ class TestHandoffExitZoneConvention:
         assert DRIVE_PAIRS_QUERY.index(GARBAGE_TIME_SQL) < DRIVE_PAIRS_QUERY.index(
             "play_number DESC"
         )
+
+
+def _synthetic_per_game() -> Counter:
+    """A few games over two downs x two zones: enough shared parents and
+    grandparent-only targets to exercise every shrink() branch."""
+    per_game: Counter = Counter()
+    drives = [
+        (1, ["d1|standard|z8", "d2|med|z8", "d3|med|z7"], "PUNT"),
+        (1, ["d1|standard|z5", "d2|short|z4"], "TD"),
+        (2, ["d1|standard|z8", "d2|med|z7"], "TURNOVER"),
+        (2, ["d1|short|z5"], "FG"),
+        (3, ["d1|standard|z5", "d2|med|z4", "d3|med|z4"], "DOWNS"),
+        (3, ["d1|standard|z8", "d2|short|z8", "d1|standard|z7"], "TD"),
+        (4, ["d1|standard|z7", "d2|med|z7", "d3|med|z7"], "PUNT"),
+    ]
+    for game, states, absorb in drives:
+        for a, b in zip(states, states[1:] + [absorb]):
+            per_game[(game, a, b)] += 1
+    return per_game
+
+
+class TestVectorizedBootstrap:
+    def test_shrink_counts_matches_shrink(self):
+        per_game = _synthetic_per_game()
+        transitions = Counter()
+        for (_, a, b), n in per_game.items():
+            transitions[(a, b)] += n
+        plan = shrink_plan(sorted(transitions))
+        counts = np.array([transitions[t] for t in plan.transitions], dtype=float)
+
+        p, _ = shrink_counts(plan, counts, alpha=5.0)
+
+        cells = {
+            (plan.states[a], plan.targets[b]): v
+            for a, b, v in zip(plan.cell_state, plan.cell_target, p)
+        }
+        expected = shrink(transitions, alpha=5.0)
+        assert set(cells) == set(expected)
+        for key, value in expected.items():
+            assert cells[key] == pytest.approx(value, abs=1e-12)
+
+    def test_weighted_matvec_equals_resampled_counter(self):
+        """w @ M (the bincount matvec) must equal rebuilding a Counter from
+        the games a weight vector resampled."""
+        per_game = _synthetic_per_game()
+        games, transitions, rows, cols, vals = game_transition_matrix(per_game)
+        w = np.array([2, 0, 1, 1])
+
+        counts = np.bincount(cols, w[rows] * vals, minlength=len(transitions))
+
+        expected = Counter()
+        for (g, a, b), n in per_game.items():
+            expected[(a, b)] += n * w[games.index(g)]
+        assert dict(zip(transitions, counts)) == {t: expected[t] for t in transitions}
+
+    def test_replicate_solve_matches_dict_path(self):
+        from scripts.compute_drive_chain import _solve_plan_ep
+
+        per_game = _synthetic_per_game()
+        games, transitions, rows, cols, vals = game_transition_matrix(per_game)
+        plan = shrink_plan(transitions)
+        w = np.array([0, 2, 1, 1])  # game 1 not drawn: some states vanish
+        counts = np.bincount(cols, w[rows] * vals, minlength=len(transitions))
+
+        p, row_tot = shrink_counts(plan, counts, alpha=5.0)
+        ep = dict(zip(plan.states, _solve_plan_ep(plan, p, row_tot)))
+
+        resampled = Counter()
+        for (g, a, b), n in per_game.items():
+            if w[games.index(g)]:
+                resampled[(a, b)] += n * w[games.index(g)]
+        expected, _ = solve_ep(shrink(resampled, alpha=5.0))
+        assert {s for s, v in ep.items() if not np.isnan(v)} == set(expected)
+        for state, value in expected.items():
+            assert ep[state] == pytest.approx(value, abs=1e-9)
+
+    def test_result_does_not_depend_on_worker_count(self):
+        per_game = _synthetic_per_game()
+        serial = bootstrap_se(per_game, alpha=5.0, n_boot=12, seed=7)
+        pooled = bootstrap_se(per_game, alpha=5.0, n_boot=12, seed=7, workers=2)
+        assert serial == pooled
+        assert serial  # every state with >1 replicate sample gets an SE
+
+
+def _columns(plays: list[dict]) -> dict:
+    """Row dicts -> the sorted column arrays fetch_play_columns() returns."""
+    rows = sorted(plays, key=lambda r: (r["game_id"], r["drive_id"], r["play_number"]))
+    prev = [None] + [(r["game_id"], r["drive_id"]) for r in rows[:-1]]
+    absorb = [ABSORB_MAP.get((r["drive_result"] or "").upper()) for r in rows]
+    return {
+        "game_id": np.array([r["game_id"] for r in rows]),
+        "new_drive": np.array([(r["game_id"], r["drive_id"]) != p for r, p in zip(rows, prev)]),
+        "down": np.array([r["down"] for r in rows]),
+        "distance": np.array([r["distance"] for r in rows]),
+        "yards_to_goal": np.array([r["yards_to_goal"] for r in rows]),
+        "absorb": np.array([ABSORBING.index(a) if a else -1 for a in absorb]),
+    }
+
+
+class TestColumnarTransitions:
+    def test_encoded_states_match_state_key_everywhere(self):
+        from scripts.compute_drive_chain import STATE_KEYS
+
+        grid = [
+            (down, dist, ytg)
+            for down in range(1, 5)
+            for dist in range(1, 46)
+            for ytg in range(1, 100)
+        ]
+        down, dist, ytg = (np.array(col) for col in zip(*grid))
+        codes = encode_states(down, dist, ytg)
+        assert [STATE_KEYS[c] for c in codes] == [state_key(*g) for g in grid]
+
+    def test_counts_match_build_transitions(self):
+        from scripts.compute_drive_chain import game_transition_matrix
+
+        drive = TestBuildTransitions()._drive
+        plays = (
+            drive(7, "a", "PUNT", [(1, 10, 75), (2, 6, 71), (3, 6, 71)])
+            + drive(7, "b", "TD", [(1, 10, 40), (1, 10, 25), (2, 3, 8), (1, 3, 3)])
+            + drive(7, "c", "Uncategorized", [(1, 10, 75), (2, 10, 75)])
+            + drive(3, "a", "fg good", [(1, 10, 30), (3, 12, 22)])
+            + drive(3, "b", None, [(1, 10, 80)])
+            + drive(3, "c", "INT", [(1, 10, 75)])
+        )
+        plays.reverse()  # build_transitions sorts; the columnar path gets SQL order
+        expected = build_transitions(plays)
+
+        cols = _columns(plays)
+        got = build_transitions_columnar(
+            cols["game_id"],
+            cols["new_drive"],
+            cols["down"],
+            cols["distance"],
+            cols["yards_to_goal"],
+            cols["absorb"],
+        )
+
+        assert got[0] == expected[0]
+        assert got[2] == expected[2]
+        assert got[3:] == expected[3:] == (4, 2)
+        games, transitions, rows, cols_, vals = game_transition_matrix(expected[1])
+        assert got[1][:2] == (games, transitions)
+        assert dict(zip(zip(got[1][2], got[1][3]), got[1][4])) == dict(zip(zip(rows, cols_), vals))
+
+    def test_plays_query_sorts_for_the_shifted_pairs(self):
+        from scripts.compute_drive_chain import PLAYS_QUERY
+
+        assert "ORDER BY p.game_id, p.drive_id, p.play_number" in PLAYS_QUERY
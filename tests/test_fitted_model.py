@@ -16,6 +16,9 @@ import numpy as np  # noqa: E402
 from scripts.score_fitted import (  # noqa: E402
     MIN_UPCOMING_COVERAGE,
     coverage_verdict,
+    linear_predictor,
+    score_game,
+    score_games,
     select_train_through,
 )
 from scripts.train_model import (  # noqa: E402
@@ -25,18 +28,22 @@ from scripts.train_model import (  # noqa: E402
     RIDGE_ALPHA,
     TEAM_WEEK_SOURCE_COLUMNS,
     WINPROB_ALPHA,
+    ExpandingWindow,
     build_design,
     build_feature_vector,
     collect_team_week_rows,
     compute_diff_stats,
     compute_feature_means,
+    fit_window,
     irls_logistic,
     penalty_mask,
     platt_fit,
     platt_transform,
+    raw_to_standardized,
     ridge_fit,
     sigmoid,
     stale_score_seasons,
+    standardization_transform,
     standardize,
 )
 
@@ -326,6 +333,210 @@ class TestEndToEndWalkForward:
         assert np.all(probs < 1.0)
 
 
+class TestExpandingWindow:
+    """The incremental walk-forward trainer must freeze exactly the stats the
+    from-scratch path does and land on the same coefficients."""
+
+    @staticmethod
+    def _seasons(n_seasons=4, n_games=150, null_rate=0.2):
+        rng = np.random.default_rng(11)
+        strength = rng.normal(0.0, 1.0, 20)
+        seasons = []
+        for _ in range(n_seasons):
+            games = [
+                _make_game(rng, strength, neutral=bool(rng.random() < 0.1)) for _ in range(n_games)
+            ]
+            for g in games:
+                # Real margins are noisy enough that the logistic fit is far
+                # from separable; keep it that way so IRLS converges.
+                g["home_points"] += float(rng.normal(0.0, 14.0))
+                for side in ("home_tw", "away_tw"):
+                    for c in TEAM_WEEK_SOURCE_COLUMNS:
+                        if rng.random() < null_rate:
+                            g[side][c] = None
+            seasons.append(games)
+        return seasons
+
+    def test_frozen_stats_match_the_from_scratch_path_exactly(self):
+        seasons = self._seasons()
+        window = ExpandingWindow()
+        for k, games in enumerate(seasons):
+            window.add_season(2015 + k, games)
+            train = [g for s in seasons[: k + 1] for g in s]
+            means = compute_feature_means(collect_team_week_rows(train))
+            assert window.feature_means() == means
+            X_ref, ym_ref, yw_ref = build_design(train, means)
+            X, ym, yw = window.design(means)
+            assert np.array_equal(X, X_ref)
+            assert np.array_equal(ym, ym_ref)
+            assert np.array_equal(yw, yw_ref)
+
+    def test_earlier_designs_survive_the_buffers_growing(self):
+        seasons = self._seasons(n_seasons=3, n_games=40)
+        window = ExpandingWindow()
+        window.add_season(2015, seasons[0])
+        means = window.feature_means()
+        X, ym, yw = window.design(means)
+        X_copy, ym_copy, yw_copy = X.copy(), ym.copy(), yw.copy()
+        for k, games in enumerate(seasons[1:], start=1):
+            window.add_season(2015 + k, games)
+        assert window.n == 120
+        assert np.array_equal(X, X_copy)
+        assert np.array_equal(ym, ym_copy)
+        assert np.array_equal(yw, yw_copy)
+        X_all, ym_all, _ = window.design(means)
+        assert np.array_equal(X_all[:40], X_copy)
+        assert np.array_equal(ym_all[:40], ym_copy)
+
+    def test_empty_window_has_an_empty_design(self):
+        X, ym, yw = ExpandingWindow().design({})
+        assert X.shape == (0, len(FEATURE_NAMES))
+        assert ym.shape == yw.shape == (0,)
+
+    def test_running_normal_equations_match_the_design(self):
+        seasons = self._seasons(n_seasons=2)
+        window = ExpandingWindow()
+        for k, games in enumerate(seasons):
+            window.add_season(2015 + k, games)
+        means = window.feature_means()
+        X, y_margin, _ = window.design(means)
+        xtx, xty = window.raw_normal_equations(means)
+        np.testing.assert_allclose(xtx, X.T @ X, rtol=1e-10, atol=1e-8)
+        np.testing.assert_allclose(xty, X.T @ y_margin, rtol=1e-10, atol=1e-8)
+
+    def test_standardization_is_a_linear_map(self):
+        seasons = self._seasons(n_seasons=1)
+        window = ExpandingWindow()
+        window.add_season(2015, seasons[0])
+        X, _, _ = window.design(window.feature_means())
+        diff_means, diff_stds = compute_diff_stats(X)
+        T = standardization_transform(diff_means, diff_stds)
+        np.testing.assert_allclose(X @ T, standardize(X, diff_means, diff_stds), atol=1e-10)
+        gamma = np.linspace(-1.0, 1.0, len(FEATURE_NAMES))
+        beta = raw_to_standardized(gamma, diff_means, diff_stds)
+        np.testing.assert_allclose(standardize(X, diff_means, diff_stds) @ beta, X @ gamma)
+
+    def test_walk_forward_fits_match_fitting_each_window_from_scratch(self):
+        """Warm-started IRLS and the running-sum ridge reach the same optimum
+        as the from-scratch fit, window after window."""
+        seasons = self._seasons()
+        mask = penalty_mask()
+        window = ExpandingWindow()
+        warm = None
+        for k, games in enumerate(seasons):
+            window.add_season(2015 + k, games)
+            fit = fit_window(window, warm)
+            warm = fit["winprob_raw"]
+
+            train = [g for s in seasons[: k + 1] for g in s]
+            means = compute_feature_means(collect_team_week_rows(train))
+            X_raw, y_margin, y_win = build_design(train, means)
+            diff_means, diff_stds = compute_diff_stats(X_raw)
+            X_std = standardize(X_raw, diff_means, diff_stds)
+            assert fit["diff_means"] == diff_means
+            assert fit["diff_stds"] == diff_stds
+            np.testing.assert_allclose(
+                fit["beta_margin"], ridge_fit(X_std, y_margin, RIDGE_ALPHA, mask), atol=1e-9
+            )
+            np.testing.assert_allclose(
+                fit["beta_winprob"],
+                irls_logistic(X_std, y_win, WINPROB_ALPHA, mask),
+                atol=1e-7,
+            )
+            assert fit["n_train"] == len(train)
+
+    def test_warm_start_does_not_move_the_optimum(self):
+        rng = np.random.default_rng(0)
+        X = np.column_stack([np.ones(400), rng.normal(size=(400, 2))])
+        y = (rng.random(400) < sigmoid(X @ np.array([0.3, 1.0, -0.5]))).astype(float)
+        mask = np.array([0.0, 1.0, 1.0])
+        cold = irls_logistic(X, y, WINPROB_ALPHA, mask)
+        warm = irls_logistic(X, y, WINPROB_ALPHA, mask, beta0=cold + 0.05)
+        np.testing.assert_allclose(warm, cold, atol=1e-8)
+
+
+class TestBatchScoring:
+    """score_games must hand every game exactly the floats the one-game path
+    does, whatever else is in the batch."""
+
+    @pytest.fixture
+    def scored(self):
+        rng = np.random.default_rng(34)
+        strength = rng.normal(0.0, 1.0, 20)
+        train = [_make_game(rng, strength, neutral=bool(i % 7 == 0)) for i in range(300)]
+        feature_means = compute_feature_means(collect_team_week_rows(train))
+        X_raw, y_margin, y_win = build_design(train, feature_means)
+        diff_means, diff_stds = compute_diff_stats(X_raw)
+        X_std = standardize(X_raw, diff_means, diff_stds)
+        mask = penalty_mask()
+        beta_winprob = irls_logistic(X_std, y_win, WINPROB_ALPHA, mask)
+        platt_a, platt_b = platt_fit(X_std @ beta_winprob, y_win)
+        fit = {
+            "feature_means": feature_means,
+            "diff_means": diff_means,
+            "diff_stds": diff_stds,
+            "beta_margin": ridge_fit(X_std, y_margin, RIDGE_ALPHA, mask),
+            "beta_winprob": beta_winprob,
+            "platt_a": platt_a,
+            "platt_b": platt_b,
+        }
+        games = [_make_game(rng, strength) for _ in range(257)]
+        # NULL sides exercise the frozen-mean imputation.
+        cols = TEAM_WEEK_SOURCE_COLUMNS
+        for i, g in enumerate(games[::5]):
+            g["home_tw"][cols[i % len(cols)]] = None
+            g["away_tw"][cols[(i + 3) % len(cols)]] = None
+        return games, fit
+
+    def test_batch_matches_one_game_path_exactly(self, scored):
+        games, fit = scored
+        margins, win_probs = score_games(games, fit)
+        singles = [score_game(g, fit) for g in games]
+        assert margins.tolist() == [m for m, _ in singles]
+        assert win_probs.tolist() == [p for _, p in singles]
+
+    def test_batch_composition_does_not_move_a_game(self, scored):
+        games, fit = scored
+        margins, win_probs = score_games(games, fit)
+        tail_margins, tail_probs = score_games(games[100:], fit)
+        assert tail_margins.tolist() == margins[100:].tolist()
+        assert tail_probs.tolist() == win_probs[100:].tolist()
+
+    def test_matches_the_training_transforms(self, scored):
+        games, fit = scored
+        margins, win_probs = score_games(games, fit)
+        X = standardize(
+            np.vstack(
+                [
+                    build_feature_vector(g, g["home_tw"], g["away_tw"], fit["feature_means"])
+                    for g in games
+                ]
+            ),
+            fit["diff_means"],
+            fit["diff_stds"],
+        )
+        np.testing.assert_allclose(margins, X @ fit["beta_margin"], rtol=0, atol=1e-9)
+        expected = [
+            platt_transform(float(z), fit["platt_a"], fit["platt_b"])
+            for z in X @ fit["beta_winprob"]
+        ]
+        np.testing.assert_allclose(win_probs, expected, rtol=0, atol=1e-12)
+
+    def test_linear_predictor_is_row_independent(self):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(1000, len(FEATURE_NAMES)))
+        beta = rng.normal(size=len(FEATURE_NAMES))
+        full = linear_predictor(X, beta)
+        assert [float(linear_predictor(X[i], beta)[0]) for i in range(50)] == full[:50].tolist()
+        np.testing.assert_allclose(full, X @ beta, rtol=1e-12, atol=1e-12)
+
+    def test_empty_batch(self, scored):
+        _games, fit = scored
+        margins, win_probs = score_games([], fit)
+        assert margins.shape == (0,)
+        assert win_probs.shape == (0,)
+
+
 class TestCoverageVerdict:
     """The silent-failure regression: score_fitted.run_upcoming used to log
     'nothing to write' and return normally when features.team_week had no rows
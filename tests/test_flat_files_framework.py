@@ -2,7 +2,7 @@
 stub-based tests only -- no live DB, no network.
 """
 
-from datetime import date
+from datetime import UTC, date, datetime
 
 import httpx
 import pytest
@@ -16,7 +16,7 @@ from src.pipelines.sources.flat_files import (
     build_flat_file_source,
     resolve_parser,
 )
-from src.pipelines.utils import load_ledger
+from src.pipelines.utils import load_ledger, team_xwalk
 from src.pipelines.utils.file_fetcher import fetch_file
 from src.pipelines.utils.team_xwalk import XwalkResolver, normalize_name
 
@@ -93,6 +93,81 @@ class TestFetchFileHttp:
             fetch_file("https://example.com/missing.csv")
 
 
+class TestFetchFileStreaming:
+    def _patch_transport(self, monkeypatch, handler):
+        import src.pipelines.utils.file_fetcher as ff_mod
+
+        transport = httpx.MockTransport(handler)
+        real_client_cls = httpx.Client
+
+        def fake_client(*, follow_redirects, timeout):
+            return real_client_cls(
+                follow_redirects=follow_redirects, timeout=timeout, transport=transport
+            )
+
+        monkeypatch.setattr(ff_mod.httpx, "Client", fake_client)
+        return ff_mod
+
+    def test_body_spooled_to_disk_and_hashed_incrementally(self, monkeypatch):
+        import hashlib
+
+        payload = bytes(range(256)) * 64
+        ff_mod = self._patch_transport(
+            monkeypatch,
+            lambda request: httpx.Response(200, content=payload, headers={"ETag": '"v1"'}),
+        )
+        monkeypatch.setattr(ff_mod, "CHUNK_SIZE", 1000)
+        monkeypatch.setattr(ff_mod, "SPOOL_MAX_BYTES", 4096)
+
+        result = fetch_file("https://example.com/big.parquet")
+
+        assert result.sha256 == hashlib.sha256(payload).hexdigest()
+        assert result.body.read() == payload
+        assert result.body._rolled  # past SPOOL_MAX_BYTES -> on disk
+        assert result.etag == '"v1"'
+        assert not result.not_modified
+        result.close()
+
+    def test_validators_sent_and_304_is_not_modified(self, monkeypatch):
+        from src.pipelines.utils.file_fetcher import Validators
+
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(304)
+
+        self._patch_transport(monkeypatch, handler)
+        validators = Validators(
+            sha256="ab" * 32, etag='"v1"', last_modified="Mon, 01 Sep 2025 00:00:00 GMT"
+        )
+
+        result = fetch_file("https://example.com/combine.parquet", validators=validators)
+
+        assert seen["if-none-match"] == '"v1"'
+        assert seen["if-modified-since"] == "Mon, 01 Sep 2025 00:00:00 GMT"
+        assert result.not_modified
+        assert result.body is None
+        assert result.sha256 == validators.sha256
+        assert result.etag == '"v1"'
+
+    def test_local_file_is_memory_mapped_for_parsers(self):
+        pytest.importorskip("pyarrow", reason="flatfiles extra not installed")
+        from src.pipelines.sources.flatfile_parsers import nflverse
+
+        path = "tests/fixtures/flatfiles/combine_sample.parquet"
+
+        result = fetch_file(path)
+        ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
+        rows = [r for b in nflverse.parse_combine(result.body, ctx) for r in b.to_pylist()]
+        result.close()
+
+        with open(path, "rb") as f:
+            expected = [r for b in nflverse.parse_combine(f.read(), ctx) for r in b.to_pylist()]
+        assert rows == expected
+        assert len(rows) == 20
+
+
 # ---------------------------------------------------------------------------
 # load_ledger
 # ---------------------------------------------------------------------------
@@ -112,6 +187,137 @@ class TestRecordLoadValidation:
         assert load_ledger.VALID_STATUSES == ("loaded", "skipped", "failed")
 
 
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.connection = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((" ".join(sql.split()), params))
+
+    def fetchone(self):
+        return self.conn.results.pop(0)
+
+    def fetchall(self):
+        return self.conn.results.pop(0)
+
+
+class _FakeConn:
+    def __init__(self, results=None, autocommit=True, dsn="dbname=warehouse"):
+        self.results = list(results or [])
+        self.executed = []
+        self.autocommit = autocommit
+        self.commits = 0
+        self.closed = False
+        self.dsn = dsn
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestSharedLedgerConnection:
+    def test_calls_reuse_a_passed_connection_and_leave_it_open(self, monkeypatch):
+        monkeypatch.setattr(
+            load_ledger.psycopg2,
+            "connect",
+            lambda *a, **k: (_ for _ in ()).throw(AssertionError("must reuse conn")),
+        )
+        conn = _FakeConn(results=[(True,)])
+
+        assert load_ledger.already_loaded("massey", "ab" * 32, conn=conn) is True
+        load_ledger.record_load("massey", "ab" * 32, status="skipped", conn=conn)
+
+        assert len(conn.executed) == 2
+        assert not conn.closed
+
+    def test_without_conn_each_call_opens_commits_and_closes_its_own(self, monkeypatch):
+        opened = []
+
+        def fake_connect(dsn):
+            opened.append(_FakeConn(autocommit=False))
+            return opened[-1]
+
+        monkeypatch.setattr(load_ledger.psycopg2, "connect", fake_connect)
+
+        load_ledger.record_load("massey", "ab" * 32, status="loaded", db_url="postgres://x")
+
+        assert len(opened) == 1
+        assert opened[0].commits == 1 and opened[0].closed
+
+    def test_last_successes_is_one_grouped_query(self):
+        when = datetime(2025, 9, 1, tzinfo=UTC)
+        conn = _FakeConn(results=[[("massey", when)]])
+
+        result = load_ledger.last_successes(["massey", "nflverse_draft"], conn=conn)
+
+        assert result == {"massey": when}
+        ((sql, params),) = conn.executed
+        assert "GROUP BY source" in sql
+        assert params == (["massey", "nflverse_draft"],)
+
+    def test_last_success_delegates_to_the_bulk_query(self):
+        conn = _FakeConn(results=[[]])
+        assert load_ledger.last_success("massey", conn=conn) is None
+
+
+class TestEnsureConnected:
+    @pytest.fixture
+    def reconnects(self, monkeypatch):
+        opened = []
+
+        def fake_connect(dsn):
+            opened.append((dsn, _FakeConn()))
+            return opened[-1][1]
+
+        monkeypatch.setattr(load_ledger.psycopg2, "connect", fake_connect)
+        return opened
+
+    def test_live_connection_is_kept(self, reconnects):
+        conn = _FakeConn()
+        assert load_ledger.ensure_connected(conn, "postgres://x") is conn
+        assert conn.executed == [("SELECT 1", None)]
+        assert reconnects == []
+
+    def test_closed_connection_is_replaced(self, reconnects):
+        conn = _FakeConn()
+        conn.closed = True
+
+        fresh = load_ledger.ensure_connected(conn, "postgres://x")
+
+        assert reconnects == [("postgres://x", fresh)]
+        assert fresh.autocommit is True
+        assert conn.executed == []
+
+    def test_dropped_connection_is_closed_and_replaced(self, reconnects):
+        import psycopg2
+
+        conn = _FakeConn()
+
+        def dropped(sql, params=None):
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+        cursor = _FakeCursor(conn)
+        cursor.execute = dropped
+        conn.cursor = lambda: cursor
+
+        fresh = load_ledger.ensure_connected(conn, "postgres://x")
+
+        assert conn.closed
+        assert reconnects == [("postgres://x", fresh)]
+
+
 # ---------------------------------------------------------------------------
 # team_xwalk
 # ---------------------------------------------------------------------------
@@ -160,6 +366,68 @@ class TestXwalkResolver:
         assert resolver.misses == {"Foo Tech": 1}
 
 
+class TestXwalkCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        team_xwalk.clear_xwalk_cache()
+        yield
+        team_xwalk.clear_xwalk_cache()
+
+    def test_whole_crosswalk_read_once_per_process(self):
+        conn = _FakeConn(
+            results=[
+                [
+                    ("massey", "Ohio St", "Ohio State"),
+                    ("sbr", "OhioState", "Ohio State"),
+                ]
+            ]
+        )
+
+        massey = XwalkResolver.load("massey", conn=conn)
+        sbr = XwalkResolver.load("sbr", conn=conn)
+        massey_again = XwalkResolver.load("massey", conn=conn)
+
+        assert len(conn.executed) == 1
+        assert massey.resolve("ohio st") == "Ohio State"
+        assert sbr.resolve("OhioState") == "Ohio State"
+        assert sbr.resolve("Ohio St") is None  # mappings stay per source
+        assert massey_again.misses == {}  # misses are per resolver, not cached
+
+    def test_cache_is_per_database(self):
+        prod = _FakeConn(results=[[("massey", "Ohio St", "Ohio State")]], dsn="dbname=prod")
+        staging = _FakeConn(results=[[]], dsn="dbname=staging")
+
+        assert XwalkResolver.load("massey", conn=prod).resolve("Ohio St") == "Ohio State"
+        assert XwalkResolver.load("massey", conn=staging).resolve("Ohio St") is None
+        assert XwalkResolver.load("massey", conn=prod).resolve("Ohio St") == "Ohio State"
+        assert len(prod.executed) == len(staging.executed) == 1
+
+    def test_db_url_keys_the_cache_when_given(self, monkeypatch):
+        opened = []
+
+        def fake_connect(dsn):
+            opened.append(dsn)
+            return _FakeConn(results=[[("massey", "Ohio St", dsn)]])
+
+        monkeypatch.setattr(team_xwalk.psycopg2, "connect", fake_connect)
+
+        assert XwalkResolver.load("massey", db_url="postgres://a").resolve("Ohio St") == (
+            "postgres://a"
+        )
+        assert XwalkResolver.load("massey", db_url="postgres://b").resolve("Ohio St") == (
+            "postgres://b"
+        )
+        XwalkResolver.load("massey", db_url="postgres://a")
+        assert opened == ["postgres://a", "postgres://b"]
+
+    def test_clear_forces_a_reload(self):
+        conn = _FakeConn(results=[[], [("massey", "Ohio St", "Ohio State")]])
+
+        assert XwalkResolver.load("massey", conn=conn).resolve("Ohio St") is None
+        team_xwalk.clear_xwalk_cache()
+        assert XwalkResolver.load("massey", conn=conn).resolve("Ohio St") == "Ohio State"
+
+
 # ---------------------------------------------------------------------------
 # flat_files.resolve_parser
 # ---------------------------------------------------------------------------
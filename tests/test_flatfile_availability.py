@@ -2,6 +2,7 @@
 stub-based tests only -- no live DB, no network.
 """
 
+import io
 from datetime import date
 
 from src.pipelines.sources.flatfile_parsers import availability
@@ -232,7 +233,7 @@ def _index_only_fetcher(*, index_html=_INDEX_HTML_BOTH_LINKS, index_url=None, pd
     def fetch(url):
         if url == good_index_url:
             return FetchedFile(
-                content=index_html.encode("utf-8"), sha256="index-sha", source_url=url
+                body=io.BytesIO(index_html.encode("utf-8")), sha256="index-sha", source_url=url
             )
         if url in (u for u in availability.bigten_index_urls(2025) if u != good_index_url):
             raise RuntimeError(f"404 Not Found: {url}")
@@ -254,7 +255,7 @@ class TestArchiveEndToEnd:
         fetch = _index_only_fetcher(
             pdf_responses={
                 LINK_B: FetchedFile(
-                    content=b"%PDF-1.4 fake bytes", sha256="b-sha", source_url=LINK_B
+                    body=io.BytesIO(b"%PDF-1.4 fake bytes"), sha256="b-sha", source_url=LINK_B
                 )
             }
         )
@@ -307,7 +308,9 @@ class TestArchiveEndToEnd:
         fetch = _index_only_fetcher(
             pdf_responses={
                 LINK_A: RuntimeError("connection reset"),
-                LINK_B: FetchedFile(content=b"%PDF-1.4 ok", sha256="b-sha-2", source_url=LINK_B),
+                LINK_B: FetchedFile(
+                    body=io.BytesIO(b"%PDF-1.4 ok"), sha256="b-sha-2", source_url=LINK_B
+                ),
             }
         )
 
@@ -357,8 +360,12 @@ class TestArchiveGapsArePermanent:
 
         fetch = _index_only_fetcher(
             pdf_responses={
-                LINK_A: FetchedFile(content=b"%PDF-1.4 a", sha256="a-sha", source_url=LINK_A),
-                LINK_B: FetchedFile(content=b"%PDF-1.4 b", sha256="b-sha", source_url=LINK_B),
+                LINK_A: FetchedFile(
+                    body=io.BytesIO(b"%PDF-1.4 a"), sha256="a-sha", source_url=LINK_A
+                ),
+                LINK_B: FetchedFile(
+                    body=io.BytesIO(b"%PDF-1.4 b"), sha256="b-sha", source_url=LINK_B
+                ),
             }
         )
 
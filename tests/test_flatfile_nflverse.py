@@ -19,6 +19,11 @@ from src.pipelines.sources.flat_files import ParseContext, ParserStructureError
 from src.pipelines.sources.flatfile_parsers import nflverse
 
 
+def _rows(batches) -> list[dict]:
+    """Flatten the parsers' record batches into row dicts for assertions."""
+    return [row for batch in batches for row in batch.to_pylist()]
+
+
 class TestParseCombine:
     """Tests for parse_combine()."""
 
@@ -27,7 +32,7 @@ class TestParseCombine:
         with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         assert len(rows) == 20
 
     def test_fixture_zero_measurables_player(self):
@@ -35,7 +40,7 @@ class TestParseCombine:
         with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         # Find Rudy Noteworth
         rudy = [r for r in rows if r.get("player_name") == "Rudy Noteworth"]
         assert len(rudy) == 1
@@ -52,7 +57,7 @@ class TestParseCombine:
         with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         assert len(rows) > 0
         row = rows[0]  # Patrick Mahomes II
         assert isinstance(row["season"], int)
@@ -65,7 +70,7 @@ class TestParseCombine:
         with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         # The fixture has undrafted rows per FINDINGS.md but no row named "AJ Green Jr."
         # Check for any row with null draft_year
         null_draft_year_rows = [r for r in rows if r.get("draft_year") is None]
@@ -101,7 +106,7 @@ class TestParseCombine:
 
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
         with caplog.at_level(logging.INFO):
-            rows = list(nflverse.parse_combine(raw, ctx))
+            rows = _rows(nflverse.parse_combine(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["player_name"] == "Player One"
         assert "dropped 1" in caplog.text
@@ -128,7 +133,7 @@ class TestParseCombine:
         raw = buf.getvalue()
 
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["player_name"] == "Player One"
 
@@ -154,7 +159,7 @@ class TestParseCombine:
         raw = buf.getvalue()
 
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["player_name"] == "Player One"
 
@@ -236,7 +241,7 @@ class TestParseDraftPicks:
         with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) == 20
 
     def test_fixture_recent_rookie_null_stats(self):
@@ -244,7 +249,7 @@ class TestParseDraftPicks:
         with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         # Find Shedeur Maye
         shedeur = [r for r in rows if r.get("pfr_player_name") == "Shedeur Maye"]
         assert len(shedeur) == 1
@@ -259,7 +264,7 @@ class TestParseDraftPicks:
         with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) > 0
         row = rows[0]  # Bryce Young
         assert isinstance(row["season"], int)
@@ -273,7 +278,7 @@ class TestParseDraftPicks:
         with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         # All rows should have hof as bool (True or False)
         for row in rows:
             assert isinstance(row["hof"], bool)
@@ -307,7 +312,7 @@ class TestParseDraftPicks:
 
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
         with caplog.at_level(logging.INFO):
-            rows = list(nflverse.parse_draft_picks(raw, ctx))
+            rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["pfr_player_name"] == "Player One"
         assert "dropped 1" in caplog.text
@@ -338,7 +343,7 @@ class TestParseDraftPicks:
         raw = buf.getvalue()
 
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["pfr_player_name"] == "Player One"
 
@@ -368,7 +373,7 @@ class TestParseDraftPicks:
         raw = buf.getvalue()
 
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) == 1
         assert rows[0]["pfr_player_name"] == "Player One"
 
@@ -447,8 +452,8 @@ class TestParseDraftPicks:
         with pytest.raises(ParserStructureError, match="missing PK column.*pick"):
             list(nflverse.parse_draft_picks(raw, ctx))
 
-    def test_extra_columns_pass_through(self):
-        """Extra columns in the file pass through untouched."""
+    def test_extra_columns_are_not_read(self):
+        """Columns outside DRAFT_PICK_COLUMNS are projected away at read time."""
         schema = pa.schema(
             [
                 ("season", pa.int64()),
@@ -471,9 +476,10 @@ class TestParseDraftPicks:
         raw = buf.getvalue()
 
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert len(rows) == 1
-        assert rows[0]["extra_col"] == "extra_value"
+        assert "extra_col" not in rows[0]
+        assert rows[0]["team"] == "CAR"
 
 
 class TestDdlAlignment:
@@ -484,7 +490,7 @@ class TestDdlAlignment:
         with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_draft_picks(raw, ctx))
+        rows = _rows(nflverse.parse_draft_picks(raw, ctx))
         assert all("to" not in row for row in rows)
         non_null = [row["to_year"] for row in rows if row.get("to_year") is not None]
         assert non_null and all(isinstance(v, int) for v in non_null)
@@ -499,6 +505,65 @@ class TestDdlAlignment:
         with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
             raw = f.read()
         ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
-        rows = list(nflverse.parse_combine(raw, ctx))
+        rows = _rows(nflverse.parse_combine(raw, ctx))
         heights = [row["ht"] for row in rows if row.get("ht") is not None]
         assert heights and all(isinstance(h, float) and 60 <= h <= 84 for h in heights)
+
+
+class TestRecordBatches:
+    """The parsers emit projected, typed record batches, never row dicts."""
+
+    def test_yields_record_batches_bounded_by_batch_rows(self, monkeypatch):
+        monkeypatch.setattr(nflverse, "BATCH_ROWS", 6)
+        with open("tests/fixtures/flatfiles/draft_picks_sample.parquet", "rb") as f:
+            raw = f.read()
+        ctx = ParseContext(source="nflverse_draft", snapshot_date=date(2026, 7, 23))
+
+        batches = list(nflverse.parse_draft_picks(raw, ctx))
+
+        assert all(isinstance(b, pa.RecordBatch) for b in batches)
+        assert [b.num_rows for b in batches] == [6, 6, 6, 2]
+        assert batches[0].schema.field("to_year").type == pa.int64()
+        assert batches[0].schema.field("hof").type == pa.bool_()
+
+    def test_reads_from_file_like(self):
+        ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
+        with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
+            from_file = _rows(nflverse.parse_combine(f, ctx))
+            f.seek(0)
+            from_bytes = _rows(nflverse.parse_combine(f.read(), ctx))
+        assert from_file == from_bytes
+
+    def test_float_ints_and_legacy_height_strings_coerced(self):
+        table = pa.table(
+            {
+                "season": pa.array([2001.0, 2002.0]),
+                "player_name": ["Old Timer", "Older Timer"],
+                "pos": ["RB", "FB"],
+                "ht": ["6-2", "71"],
+                "wt": pa.array([215.0, None]),
+            }
+        )
+        buf = io.BytesIO()
+        pyarrow.parquet.write_table(table, buf)
+        ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
+
+        rows = _rows(nflverse.parse_combine(buf.getvalue(), ctx))
+
+        assert [r["season"] for r in rows] == [2001, 2002]
+        assert [r["ht"] for r in rows] == [74.0, 71.0]
+        assert [r["wt"] for r in rows] == [215, None]
+
+    def test_flat_file_source_loads_batches_as_one_resource(self):
+        from src.pipelines.sources.flat_files import REGISTRY, build_flat_file_source
+
+        with open("tests/fixtures/flatfiles/combine_sample.parquet", "rb") as f:
+            raw = f.read()
+        ctx = ParseContext(source="nflverse_combine", snapshot_date=date(2026, 7, 23))
+
+        source = build_flat_file_source(REGISTRY["nflverse_combine"], raw, ctx)
+
+        assert list(source.resources) == ["combine"]
+        items = list(source.resources["combine"])
+        assert all(isinstance(b, pa.RecordBatch) for b in items)
+        assert sum(b.num_rows for b in items) == 20
@@ -8,8 +8,9 @@ core.plays columns for performance instead of calling the function per row.
 These tests guard against the two definitions silently drifting apart:
 
 - `TestMartInlineSitesMatchCanonical` (no DB): regex-extracts every inline
-  occurrence of the predicate from src/schemas/marts/*.sql and asserts it
-  normalizes to the same canonical constant used by `is_garbage_time()`.
+  occurrence of the predicate from src/schemas/marts/*.sql (and the split-RPC
+  files in OTHER_INLINE_SITES) and asserts it normalizes to the same
+  canonical constant used by `is_garbage_time()`.
 - `TestIsGarbageTimeFunctionMatchesCanonical` (DB, skips without creds): calls
   `public.is_garbage_time(period, score_diff)` over a grid of values and
   asserts it agrees with the canonical rule evaluated in Python.
@@ -21,7 +22,8 @@ from pathlib import Path
 import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-MARTS_DIR = PROJECT_ROOT / "src" / "schemas" / "marts"
+SCHEMAS_DIR = PROJECT_ROOT / "src" / "schemas"
+MARTS_DIR = SCHEMAS_DIR / "marts"
 
 # ---------------------------------------------------------------------------
 # Canonical definition
@@ -48,6 +50,14 @@ KNOWN_INLINE_SITES = {
     "019_team_tempo_metrics.sql",
 }
 
+# Inline sites outside src/schemas/marts/: the situational split RPCs' live
+# fallbacks and the analytics.team_split_agg refresh that backs them.
+OTHER_INLINE_SITES = [
+    SCHEMAS_DIR / "public" / "005_team_split_functions.sql",
+    SCHEMAS_DIR / "public" / "006_play_analysis_functions.sql",
+    SCHEMAS_DIR / "migrations" / "053_team_split_agg.sql",
+]
+
 QUARTER_THRESHOLD = 28
 SECOND_HALF_THRESHOLD = 35
 
@@ -82,8 +92,13 @@ def _mart_files() -> list[Path]:
     return sorted(MARTS_DIR.glob("*.sql"))
 
 
+def _inline_site_files() -> list[Path]:
+    return _mart_files() + OTHER_INLINE_SITES
+
+
 class TestMartInlineSitesMatchCanonical:
-    """Every inline garbage-time predicate in src/schemas/marts/ must match canonical."""
+    """Every inline garbage-time predicate (src/schemas/marts/ and
+    OTHER_INLINE_SITES) must match canonical."""
 
     def test_canonical_predicate_is_internally_consistent(self):
         # Sanity check that the constant itself matches the extraction regex,
@@ -101,7 +116,15 @@ class TestMartInlineSitesMatchCanonical:
             "src/schemas/functions/is_garbage_time.sql."
         )
 
-    @pytest.mark.parametrize("mart_path", _mart_files(), ids=lambda p: p.name)
+    @pytest.mark.parametrize("path", OTHER_INLINE_SITES, ids=lambda p: p.name)
+    def test_other_inline_sites_have_at_least_one_occurrence(self, path: Path):
+        assert _extract_inline_predicates(path.read_text()), (
+            f"Expected inline garbage-time predicate not found in {path.name}. "
+            "If it was intentionally removed, update OTHER_INLINE_SITES here and the "
+            "canonical-source comment in src/schemas/functions/is_garbage_time.sql."
+        )
+
+    @pytest.mark.parametrize("mart_path", _inline_site_files(), ids=lambda p: p.name)
     def test_inline_predicates_match_canonical(self, mart_path: Path):
         occurrences = _extract_inline_predicates(mart_path.read_text())
         for occurrence in occurrences:
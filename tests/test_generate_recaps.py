@@ -4,8 +4,10 @@ Covers selection SQL shape (default/season/game_id/limit, and the
 recap-IS-NULL-or-regenerate gate that makes reruns idempotent), win-
 probability swing math (present and absent), prompt construction (facts +
 untrusted-play-description delimiters), response parsing, cost accounting,
-and process_game()'s dry-run short-circuit (mocked facts + mocked Anthropic
-client, asserting no API call and no write).
+process_game()'s dry-run short-circuit (mocked facts + mocked Anthropic
+client, asserting no API call and no write), and the batched path: set-based
+fact query shape, per-game regrouping, the local stub client, and bounded-
+concurrency generation with batched upserts.
 """
 
 import json
@@ -14,11 +16,21 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from scripts.generate_recaps import (
+    GAME_DETAIL_BATCH_SQL,
     INPUT_COST_PER_MTOK,
+    LEADERS_BATCH_SQL,
+    LINE_SCORES_BATCH_SQL,
     MAX_RECAPS_PER_RUN,
     MODEL_ID,
     OUTPUT_COST_PER_MTOK,
     PROMPT_VERSION,
+    STUB_MODEL_ID,
+    TOP_PLAYS_BATCH_SQL,
+    UPSERT_BATCH_SQL,
+    UPSERT_BATCH_TEMPLATE,
+    UPSERT_SQL,
+    WP_ROWS_BATCH_SQL,
+    StubRecapClient,
     assemble_facts,
     build_prompt,
     build_selection_query,
@@ -26,6 +38,9 @@ from scripts.generate_recaps import (
     compute_input_hash,
     compute_wp_swings,
     estimate_cost,
+    generate_batch,
+    generate_recap,
+    group_by_game,
     parse_recap_response,
     pivot_line_scores,
     process_game,
@@ -531,3 +546,132 @@ class TestProcessGameLive:
         assert result["input_tokens"] == 1234
         assert result["output_tokens"] == 321
         assert result["cost"] == pytest.approx(estimate_cost(1234, 321))
+
+
+# =============================================================================
+# Batched path: set-based facts, stub client, concurrent generation
+# =============================================================================
+
+
+class TestBatchQueries:
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            LINE_SCORES_BATCH_SQL,
+            TOP_PLAYS_BATCH_SQL,
+            WP_ROWS_BATCH_SQL,
+            LEADERS_BATCH_SQL,
+            GAME_DETAIL_BATCH_SQL,
+        ],
+    )
+    def test_keyed_on_game_id_any(self, sql):
+        assert "= ANY(%(game_ids)s)" in sql
+        assert "game_id" in sql
+
+    def test_top_plays_keeps_five_per_game(self):
+        assert "PARTITION BY game_id ORDER BY ABS(epa) DESC" in TOP_PLAYS_BATCH_SQL
+        assert "rn <= 5" in TOP_PLAYS_BATCH_SQL
+
+    def test_leaders_one_row_per_game_and_category(self):
+        assert "DISTINCT ON (game_id, category)" in LEADERS_BATCH_SQL
+        assert "stat DESC" in LEADERS_BATCH_SQL
+
+    def test_batch_upsert_shares_the_single_row_conflict_clause(self):
+        assert "VALUES %s" in UPSERT_BATCH_SQL
+        assert (
+            UPSERT_BATCH_SQL.split("VALUES %s")[1]
+            == UPSERT_SQL.split(
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now(), false)"
+            )[1]
+        )
+        assert UPSERT_BATCH_TEMPLATE.count("%s") == 11
+
+
+class TestGroupByGame:
+    def test_drops_key_and_keeps_row_order(self):
+        rows = [
+            {"game_id": 2, "play_id": 1, "wp": 0.5},
+            {"game_id": 1, "play_id": 1, "wp": 0.4},
+            {"game_id": 2, "play_id": 2, "wp": 0.6},
+        ]
+        assert group_by_game(rows) == {
+            2: [{"play_id": 1, "wp": 0.5}, {"play_id": 2, "wp": 0.6}],
+            1: [{"play_id": 1, "wp": 0.4}],
+        }
+
+    def test_empty(self):
+        assert group_by_game([]) == {}
+
+
+class TestStubClient:
+    def test_response_parses_like_a_real_one(self):
+        client = StubRecapClient()
+        result = generate_recap(client, _game_row(), _FAKE_FACTS, model=STUB_MODEL_ID)
+
+        assert client.calls == 1
+        assert result["headline"].startswith("Stub recap ")
+        assert result["recap"] == "Stub recap body."
+        assert result["model"] == STUB_MODEL_ID
+        assert result["input_tokens"] > 0
+        assert result["input_hash"] == compute_input_hash(_FAKE_FACTS)
+        assert result["wp_available"] is True
+
+    def test_deterministic(self):
+        a = generate_recap(StubRecapClient(), _game_row(), _FAKE_FACTS)
+        b = generate_recap(StubRecapClient(), _game_row(), _FAKE_FACTS)
+        assert a == b
+
+
+class TestGenerateBatch:
+    def _games(self, n):
+        return [dict(_game_row(), game_id=1000 + i) for i in range(n)]
+
+    @patch("scripts.generate_recaps.UPSERT_BATCH_SIZE", 3)
+    @patch("scripts.generate_recaps.upsert_recaps")
+    def test_every_game_generated_and_upserted_in_batches(self, mock_upsert):
+        games = self._games(7)
+        facts = {g["game_id"]: dict(_FAKE_FACTS, game_id=g["game_id"]) for g in games}
+        client = StubRecapClient()
+
+        results, failures = generate_batch(
+            MagicMock(), client, games, facts, concurrency=3, model=MODEL_ID, write=True
+        )
+
+        assert failures == 0
+        assert client.calls == 7
+        assert sorted(r["game_id"] for r in results) == [g["game_id"] for g in games]
+        batch_sizes = [len(c.args[1]) for c in mock_upsert.call_args_list]
+        assert batch_sizes == [3, 3, 1]
+
+    @patch("scripts.generate_recaps.upsert_recaps")
+    def test_no_write_when_disabled(self, mock_upsert):
+        games = self._games(2)
+        facts = {g["game_id"]: _FAKE_FACTS for g in games}
+        generate_batch(
+            MagicMock(), StubRecapClient(), games, facts, concurrency=2, model="x", write=False
+        )
+        mock_upsert.assert_not_called()
+
+    @patch("scripts.generate_recaps.upsert_recaps")
+    def test_one_failed_call_does_not_sink_the_batch(self, mock_upsert):
+        games = self._games(3)
+        facts = {g["game_id"]: _FAKE_FACTS for g in games}
+        stub = StubRecapClient()
+        real_create = stub.create
+
+        def flaky(**kwargs):
+            if stub.calls == 1:
+                stub.calls += 1
+                raise RuntimeError("overloaded")
+            return real_create(**kwargs)
+
+        client = MagicMock()
+        client.messages.create.side_effect = flaky
+
+        results, failures = generate_batch(
+            MagicMock(), client, games, facts, concurrency=1, model=MODEL_ID, write=True
+        )
+
+        assert failures == 1
+        assert len(results) == 2
+        assert sum(len(c.args[1]) for c in mock_upsert.call_args_list) == 2
@@ -13,6 +13,8 @@ import pytest
 from scripts.compute_house_elo import (
     EloEngine,
     expected_score,
+    game_order_key,
+    incremental_rebuild_reason,
     mov_multiplier,
     pearson_r,
 )
@@ -233,3 +235,78 @@ class TestMiniSeasonEndToEnd:
         assert snapshot["A"]["last_game_id"] == 102
         assert snapshot["B"]["last_game_id"] == 103
         assert snapshot["C"]["last_game_id"] == 103
+
+
+class TestIncrementalState:
+    """--incremental resumes a persisted engine; it must match a single
+    uninterrupted run over the same games."""
+
+    COUNTS = {"A": 4, "B": 4, "C": 4, "Tiny": 1}
+
+    def games(self):
+        return [
+            make_game(201, 2022, "A", "B", 24, 17, start_date=1),
+            make_game(202, 2022, "C", "Tiny", 56, 0, start_date=2),
+            make_game(203, 2022, "B", "C", 10, 13, start_date=3),
+            make_game(204, 2022, "A", "C", 31, 30, start_date=4),
+        ]
+
+    def test_export_restore_round_trip_matches_uninterrupted_run(self):
+        seeded = {"A": 1620.0, "B": 1480.0, "C": 1555.5}
+
+        straight = EloEngine()
+        straight.ratings.update(seeded)
+        straight.last_season.update({team: 2021 for team in seeded})
+        straight.start_season(2022, self.COUNTS)
+        expected = [straight.process_game(g) for g in self.games()]
+
+        first = EloEngine()
+        first.ratings.update(seeded)
+        first.last_season.update({team: 2021 for team in seeded})
+        first.start_season(2022, self.COUNTS)
+        rows = [first.process_game(g) for g in self.games()[:2]]
+
+        resumed = EloEngine.from_state(first.export_state())
+        rows += [resumed.process_game(g) for g in self.games()[2:]]
+
+        assert rows == expected
+        assert resumed.export_state() == straight.export_state()
+        assert resumed.current_snapshot(2022) == straight.current_snapshot(2022)
+
+    def test_alias_map_matches_start_season(self):
+        engine = EloEngine()
+        engine.start_season(2022, self.COUNTS)
+        assert EloEngine.alias_map(self.COUNTS) == engine.alias
+
+    def test_append_when_nothing_moved(self):
+        engine = EloEngine()
+        engine.start_season(2022, self.COUNTS)
+        watermark = {"start_date": 2, "game_id": 202}
+        new = self.games()[2:]
+        assert incremental_rebuild_reason(engine, watermark, self.COUNTS, [], new) is None
+
+    def test_changed_game_forces_rebuild(self):
+        engine = EloEngine()
+        engine.start_season(2022, self.COUNTS)
+        watermark = {"start_date": 2, "game_id": 202}
+        reason = incremental_rebuild_reason(engine, watermark, self.COUNTS, [201], [])
+        assert "201" in reason
+
+    def test_schedule_alias_change_forces_rebuild(self):
+        engine = EloEngine()
+        engine.start_season(2022, self.COUNTS)
+        watermark = {"start_date": 2, "game_id": 202}
+        counts = {**self.COUNTS, "Tiny": 4}
+        assert incremental_rebuild_reason(engine, watermark, counts, [], []) is not None
+
+    def test_out_of_order_game_forces_rebuild(self):
+        engine = EloEngine()
+        engine.start_season(2022, self.COUNTS)
+        watermark = {"start_date": 3, "game_id": 203}
+        late = [make_game(199, 2022, "A", "B", 7, 3, start_date=1)]
+        assert incremental_rebuild_reason(engine, watermark, self.COUNTS, [], late) is not None
+
+    def test_order_key_puts_undated_games_last(self):
+        dated = make_game(9, 2022, "A", "B", 1, 0, start_date=5)
+        undated = make_game(1, 2022, "A", "B", 1, 0, start_date=None)
+        assert game_order_key(dated) < game_order_key(undated)
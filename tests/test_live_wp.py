@@ -3,21 +3,55 @@
 Covers scripts/poll_scoreboard.py's pure core -- house_live_home_wp (the
 closed-form formula from migration 029's header:
 src/schemas/migrations/029_live_schema.sql), clock parsing (including the
-documented overtime rule), and the snapshot dedup hash -- plus
+documented overtime rule), the snapshot dedup hash, snapshot row building,
+the --daemon polling cadence and the retention rollup (migration 056) -- plus
 scripts/calibrate_live_wp.py's pure sigma grid search, recovered against
 synthetic data generated from a known ground-truth sigma, per
 docs/plans/2026-07-21-tier3-analytics-plan.md, Pillar D.
 """
 
+import math
 import random
+import re
+from datetime import UTC, datetime
+from pathlib import Path
 
+import numpy as np
 import pytest
 
-from scripts.calibrate_live_wp import brier_score, grid_search_sigma
+from scripts import poll_scoreboard
+from scripts.calibrate_live_wp import (
+    _erf,
+    brier_score,
+    build_states,
+    decile_calibration,
+    era_label,
+    explode_wp_game,
+    fit_sigma,
+    fit_sigma_by_group,
+    golden_section_min,
+    grid_search_sigma,
+    house_live_home_wp_array,
+    predict_states,
+    quarter_label,
+    refine_bracket,
+    state_arrays,
+)
 from scripts.poll_scoreboard import (
+    FINAL_RETENTION_DAYS,
+    POLL_SECONDS_CLOSE,
+    POLL_SECONDS_IDLE,
+    POLL_SECONDS_IDLE_MAX,
+    POLL_SECONDS_LIVE,
+    build_snapshot_row,
     clamp,
+    dedup_rows,
     house_live_home_wp,
+    is_close_late,
+    next_poll_interval,
     parse_clock,
+    rollup_final_snapshots,
+    slate_finished,
     snapshot_hash,
 )
 
@@ -183,3 +217,555 @@ class TestCalibrationGridRecovery:
 
     def test_brier_score_empty_is_nan(self):
         assert brier_score([], []) != brier_score([], [])  # NaN != NaN
+
+
+def _synthetic_states(true_sigma: float, n: int, seed: int, season: int | None = None):
+    rng = random.Random(seed)
+    states = []
+    for _ in range(n):
+        current_margin = rng.uniform(-21, 21)
+        pregame_expected_margin = rng.uniform(-14, 14)
+        seconds_remaining = rng.uniform(0, 3600)
+        true_wp = house_live_home_wp(
+            current_margin, pregame_expected_margin, seconds_remaining, true_sigma
+        )
+        states.append(
+            {
+                "season": season,
+                "current_margin": current_margin,
+                "pregame_expected_margin": pregame_expected_margin,
+                "seconds_remaining": seconds_remaining,
+                "home_win": 1.0 if rng.random() < true_wp else 0.0,
+            }
+        )
+    return states
+
+
+class TestVectorizedCalibration:
+    """The numpy path must score exactly what the live scalar formula
+    would, and the continuous fit must land where the grid says."""
+
+    def test_erf_matches_math_erf(self):
+        rng = np.random.default_rng(5)
+        xs = np.concatenate(
+            [
+                rng.normal(0.0, 3.0, 20_000),
+                np.linspace(-30.0, 30.0, 20_001),
+                [0.0, 0.46875, -0.46875, 4.0, -4.0, 27.0, 1e-300, 1e300, np.inf, -np.inf],
+            ]
+        )
+        expected = np.array([math.erf(x) for x in xs])
+        np.testing.assert_allclose(_erf(xs), expected, rtol=0, atol=4.5e-16)
+
+    def test_erf_edge_values(self):
+        assert math.copysign(1.0, _erf(np.array([-0.0]))[0]) == -1.0
+        assert np.isnan(_erf(np.array([np.nan]))[0])
+        assert _erf(np.zeros((2, 3))).shape == (2, 3)
+
+    def test_erf_blocks_agree_with_one_pass(self):
+        xs = np.random.default_rng(9).normal(0.0, 2.0, 200_000)
+        blocked = _erf(xs)
+        one_pass = np.concatenate([_erf(xs[i : i + 1000]) for i in range(0, xs.size, 1000)])
+        assert np.array_equal(blocked, one_pass)
+
+    def test_array_wp_matches_scalar(self):
+        states = _synthetic_states(16.0, 500, seed=7)
+        states.append(
+            {"current_margin": 3.0, "pregame_expected_margin": -2.0, "seconds_remaining": 0.0}
+        )
+        for sigma in (10.0, 15.5, 24.0):
+            array_wp = predict_states(states, sigma)
+            scalar_wp = [
+                house_live_home_wp(
+                    s["current_margin"],
+                    s["pregame_expected_margin"],
+                    s["seconds_remaining"],
+                    sigma,
+                )
+                for s in states
+            ]
+            np.testing.assert_allclose(array_wp, scalar_wp, rtol=0, atol=1e-15)
+
+    def test_array_wp_accepts_plain_sequences(self):
+        out = house_live_home_wp_array([7.0, -7.0], [0.0, 0.0], [1800, 1800], 16.0)
+        np.testing.assert_allclose(
+            out,
+            [house_live_home_wp(7.0, 0.0, 1800, 16.0), house_live_home_wp(-7.0, 0.0, 1800, 16.0)],
+            rtol=0,
+            atol=1e-15,
+        )
+
+    def test_grid_search_same_for_dicts_and_arrays(self):
+        states = _synthetic_states(16.0, 300, seed=3)
+        grid = [12.0, 16.0, 20.0]
+        assert grid_search_sigma(states, grid) == grid_search_sigma(state_arrays(states), grid)
+
+    def test_golden_section_finds_parabola_minimum(self):
+        x, fx = golden_section_min(lambda v: (v - 3.3) ** 2 + 1.0, 0.0, 10.0, tol=1e-6)
+        assert x == pytest.approx(3.3, abs=1e-5)
+        assert fx == pytest.approx(1.0)
+
+    def test_golden_section_finds_minimum_at_bracket_end(self):
+        x, _ = golden_section_min(lambda v: v, 2.0, 5.0)
+        assert x == 2.0
+
+    def test_continuous_fit_recovers_known_sigma(self):
+        states = _synthetic_states(16.0, 4000, seed=20260721)
+        arrays = state_arrays(states)
+        grid = [float(s) for s in range(10, 25)]
+        results = grid_search_sigma(arrays, grid)
+        bracket = refine_bracket(grid, results)
+        sigma, brier = fit_sigma(arrays, *bracket)
+
+        assert bracket[0] <= sigma <= bracket[1]
+        assert abs(sigma - 16.0) <= 1.0
+        # The refined optimum is never worse than the best grid cell.
+        assert brier <= min(b for _, b in results) + 1e-12
+
+    def test_refine_bracket_clamps_at_grid_edges(self):
+        grid = [10.0, 11.0, 12.0]
+        assert refine_bracket(grid, [(10.0, 0.1), (11.0, 0.2), (12.0, 0.3)]) == (10.0, 11.0)
+        assert refine_bracket(grid, [(10.0, 0.3), (11.0, 0.2), (12.0, 0.1)]) == (11.0, 12.0)
+
+
+class TestDecileCalibration:
+    def _reference(self, predictions, outcomes, n_buckets):
+        """The sort-and-slice implementation the one-pass version replaced."""
+        pairs = sorted(zip(predictions, outcomes, strict=True), key=lambda p: p[0])
+        n = len(pairs)
+        buckets = []
+        for i in range(n_buckets):
+            chunk = pairs[(i * n) // n_buckets : ((i + 1) * n) // n_buckets]
+            if not chunk:
+                buckets.append(
+                    {"decile": i + 1, "n": 0, "predicted_mean": None, "empirical_rate": None}
+                )
+                continue
+            buckets.append(
+                {
+                    "decile": i + 1,
+                    "n": len(chunk),
+                    "predicted_mean": sum(p for p, _ in chunk) / len(chunk),
+                    "empirical_rate": sum(o for _, o in chunk) / len(chunk),
+                }
+            )
+        return buckets
+
+    def test_matches_sort_and_slice(self):
+        rng = random.Random(11)
+        predictions = [round(rng.random(), 2) for _ in range(1234)]  # with ties
+        outcomes = [float(rng.random() < p) for p in predictions]
+        got = decile_calibration(predictions, outcomes)
+        want = self._reference(predictions, outcomes, 10)
+        assert [b["n"] for b in got] == [b["n"] for b in want]
+        for g, w in zip(got, want, strict=True):
+            assert g["predicted_mean"] == pytest.approx(w["predicted_mean"], abs=1e-12)
+            assert g["empirical_rate"] == pytest.approx(w["empirical_rate"], abs=1e-12)
+
+    def test_fewer_states_than_buckets(self):
+        got = decile_calibration([0.2, 0.9, 0.5], [0.0, 1.0, 1.0])
+        assert sum(b["n"] for b in got) == 3
+        assert got == self._reference([0.2, 0.9, 0.5], [0.0, 1.0, 1.0], 10)
+
+
+class TestGroupFits:
+    def test_era_labels(self):
+        assert era_label(2014) == "<2023"
+        assert era_label(2023) == "2023+"
+        assert era_label(2025) == "2023+"
+        assert era_label(None) is None
+
+    def test_quarter_labels(self):
+        assert quarter_label(3600) == "Q1"
+        assert quarter_label(2701) == "Q1"
+        assert quarter_label(2700) == "Q2"
+        assert quarter_label(900) == "Q4"
+        assert quarter_label(0) == "Q4"
+
+    def test_fit_by_season_recovers_each_seasons_sigma(self):
+        states = _synthetic_states(12.0, 3000, seed=1, season=2021)
+        states += _synthetic_states(20.0, 3000, seed=2, season=2024)
+        fits = fit_sigma_by_group(states, "season", 8.0, 26.0)
+
+        assert [f["group"] for f in fits] == [2021, 2024]
+        assert [f["n_states"] for f in fits] == [3000, 3000]
+        assert abs(fits[0]["sigma"] - 12.0) <= 1.5
+        assert abs(fits[1]["sigma"] - 20.0) <= 1.5
+
+    def test_fit_by_skips_states_without_a_group(self):
+        states = _synthetic_states(16.0, 200, seed=5, season=None)
+        assert fit_sigma_by_group(states, "era", 8.0, 26.0) == []
+
+
+def _packed_game(**overrides):
+    row = {
+        "game_id": 7,
+        "play_numbers": [1, 2, 3, 4],
+        "home_wp": [0.6, None, 0.7, 0.9],
+        "home_scores": [0, 7, 7, 14],
+        "away_scores": [0, 0, 3, 3],
+        "season": 2024,
+        "home_points": 21,
+        "away_points": 10,
+        "home_pregame_elo": 1600.0,
+        "away_pregame_elo": 1500.0,
+        "neutral_site": False,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestExplodeWpGame:
+    """metrics.win_probability_game packs a game's plays into parallel arrays;
+    explode_wp_game must hand build_states the same per-play dicts the
+    per-play query did."""
+
+    def test_unpacks_arrays_and_copies_game_level_fields(self):
+        plays = explode_wp_game(_packed_game())
+
+        assert [p["order_key"] for p in plays] == [1, 3, 4]  # NULL WP dropped
+        assert [p["cfbd_wp"] for p in plays] == [0.6, 0.7, 0.9]
+        assert plays[1]["home_score"] == 7 and plays[1]["away_score"] == 3
+        assert all(p["game_id"] == 7 and p["home_points"] == 21 for p in plays)
+        assert "home_wp" not in plays[0] and "play_numbers" not in plays[0]
+
+    def test_missing_play_number_falls_back_to_array_position(self):
+        plays = explode_wp_game(_packed_game(play_numbers=[10, None, 30, 40]))
+        assert [p["order_key"] for p in plays] == [1, 3, 4]
+
+    def test_feeds_build_states(self):
+        states = build_states(explode_wp_game(_packed_game()))
+
+        assert len(states) == 3
+        assert states[0]["seconds_remaining"] == 3600
+        assert states[-1]["seconds_remaining"] == 0
+        assert [s["current_margin"] for s in states] == [0.0, 4.0, 11.0]
+        assert all(s["home_win"] == 1.0 for s in states)
+
+    def test_build_states_streams_contiguous_games(self):
+        rows = (
+            play
+            for game_id, home_points in ((7, 21), (8, 3))
+            for play in explode_wp_game(_packed_game(game_id=game_id, home_points=home_points))
+        )
+        states = build_states(rows)
+        assert [s["game_id"] for s in states] == [7] * 3 + [8] * 3
+        assert [s["home_win"] for s in states] == [1.0] * 3 + [0.0] * 3
+
+    def test_uses_the_clock_when_a_row_carries_one(self):
+        plays = explode_wp_game(_packed_game())
+        plays[1].update(period=3, clock="10:00")
+        states = build_states(plays)
+        assert states[1]["seconds_remaining"] == 900 + 600
+
+
+def _game(game_id=1, status="in_progress", period=2, clock="07:30", home=14, away=10):
+    return {
+        "game_id": game_id,
+        "season": 2025,
+        "week": 6,
+        "season_type": "regular",
+        "status": status,
+        "period": period,
+        "clock": clock,
+        "home_team": "Home",
+        "away_team": "Away",
+        "home_points": home,
+        "away_points": away,
+        "possession": "home",
+        "neutral_site": False,
+        "spread": -3.5,
+        "over_under": 52.5,
+        "cfbd_home_wp": 0.6,
+    }
+
+
+class TestSnapshotRows:
+    CAPTURED = datetime(2025, 10, 4, 20, 0, tzinfo=UTC)
+
+    def test_row_carries_wp_and_hash(self):
+        row = build_snapshot_row(_game(), 2025, 3.0, 16.0, self.CAPTURED)
+        assert row["captured_at"] == self.CAPTURED
+        assert row["seconds_remaining"] == 2 * 900 + 450
+        assert row["house_live_home_wp"] == house_live_home_wp(4, 3.0, 2250, 16.0)
+        assert row["snapshot_hash"] == snapshot_hash(1, 2, "07:30", 14, 10, "home")
+
+    def test_unreadable_clock_keeps_row_without_wp(self):
+        row = build_snapshot_row(_game(clock=None), 2025, 3.0, 16.0, self.CAPTURED)
+        assert row["seconds_remaining"] is None
+        assert row["house_live_home_wp"] is None
+
+    def test_dedup_skips_unchanged_and_remembers_kept(self):
+        first = build_snapshot_row(_game(), 2025, 3.0, 16.0, self.CAPTURED)
+        latest = {}
+        kept, deduped = dedup_rows([first], latest)
+        assert (len(kept), deduped) == (1, 0)
+        assert latest == {1: first["snapshot_hash"]}
+
+        # Same state next poll: skipped without another lookup.
+        again = build_snapshot_row(_game(), 2025, 3.0, 16.0, self.CAPTURED)
+        assert dedup_rows([again], latest) == ([], 1)
+
+        moved = build_snapshot_row(_game(clock="07:05"), 2025, 3.0, 16.0, self.CAPTURED)
+        kept, deduped = dedup_rows([moved], latest)
+        assert kept == [moved] and deduped == 0
+        assert latest[1] == moved["snapshot_hash"]
+
+
+class TestPollCadence:
+    def test_close_fourth_quarter_polls_fastest(self):
+        games = [_game(1), _game(2, period=4, home=21, away=17)]
+        assert is_close_late(games[1])
+        assert next_poll_interval(games, idle_polls=0) == POLL_SECONDS_CLOSE
+
+    def test_overtime_counts_as_late(self):
+        assert is_close_late(_game(period=5, home=28, away=28))
+
+    def test_blowout_or_early_game_is_normal_cadence(self):
+        assert not is_close_late(_game(period=4, home=42, away=10))
+        assert not is_close_late(_game(period=3, home=21, away=17))
+        games = [_game(period=4, home=42, away=10)]
+        assert next_poll_interval(games, idle_polls=3) == POLL_SECONDS_LIVE
+
+    def test_final_close_game_is_not_live(self):
+        assert not is_close_late(_game(status="final", period=4, home=21, away=20))
+
+    def test_idle_backs_off_to_cap(self):
+        games = [_game(status="scheduled", period=None, clock=None, home=None, away=None)]
+        assert next_poll_interval(games, idle_polls=0) == POLL_SECONDS_IDLE
+        assert next_poll_interval(games, idle_polls=1) == 2 * POLL_SECONDS_IDLE
+        assert next_poll_interval([], idle_polls=10) == POLL_SECONDS_IDLE_MAX
+
+    def test_slate_finished_only_when_every_game_is_final(self):
+        assert slate_finished([_game(status="final"), _game(2, status="completed")])
+        assert not slate_finished([_game(status="final"), _game(2, status="scheduled")])
+        assert not slate_finished([])
+
+
+class _FlakyClient:
+    """/scoreboard stand-in: raises for the first `failures` calls."""
+
+    def __init__(self, failures, games):
+        self.failures = failures
+        self.games = games
+        self.calls = 0
+
+    def get(self, path, params=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("CFBD 502 after retries")
+        return self.games
+
+    def close(self):
+        pass
+
+
+class TestDaemonRun:
+    @pytest.fixture
+    def daemon(self, monkeypatch):
+        monkeypatch.setattr(poll_scoreboard, "fetch_elo_current", lambda conn: {})
+        monkeypatch.setattr(poll_scoreboard, "fetch_wp_params", lambda conn: (16.0, None))
+        monkeypatch.setattr(poll_scoreboard, "fetch_latest_hashes", lambda conn, ids: {})
+        monkeypatch.setattr(poll_scoreboard, "parse_scoreboard", lambda raw: raw)
+        monkeypatch.setattr(poll_scoreboard, "pregame_margin", lambda game, elo: (2025, 0.0))
+
+        def make(failures, games):
+            return poll_scoreboard.LiveScoreboardDaemon(
+                _FlakyClient(failures, games), _RollupConn(), dry_run=True
+            )
+
+        return make
+
+    def test_a_failed_poll_backs_off_and_keeps_polling(self, daemon):
+        d = daemon(1, [_game(status="final")])
+        sleeps = []
+
+        d.run(3600, sleep=sleeps.append)
+
+        assert d.client.calls == 2
+        assert sleeps == [POLL_SECONDS_LIVE]
+        assert (d.polls, d.poll_errors, d.inserted) == (1, 1, 1)
+
+    def test_every_poll_failing_still_fails_the_run(self, daemon, monkeypatch):
+        d = daemon(10**6, [])
+        clock = [0.0]
+        monkeypatch.setattr(poll_scoreboard.time, "monotonic", lambda: clock[0])
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        with pytest.raises(RuntimeError, match="CFBD 502"):
+            d.run(10 * POLL_SECONDS_LIVE, sleep=sleep)
+        assert d.polls == 0
+        assert d.poll_errors == 10
+
+
+# ---------------------------------------------------------------------------
+# Retention: live.latest_snapshot + live.rollup_final_snapshots (migration 056)
+# ---------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LIVE_RETENTION = PROJECT_ROOT / "src" / "schemas" / "migrations" / "056_live_retention.sql"
+LIVE_SCOREBOARD_VIEW = PROJECT_ROOT / "src" / "schemas" / "api" / "035_live_scoreboard.sql"
+
+
+def _strip_comments(sql: str) -> str:
+    return "\n".join(line.split("--", 1)[0] for line in sql.splitlines())
+
+
+def _function_body(sql: str, name: str) -> str:
+    start = sql.index(f"CREATE OR REPLACE FUNCTION {name}")
+    return sql[start : sql.index("$function$;", start)]
+
+
+class TestLiveRetentionShape:
+    """Static drift-guards for migration 056; the rollup's behavior against
+    a real database is covered in tests/test_api_views.py."""
+
+    def test_latest_snapshot_trigger_is_statement_level(self):
+        sql = _strip_comments(LIVE_RETENTION.read_text())
+        assert re.search(
+            r"AFTER INSERT ON live\.scoreboard_snapshots\s+REFERENCING NEW TABLE AS inserted"
+            r"\s+FOR EACH STATEMENT\s+EXECUTE FUNCTION live\.track_latest_snapshot\(\)",
+            sql,
+        )
+
+    def test_trigger_keeps_the_newest_row_per_game(self):
+        body = _function_body(
+            _strip_comments(LIVE_RETENTION.read_text()), "live.track_latest_snapshot"
+        )
+        assert "SELECT DISTINCT ON (n.game_id)" in body
+        assert "ORDER BY n.game_id, n.captured_at DESC, n.id DESC" in body
+        # An out-of-order (older) insert must not move the pointer back.
+        assert "WHERE live.latest_snapshot.captured_at <= EXCLUDED.captured_at" in body
+
+    def test_rollup_counts_crossings_between_consecutive_snapshots(self):
+        body = _function_body(
+            _strip_comments(LIVE_RETENTION.read_text()), "live.rollup_final_snapshots"
+        )
+        assert "lag(s.house_live_home_wp) OVER w AS prev_house_wp" in body
+        assert "WINDOW w AS (PARTITION BY s.game_id ORDER BY s.captured_at, s.id)" in body
+        assert "(o.prev_house_wp - 0.5) * (o.house_live_home_wp - 0.5) < 0" in body
+
+    def test_rollup_merges_a_re_polled_game(self):
+        body = _function_body(
+            _strip_comments(LIVE_RETENTION.read_text()), "live.rollup_final_snapshots"
+        )
+        assert "ON CONFLICT (game_id) DO UPDATE SET" in body
+        for merged in (
+            "snapshots = live.game_summaries.snapshots + EXCLUDED.snapshots",
+            "house_wp_crossings = live.game_summaries.house_wp_crossings"
+            " + EXCLUDED.house_wp_crossings",
+            "first_captured_at = LEAST(live.game_summaries.first_captured_at,",
+            "house_wp_min = LEAST(live.game_summaries.house_wp_min, EXCLUDED.house_wp_min)",
+            "house_wp_max = GREATEST(live.game_summaries.house_wp_max, EXCLUDED.house_wp_max)",
+        ):
+            assert merged in body, merged
+
+    def test_rollup_deletes_only_the_rolled_up_games(self):
+        body = _function_body(
+            _strip_comments(LIVE_RETENTION.read_text()), "live.rollup_final_snapshots"
+        )
+        assert "WHERE l.status IN ('completed', 'final', 'closed')" in body
+        assert "l.captured_at < now() - make_interval(days => p_final_days)" in body
+        assert "DELETE FROM live.scoreboard_snapshots s WHERE s.game_id = ANY(v_games)" in body
+        # latest_snapshot keeps its row so a re-polled final game still dedups.
+        assert "DELETE FROM live.latest_snapshot" not in body
+
+    def test_api_view_joins_latest_snapshot(self):
+        sql = _strip_comments(LIVE_SCOREBOARD_VIEW.read_text())
+        assert "DISTINCT ON" not in sql
+        assert re.search(
+            r"FROM live\.latest_snapshot l\s+"
+            r"JOIN live\.scoreboard_snapshots s ON s\.id = l\.snapshot_id",
+            sql,
+        )
+        assert "WHERE l.captured_at > now() - INTERVAL '24 hours'" in sql
+
+    def test_api_view_header_is_one_comment_block(self):
+        header = LIVE_SCOREBOARD_VIEW.read_text().split("CREATE OR REPLACE VIEW", 1)[0]
+        lines = header.rstrip("\n").splitlines()
+        assert all(line.startswith("--") for line in lines)
+
+
+class _RollupConn:
+    def __init__(self, rolled_up=2):
+        self.rolled_up = rolled_up
+        self.executed = []
+        self.commits = 0
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return (self.rolled_up,)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestRollupFinalSnapshots:
+    def test_calls_the_rollup_and_commits(self, capsys):
+        conn = _RollupConn(rolled_up=4)
+
+        assert rollup_final_snapshots(conn, 3) == 4
+
+        assert conn.executed == [("SELECT live.rollup_final_snapshots(%s)", (3,))]
+        assert conn.commits == 1
+        assert "SCOREBOARD_ROLLUP games=4 final_days=3" in capsys.readouterr().out
+
+    @pytest.fixture
+    def one_shot(self, monkeypatch):
+        """main()'s single-poll path with the client, DB and poll stubbed."""
+        conn = _RollupConn()
+        rollups = []
+
+        class _Client:
+            def get(self, path, params=None):
+                return [{"id": 1}]
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(poll_scoreboard, "get_client", _Client)
+        monkeypatch.setattr(poll_scoreboard, "connect", lambda: conn)
+        monkeypatch.setattr(poll_scoreboard, "run", lambda conn, raw, dry_run: None)
+        monkeypatch.setattr(
+            poll_scoreboard,
+            "rollup_final_snapshots",
+            lambda c, days: rollups.append((c, days)),
+        )
+        return conn, rollups
+
+    def test_cli_defaults_to_the_retention_window(self, one_shot):
+        conn, rollups = one_shot
+        poll_scoreboard.main([])
+        assert FINAL_RETENTION_DAYS == 3
+        assert rollups == [(conn, FINAL_RETENTION_DAYS)]
+        assert conn.closed
+
+    def test_retention_days_flag(self, one_shot):
+        conn, rollups = one_shot
+        poll_scoreboard.main(["--retention-days", "7"])
+        assert rollups == [(conn, 7)]
+
+    def test_dry_run_skips_the_rollup(self, one_shot):
+        _conn, rollups = one_shot
+        poll_scoreboard.main(["--dry-run"])
+        assert rollups == []
@@ -2,6 +2,7 @@
 and monkeypatched run_source paths -- no live DB, no network.
 """
 
+import io
 import re
 from datetime import date, datetime, timedelta
 
@@ -10,7 +11,7 @@ import pytest
 import scripts.load_flat_files as load_flat_files
 import src.pipelines.sources.flat_files as flat_files_module
 from src.pipelines.sources.flat_files import REGISTRY, FlatFileSpec, StaleSnapshotError
-from src.pipelines.utils.file_fetcher import FetchedFile
+from src.pipelines.utils.file_fetcher import FetchedFile, Validators
 
 # ---------------------------------------------------------------------------
 # is_due truth table
@@ -95,7 +96,7 @@ class TestIsDueUnknownCadence:
 
 class TestArgParsing:
     def test_source_and_due_mutually_exclusive(self, monkeypatch):
-        monkeypatch.setattr(load_flat_files, "last_success", lambda *a, **k: None)
+        monkeypatch.setattr(load_flat_files, "last_successes", lambda *a, **k: {})
         with pytest.raises(SystemExit):
             load_flat_files.main(["--source", "massey", "--due"])
 
@@ -112,7 +113,7 @@ class TestArgParsing:
     def test_file_with_exactly_one_source_is_accepted_by_parser(self, monkeypatch):
         # Only checking the arg-validation gate doesn't reject this combo --
         # short-circuit before any fetch/DB work happens via --dry-run.
-        monkeypatch.setattr(load_flat_files, "last_success", lambda *a, **k: None)
+        monkeypatch.setattr(load_flat_files, "last_successes", lambda *a, **k: {})
         rc = load_flat_files.main(["--file", "somefile.csv", "--source", "massey", "--dry-run"])
         assert rc == 0
 
@@ -127,7 +128,7 @@ class TestDryRun:
         # gracefully rather than raising.
         monkeypatch.setattr(
             load_flat_files,
-            "last_success",
+            "last_successes",
             lambda *a, **k: (_ for _ in ()).throw(RuntimeError("no db creds")),
         )
 
@@ -146,7 +147,7 @@ class TestDryRun:
         monkeypatch.setattr(load_flat_files, "fetch_file", boom)
         monkeypatch.setattr(load_flat_files, "build_flat_file_source", boom)
         monkeypatch.setattr(load_flat_files, "record_load", boom)
-        monkeypatch.setattr(load_flat_files, "last_success", lambda *a, **k: None)
+        monkeypatch.setattr(load_flat_files, "last_successes", lambda *a, **k: {})
 
         rc = load_flat_files.main(["--dry-run"])
         assert rc == 0
@@ -157,7 +158,7 @@ class TestDryRun:
 # ---------------------------------------------------------------------------
 
 FAKE_FETCHED = FetchedFile(
-    content=b"raw-bytes",
+    body=io.BytesIO(b"raw-bytes"),
     sha256="deadbeef" * 8,
     source_url="https://example.com/data.csv",
 )
@@ -189,6 +190,69 @@ class TestRunSourceSkippedHash:
         assert kwargs["status"] == "skipped"
 
 
+class TestRunSourceNotModified:
+    def test_304_skips_hash_check_and_parse_and_records_skipped(self, monkeypatch):
+        validators = Validators(sha256="cafe" * 16, etag='"v7"')
+        not_modified = FetchedFile(
+            body=None,
+            sha256=validators.sha256,
+            source_url="https://example.com/data.csv",
+            etag='"v7"',
+        )
+        fetch_kwargs = {}
+
+        def fake_fetch(target, **kw):
+            fetch_kwargs.update(kw)
+            return not_modified
+
+        def boom(*a, **k):
+            raise AssertionError("a 304 must not hash-check or build a source")
+
+        monkeypatch.setattr(load_flat_files, "last_validators", lambda name, **k: validators)
+        monkeypatch.setattr(load_flat_files, "fetch_file", fake_fetch)
+        monkeypatch.setattr(load_flat_files, "already_loaded", boom)
+        monkeypatch.setattr(load_flat_files, "build_flat_file_source", boom)
+
+        record_calls = []
+        monkeypatch.setattr(
+            load_flat_files, "record_load", lambda *a, **k: record_calls.append((a, k))
+        )
+
+        spec = REGISTRY["nflverse_combine"]
+        result = load_flat_files.run_source(spec, season=2025, today=date(2025, 9, 1))
+
+        assert fetch_kwargs["validators"] is validators
+        assert result["status"] == "not_modified"
+        assert result["sha"] == validators.sha256
+        (args, kwargs) = record_calls[0]
+        assert args[1] == validators.sha256
+        assert kwargs["status"] == "skipped"
+        assert kwargs["etag"] == '"v7"'
+
+    def test_file_override_fetches_unconditionally(self, monkeypatch, tmp_path):
+        def boom(name, **k):
+            raise AssertionError("--file inputs have no validators to look up")
+
+        fetch_kwargs = {}
+
+        def fake_fetch(target, **kw):
+            fetch_kwargs.update(kw)
+            return FAKE_FETCHED
+
+        monkeypatch.setattr(load_flat_files, "last_validators", boom)
+        monkeypatch.setattr(load_flat_files, "fetch_file", fake_fetch)
+        monkeypatch.setattr(load_flat_files, "already_loaded", lambda *a, **k: True)
+        monkeypatch.setattr(load_flat_files, "record_load", lambda *a, **k: None)
+
+        spec = REGISTRY["sbr"]
+        result = load_flat_files.run_source(
+            spec, file_path=str(tmp_path / "odds.xlsx"), season=2025, today=date(2025, 9, 1)
+        )
+
+        assert fetch_kwargs["validators"] is None
+        assert result["status"] == "skipped_hash"
+
+
 class TestRunSourceStaleSnapshot:
     def test_stale_snapshot_maps_to_no_op_offseason(self, monkeypatch):
         monkeypatch.setattr(load_flat_files, "fetch_file", lambda target, **kw: FAKE_FETCHED)
@@ -290,6 +354,198 @@ class TestRunSourceGenericFailure:
         assert rc == 1
 
 
+# ---------------------------------------------------------------------------
+# Shared ledger connection
+# ---------------------------------------------------------------------------
+
+
+class _FakeConn:
+    def __init__(self):
+        self.closed = False
+        self.probes = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.probes += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestSharedLedgerConnection:
+    def test_one_connection_threaded_through_every_source_then_closed(self, monkeypatch):
+        conn = _FakeConn()
+        connects = []
+        monkeypatch.setattr(load_flat_files, "ledger_connect", lambda: connects.append(1) or conn)
+        seen = []
+
+        def fake_run_source(spec, **kw):
+            seen.append((spec.name, kw["conn"]))
+            return {"source": spec.name, "status": "loaded", "rows": 0, "duration_s": 0.0}
+
+        monkeypatch.setattr(load_flat_files, "run_source", fake_run_source)
+
+        rc = load_flat_files.main(["--source", "massey", "--source", "nflverse_draft"])
+
+        assert rc == 0
+        assert connects == [1]
+        assert seen == [("massey", conn), ("nflverse_draft", conn)]
+        assert conn.probes == 2  # health-checked before each source
+        assert conn.closed
+
+    def test_dropped_connection_is_replaced_between_sources(self, monkeypatch):
+        first, second = _FakeConn(), _FakeConn()
+        monkeypatch.setattr(load_flat_files, "ledger_connect", lambda: first)
+
+        def fake_ensure_connected(conn):
+            if conn is first:
+                first.close()
+                return second
+            return conn
+
+        monkeypatch.setattr(load_flat_files, "ledger_ensure_connected", fake_ensure_connected)
+        seen = []
+
+        def fake_run_source(spec, **kw):
+            seen.append(kw["conn"])
+            return {"source": spec.name, "status": "loaded", "rows": 0, "duration_s": 0.0}
+
+        monkeypatch.setattr(load_flat_files, "run_source", fake_run_source)
+
+        rc = load_flat_files.main(["--source", "massey", "--source", "nflverse_draft"])
+
+        assert rc == 0
+        assert seen == [second, second]
+        assert second.closed  # the replacement is the one closed at the end
+
+    def test_failed_reconnect_falls_back_to_per_call_connections(self, monkeypatch):
+        conn = _FakeConn()
+        monkeypatch.setattr(load_flat_files, "ledger_connect", lambda: conn)
+        monkeypatch.setattr(
+            load_flat_files,
+            "ledger_ensure_connected",
+            lambda c: (_ for _ in ()).throw(RuntimeError("db unreachable")),
+        )
+        seen = []
+
+        def fake_run_source(spec, **kw):
+            seen.append(kw["conn"])
+            return {"source": spec.name, "status": "loaded", "rows": 0, "duration_s": 0.0}
+
+        monkeypatch.setattr(load_flat_files, "run_source", fake_run_source)
+
+        rc = load_flat_files.main(["--source", "massey", "--source", "nflverse_draft"])
+
+        assert rc == 0
+        assert seen == [None, None]
+
+    def test_connection_dropped_during_a_load_does_not_fail_the_source(self, monkeypatch):
+        """The pooler can drop the shared connection while pipeline.run()
+        holds it idle; the post-load ledger write then goes through a
+        connection of its own instead of failing the load."""
+        conn = _FakeConn()
+        monkeypatch.setattr(load_flat_files, "last_validators", lambda *a, **k: None)
+        monkeypatch.setattr(load_flat_files, "fetch_file", lambda target, **kw: FAKE_FETCHED)
+        monkeypatch.setattr(load_flat_files, "already_loaded", lambda *a, **k: False)
+        monkeypatch.setattr(load_flat_files, "build_flat_file_source", lambda *a: object())
+
+        class _NormalizeInfo:
+            row_counts = {"draft": 5}
+
+        class _Trace:
+            last_normalize_info = _NormalizeInfo()
+
+        class _Pipeline:
+            last_trace = _Trace()
+
+            def run(self, source_obj):
+                conn.closed = True  # dropped mid-load
+
+        monkeypatch.setattr(load_flat_files.dlt, "pipeline", lambda **kw: _Pipeline())
+        monkeypatch.setattr(load_flat_files, "ledger_is_connected", lambda c: not c.closed)
+        record_calls = []
+
+        def fake_record_load(name, sha, **kw):
+            if kw["conn"] is not None and kw["conn"].closed:
+                raise RuntimeError("connection already closed")
+            record_calls.append(kw)
+
+        monkeypatch.setattr(load_flat_files, "record_load", fake_record_load)
+
+        result = load_flat_files.run_source(
+            REGISTRY["nflverse_draft"], season=2025, today=date(2025, 9, 1), conn=conn
+        )
+
+        assert result["status"] == "loaded"
+        assert [(k["status"], k["conn"]) for k in record_calls] == [("loaded", None)]
+
+    def test_live_connection_is_kept_for_the_ledger_writes(self, monkeypatch):
+        conn = _FakeConn()
+        monkeypatch.setattr(load_flat_files, "last_validators", lambda *a, **k: None)
+        monkeypatch.setattr(load_flat_files, "fetch_file", lambda target, **kw: FAKE_FETCHED)
+        monkeypatch.setattr(load_flat_files, "already_loaded", lambda *a, **k: True)
+        record_calls = []
+        monkeypatch.setattr(
+            load_flat_files, "record_load", lambda *a, **k: record_calls.append(k["conn"])
+        )
+
+        result = load_flat_files.run_source(
+            REGISTRY["nflverse_draft"], season=2025, today=date(2025, 9, 1), conn=conn
+        )
+
+        assert result["status"] == "skipped_hash"
+        assert record_calls == [conn]
+        assert conn.probes == 1  # checked once, after the download
+
+    def test_due_reads_every_last_success_in_one_call(self, monkeypatch):
+        conn = _FakeConn()
+        monkeypatch.setattr(load_flat_files, "ledger_connect", lambda: conn)
+        bulk_calls = []
+
+        def fake_last_successes(names, conn=None):
+            bulk_calls.append((list(names), conn))
+            return {name: datetime.now() for name in names}  # everything fresh
+
+        monkeypatch.setattr(load_flat_files, "last_successes", fake_last_successes)
+        monkeypatch.setattr(
+            load_flat_files,
+            "run_source",
+            lambda spec, **kw: (_ for _ in ()).throw(AssertionError("nothing is due")),
+        )
+
+        rc = load_flat_files.main(["--due"])
+
+        assert rc == 0
+        assert bulk_calls == [(list(REGISTRY), conn)]
+
+    def test_no_db_falls_back_to_per_call_connections(self, monkeypatch):
+        monkeypatch.setattr(
+            load_flat_files,
+            "ledger_connect",
+            lambda: (_ for _ in ()).throw(RuntimeError("no db creds")),
+        )
+        seen = []
+
+        def fake_run_source(spec, **kw):
+            seen.append(kw["conn"])
+            return {"source": spec.name, "status": "failed", "rows": 0, "duration_s": 0.0}
+
+        monkeypatch.setattr(load_flat_files, "run_source", fake_run_source)
+
+        rc = load_flat_files.main(["--source", "massey"])
+
+        assert rc == 1
+        assert seen == [None]
+
+
 # ---------------------------------------------------------------------------
 # Gate-line format
 # ---------------------------------------------------------------------------
@@ -27,6 +27,7 @@ MARTS_VIEWS = [
     "play_epa",
     "player_comparison",
     "player_game_epa",
+    "player_search",
     "player_season_epa",
     "recruiting_class",
     "recruiting_roi",
@@ -430,6 +430,39 @@ class TestPlayerSearch:
         )
         assert len(rows) == 0, "Gibberish query should return no results"
 
+    def test_match_uses_trigram_index(self, db_conn):
+        """The RPC's name match must be served by marts.player_search's GIN
+        trigram index, not a scan of the projection."""
+        with db_conn.cursor() as cur:
+            cur.execute("SET LOCAL enable_seqscan = off")
+            cur.execute(
+                "EXPLAIN SELECT player_id FROM marts.player_search "
+                "WHERE search_name OPERATOR(public.%%) lower(%s)",
+                ("Bryce Young",),
+            )
+            plan = "\n".join(r[0] for r in cur.fetchall())
+        db_conn.rollback()
+        assert "Bitmap Index Scan" in plan, plan
+
+    def test_recruit_rating_is_best_recruits_row(self, db_conn):
+        """The precomputed recruit_rating is the athlete's highest-rated
+        recruiting.recruits row (what the RPC's old LATERAL top-1 picked)."""
+        mismatches = _fetch_count(
+            db_conn,
+            """
+            SELECT COUNT(*)
+            FROM marts.player_search ps
+            JOIN core.roster r ON r.id::text = ps.player_id
+            WHERE ps.recruit_rating IS DISTINCT FROM (
+                SELECT rr.rating FROM recruiting.recruits rr
+                WHERE rr.athlete_id = r.id
+                ORDER BY rr.rating DESC NULLS LAST
+                LIMIT 1
+            )
+            """,
+        )
+        assert mismatches == 0
+
 
 # ---------------------------------------------------------------------------
 # api.player_comparison
@@ -4,6 +4,7 @@ Tests cover matching logic, SQL escaping, fixture extraction, and end-to-end
 CLI runs.
 """
 
+import difflib
 import re
 import subprocess
 from pathlib import Path
@@ -11,6 +12,7 @@ from pathlib import Path
 import pytest
 
 from scripts.seed_team_xwalk import (
+    CanonicalIndex,
     escape_sql,
     expand_abbrevs,
     generate_seed_sql,
@@ -165,6 +167,129 @@ class TestMatchTeam:
         assert match_type == "exact"
 
 
+def _brute_force_match(source_name, canonical_names, min_confidence=0.85):
+    """Reference matcher: every tier scans every canonical name."""
+    norm_source = normalize_name(source_name)
+    for cfbd_name in canonical_names:
+        if normalize_name(cfbd_name) == norm_source:
+            return (cfbd_name, 1.0, "exact")
+    expanded_source = expand_abbrevs(norm_source)
+    for cfbd_name in canonical_names:
+        if expand_abbrevs(normalize_name(cfbd_name)) == expanded_source:
+            return (cfbd_name, 0.95, "abbrev")
+    best_match, best_ratio = None, 0.0
+    for cfbd_name in canonical_names:
+        expanded_cfbd = expand_abbrevs(normalize_name(cfbd_name))
+        ratio = difflib.SequenceMatcher(None, expanded_source, expanded_cfbd).ratio()
+        if ratio > best_ratio:
+            best_match, best_ratio = cfbd_name, ratio
+    if best_match and best_ratio >= min_confidence:
+        return (best_match, best_ratio, "fuzzy")
+    if best_match and best_ratio > 0:
+        return (best_match, best_ratio, "unmatched")
+    return (None, 0.0, "unmatched")
+
+
+CANONICAL_SAMPLE = [
+    "Ohio State",
+    "Ohio",
+    "Miami",
+    "Miami (OH)",
+    "Michigan",
+    "Michigan State",
+    "Central Michigan",
+    "Western Michigan",
+    "Eastern Michigan",
+    "Louisiana",
+    "Louisiana Monroe",
+    "Louisiana Tech",
+    "Texas A&M",
+    "Texas",
+    "Texas State",
+    "Texas Tech",
+    "UTEP",
+    "UTSA",
+    "San José State",
+    "San Diego State",
+    "Southern Mississippi",
+    "Mississippi State",
+    "Ole Miss",
+    "North Carolina",
+    "NC State",
+    "South Carolina",
+    "Coastal Carolina",
+    "East Carolina",
+    "Appalachian State",
+    "BYU",
+]
+
+
+class TestCanonicalIndex:
+    """CanonicalIndex must return exactly what a full scan returns."""
+
+    @pytest.mark.parametrize(
+        "source_name",
+        [
+            "Ohio St",
+            "OHIO STATE",
+            "Ohoi State",
+            "Miami-Ohio",
+            "Miami Fla",
+            "Mich St.",
+            "C Michigan",
+            "W. Michigan",
+            "UL Monroe",
+            "Louisiana-Lafayette",
+            "Texas A&amp;M",
+            "Texas-San Antonio",
+            "San Jose St",
+            "Southern Miss",
+            "N Carolina St",
+            "App State",
+            "Brigham Young",
+            "XYZ University",
+            "qq",
+            "",
+        ],
+    )
+    def test_matches_full_scan(self, source_name):
+        """Top match, confidence and match type equal the brute-force scan."""
+        index = CanonicalIndex(CANONICAL_SAMPLE)
+        assert match_team(source_name, CANONICAL_SAMPLE, index=index) == _brute_force_match(
+            source_name, CANONICAL_SAMPLE
+        )
+
+    def test_tie_keeps_first_in_list_order(self):
+        """Equal ratios resolve to the earliest canonical name, as a full scan does."""
+        canonical = ["Abcx", "Abcy", "Abcz"]
+        for order in (canonical, list(reversed(canonical))):
+            expected = _brute_force_match("abcw", order)
+            assert match_team("abcw", order) == expected
+            assert expected[0] == order[0]
+
+    def test_first_duplicate_wins_exact_and_abbrev(self):
+        """Names that normalize alike resolve to the first listed, for tiers 1 and 2."""
+        canonical = ["Ohio State", "OHIO STATE", "Ohio St"]
+        index = CanonicalIndex(canonical)
+        assert match_team("ohio state", canonical, index=index) == ("Ohio State", 1.0, "exact")
+        assert match_team("Ohio St.", canonical, index=index) == ("Ohio State", 0.95, "abbrev")
+
+    def test_no_shared_grams_still_scored(self):
+        """A name sharing no token or trigram with the source is still found by the sweep."""
+        canonical = ["Zzzz", "Xhoex"]
+        assert match_team("ohee", canonical) == _brute_force_match("ohee", canonical)
+        assert match_team("ohee", canonical)[0] == "Xhoex"
+
+    def test_generated_names_match_full_scan(self):
+        """Perturbed spellings of every canonical name score as a full scan does."""
+        index = CanonicalIndex(CANONICAL_SAMPLE)
+        for name in CANONICAL_SAMPLE:
+            for source_name in (name[1:], name[:-1], name[::-1], name.replace("a", "e")):
+                assert match_team(source_name, CANONICAL_SAMPLE, 0.85, index=index) == (
+                    _brute_force_match(source_name, CANONICAL_SAMPLE)
+                ), source_name
+
+
 class TestGenerateSeedSql:
     """Test SQL generation."""
 
@@ -28,19 +28,24 @@ from scripts.simulate_season import (  # noqa: E402
     DEFAULT_STRENGTH_SHARE,
     MIN_SLATE_COHORT,
     STANDARD_SLATE_GAMES,
+    CrnSeasonSimulation,
     assign_sos_ranks,
     bowls_apply,
     build_projection_row,
     conference_title_probs,
     expected_slate_games,
     normalize_strength_share,
+    resume_crn_simulation,
     schedule_strength,
+    simulate_win_counts,
     simulate_wins,
     standard_slate,
     strength_sd,
     summarize,
+    summarize_win_counts,
     team_classifications,
     win_distribution,
+    win_distribution_from_counts,
 )
 
 
@@ -566,6 +571,338 @@ class TestCorrelatedDraws:
         assert np.all(sim["conf_wins"]["A"] <= sim["wins"]["A"])
 
 
+def _reference_wins(games, n_sims, sigma, seed, strength_share):
+    """The pre-chunking per-game loop, kept verbatim as the oracle for the
+    vectorized scatter-adds."""
+    teams = sorted({g["home_team"] for g in games} | {g["away_team"] for g in games})
+    index = {t: i for i, t in enumerate(teams)}
+    wins = np.zeros((len(teams), n_sims), dtype=np.int32)
+    conf = np.zeros((len(teams), n_sims), dtype=np.int32)
+    pending = []
+    for g in games:
+        if g["completed"]:
+            w = index[g["home_team"] if g["home_win"] else g["away_team"]]
+            wins[w] += 1
+            conf[w] += bool(g.get("conference_game"))
+        elif g.get("expected_home_margin") is not None:
+            pending.append(g)
+    rng = np.random.default_rng(seed)
+    tau, game_sd = strength_sd(sigma, strength_share)
+    u = rng.normal(0.0, tau, size=(len(teams), n_sims)) if tau > 0 else None
+    eps = rng.normal(0.0, game_sd, size=(len(pending), n_sims))
+    for row, g in enumerate(pending):
+        h, a = index[g["home_team"]], index[g["away_team"]]
+        margin = eps[row]
+        margin += g["expected_home_margin"]
+        if u is not None:
+            margin += u[h]
+            margin -= u[a]
+        won = margin > 0.0
+        wins[h] += won
+        wins[a] += ~won
+        if g.get("conference_game"):
+            conf[h] += won
+            conf[a] += ~won
+    return {t: wins[index[t]] for t in teams}, {t: conf[index[t]] for t in teams}
+
+
+class TestChunkedSimulation:
+    """simulate_wins' memory-bounded mode: blocks of ``chunk_size`` sims from
+    spawned seeds, optionally spread over processes."""
+
+    @staticmethod
+    def _league(n_teams=24, n_games=140, seed=0):
+        rng = np.random.default_rng(seed)
+        games = []
+        for k in range(n_games):
+            h, a = rng.choice(n_teams, size=2, replace=False)
+            completed = k % 4 == 0
+            games.append(
+                {
+                    "home_team": f"T{h:02d}",
+                    "away_team": f"T{a:02d}",
+                    "completed": completed,
+                    "home_win": bool(rng.random() < 0.5),
+                    "expected_home_margin": None if k % 17 == 0 else float(rng.normal(0, 9)),
+                    "conference_game": k % 3 != 0,
+                }
+            )
+        return games
+
+    @pytest.mark.parametrize("share", [0.0, 0.15])
+    def test_default_path_is_bit_identical_to_the_per_game_loop(self, share):
+        """The unchunked default must keep reproducing every projection
+        already written; only the accumulation changed."""
+        games = self._league()
+        sim = simulate_wins(games, 700, 17.0, seed=21, strength_share=share)
+        ref_wins, ref_conf = _reference_wins(games, 700, 17.0, 21, share)
+        for t in ref_wins:
+            assert np.array_equal(sim["wins"][t], ref_wins[t]), t
+            assert np.array_equal(sim["conf_wins"][t], ref_conf[t]), t
+
+    def test_chunked_results_do_not_depend_on_worker_count(self):
+        games = self._league()
+        serial = simulate_wins(games, 1000, 17.0, seed=3, chunk_size=300)
+        spread = simulate_wins(games, 1000, 17.0, seed=3, chunk_size=300, workers=2)
+        for t in serial["wins"]:
+            assert np.array_equal(serial["wins"][t], spread["wins"][t]), t
+            assert np.array_equal(serial["conf_wins"][t], spread["conf_wins"][t]), t
+
+    def test_chunked_is_reproducible_and_fills_every_sim(self):
+        """n_sims need not be a multiple of chunk_size: the short last block
+        must still be simulated, not left at the completed-games baseline."""
+        games = [_game("A", f"O{i}", margin=0.0) for i in range(10)]
+        a = simulate_wins(games, 1050, 18.0, seed=9, chunk_size=100)["wins"]["A"]
+        b = simulate_wins(games, 1050, 18.0, seed=9, chunk_size=100)["wins"]["A"]
+        assert len(a) == 1050
+        assert np.array_equal(a, b)
+        assert a[1000:].std() > 0
+
+    def test_chunked_agrees_with_the_default_in_distribution(self):
+        games = [_game("A", f"O{i}", margin=3.0) for i in range(12)]
+        one = simulate_wins(games, 20000, 18.0, seed=5)["wins"]["A"]
+        chunked = simulate_wins(games, 20000, 18.0, seed=5, chunk_size=2500)["wins"]["A"]
+        assert float(np.mean(chunked)) == pytest.approx(float(np.mean(one)), abs=0.1)
+        assert float(np.std(chunked)) == pytest.approx(float(np.std(one)), abs=0.1)
+
+    def test_completed_games_are_not_re_rolled_in_chunks(self):
+        games = [
+            _game("A", "B", completed=True, home_win=True),
+            _game("A", "C", completed=True, home_win=True),
+            _game("A", "D", margin=-50.0),
+        ]
+        sim = simulate_wins(games, 500, 1.0, seed=1, chunk_size=64)
+        assert np.all(sim["wins"]["A"] == 2)
+        assert np.all(sim["conf_wins"]["A"] <= sim["wins"]["A"])
+
+    def test_non_positive_chunk_size_is_rejected(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            simulate_wins([_game("A", "B", margin=1.0)], 10, 18.0, chunk_size=0)
+
+
+class TestWinCounts:
+    """simulate_win_counts: the same draws as simulate_wins, reduced to
+    per-team counts inside the block loop."""
+
+    _league = staticmethod(TestChunkedSimulation._league)
+
+    @staticmethod
+    def _conferences(games):
+        return {t: f"C{int(t[1:]) % 3}" for g in games for t in (g["home_team"], g["away_team"])}
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"chunk_size": 128}, {"chunk_size": 128, "workers": 2}, {"strength_share": 0.0}],
+    )
+    def test_counts_and_titles_match_the_per_sim_tallies(self, kwargs):
+        games = self._league()
+        conf = self._conferences(games)
+        full = simulate_wins(games, 600, 17.0, seed=4, **kwargs)
+        counted = simulate_win_counts(games, 600, 17.0, seed=4, conf_by_team=conf, **kwargs)
+
+        assert counted["games_simulated"] == full["games_simulated"]
+        assert counted["conf_games"] == full["conf_games"]
+        for t, wins in full["wins"].items():
+            hist = counted["win_counts"][t]
+            assert len(hist) == max(full["games_simulated"].values()) + 1
+            assert np.array_equal(hist[: wins.max() + 1], np.bincount(wins)), t
+            assert not hist[wins.max() + 1 :].any()
+
+        titles = conference_title_probs(full["conf_wins"], conf, full["conf_games"])
+        assert counted["conf_title_prob"].keys() == titles.keys()
+        for t, p in titles.items():
+            assert counted["conf_title_prob"][t] == pytest.approx(p, abs=1e-12), t
+
+    def test_nothing_left_to_draw(self):
+        games = [
+            _game("A", "B", completed=True, home_win=True, conference_game=True),
+            _game("B", "C", completed=True, home_win=True, conference_game=True),
+        ]
+        conf = {"A": "X", "B": "X", "C": "X"}
+        counted = simulate_win_counts(games, 50, 18.0, conf_by_team=conf)
+        assert list(counted["win_counts"]["B"]) == [0, 50, 0]
+        full = simulate_wins(games, 50, 18.0)
+        titles = conference_title_probs(full["conf_wins"], conf, full["conf_games"])
+        assert counted["conf_title_prob"] == titles == {"A": 1.0, "B": 0.0, "C": 0.0}
+
+    def test_non_positive_chunk_size_is_rejected(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            simulate_win_counts([_game("A", "B", margin=1.0)], 10, 18.0, chunk_size=0)
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 7, 10, 11, 100, 1001, 9999, 10001])
+    def test_summaries_are_identical_to_the_per_sim_path(self, n):
+        wins = np.random.default_rng(n).integers(0, 13, size=n).astype("int16")
+        counts = np.bincount(wins)
+        for bowl in (True, False):
+            assert summarize_win_counts(counts, 12, bowl) == summarize(wins, 12, bowl)
+        assert win_distribution_from_counts(counts, 12) == win_distribution(wins, 12)
+
+    def test_projection_row_from_counts_matches_row_from_wins(self):
+        games = [_game("A", f"O{i}", margin=2.0) for i in range(12)]
+        sim = simulate_wins(games, 400, 18.0, seed=3)
+        args = (games, {}, "SEC", "fitted_v1", 400, 18.0, None, 12, 0.15)
+        from_wins = build_projection_row("A", sim["wins"]["A"], *args, classification="fbs")
+        from_counts = build_projection_row(
+            "A",
+            None,
+            *args,
+            classification="fbs",
+            win_counts=np.bincount(sim["wins"]["A"]),
+        )
+        assert from_counts == from_wins
+
+
+class TestCrnIncrementalSimulation:
+    """CrnSeasonSimulation: common random numbers, patched per changed game."""
+
+    @staticmethod
+    def _schedule():
+        games = TestChunkedSimulation._league(n_teams=16, n_games=90, seed=4)
+        for i, g in enumerate(games):
+            g["game_id"] = 500 + i
+        return games
+
+    @staticmethod
+    def _assert_same(a, b):
+        assert a["games_simulated"] == b["games_simulated"]
+        assert a["conf_games"] == b["conf_games"]
+        assert a["wins"].keys() == b["wins"].keys()
+        for t in a["wins"]:
+            assert np.array_equal(a["wins"][t], b["wins"][t]), t
+            assert np.array_equal(a["conf_wins"][t], b["conf_wins"][t]), t
+
+    def _updated(self, games):
+        """A week later: some games final, one prediction moved, one game
+        dropped from the schedule and one added."""
+        later = [dict(g) for g in games if g["game_id"] != 520]
+        for g in later[:12]:
+            if not g["completed"]:
+                g.update(completed=True, home_win=True)
+        later[40]["expected_home_margin"] = 4.5
+        later.append(dict(games[0], game_id=999, home_team="New", completed=False))
+        later[-1]["expected_home_margin"] = -2.0
+        return later
+
+    def test_patched_tallies_equal_a_fresh_simulation(self):
+        """The property that makes --incremental safe: patch order does not
+        matter, only the final schedule does."""
+        games = self._schedule()
+        sim = CrnSeasonSimulation(400, 17.0, seed=8)
+        sim.apply(games)
+        sim.apply(self._updated(games))
+        fresh = CrnSeasonSimulation(400, 17.0, seed=8)
+        fresh.apply(self._updated(games))
+        self._assert_same(sim.result(), fresh.result())
+
+    def test_only_changed_games_are_re_evaluated(self):
+        games = self._schedule()
+        sim = CrnSeasonSimulation(200, 17.0, seed=8)
+        assert len(sim.apply(games)) == len(games)
+        assert sim.apply(games) == []
+        later = [dict(g) for g in games]
+        later[3]["expected_home_margin"] = 11.0
+        assert sim.apply(later) == [later[3]["game_id"]]
+
+    def test_unchanged_games_keep_their_draws(self):
+        """No run-to-run jitter: a team none of whose games changed keeps its
+        exact win distribution while the rest of the league moves."""
+        games = [
+            {**_game("A", "B", margin=1.0), "game_id": 1},
+            {**_game("C", "D", margin=-3.0), "game_id": 2},
+        ]
+        sim = CrnSeasonSimulation(1000, 18.0, seed=2)
+        sim.apply(games)
+        before = sim.result()["wins"]["A"]
+        games[1]["expected_home_margin"] = 6.0
+        sim.apply(games)
+        assert np.array_equal(sim.result()["wins"]["A"], before)
+
+    def test_a_prediction_refresh_on_a_finished_game_is_not_a_change(self):
+        game = {**_game("A", "B", completed=True, home_win=False, margin=3.0), "game_id": 1}
+        sim = CrnSeasonSimulation(50, 18.0)
+        sim.apply([game])
+        assert sim.apply([dict(game, expected_home_margin=9.0)]) == []
+        assert np.all(sim.result()["wins"]["B"] == 1)
+
+    def test_counts_follow_simulate_wins_rules(self):
+        """Completed games are not re-rolled and unscored games are skipped,
+        exactly as in simulate_wins, so games_simulated agrees."""
+        games = self._schedule()
+        sim = CrnSeasonSimulation(300, 17.0, seed=1)
+        sim.apply(games)
+        ours, theirs = sim.result(), simulate_wins(games, 300, 17.0, seed=1)
+        assert ours["games_simulated"] == theirs["games_simulated"]
+        assert ours["conf_games"] == theirs["conf_games"]
+        for t in theirs["wins"]:
+            assert np.all(ours["conf_wins"][t] <= ours["wins"][t])
+
+    def test_agrees_with_simulate_wins_in_distribution(self):
+        games = [{**_game("A", f"O{i}", margin=3.0), "game_id": i} for i in range(12)]
+        sim = CrnSeasonSimulation(20000, 18.0, seed=5)
+        sim.apply(games)
+        crn = sim.result()["wins"]["A"]
+        one = simulate_wins(games, 20000, 18.0, seed=5)["wins"]["A"]
+        assert float(np.mean(crn)) == pytest.approx(float(np.mean(one)), abs=0.1)
+        assert float(np.std(crn)) == pytest.approx(float(np.std(one)), abs=0.1)
+
+    def test_state_round_trip_resumes_exactly(self):
+        games = self._schedule()
+        sim = CrnSeasonSimulation(333, 17.0, seed=8, strength_share=0.2)
+        sim.apply(games)
+        params, rows = sim.export_state()
+        restored = CrnSeasonSimulation.from_state(params, rows)
+        assert restored.params() == sim.params()
+        self._assert_same(restored.result(), sim.result())
+        assert restored.apply(games) == []
+        restored.apply(self._updated(games))
+        sim.apply(self._updated(games))
+        self._assert_same(restored.result(), sim.result())
+
+    def test_params_identify_the_stream(self):
+        """simulate_incremental rebuilds whenever these differ."""
+        a = CrnSeasonSimulation(100, 17.0, seed=1)
+        assert a.params() == CrnSeasonSimulation(100, 17.0, seed=1).params()
+        assert a.params() != CrnSeasonSimulation(100, 17.5, seed=1).params()
+        assert a.params() != CrnSeasonSimulation(100, 17.0, seed=2).params()
+        assert a.params() != CrnSeasonSimulation(100, 17.0, 1, strength_share=0.3).params()
+
+    def test_resume_pins_sigma_so_new_results_patch(self):
+        """A finished week moves the measured sigma; the stored state keeps its
+        own, so only the newly finished games are re-evaluated."""
+        games = self._schedule()
+        stored = CrnSeasonSimulation(200, 17.0, seed=8)
+        stored.apply(games)
+        sim, rebuilt = resume_crn_simulation(stored, 200, 17.3, 8, DEFAULT_STRENGTH_SHARE)
+        assert sim is stored and not rebuilt
+        assert sim.sigma == 17.0
+        assert sim.result()["sigma"] == 17.0
+
+        later = [dict(g) for g in games]
+        finished = [g for g in later if not g["completed"]][:3]
+        for g in finished:
+            g.update(completed=True, home_win=False)
+        assert sorted(sim.apply(later)) == sorted(g["game_id"] for g in finished)
+
+    def test_resume_rebuilds_at_the_measured_sigma(self):
+        stored = CrnSeasonSimulation(200, 17.0, seed=8)
+        for kwargs in (
+            {"reset_sigma": True},
+            {"strength_share": 0.3},
+            {"n_sims": 400},
+            {"seed": 9},
+        ):
+            args = {"n_sims": 200, "seed": 8, "strength_share": DEFAULT_STRENGTH_SHARE}
+            reset = kwargs.pop("reset_sigma", False)
+            args.update(kwargs)
+            sim, rebuilt = resume_crn_simulation(
+                stored, args["n_sims"], 17.3, args["seed"], args["strength_share"], reset
+            )
+            assert rebuilt and sim is not stored
+            assert sim.sigma == 17.3
+        sim, rebuilt = resume_crn_simulation(None, 200, 17.3, 8, DEFAULT_STRENGTH_SHARE)
+        assert rebuilt and sim.sigma == 17.3
+
+
 class TestRowContractCoverage:
     """build_projection_row and _ROW_COLUMNS must not drift apart.
 
@@ -210,3 +210,99 @@ def test_line_snapshots_resource_hash_differs_on_spread_and_normalizes_none():
         results_again = list(line_snapshots_resource(years=[2024]))
 
         assert results_again[0]["line_hash"] == results[0]["line_hash"]
+
+
+def test_line_snapshots_resource_writes_full_rows_only_for_moved_lines():
+    """A line whose hash matches the known baseline gets a narrow confirm row
+    (routed to line_snapshot_confirms), not another full snapshot."""
+    from src.pipelines.sources.betting import line_snapshots_resource
+
+    def make_line(provider, spread):
+        return {
+            "provider": provider,
+            "spread": spread,
+            "formattedSpread": None,
+            "overUnder": None,
+            "homeMoneyline": None,
+            "awayMoneyline": None,
+        }
+
+    game = {
+        "id": 30,
+        "season": 2024,
+        "week": 5,
+        "homeTeam": "Oregon",
+        "awayTeam": "Ohio State",
+        "homeScore": None,
+        "awayScore": None,
+        "lines": [make_line("consensus", -3.0), make_line("Bovada", -3.5)],
+    }
+
+    with (
+        patch("src.pipelines.sources.betting.get_client") as mock_get_client,
+        patch("src.pipelines.sources.betting.make_request") as mock_make_request,
+    ):
+        mock_get_client.return_value = MagicMock()
+        mock_make_request.return_value = [game]
+
+        baseline = {
+            (r["game_id"], r["provider"]): r["line_hash"]
+            for r in line_snapshots_resource(years=[2024])
+        }
+        # Bovada moves to -4; consensus holds.
+        game["lines"][1] = make_line("Bovada", -4.0)
+        results = list(line_snapshots_resource(years=[2024], known_hashes=baseline))
+
+    by_provider = {r["provider"]: r for r in results}
+    assert set(by_provider["consensus"]) == {"captured_at", "game_id", "provider", "line_hash"}
+    assert by_provider["consensus"]["line_hash"] == baseline[(30, "consensus")]
+    assert by_provider["Bovada"]["spread"] == -4.0
+    assert by_provider["Bovada"]["line_hash"] != baseline[(30, "Bovada")]
+
+
+def test_run_betting_pipeline_deltas_against_current_lines_then_compacts():
+    from src.pipelines.run import _LINE_COMPACT_QUERY, run_betting_pipeline
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.__iter__.return_value = iter([(30, "consensus", "abc")])
+    cur.fetchone.return_value = (2,)
+
+    with (
+        patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
+        patch("psycopg2.connect", return_value=conn),
+        patch("src.pipelines.run.dlt.pipeline", return_value=MagicMock()),
+        patch("src.pipelines.run.betting_source") as mock_source,
+    ):
+        run_betting_pipeline(years=[2024])
+
+    assert mock_source.call_args.kwargs["known_line_hashes"] == {(30, "consensus"): "abc"}
+    cur.execute.assert_any_call(_LINE_COMPACT_QUERY)
+
+
+def test_run_betting_pipeline_without_interval_tables_snapshots_everything():
+    """Before migration 055 (or the first load) there is no baseline and no
+    compaction function: every line is written in full, nothing raises."""
+    import psycopg2.errors
+
+    from src.pipelines.run import _LINE_COMPACT_QUERY, run_betting_pipeline
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+
+    def execute(sql, params=None):
+        if sql == _LINE_COMPACT_QUERY:
+            raise psycopg2.errors.UndefinedFunction()
+        raise psycopg2.errors.UndefinedTable()
+
+    cur.execute.side_effect = execute
+
+    with (
+        patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
+        patch("psycopg2.connect", return_value=conn),
+        patch("src.pipelines.run.dlt.pipeline", return_value=MagicMock()),
+        patch("src.pipelines.run.betting_source") as mock_source,
+    ):
+        run_betting_pipeline(years=[2024])
+
+    assert mock_source.call_args.kwargs["known_line_hashes"] == {}
@@ -8,6 +8,8 @@ source is game-id-driven instead of year-driven like every other metrics.py
 resource.
 """
 
+import re
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -214,7 +216,7 @@ class TestRunMetricsWpPipelineBatching:
         mock_pipeline.run.return_value = "load-info"
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
             patch("src.pipelines.run.metrics_wp_source") as mock_source,
@@ -236,7 +238,7 @@ class TestRunMetricsWpPipelineBatching:
         mock_pipeline = MagicMock()
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
             patch("src.pipelines.run.metrics_wp_source") as mock_source,
@@ -262,7 +264,7 @@ class TestRunMetricsWpPipelineBatching:
         mock_pipeline = MagicMock()
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
             patch("src.pipelines.run.metrics_wp_source") as mock_source,
@@ -281,7 +283,7 @@ class TestRunMetricsWpPipelineBatching:
         mock_pipeline = MagicMock()
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
         ):
@@ -292,6 +294,107 @@ class TestRunMetricsWpPipelineBatching:
         mock_pipeline.run.assert_not_called()
 
 
+class TestRunMetricsWpPipelinePacking:
+    """Readers consume metrics.win_probability_game (migration 054), so every
+    run repacks the seasons it covered."""
+
+    def test_repacks_requested_seasons_after_loading(self):
+        from src.pipelines.run import _METRICS_WP_PACK_QUERY, run_metrics_wp_pipeline
+
+        conn = _mock_conn([(1, 2024)], existing_rows=[])
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.return_value = (1,)
+
+        with (
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
+            patch("psycopg2.connect", return_value=conn),
+            patch("src.pipelines.run.dlt.pipeline", return_value=MagicMock()),
+            patch("src.pipelines.run.metrics_wp_source"),
+        ):
+            result = run_metrics_wp_pipeline(seasons=[2024], batch_size=50)
+
+        cur.execute.assert_any_call(_METRICS_WP_PACK_QUERY, ([2024],))
+        assert result["packed"] == 1
+
+    def test_nothing_to_load_still_repacks(self):
+        """A pack that failed on an earlier run is retried by the next one."""
+        from src.pipelines.run import _METRICS_WP_PACK_QUERY, run_metrics_wp_pipeline
+
+        conn = _mock_conn([(1, 2024)], existing_rows=[(1,)])
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.return_value = (1,)
+
+        with (
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
+            patch("psycopg2.connect", return_value=conn),
+        ):
+            result = run_metrics_wp_pipeline(seasons=[2024], batch_size=50)
+
+        cur.execute.assert_any_call(_METRICS_WP_PACK_QUERY, ([2024],))
+        assert result["packed"] == 1
+
+    def test_missing_pack_function_is_logged_not_raised(self):
+        import psycopg2.errors
+
+        from src.pipelines.run import _METRICS_WP_PACK_QUERY, run_metrics_wp_pipeline
+
+        conn = _mock_conn([(1, 2024)], existing_rows=[])
+        cur = conn.cursor.return_value.__enter__.return_value
+
+        def execute(sql, params=None):
+            if sql == _METRICS_WP_PACK_QUERY:
+                raise psycopg2.errors.UndefinedFunction()
+
+        cur.execute.side_effect = execute
+
+        with (
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
+            patch("psycopg2.connect", return_value=conn),
+            patch("src.pipelines.run.dlt.pipeline", return_value=MagicMock()),
+            patch("src.pipelines.run.metrics_wp_source"),
+        ):
+            result = run_metrics_wp_pipeline(seasons=[2024], batch_size=50)
+
+        assert result["batches"] == 1
+        assert result["packed"] is None
+
+
+PACK_MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "src"
+    / "schemas"
+    / "migrations"
+    / "054_win_probability_game.sql"
+)
+
+
+def _stale_cte() -> str:
+    sql = "\n".join(line.split("--", 1)[0] for line in PACK_MIGRATION.read_text().splitlines())
+    return sql[sql.index("per_game AS (") : sql.index("INSERT INTO metrics.win_probability_game")]
+
+
+class TestPackWinProbabilityStaleness:
+    """A game is repacked when its plays were re-merged, not only when their
+    count moved: dlt stamps re-merged rows with the new load's id, so a
+    same-count reload (a corrected WP or score) shows a newer
+    max(_dlt_load_id) than the packed row recorded."""
+
+    def test_per_game_reads_the_newest_load_id(self):
+        assert re.search(r"max\(w\._dlt_load_id\)::text AS load_id", _stale_cte())
+
+    def test_stale_compares_load_id_as_well_as_play_count(self):
+        cte = _stale_cte()
+        where = cte[cte.index("WHERE c.game_id IS NULL") :]
+        assert re.search(r"OR c\.play_count <> pg\.n", where)
+        assert re.search(r"OR c\.source_load_id IS DISTINCT FROM pg\.load_id", where)
+
+    def test_repack_records_the_load_id_it_packed(self):
+        sql = PACK_MIGRATION.read_text()
+        assert "ADD COLUMN IF NOT EXISTS source_load_id TEXT" in sql
+        assert "max(w._dlt_load_id)::text,\n        now()" in sql
+        assert "source_load_id = EXCLUDED.source_load_id" in sql
+
+
 class TestRunMetricsWpPipelineBudgetGuard:
     def test_insufficient_budget_refuses_without_running_pipeline(self):
         from src.pipelines.run import run_metrics_wp_pipeline
@@ -306,7 +409,7 @@ class TestRunMetricsWpPipelineBudgetGuard:
         mock_pipeline = MagicMock()
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.get_rate_limiter", return_value=mock_rate_limiter),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
@@ -330,7 +433,7 @@ class TestRunMetricsWpPipelineBudgetGuard:
         mock_pipeline = MagicMock()
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://fake"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://fake"),
             patch("psycopg2.connect", return_value=conn),
             patch("src.pipelines.run.get_rate_limiter", return_value=mock_rate_limiter),
             patch("src.pipelines.run.dlt.pipeline", return_value=mock_pipeline),
@@ -115,7 +115,7 @@ class TestScheduledTeamResolution:
         from src.pipelines.run import run_rosters_pipeline
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://x"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://x"),
             patch("psycopg2.connect", return_value=FakeConn([])),
             pytest.raises(RuntimeError, match="No teams with scheduled games"),
         ):
@@ -130,7 +130,7 @@ class TestScheduledTeamResolution:
         from src.pipelines.run import run_rosters_pipeline
 
         with (
-            patch("src.pipelines.run._metrics_wp_db_url", return_value="postgres://x"),
+            patch("src.pipelines.run._warehouse_db_url", return_value="postgres://x"),
             patch("psycopg2.connect", return_value=FakeConn([])),
             pytest.raises(RuntimeError, match=r"--sources games --season 2027"),
         ):
@@ -16,6 +16,21 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SCHEMAS_DIR = PROJECT_ROOT / "src" / "schemas"
 PLAY_ANALYSIS = SCHEMAS_DIR / "public" / "006_play_analysis_functions.sql"
 TEAM_SPLITS = SCHEMAS_DIR / "public" / "005_team_split_functions.sql"
+SPLIT_AGG = SCHEMAS_DIR / "migrations" / "053_team_split_agg.sql"
+
+SPLIT_RPCS = {
+    "get_down_distance_splits": (PLAY_ANALYSIS, "down_distance"),
+    "get_field_position_splits": (PLAY_ANALYSIS, "field_position"),
+    "get_red_zone_splits": (PLAY_ANALYSIS, "red_zone"),
+    "get_home_away_splits": (TEAM_SPLITS, "home_away"),
+    "get_conference_splits": (TEAM_SPLITS, "conference"),
+}
+
+# The canonical predicate's core, as inlined (see test_garbage_time_consistency).
+INLINE_GARBAGE_TIME = re.compile(
+    r"\(p\.period = 4 AND ABS\(COALESCE\(p\.score_diff, 0\)\) > 28\) OR\s+"
+    r"\(p\.period >= 3 AND ABS\(COALESCE\(p\.score_diff, 0\)\) > 35\)"
+)
 
 
 def _strip_comments(sql: str) -> str:
@@ -48,28 +63,72 @@ class TestAbsoluteYardlineBan:
             assert bare == [], f"absolute yardline reference in {path.name}"
 
 
+def _body(sql: str, fn: str) -> str:
+    start = sql.index(f"FUNCTION public.{fn}")
+    end = sql.find("CREATE OR REPLACE FUNCTION", start + 1)
+    return sql[start : end if end != -1 else len(sql)]
+
+
 class TestGarbageTimeWiring:
     """Each split RPC applies the canonical garbage-time exclusion on its
-    play-level stats (as a function call or the marts.play_epa boolean).
-    Guards against the filter being dropped in a rewrite; the predicate's
-    VALUE drift is guarded by test_garbage_time_consistency.py."""
-
-    def _body(self, sql: str, fn: str) -> str:
-        start = sql.index(f"FUNCTION public.{fn}")
-        end = sql.find("CREATE OR REPLACE FUNCTION", start + 1)
-        return sql[start : end if end != -1 else len(sql)]
+    play-level stats (the marts.play_epa boolean, or the canonical predicate
+    inlined against core.plays). Guards against the filter being dropped in a
+    rewrite; the predicate's VALUE drift is guarded by
+    test_garbage_time_consistency.py."""
 
     def test_all_five_reference_garbage_time(self):
-        combined = {
-            "get_down_distance_splits": PLAY_ANALYSIS,
-            "get_field_position_splits": PLAY_ANALYSIS,
-            "get_red_zone_splits": PLAY_ANALYSIS,
-            "get_home_away_splits": TEAM_SPLITS,
-            "get_conference_splits": TEAM_SPLITS,
-        }
-        for fn, path in combined.items():
-            body = self._body(path.read_text(), fn)
-            assert "is_garbage_time" in body, f"{fn} lost its garbage-time exclusion"
+        for fn, (path, _) in SPLIT_RPCS.items():
+            body = _strip_comments(_body(path.read_text(), fn))
+            assert "pe.is_garbage_time" in body or INLINE_GARBAGE_TIME.search(body), (
+                f"{fn} lost its garbage-time exclusion"
+            )
+
+    def test_no_per_row_function_call(self):
+        """public.is_garbage_time is plpgsql and cannot be inlined by the
+        planner; the RPCs and the mart refresh inline the predicate instead."""
+        for path in (PLAY_ANALYSIS, TEAM_SPLITS, SPLIT_AGG):
+            sql = _strip_comments(path.read_text())
+            assert "public.is_garbage_time(" not in sql, path.name
+
+    def test_mart_refresh_excludes_garbage_time_on_every_play_read(self):
+        sql = _strip_comments(SPLIT_AGG.read_text())
+        assert len(INLINE_GARBAGE_TIME.findall(sql)) == 2  # home_away/conference, red-zone EPA
+        assert sql.count("NOT pe.is_garbage_time") == 2  # down_distance, field_position
+
+
+class TestMartRouting:
+    """Each RPC answers from analytics.team_split_agg for built seasons and
+    keeps a partition-pruned live fallback for the rest."""
+
+    def test_reads_its_split_type_from_the_mart(self):
+        for fn, (path, split_type) in SPLIT_RPCS.items():
+            body = _body(path.read_text(), fn)
+            assert "analytics.team_split_agg_season s WHERE s.season = p_season" in body, fn
+            assert "FROM analytics.team_split_agg a" in body, fn
+            assert f"a.split_type = '{split_type}'" in body, fn
+            # Lookup hits the (team, season, split_type, ...) primary key.
+            assert "a.team = p_team" in body and "a.season = p_season" in body, fn
+
+    def test_fallback_plays_reads_prune_partitions(self):
+        """Every core.plays read in the live fallbacks filters p.season."""
+        for fn, (path, _) in SPLIT_RPCS.items():
+            body = _strip_comments(_body(path.read_text(), fn))
+            for m in re.finditer(r"FROM core\.plays p\b", body):
+                # The WHERE clause follows within the next few joins.
+                assert "p.season = p_season" in body[m.end() : m.end() + 400], fn
+
+    def test_no_correlated_per_bucket_subqueries(self):
+        for fn, (path, _) in SPLIT_RPCS.items():
+            body = _strip_comments(_body(path.read_text(), fn))
+            assert "(SELECT AVG(" not in body, f"{fn} still averages per row via a subquery"
+
+    def test_mart_refresh_filters_partition_key(self):
+        sql = _strip_comments(SPLIT_AGG.read_text())
+        plays_reads = len(re.findall(r"FROM core\.plays p\b", sql))
+        assert plays_reads == 3
+        assert sql.count("p.season = p_season") == plays_reads
+        for _, split_type in SPLIT_RPCS.values():
+            assert f"'{split_type}'" in sql
 
 
 class TestRedZoneShape: